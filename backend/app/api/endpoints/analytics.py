@@ -9,7 +9,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 import structlog
 
 from app.core.auth import require_auth
-from app.database.connection import get_db
+from app.database.connection import get_read_db
 from app.schemas.analytics import (
     AnalyticsOverviewResponse,
     CriticalPathResponse,
@@ -17,6 +17,7 @@ from app.schemas.analytics import (
     SimulationSummaryResponse,
     ProgressMetricsResponse,
 )
+from app.models.project import Project
 from app.services.analytics_service import AnalyticsService
 from app.services.project_service import ProjectService
 
@@ -34,7 +35,7 @@ async def verify_project_access(
     project_id: UUID,
     user_info: Dict[str, Any],
     db: AsyncSession,
-) -> None:
+) -> Project:
     """Verify user has access to the project.
 
     Args:
@@ -42,6 +43,9 @@ async def verify_project_access(
         user_info: Authenticated user information
         db: Database session
 
+    Returns:
+        The verified project
+
     Raises:
         HTTPException: If project not found or access denied
     """
@@ -68,6 +72,8 @@ async def verify_project_access(
             detail="Project not found",
         )
 
+    return project
+
 
 @router.get(
     "/{project_id}/analytics/overview",
@@ -84,7 +90,7 @@ async def verify_project_access(
 async def get_analytics_overview(
     project_id: UUID,
     user_info: Dict[str, Any] = Depends(require_auth),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     analytics_service: AnalyticsService = Depends(get_analytics_service),
 ) -> AnalyticsOverviewResponse:
     """Get comprehensive analytics overview.
@@ -96,6 +102,10 @@ async def get_analytics_overview(
     - Latest simulation results
     - Progress metrics
 
+    The metrics share one request-scoped loader, so the project and its
+    simulations are fetched once, and are read from and written to Redis
+    in a single round-trip each.
+
     Args:
         project_id: Project UUID
         user_info: Authenticated user information from JWT
@@ -116,14 +126,17 @@ async def get_analytics_overview(
 
     try:
         # Verify project access
-        await verify_project_access(project_id, user_info, db)
+        project = await verify_project_access(project_id, user_info, db)
 
         # Calculate all metrics
-        health_score = await analytics_service.calculate_project_health_score(project_id, db)
-        critical_path = await analytics_service.get_critical_path_metrics(project_id, db)
-        resources = await analytics_service.get_resource_utilization(project_id, db)
-        simulation = await analytics_service.get_simulation_summary(project_id, db)
-        progress = await analytics_service.get_progress_metrics(project_id, db)
+        overview = await analytics_service.get_analytics_overview(
+            project_id, db, project=project
+        )
+        health_score = overview["health_score"]
+        critical_path = overview["critical_path"]
+        resources = overview["resources"]
+        simulation = overview["simulation"]
+        progress = overview["progress"]
 
         # Build summary dictionaries
         critical_path_summary = {
@@ -188,7 +201,7 @@ async def get_analytics_overview(
 async def get_critical_path_analytics(
     project_id: UUID,
     user_info: Dict[str, Any] = Depends(require_auth),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     analytics_service: AnalyticsService = Depends(get_analytics_service),
 ) -> CriticalPathResponse:
     """Get detailed critical path analysis.
@@ -249,7 +262,7 @@ async def get_critical_path_analytics(
 async def get_resource_analytics(
     project_id: UUID,
     user_info: Dict[str, Any] = Depends(require_auth),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     analytics_service: AnalyticsService = Depends(get_analytics_service),
 ) -> ResourceUtilizationResponse:
     """Get resource utilization metrics.
@@ -310,7 +323,7 @@ async def get_resource_analytics(
 async def get_simulation_analytics(
     project_id: UUID,
     user_info: Dict[str, Any] = Depends(require_auth),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     analytics_service: AnalyticsService = Depends(get_analytics_service),
 ) -> SimulationSummaryResponse:
     """Get Monte Carlo simulation summary.
@@ -371,7 +384,7 @@ async def get_simulation_analytics(
 async def get_progress_analytics(
     project_id: UUID,
     user_info: Dict[str, Any] = Depends(require_auth),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     analytics_service: AnalyticsService = Depends(get_analytics_service),
 ) -> ProgressMetricsResponse:
     """Get progress tracking metrics.
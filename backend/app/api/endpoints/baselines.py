@@ -1,10 +1,10 @@
 """Project baseline management API endpoints."""
 
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 from uuid import UUID
 
 import structlog
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
 from sqlalchemy import select, desc
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -19,7 +19,12 @@ from app.schemas.baseline import (
     CreateBaselineRequest,
     SetBaselineActiveResponse,
 )
-from app.services.baseline_service import BaselineService, BaselineError
+from app.services.baseline_service import (
+    BaselineError,
+    BaselineNotFoundError,
+    BaselineService,
+    DEFAULT_COMPARISON_LIMIT,
+)
 
 logger = structlog.get_logger(__name__)
 
@@ -226,7 +231,12 @@ async def get_baseline(
                 detail="Baseline not found",
             )
 
-        return BaselineDetailResponse.model_validate(baseline)
+        return BaselineDetailResponse.model_validate(
+            {
+                **baseline.to_summary_dict(),
+                "snapshot_data": await BaselineService().materialize_snapshot(baseline, db),
+            }
+        )
 
     except HTTPException:
         raise
@@ -267,31 +277,22 @@ async def delete_baseline(
     )
 
     try:
-        result = await db.execute(
-            select(ProjectBaseline)
-            .where(
-                ProjectBaseline.id == baseline_id,
-                ProjectBaseline.project_id == project_id,
-            )
+        await BaselineService().delete_baseline(
+            baseline_id=baseline_id,
+            project_id=project_id,
+            db=db,
         )
-        baseline = result.scalar_one_or_none()
-
-        if not baseline:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Baseline not found",
-            )
-
-        await db.delete(baseline)
-        await db.commit()
 
         logger.info(
             "Baseline deleted successfully",
             baseline_id=str(baseline_id),
         )
 
-    except HTTPException:
-        raise
+    except BaselineNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Baseline not found",
+        )
     except Exception as e:
         logger.error(
             "Failed to delete baseline",
@@ -299,7 +300,6 @@ async def delete_baseline(
             error=str(e),
             exc_info=True,
         )
-        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to delete baseline",
@@ -386,16 +386,27 @@ async def activate_baseline(
 
     **Query Parameters:**
     - **include_unchanged**: Include tasks with zero variance (default: false)
+    - **page** / **limit**: Page of task variances to return
 
-    **Note:** Comparison results are cached for 5 minutes in Redis.
+    **Caching:**
+    The default page against the active baseline is precomputed when the
+    baseline is activated and whenever the project's tasks change. Responses
+    carry an ETag; send it back in If-None-Match to get 304 Not Modified
+    while the comparison is unchanged.
     """,
 )
 async def compare_baseline(
     project_id: UUID,
     baseline_id: UUID,
+    response: Response,
     include_unchanged: bool = Query(
         False, description="Include tasks with no variance"
     ),
+    page: int = Query(1, ge=1, description="Page number (1-indexed)"),
+    limit: int = Query(
+        DEFAULT_COMPARISON_LIMIT, ge=1, le=5000, description="Task variances per page"
+    ),
+    if_none_match: Optional[str] = Header(None),
     user_info: Dict[str, Any] = Depends(require_auth),
     db: AsyncSession = Depends(get_db),
 ) -> BaselineComparisonResponse:
@@ -409,13 +420,22 @@ async def compare_baseline(
 
     try:
         service = BaselineService()
-        comparison = await service.compare_to_baseline(
+        etag, comparison = await service.get_comparison(
             baseline_id=baseline_id,
             project_id=project_id,
             db=db,
             include_unchanged=include_unchanged,
+            offset=(page - 1) * limit,
+            limit=limit,
+            if_none_match=if_none_match,
         )
 
+        if comparison is None:
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+            )
+        response.headers["ETag"] = etag
+
         logger.info(
             "Comparison completed successfully",
             baseline_id=str(baseline_id),
@@ -3,7 +3,7 @@
 from typing import Dict, Any
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status, Request
+from fastapi import APIRouter, Depends, File, HTTPException, status, Request, UploadFile
 from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 import structlog
@@ -13,6 +13,8 @@ from app.core.security import get_client_ip
 from app.database.connection import get_db
 from app.services.project_service import ProjectService
 from app.services.excel_service import ExcelService
+from app.services.excel_sync_service import ExcelSyncError, ExcelSyncService
+from app.schemas.excel_workflow import ExcelSyncResponse
 from app.services.abuse_service import AbuseDetectionService
 from app.middleware.rate_limit import get_rate_limiter
 
@@ -20,6 +22,9 @@ logger = structlog.get_logger(__name__)
 
 router = APIRouter(prefix="/projects", tags=["excel"])
 
+# Maximum upload size for sync workbooks
+MAX_SYNC_FILE_SIZE = 10 * 1024 * 1024  # 10MB
+
 
 @router.post(
     "/{project_id}/generate",
@@ -176,3 +181,158 @@ async def generate_excel(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to generate Excel template",
         )
+
+
+@router.post(
+    "/{project_id}/sync",
+    response_model=ExcelSyncResponse,
+    summary="Sync edited Excel workbook",
+    description=(
+        "Upload a workbook generated by SprintForge. Only rows whose checksum "
+        "differs from the embedded sync metadata are applied. Rate limited like "
+        "Excel generation."
+    ),
+    responses={
+        200: {"description": "Workbook synced successfully"},
+        400: {"description": "Invalid or foreign workbook"},
+        404: {"description": "Project not found"},
+        413: {"description": "File exceeds 10MB"},
+        429: {"description": "Rate limit exceeded"},
+        500: {"description": "Internal server error"},
+    },
+)
+async def sync_excel(
+    request: Request,
+    project_id: UUID,
+    file: UploadFile = File(..., description="Workbook (.xlsx) generated by SprintForge"),
+    user_info: Dict[str, Any] = Depends(require_auth),
+    db: AsyncSession = Depends(get_db),
+) -> ExcelSyncResponse:
+    """
+    Apply inserted, changed and deleted tasks from an edited workbook.
+
+    Args:
+        request: FastAPI request object
+        project_id: Project UUID
+        file: Uploaded workbook
+        user_info: Authenticated user information from JWT
+        db: Database session
+
+    Returns:
+        ExcelSyncResponse with the applied delta
+
+    Raises:
+        HTTPException: If project not found, file invalid, rate limited, or sync fails
+    """
+    user_id = UUID(user_info.get("sub"))
+    client_ip = get_client_ip(request)
+
+    logger.info(
+        "Excel sync requested",
+        project_id=str(project_id),
+        user_id=str(user_id),
+        client_ip=client_ip,
+        filename=file.filename,
+    )
+
+    file_content = await file.read()
+    if len(file_content) > MAX_SYNC_FILE_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=(
+                f"File size ({len(file_content)} bytes) exceeds maximum "
+                f"allowed size ({MAX_SYNC_FILE_SIZE} bytes)"
+            ),
+        )
+
+    try:
+        # Get user's subscription tier for rate limiting
+        from app.services.quota_service import QuotaService
+        quota_service = QuotaService(db)
+        subscription_tier = await quota_service.get_user_tier(user_id)
+
+        # Check rate limits BEFORE parsing the workbook
+        rate_limiter = await get_rate_limiter()
+        await rate_limiter.check_generation_limit(
+            str(user_id),
+            client_ip,
+            subscription_tier
+        )
+
+        # Check for abuse patterns
+        abuse_service = AbuseDetectionService(db)
+        if await abuse_service.should_throttle_user(user_id):
+            logger.warning(
+                "Excel sync blocked due to suspicious activity",
+                user_id=str(user_id),
+                project_id=str(project_id),
+            )
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail={
+                    "error": "suspicious_activity",
+                    "message": "Suspicious activity detected. Please contact support.",
+                }
+            )
+
+        project_service = ProjectService(db)
+
+        if not await project_service.check_owner_permission(project_id, user_id):
+            logger.warning(
+                "Unauthorized Excel sync attempt",
+                project_id=str(project_id),
+                user_id=str(user_id),
+            )
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Project not found",
+            )
+
+        project = await project_service.get_project(project_id)
+        if not project:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Project not found",
+            )
+
+        sync_service = ExcelSyncService(db)
+        operation = await sync_service.sync_workbook(
+            project, user_id, file_content, file.filename or "upload.xlsx"
+        )
+
+        sync_data = operation.sync_data or {}
+        return ExcelSyncResponse(
+            sync_operation_id=str(operation.id),
+            project_id=str(project_id),
+            inserted=sync_data.get("inserted", []),
+            updated=sync_data.get("updated", []),
+            deleted=sync_data.get("deleted", []),
+            conflicts=sync_data.get("conflicts", []),
+            unchanged_count=sync_data.get("unchanged_count", 0),
+            completed_at=operation.completed_at,
+        )
+
+    except HTTPException:
+        raise
+    except ExcelSyncError as e:
+        logger.warning(
+            "Excel sync rejected",
+            project_id=str(project_id),
+            user_id=str(user_id),
+            error=str(e),
+        )
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Excel sync failed: {str(e)}",
+        )
+    except Exception as e:
+        logger.error(
+            "Error syncing Excel",
+            project_id=str(project_id),
+            user_id=str(user_id),
+            error=str(e),
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to sync Excel workbook",
+        )
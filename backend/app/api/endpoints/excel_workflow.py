@@ -5,11 +5,12 @@ Provides complete workflow:
 1. Upload Excel → Parse → Simulate → Save
 2. Download Excel with Monte Carlo results
 3. Download blank or sample templates
+4. Batch import many workbooks as projects
 """
 
 import io
 from datetime import date, datetime
-from typing import Dict
+from typing import Dict, List
 from uuid import UUID
 
 import structlog
@@ -19,7 +20,17 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.auth import require_auth
 from app.database.connection import get_db
-from app.schemas.excel_workflow import ExcelSimulationResponse
+from app.schemas.excel_workflow import (
+    ExcelBatchImportResponse,
+    ExcelImportedProject,
+    ExcelImportFileReport,
+    ExcelSimulationResponse,
+)
+from app.services.excel_import_service import (
+    MAX_IMPORT_FILES,
+    ExcelBatchImportService,
+    ExcelImportError,
+)
 from app.services.excel_generation_service import ExcelGenerationService
 from app.services.excel_parser_service import ExcelParseError, ExcelParserService
 from app.services.scheduler.distributions import TriangularDistribution
@@ -36,6 +47,7 @@ ALLOWED_CONTENT_TYPES = [
     "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",  # .xlsx
     "application/vnd.ms-excel",  # .xls
 ]
+MAX_IMPORT_UPLOAD_SIZE = 50 * 1024 * 1024  # 50MB across all uploaded files
 
 
 @router.post(
@@ -136,8 +148,9 @@ async def upload_excel_and_simulate(
             filename=file.filename,
         )
 
-        # Step 4: Validate task structure
-        validation_errors = parser_service.validate_task_structure(parsed_data.tasks)
+        # Step 4: Validate task structure (builds the dependency graph once)
+        validation = parser_service.build_dependency_graph(parsed_data.tasks)
+        validation_errors = validation.errors
         if validation_errors:
             logger.warning(
                 "Excel validation errors",
@@ -181,6 +194,7 @@ async def upload_excel_and_simulate(
                 duration_sampler=duration_sampler,
                 iterations=iterations,
                 percentiles=[10, 50, 90, 95, 99],
+                graph=validation.graph,
             )
 
             logger.info(
@@ -257,6 +271,134 @@ async def upload_excel_and_simulate(
         )
 
 
+@router.post(
+    "/import",
+    response_model=ExcelBatchImportResponse,
+    summary="Batch import workbooks as projects",
+    status_code=status.HTTP_200_OK,
+    responses={
+        200: {"description": "Workbooks imported (one project per task sheet)"},
+        400: {"description": "Bad Request - Invalid archive or file type"},
+        401: {"description": "Unauthorized - Authentication required"},
+        403: {"description": "Forbidden - Batch would exceed project quota"},
+        413: {"description": "Payload Too Large - Upload exceeds 50MB"},
+        422: {"description": "Validation Error - A workbook failed; nothing imported"},
+        500: {"description": "Internal Server Error - Import failed"},
+    },
+)
+async def batch_import_excel(
+    files: List[UploadFile] = File(
+        ..., description="Excel workbooks (.xlsx) and/or zip archives of workbooks"
+    ),
+    user_info: Dict = Depends(require_auth),
+    db: AsyncSession = Depends(get_db),
+) -> ExcelBatchImportResponse:
+    """
+    Import many workbooks at once, creating one project per task sheet.
+
+    Workbooks are parsed in parallel in a process pool and every sheet's
+    dependency graph is validated. The batch is inserted in one transaction,
+    so either all projects are created or none are.
+
+    Args:
+        files: Uploaded workbooks or zip archives
+        user_info: Authenticated user info from JWT
+        db: Database session
+
+    Returns:
+        ExcelBatchImportResponse with created projects and per-file timings
+
+    Raises:
+        HTTPException: 400 for invalid uploads, 403 if the batch exceeds
+            the project quota, 413 if too large, 422 with the report if any
+            workbook fails validation
+    """
+    user_id = UUID(user_info.get("sub"))
+
+    if len(files) > MAX_IMPORT_FILES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Too many files (maximum {MAX_IMPORT_FILES} per import)",
+        )
+
+    uploads = []
+    total_size = 0
+    for upload in files:
+        content = await upload.read()
+        total_size += len(content)
+        if total_size > MAX_IMPORT_UPLOAD_SIZE:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=(
+                    f"Upload size exceeds maximum allowed size "
+                    f"({MAX_IMPORT_UPLOAD_SIZE} bytes)"
+                ),
+            )
+        uploads.append((upload.filename or "upload.xlsx", content))
+
+    logger.info(
+        "Excel batch import requested",
+        user_id=str(user_id),
+        upload_count=len(uploads),
+        size_bytes=total_size,
+    )
+
+    try:
+        import_service = ExcelBatchImportService(db)
+        result = await import_service.import_files(user_id, uploads)
+    except HTTPException:
+        # Quota exceeded
+        raise
+    except ExcelImportError as e:
+        logger.warning("Excel batch import rejected", error=str(e))
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Excel import failed: {str(e)}",
+        )
+    except Exception as e:
+        logger.error("Unexpected error during Excel batch import", error=str(e))
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to import Excel files",
+        )
+
+    response = ExcelBatchImportResponse(
+        imported=not result.errors,
+        projects=[
+            ExcelImportedProject(
+                project_id=str(project.id),
+                name=project.name,
+                filename=file_result.filename,
+                sheet_name=sheet.sheet_name,
+                task_count=len(sheet.tasks),
+            )
+            for project, file_result, sheet in result.projects
+        ],
+        files=[
+            ExcelImportFileReport(
+                filename=file_result.filename,
+                status="failed" if file_result.errors else "imported",
+                sheet_count=len(file_result.sheets),
+                task_count=file_result.task_count,
+                errors=file_result.errors,
+                parse_ms=round(file_result.parse_ms, 2),
+                validate_ms=round(file_result.validate_ms, 2),
+                wall_ms=round(file_result.wall_ms, 2),
+            )
+            for file_result in result.files
+        ],
+        total_ms=round(result.total_ms, 2),
+    )
+
+    if result.errors:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=response.model_dump(),
+        )
+
+    return response
+
+
 @router.get(
     "/simulations/{simulation_id}/excel",
     response_class=StreamingResponse,
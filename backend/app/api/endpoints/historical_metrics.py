@@ -1,17 +1,18 @@
 """Historical Metrics API endpoints."""
 
+import json
 from datetime import datetime, timezone
 from typing import List, Optional, Dict, Any
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 import structlog
 
-from app.database.connection import get_db
+from app.core.auth import require_auth
+from app.database.connection import get_db, get_read_db
 from app.models.historical_metrics import (
-    HistoricalMetric,
     SprintVelocity,
     CompletionTrend,
     ForecastData,
@@ -19,10 +20,23 @@ from app.models.historical_metrics import (
 )
 from app.schemas.historical_metrics import (
     VelocityTrendResponse,
+    CompletionForecastResponse,
     CompletionTrendResponse,
     ForecastResponse,
     HistoricalMetricsSummaryResponse,
+    MetricIngestResponse,
 )
+from app.services.forecast_engine import DEFAULT_SIMULATIONS, MAX_SIMULATIONS, ForecastEngine
+from app.services.metric_ingest_service import (
+    MAX_INGEST_BODY_SIZE,
+    MetricIngestError,
+    MetricIngestService,
+    parse_columnar,
+    parse_ndjson,
+)
+from app.services.project_service import ProjectService
+from app.services.velocity_tracker import VelocityTracker
+from app.services.metric_rollup_service import DEFAULT_MAX_POINTS, MetricRollupService
 
 logger = structlog.get_logger(__name__)
 
@@ -35,31 +49,105 @@ async def get_historical_metrics(
     metric_type: Optional[str] = None,
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
-    db: AsyncSession = Depends(get_db),
+    max_points: int = Query(DEFAULT_MAX_POINTS, ge=1, le=10000),
+    db: AsyncSession = Depends(get_read_db),
 ) -> List[Dict[str, Any]]:
-    """Get historical metrics with optional filtering."""
-    query = select(HistoricalMetric).where(HistoricalMetric.project_id == project_id)
-
-    if metric_type:
-        query = query.where(HistoricalMetric.metric_type == metric_type)
-    if start_date:
-        query = query.where(HistoricalMetric.timestamp >= start_date)
-    if end_date:
-        query = query.where(HistoricalMetric.timestamp <= end_date)
-
-    result = await db.execute(query)
-    metrics = result.scalars().all()
-
-    return [
-        {
-            "id": str(m.id),
-            "project_id": str(m.project_id),
-            "metric_type": m.metric_type,
-            "value": m.value,
-            "timestamp": m.timestamp.isoformat(),
-        }
-        for m in metrics
-    ]
+    """
+    Get historical metrics with optional filtering.
+
+    Raw points are returned while they fit in ``max_points``; larger ranges
+    are served from hourly, daily or weekly rollups (each point then carries
+    count, min, max and last alongside the bucket average).
+    """
+    resolution, points = await MetricRollupService(db).get_series(
+        project_id,
+        metric_type=metric_type,
+        start_date=start_date,
+        end_date=end_date,
+        max_points=max_points,
+    )
+    logger.debug(
+        "Historical metrics served",
+        project_id=str(project_id),
+        resolution=resolution,
+        points=len(points),
+    )
+    return points
+
+
+@router.post(
+    "/{project_id}/metrics/ingest",
+    response_model=MetricIngestResponse,
+    summary="Bulk ingest historical metrics",
+    description="""
+    Ingest many metric points in one request.
+
+    **Payload formats:**
+    - `application/x-ndjson`: one JSON object per line with `metric_type`,
+      `value`, `timestamp` and optional `idempotency_key` and `metadata`
+    - `application/json`: columnar object with `metric_type` (single value
+      or array), `values`, `timestamps`, optional `idempotency_keys` and
+      shared `metadata`
+
+    Timestamps are ISO 8601 strings or epoch seconds. Invalid points are
+    reported by index and skipped. Points whose idempotency key was already
+    stored are counted as duplicates, so retrying a batch is safe.
+
+    **Authentication:**
+    Requires valid JWT token. User must own the project.
+    """,
+    responses={
+        400: {"description": "Malformed payload"},
+        404: {"description": "Project not found"},
+        413: {"description": "Payload too large"},
+    },
+)
+async def ingest_metrics(
+    project_id: UUID,
+    request: Request,
+    user_info: Dict[str, Any] = Depends(require_auth),
+    db: AsyncSession = Depends(get_db),
+) -> MetricIngestResponse:
+    """Bulk ingest metric points from NDJSON or columnar JSON."""
+    user_id = UUID(user_info.get("sub"))
+
+    if not await ProjectService(db).check_owner_permission(project_id, user_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Project not found",
+        )
+
+    body = await request.body()
+    if len(body) > MAX_INGEST_BODY_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Payload exceeds {MAX_INGEST_BODY_SIZE} bytes",
+        )
+
+    content_type = request.headers.get("content-type", "").split(";")[0].strip()
+    try:
+        if content_type in ("application/x-ndjson", "application/jsonl"):
+            columns = parse_ndjson(body)
+        else:
+            try:
+                payload = json.loads(body)
+            except ValueError as e:
+                raise MetricIngestError(f"Invalid JSON: {e}")
+            columns = parse_columnar(payload)
+    except MetricIngestError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    result = await MetricIngestService(db).ingest(project_id, columns)
+
+    return MetricIngestResponse(
+        project_id=project_id,
+        received=result.received,
+        inserted=result.inserted,
+        duplicates=result.duplicates,
+        rejected=result.rejected,
+        errors=result.errors,
+        elapsed_ms=result.elapsed_ms,
+    )
 
 
 @router.get("/{project_id}/metrics/velocity", response_model=VelocityTrendResponse)
@@ -67,51 +155,43 @@ async def get_velocity_trend(
     project_id: UUID,
     num_sprints: int = Query(10, ge=1, le=50),
     include_moving_avg: bool = True,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> VelocityTrendResponse:
     """Get velocity trend for project."""
-    query = (
-        select(SprintVelocity)
-        .where(SprintVelocity.project_id == project_id)
-        .order_by(SprintVelocity.timestamp.desc())
-        .limit(num_sprints)
+    analytics = await VelocityTracker(db).get_velocity_analytics(
+        project_id, num_sprints=num_sprints
     )
 
-    result = await db.execute(query)
-    velocities = list(result.scalars().all())
-
+    # Most recent sprint first
     data_points = [
         {
-            "sprint_id": v.sprint_id,
-            "velocity": v.velocity_points,
-            "completed_tasks": v.completed_tasks,
-            "timestamp": v.timestamp.isoformat(),
+            "sprint_id": p["sprint_id"],
+            "velocity": p["velocity_points"],
+            "completed_tasks": p["completed_tasks"],
+            "timestamp": p["timestamp"].isoformat(),
+            "moving_average": p["moving_average"],
+            "z_score": p["z_score"],
         }
-        for v in velocities
+        for p in reversed(analytics.points)
     ]
 
     moving_avg = None
-    if include_moving_avg and velocities:
-        moving_avg = sum(v.velocity_points for v in velocities) / len(velocities)
-
-    # Determine trend direction
-    trend_direction = "stable"
-    if len(velocities) >= 2:
-        first_half_avg = sum(v.velocity_points for v in velocities[:len(velocities)//2]) / max(1, len(velocities)//2)
-        second_half_avg = sum(v.velocity_points for v in velocities[len(velocities)//2:]) / max(1, len(velocities) - len(velocities)//2)
-        if second_half_avg > first_half_avg * 1.1:
-            trend_direction = "increasing"
-        elif second_half_avg < first_half_avg * 0.9:
-            trend_direction = "decreasing"
+    if include_moving_avg and analytics.points:
+        moving_avg = analytics.mean
+
+    anomalies = [
+        {**anomaly, "timestamp": anomaly["timestamp"].isoformat()}
+        for anomaly in analytics.anomalies
+    ]
 
     return VelocityTrendResponse(
         project_id=project_id,
         data_points=data_points,
         velocities=data_points,  # Alias for test compatibility
         moving_average=moving_avg,
-        trend_direction=trend_direction,
-        trend=trend_direction,  # Alias for test compatibility
-        anomalies=[],
+        trend_direction=analytics.trend_direction,
+        trend=analytics.trend_direction,  # Alias for test compatibility
+        anomalies=anomalies,
     )
 
 
@@ -120,7 +200,7 @@ async def get_completion_trends(
     project_id: UUID,
     period_days: int = Query(30, ge=7, le=365),
     granularity: Optional[str] = None,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> CompletionTrendResponse:
     """Get completion trends."""
     query = select(CompletionTrend).where(CompletionTrend.project_id == project_id)
@@ -183,41 +263,67 @@ async def get_forecast(
     )
 
 
+@router.get(
+    "/{project_id}/metrics/forecast/completion",
+    response_model=CompletionForecastResponse,
+)
+async def get_completion_forecast(
+    project_id: UUID,
+    remaining_points: float = Query(..., ge=0),
+    simulations: int = Query(DEFAULT_SIMULATIONS, ge=100, le=MAX_SIMULATIONS),
+    db: AsyncSession = Depends(get_db),
+) -> CompletionForecastResponse:
+    """Get Monte Carlo completion-date percentiles and probability curve."""
+    forecast = await ForecastEngine(db).simulate_completion_date(
+        project_id, remaining_points, num_simulations=simulations
+    )
+    return CompletionForecastResponse(
+        project_id=project_id,
+        remaining_points=remaining_points,
+        **{k: v for k, v in forecast.items() if k not in ("project_id", "remaining_points")},
+    )
+
+
 @router.get("/{project_id}/metrics/summary", response_model=HistoricalMetricsSummaryResponse)
 async def get_metrics_summary(
     project_id: UUID,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> HistoricalMetricsSummaryResponse:
     """Get overall metrics summary."""
-    # Get velocity data
-    velocity_query = (
-        select(SprintVelocity)
+    # Velocity aggregates are computed in the database
+    velocity_stats = (
+        await db.execute(
+            select(
+                func.count(SprintVelocity.id),
+                func.avg(SprintVelocity.velocity_points),
+            ).where(SprintVelocity.project_id == project_id)
+        )
+    ).one()
+    total_sprints = velocity_stats[0]
+    avg_velocity = float(velocity_stats[1] or 0.0)
+
+    current_velocity = await db.scalar(
+        select(SprintVelocity.velocity_points)
         .where(SprintVelocity.project_id == project_id)
         .order_by(SprintVelocity.timestamp.desc())
+        .limit(1)
     )
-    velocity_result = await db.execute(velocity_query)
-    velocities = list(velocity_result.scalars().all())
-
-    current_velocity = velocities[0].velocity_points if velocities else 0.0
-    avg_velocity = (
-        sum(v.velocity_points for v in velocities) / len(velocities)
-        if velocities
-        else 0.0
-    )
+    current_velocity = current_velocity or 0.0
 
-    # Get completion trends
-    trend_query = select(CompletionTrend).where(CompletionTrend.project_id == project_id)
-    trend_result = await db.execute(trend_query)
-    trends = list(trend_result.scalars().all())
-
-    completion_rate = (
-        sum(t.completion_rate for t in trends) / len(trends) if trends else 0.0
+    completion_rate = await db.scalar(
+        select(func.avg(CompletionTrend.completion_rate)).where(
+            CompletionTrend.project_id == project_id
+        )
     )
+    completion_rate = float(completion_rate or 0.0)
 
-    # Get forecasts
-    forecast_query = select(ForecastData).where(ForecastData.project_id == project_id)
-    forecast_result = await db.execute(forecast_query)
-    forecasts_list = list(forecast_result.scalars().all())
+    # Get forecasts (only the columns the summary uses)
+    forecast_result = await db.execute(
+        select(ForecastData.forecast_date, ForecastData.predicted_value)
+        .where(ForecastData.project_id == project_id)
+        .order_by(ForecastData.forecast_date)
+    )
+    forecasts_list = forecast_result.all()
 
     forecasts_data = [
         {
@@ -238,7 +344,7 @@ async def get_metrics_summary(
         velocity_trend="stable",
         trend="stable",
         completion_rate=completion_rate,
-        total_sprints=len(velocities),
+        total_sprints=total_sprints,
         predicted_completion_date=predicted_date,
         predicted=predicted_date,
         forecasts=forecasts_data,
@@ -1,14 +1,15 @@
 """Notification management endpoints."""
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 
 import structlog
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.auth import require_auth
 from app.database.connection import get_database_session
+from app.database.pagination import InvalidCursorError, next_cursor
 from app.models.notification import NotificationChannel, NotificationType
 from app.schemas.notification import (
     NotificationEventTrigger,
@@ -17,7 +18,7 @@ from app.schemas.notification import (
     NotificationRuleResponse,
     NotificationRuleUpdate,
 )
-from app.services.notification_service import NotificationService
+from app.services.notification_service import NOTIFICATION_SORT, NotificationService
 
 logger = structlog.get_logger(__name__)
 
@@ -28,9 +29,15 @@ rules_router = APIRouter(prefix="/notification-rules", tags=["notification-rules
 # Notification endpoints
 @router.get("", response_model=List[NotificationResponse])
 async def list_notifications(
+    response: Response,
     status: str = None,  # "unread" or "read" filter
     limit: int = 50,
     offset: int = 0,
+    cursor: Optional[str] = Query(
+        None,
+        max_length=1024,
+        description="X-Next-Cursor header of the previous page; takes precedence over offset",
+    ),
     user_info: Dict[str, Any] = Depends(require_auth),
     db: AsyncSession = Depends(get_database_session),
 ) -> List[NotificationResponse]:
@@ -41,6 +48,7 @@ async def list_notifications(
     - status: Filter by status ("unread" or "read")
     - limit: Maximum number of notifications to return (default: 50)
     - offset: Offset for pagination (default: 0)
+    - cursor: X-Next-Cursor header of the previous page; takes precedence over offset
     """
     try:
         user_id = UUID(user_info.get("sub"))
@@ -61,11 +69,19 @@ async def list_notifications(
             status=status_enum,
             limit=limit,
             offset=offset,
+            cursor=cursor,
         )
 
+        # The body stays a plain list, so the next cursor goes in a header
+        following = next_cursor(notifications, limit, NOTIFICATION_SORT, "created_at")
+        if following:
+            response.headers["X-Next-Cursor"] = following
+
         # Return simple list, not wrapped object
         return [NotificationResponse.model_validate(n) for n in notifications]
 
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid user ID")
     except Exception as e:
@@ -9,6 +9,7 @@ import structlog
 
 from app.core.auth import require_auth
 from app.database.connection import get_db
+from app.database.pagination import InvalidCursorError, next_cursor
 from app.schemas.project import (
     ProjectCreate,
     ProjectUpdate,
@@ -115,6 +116,11 @@ async def create_project(
 async def list_projects(
     limit: int = Query(20, ge=1, le=100, description="Results per page"),
     offset: int = Query(0, ge=0, description="Pagination offset"),
+    cursor: Optional[str] = Query(
+        None,
+        max_length=1024,
+        description="next_cursor of the previous page; takes precedence over offset",
+    ),
     search: Optional[str] = Query(None, max_length=255, description="Search query for name/description"),
     sort: str = Query(
         "-created_at",
@@ -130,6 +136,7 @@ async def list_projects(
     Args:
         limit: Maximum number of results (1-100)
         offset: Pagination offset
+        cursor: Cursor returned as next_cursor by the previous page
         search: Optional search query for name or description
         sort: Sort field with optional - prefix for descending order
         user_info: Authenticated user information from JWT
@@ -152,6 +159,7 @@ async def list_projects(
         user_id=str(user_id),
         limit=limit,
         offset=offset,
+        cursor=cursor is not None,
         search=search,
         sort_by=sort_by,
         sort_desc=sort_desc,
@@ -166,8 +174,12 @@ async def list_projects(
             search=search,
             sort_by=sort_by,
             sort_desc=sort_desc,
+            cursor=cursor,
         )
 
+        # Another page may follow a full page that did not reach the total
+        more = len(projects) == limit and (cursor is not None or offset + limit < total)
+
         logger.info(
             "Projects listed successfully",
             user_id=str(user_id),
@@ -180,8 +192,14 @@ async def list_projects(
             limit=limit,
             offset=offset,
             projects=[ProjectResponse.model_validate(p) for p in projects],
+            next_cursor=next_cursor(projects, limit, sort, sort_by) if more else None,
         )
 
+    except InvalidCursorError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
     except Exception as e:
         logger.error(
             "Error listing projects",
@@ -3,7 +3,7 @@
 from typing import Dict, Any, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status, Request
+from fastapi import APIRouter, Cookie, Depends, HTTPException, Response, status, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 import structlog
 
@@ -17,7 +17,9 @@ from app.schemas.sharing import (
     PublicProjectResponse,
     ShareAccessRequest
 )
-from app.services.share_service import ShareService
+from app.core.config import settings
+from app.services.share_access_tracker import share_access_tracker
+from app.services.share_service import SHARE_ACCESS_COOKIE, SHARE_ACCESS_TTL, ShareService
 from app.services.project_service import ProjectService
 
 logger = structlog.get_logger(__name__)
@@ -140,7 +142,10 @@ async def create_share_link(
 )
 async def get_shared_project(
     token: str,
+    request: Request,
+    response: Response,
     password: Optional[str] = None,
+    share_access: Optional[str] = Cookie(None, alias=SHARE_ACCESS_COOKIE),
     db: AsyncSession = Depends(get_db),
 ) -> PublicProjectResponse:
     """
@@ -151,14 +156,19 @@ async def get_shared_project(
     **Password Protection:**
     - If link is password protected, password parameter is required
     - Returns 401 if password is incorrect or missing
+    - A correct password sets a short-lived signed cookie, scoped to this
+      link, that lets repeat views skip the password
 
     **Expiration:**
     - Returns 410 Gone if link has expired
-    - Access count is incremented on successful access
+    - Access count is incremented on successful access (written in batches)
 
     Args:
         token: Share link token from URL
+        request: Incoming request
+        response: Response to set the access cookie on
         password: Optional password for protected links
+        share_access: Signed access grant from an earlier password check
         db: Database session
 
     Returns:
@@ -175,7 +185,25 @@ async def get_shared_project(
 
     try:
         share_service = ShareService(db)
-        share_link, project = await share_service.verify_share_access(token, password)
+        share_link, project = await share_service.verify_share_access(
+            token, password, access_grant=share_access
+        )
+
+        # Issue a grant after a password check, not on a view the grant allowed
+        if (
+            share_link.is_password_protected()
+            and password
+            and not share_service.check_access_grant(share_link, share_access)
+        ):
+            response.set_cookie(
+                SHARE_ACCESS_COOKIE,
+                share_service.issue_access_grant(share_link),
+                max_age=SHARE_ACCESS_TTL,
+                path=request.url.path,
+                httponly=True,
+                secure=settings.environment == "production",
+                samesite="lax",
+            )
 
         # Build permissions based on access type
         can_generate = share_link.access_type in ["viewer", "editor"]
@@ -183,7 +211,7 @@ async def get_shared_project(
         can_comment = share_link.access_type in ["editor", "commenter"]
 
         # Return public project data (sensitive fields excluded)
-        response = PublicProjectResponse(
+        public_project = PublicProjectResponse(
             project={
                 "id": str(project.id),
                 "name": project.name,
@@ -205,7 +233,7 @@ async def get_shared_project(
             access_type=share_link.access_type,
         )
 
-        return response
+        return public_project
 
     except HTTPException:
         raise
@@ -290,6 +318,8 @@ async def list_project_shares(
             response = ShareLinkResponse.model_validate(link)
             response.share_url = f"{base_url}/s/{link.token}"
             response.password_protected = link.is_password_protected()
+            # Include hits this process has not flushed yet
+            response.access_count += share_access_tracker.pending_hits(link.id)
             responses.append(response)
 
         logger.info(
@@ -1,6 +1,6 @@
 """Monte Carlo simulation API endpoints."""
 
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 from uuid import UUID
 
 import structlog
@@ -8,7 +8,8 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.auth import require_auth
-from app.database.connection import get_db
+from app.database.connection import get_db, get_read_db
+from app.database.pagination import InvalidCursorError, next_cursor
 from app.schemas.simulation import (
     SimulationDetailResponse,
     SimulationHistoryItem,
@@ -16,7 +17,10 @@ from app.schemas.simulation import (
     SimulationRequest,
     SimulationResponse,
 )
-from app.services.simulation_persistence_service import SimulationPersistenceService
+from app.services.simulation_persistence_service import (
+    SIMULATION_HISTORY_SORT,
+    SimulationPersistenceService,
+)
 from app.services.simulation_service import SimulationService
 
 logger = structlog.get_logger(__name__)
@@ -229,6 +233,7 @@ async def run_project_simulation(
     **Query Parameters:**
     - **page**: Page number (0-indexed, default: 0)
     - **page_size**: Results per page (1-100, default: 10)
+    - **cursor**: next_cursor of the previous page (keyset pagination)
 
     **Authentication:**
     Requires valid JWT token. User must own the project.
@@ -238,8 +243,13 @@ async def get_project_simulations(
     project_id: UUID,
     page: int = Query(0, ge=0, description="Page number (0-indexed)"),
     page_size: int = Query(10, ge=1, le=100, description="Results per page"),
+    cursor: Optional[str] = Query(
+        None,
+        max_length=1024,
+        description="next_cursor of the previous page; takes precedence over page",
+    ),
     user_info: Dict[str, Any] = Depends(require_auth),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> SimulationHistoryResponse:
     """
     Get simulation history for a project.
@@ -248,6 +258,7 @@ async def get_project_simulations(
         project_id: Project UUID
         page: Page number (0-indexed)
         page_size: Number of results per page (1-100)
+        cursor: Cursor returned as next_cursor by the previous page
         user_info: Authenticated user information
         db: Database session
 
@@ -278,7 +289,7 @@ async def get_project_simulations(
 
         # Fetch simulations
         simulations = await persistence_service.get_project_simulation_history(
-            db=db, project_id=project_id, limit=page_size, offset=offset
+            db=db, project_id=project_id, limit=page_size, offset=offset, cursor=cursor
         )
 
         # Get total count for pagination
@@ -296,8 +307,16 @@ async def get_project_simulations(
             total_count=total_count,
             page=page,
             page_size=page_size,
+            next_cursor=next_cursor(
+                simulations, page_size, SIMULATION_HISTORY_SORT, "created_at"
+            ),
         )
 
+    except InvalidCursorError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
     except Exception as e:
         logger.error(
             "Failed to fetch simulation history",
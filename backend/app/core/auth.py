@@ -1,6 +1,9 @@
 """Authentication utilities and JWT token validation for NextAuth.js integration."""
 
+import hashlib
 import json
+import random
+import time
 from datetime import datetime, timezone
 from typing import Optional, Dict, Any
 from jose import jwt, JWTError
@@ -10,6 +13,7 @@ import httpx
 import structlog
 
 from app.core.config import settings
+from app.core.cache import BoundedTTLDict
 
 logger = structlog.get_logger(__name__)
 
@@ -34,6 +38,26 @@ security = HTTPBearerWith401()
 NEXTAUTH_SECRET = settings.secret_key
 ALGORITHM = settings.algorithm
 
+# Verified tokens are cached for at most this many seconds, and never past exp
+JWT_CACHE_TTL = 300
+JWT_CACHE_MAX_ENTRIES = 10_000
+
+# Fraction of successful verifications that are logged
+AUTH_LOG_SAMPLE_RATE = 0.01
+
+# SHA-256 digest of a verified token -> its claims
+_verified_tokens: BoundedTTLDict = BoundedTTLDict(max_entries=JWT_CACHE_MAX_ENTRIES)
+
+
+def token_digest(token: str) -> str:
+    """Return the cache key of a token, so raw tokens are never kept in memory."""
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def clear_token_cache() -> None:
+    """Drop all cached token verifications."""
+    _verified_tokens.clear()
+
 
 class JWTAuthError(HTTPException):
     """Custom exception for JWT authentication errors."""
@@ -46,6 +70,10 @@ async def verify_nextauth_jwt(token: str) -> Dict[str, Any]:
     """
     Verify a NextAuth.js JWT token and extract user information.
 
+    Successful verifications are cached by token digest until the token
+    expires or JWT_CACHE_TTL passes, whichever comes first. Failures are
+    not cached.
+
     Args:
         token: The JWT token string
 
@@ -55,6 +83,11 @@ async def verify_nextauth_jwt(token: str) -> Dict[str, Any]:
     Raises:
         JWTAuthError: If token is invalid or expired
     """
+    digest = token_digest(token)
+    if digest in _verified_tokens:
+        # Copy so callers cannot alter the cached claims
+        return dict(_verified_tokens[digest])
+
     try:
         # Decode the JWT token
         payload = jwt.decode(
@@ -72,13 +105,16 @@ async def verify_nextauth_jwt(token: str) -> Dict[str, Any]:
         if not payload.get("sub"):
             raise JWTAuthError("Invalid token: missing user ID")
 
-        logger.info(
-            "JWT token validated successfully",
-            user_id=payload.get("sub"),
-            email=payload.get("email")
-        )
+        if random.random() < AUTH_LOG_SAMPLE_RATE:
+            logger.info("JWT token validated successfully", user_id=payload.get("sub"))
+
+        ttl = JWT_CACHE_TTL
+        if exp:
+            ttl = min(ttl, exp - time.time())
+        if ttl > 0:
+            _verified_tokens.set(digest, payload, ttl=ttl)
 
-        return payload
+        return dict(payload)
 
     except JWTError as e:
         error_str = str(e)
@@ -95,14 +131,29 @@ async def verify_nextauth_jwt(token: str) -> Dict[str, Any]:
         raise JWTAuthError("Authentication error")
 
 
+def _user_from_middleware(request: Optional[Request], token: str) -> Optional[Dict[str, Any]]:
+    """Return the claims AuthenticationMiddleware verified for this token, if any."""
+    if request is None:
+        return None
+    state = request.state
+    if getattr(state, "auth_token_digest", None) != token_digest(token):
+        return None
+    return dict(state.user)
+
+
 async def get_current_user_from_token(
-    credentials: HTTPAuthorizationCredentials = Depends(security)
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    request: Request = None,
 ) -> Dict[str, Any]:
     """
     Extract and validate user information from JWT token in Authorization header.
 
+    Reuses the claims AuthenticationMiddleware already verified for the
+    same token instead of verifying it again.
+
     Args:
         credentials: HTTP authorization credentials from request header
+        request: Current request, injected by FastAPI
 
     Returns:
         Dict containing user information from token
@@ -114,19 +165,23 @@ async def get_current_user_from_token(
         raise JWTAuthError("Missing authentication token")
 
     token = credentials.credentials
-    user_info = await verify_nextauth_jwt(token)
+    user_info = _user_from_middleware(request, token)
+    if user_info is None:
+        user_info = await verify_nextauth_jwt(token)
 
     return user_info
 
 
 async def get_current_user_optional(
-    credentials: Optional[HTTPAuthorizationCredentials] = Depends(HTTPBearer(auto_error=False))
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(HTTPBearer(auto_error=False)),
+    request: Request = None,
 ) -> Optional[Dict[str, Any]]:
     """
     Optionally extract user information from JWT token. Returns None if no token provided.
 
     Args:
         credentials: Optional HTTP authorization credentials
+        request: Current request, injected by FastAPI
 
     Returns:
         Dict containing user information or None if no token
@@ -134,6 +189,10 @@ async def get_current_user_optional(
     if not credentials or not credentials.credentials:
         return None
 
+    user_info = _user_from_middleware(request, credentials.credentials)
+    if user_info is not None:
+        return user_info
+
     try:
         return await verify_nextauth_jwt(credentials.credentials)
     except JWTAuthError:
@@ -208,6 +267,8 @@ class AuthenticationMiddleware:
                     request.state.user = user_info
                     request.state.user_id = user_info.get("sub")
                     request.state.user_email = user_info.get("email")
+                    # Lets the auth dependencies skip verifying this token again
+                    request.state.auth_token_digest = token_digest(token)
                 except (JWTAuthError, Exception):
                     # Invalid token, but don't reject the request
                     # Let individual endpoints decide if auth is required
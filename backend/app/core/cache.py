@@ -0,0 +1,88 @@
+"""
+Small in-process caches.
+
+BoundedTTLDict is a dict with a size bound and per-entry expiry. It backs
+the in-memory rate limiter storage, the verified JWT cache and cached
+listing totals, where memory has to stay flat however many keys are seen.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Iterator, MutableMapping, Optional, Tuple
+
+# Default upper bound on entries per map
+DEFAULT_MAX_ENTRIES = 100_000
+
+
+class BoundedTTLDict(MutableMapping):
+    """
+    Dict with least-recently-used eviction and per-entry expiry.
+
+    Expired entries behave as missing and are dropped when touched; the
+    least recently used entry is evicted once ``max_entries`` is exceeded.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl: Optional[float] = None,
+        default_factory: Optional[Callable[[], Any]] = None,
+    ):
+        """
+        Initialize the map.
+
+        Args:
+            max_entries: Maximum number of entries kept
+            ttl: Default seconds an entry lives (None for no expiry)
+            default_factory: Creates values for missing keys, as in defaultdict
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.default_factory = default_factory
+        self._data: "OrderedDict[Any, Tuple[Any, Optional[float]]]" = OrderedDict()
+
+    def set(self, key: Any, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value with an explicit time to live."""
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        self._data[key] = (value, expires_at)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_entries:
+            self._data.popitem(last=False)
+
+    def _live(self, key: Any) -> bool:
+        entry = self._data.get(key)
+        if entry is None:
+            return False
+        if entry[1] is not None and entry[1] <= time.monotonic():
+            del self._data[key]
+            return False
+        return True
+
+    def __getitem__(self, key: Any) -> Any:
+        if self._live(key):
+            self._data.move_to_end(key)
+            return self._data[key][0]
+        if self.default_factory is None:
+            raise KeyError(key)
+        value = self.default_factory()
+        self.set(key, value)
+        return value
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self.set(key, value)
+
+    def __delitem__(self, key: Any) -> None:
+        del self._data[key]
+
+    def __contains__(self, key: Any) -> bool:
+        return self._live(key)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter([key for key in list(self._data) if self._live(key)])
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def clear(self) -> None:
+        self._data.clear()
@@ -0,0 +1,311 @@
+"""
+Storage backends and route matching for the global rate limiter.
+
+The rate limiter keeps a sliding window log of request times per client
+plus auth failure counters and account lockouts. Two backends store them:
+
+- MemoryRateLimitBackend: per-process, in bounded LRU maps whose entries
+  expire, so memory stays flat however many clients are seen
+- RedisRateLimitBackend: shared by all workers; each request is one
+  atomic Lua script call, falling back to memory while Redis is down
+"""
+
+import time
+import uuid
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Deque, Dict, Optional, Protocol
+
+import redis.asyncio as redis
+import structlog
+
+from app.core.cache import BoundedTTLDict
+
+logger = structlog.get_logger(__name__)
+
+# Upper bound on tracked clients per in-memory map
+DEFAULT_MAX_KEYS = 100_000
+
+# Seconds auth failures and lockouts are remembered by default
+LOCKOUT_DURATION = 900
+
+# Seconds to stay on the in-memory fallback after a Redis error
+REDIS_RETRY_INTERVAL = 30.0
+
+
+# Account lockout storage shared by in-memory backends of this process
+account_lockouts: BoundedTTLDict = BoundedTTLDict(ttl=LOCKOUT_DURATION)
+failed_attempts: BoundedTTLDict = BoundedTTLDict(
+    ttl=LOCKOUT_DURATION, default_factory=int
+)
+
+
+@dataclass
+class RateLimitDecision:
+    """Outcome of one rate limit check."""
+
+    limited: bool
+    # Requests in the window, including this one when it was allowed
+    count: int
+    # Epoch seconds the identifier is locked out until, if locked
+    locked_until: Optional[float] = None
+
+
+class RateLimitBackend(Protocol):
+    """Storage for sliding window logs, auth failures and lockouts."""
+
+    async def check(
+        self,
+        identifier: str,
+        limit: int,
+        window: int,
+        auth: bool = False,
+        max_failed_attempts: int = 5,
+        lockout_duration: int = LOCKOUT_DURATION,
+    ) -> RateLimitDecision:
+        """
+        Record a request if it is within its limit.
+
+        For auth requests an active lockout rejects the request outright,
+        and a rejected request counts as a failure that locks the
+        identifier out after ``max_failed_attempts``. An allowed non-auth
+        request clears the identifier's failures.
+        """
+        ...
+
+
+class MemoryRateLimitBackend:
+    """Per-process backend with bounded, expiring storage."""
+
+    def __init__(self, max_keys: int = DEFAULT_MAX_KEYS):
+        """
+        Initialize the backend.
+
+        Args:
+            max_keys: Maximum number of request logs kept
+        """
+        self.requests = BoundedTTLDict(max_entries=max_keys)
+
+    async def check(
+        self,
+        identifier: str,
+        limit: int,
+        window: int,
+        auth: bool = False,
+        max_failed_attempts: int = 5,
+        lockout_duration: int = LOCKOUT_DURATION,
+    ) -> RateLimitDecision:
+        """Record a request if it is within its limit (see RateLimitBackend)."""
+        now = time.time()
+
+        if auth and identifier in account_lockouts:
+            locked_until = account_lockouts[identifier]
+            if datetime.now() < locked_until:
+                return RateLimitDecision(True, 0, locked_until.timestamp())
+            # Lockout expired, remove it
+            del account_lockouts[identifier]
+            failed_attempts[identifier] = 0
+
+        request_times: Deque[float] = (
+            self.requests[identifier] if identifier in self.requests else deque()
+        )
+        window_start = now - window
+        while request_times and request_times[0] < window_start:
+            request_times.popleft()
+
+        if len(request_times) >= limit:
+            locked_until = None
+            if auth:
+                failed_attempts[identifier] += 1
+                if failed_attempts[identifier] >= max_failed_attempts:
+                    until = datetime.now() + timedelta(seconds=lockout_duration)
+                    account_lockouts.set(identifier, until, ttl=lockout_duration)
+                    locked_until = until.timestamp()
+            return RateLimitDecision(True, len(request_times), locked_until)
+
+        request_times.append(now)
+        self.requests.set(identifier, request_times, ttl=window)
+
+        # Reset failed attempts on successful requests to non-auth endpoints
+        if not auth and identifier in failed_attempts:
+            failed_attempts[identifier] = 0
+
+        return RateLimitDecision(False, len(request_times))
+
+
+# KEYS = [log, failures, lockout]
+# ARGV = [now, window, limit, member, auth, max_failed_attempts, lockout_duration]
+# Returns {limited, count, lockout_ttl}
+RATE_LIMIT_SCRIPT = """
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local limit = tonumber(ARGV[3])
+local auth = ARGV[5] == '1'
+local lockout = tonumber(ARGV[7])
+
+if auth then
+    local ttl = redis.call('TTL', KEYS[3])
+    if ttl > 0 then
+        return {1, 0, ttl}
+    end
+end
+
+redis.call('ZREMRANGEBYSCORE', KEYS[1], 0, now - window)
+local count = redis.call('ZCARD', KEYS[1])
+
+if count >= limit then
+    local locked = 0
+    if auth then
+        local failures = redis.call('INCR', KEYS[2])
+        redis.call('EXPIRE', KEYS[2], lockout)
+        if failures >= tonumber(ARGV[6]) then
+            redis.call('SET', KEYS[3], '1', 'EX', lockout)
+            locked = lockout
+        end
+    end
+    return {1, count, locked}
+end
+
+redis.call('ZADD', KEYS[1], now, ARGV[4])
+redis.call('EXPIRE', KEYS[1], math.ceil(window))
+if not auth then
+    redis.call('DEL', KEYS[2])
+end
+return {0, count + 1, 0}
+"""
+
+
+class RedisRateLimitBackend:
+    """Backend shared by all workers through Redis."""
+
+    def __init__(
+        self,
+        redis_url: str,
+        fallback: Optional[MemoryRateLimitBackend] = None,
+        retry_interval: float = REDIS_RETRY_INTERVAL,
+    ):
+        """
+        Initialize the backend.
+
+        Args:
+            redis_url: Redis connection URL
+            fallback: Backend used while Redis is unavailable
+            retry_interval: Seconds to wait before retrying Redis after an error
+        """
+        self.client = redis.from_url(redis_url, decode_responses=True)
+        self._script = self.client.register_script(RATE_LIMIT_SCRIPT)
+        self.fallback = fallback or MemoryRateLimitBackend()
+        self.retry_interval = retry_interval
+        self._retry_at = 0.0
+
+    @staticmethod
+    def _keys(identifier: str) -> list:
+        # Hash tag keeps one identifier's keys in one cluster slot
+        base = f"ratelimit:{{{identifier}}}"
+        return [f"{base}:log", f"{base}:failures", f"{base}:lockout"]
+
+    async def check(
+        self,
+        identifier: str,
+        limit: int,
+        window: int,
+        auth: bool = False,
+        max_failed_attempts: int = 5,
+        lockout_duration: int = LOCKOUT_DURATION,
+    ) -> RateLimitDecision:
+        """Record a request if it is within its limit (see RateLimitBackend)."""
+        if time.monotonic() < self._retry_at:
+            return await self.fallback.check(
+                identifier, limit, window, auth, max_failed_attempts, lockout_duration
+            )
+
+        now = time.time()
+        try:
+            limited, count, lockout_ttl = await self._script(
+                keys=self._keys(identifier),
+                args=[
+                    now,
+                    window,
+                    limit,
+                    f"{now}:{uuid.uuid4().hex}",
+                    1 if auth else 0,
+                    max_failed_attempts,
+                    lockout_duration,
+                ],
+            )
+        except Exception as e:
+            logger.error("Redis rate limit check failed", error=str(e))
+            self._retry_at = time.monotonic() + self.retry_interval
+            return await self.fallback.check(
+                identifier, limit, window, auth, max_failed_attempts, lockout_duration
+            )
+
+        return RateLimitDecision(
+            bool(limited),
+            int(count),
+            now + int(lockout_ttl) if int(lockout_ttl) > 0 else None,
+        )
+
+    async def close(self) -> None:
+        """Close the Redis connection."""
+        await self.client.close()
+
+
+def create_rate_limit_backend(
+    backend: str, redis_url: Optional[str] = None
+) -> RateLimitBackend:
+    """
+    Create a rate limit backend by name.
+
+    Args:
+        backend: "memory" or "redis"
+        redis_url: Redis connection URL for the redis backend
+
+    Returns:
+        Rate limit backend
+
+    Raises:
+        ValueError: If the backend name is unknown
+    """
+    if backend == "memory":
+        return MemoryRateLimitBackend()
+    if backend == "redis":
+        return RedisRateLimitBackend(redis_url)
+    raise ValueError(f"Unknown rate limit backend: {backend}")
+
+
+_LIMIT = ""  # Trie key holding a prefix's limits; never a path character
+
+
+class RouteLimitMatcher:
+    """Prefix trie mapping request paths to rate limits."""
+
+    def __init__(
+        self, endpoint_limits: Dict[str, Dict[str, int]], default: Dict[str, int]
+    ):
+        """
+        Compile the trie.
+
+        Args:
+            endpoint_limits: Path prefix to {"requests", "window"} limits
+            default: Limits for paths without a matching prefix
+        """
+        self.default = default
+        self._root: Dict[str, Any] = {}
+        for prefix, limits in endpoint_limits.items():
+            node = self._root
+            for char in prefix:
+                node = node.setdefault(char, {})
+            node[_LIMIT] = limits
+
+    def match(self, path: str) -> Dict[str, int]:
+        """Return the limits of the longest configured prefix of ``path``."""
+        limits = self.default
+        node = self._root
+        for char in path:
+            node = node.get(char)
+            if node is None:
+                break
+            limits = node.get(_LIMIT, limits)
+        return limits
@@ -5,48 +5,75 @@ Security utilities and middleware for SprintForge.
 import time
 import hashlib
 from typing import Dict, Optional, Set
-from collections import defaultdict, deque
 from datetime import datetime, timedelta
 
 from fastapi import HTTPException, Request
 from fastapi.responses import Response
+from starlette.datastructures import MutableHeaders
 from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 import structlog
 from jose import jwt
 
 import asyncio
 
+from app.core.rate_limit_backends import (
+    MemoryRateLimitBackend,
+    RateLimitBackend,
+    RouteLimitMatcher,
+    account_lockouts,
+    failed_attempts,
+)
+
 logger = structlog.get_logger(__name__)
 
 
 # Token blacklist storage (use Redis in production)
 token_blacklist: Set[str] = set()
 
-# Account lockout storage (use Redis in production)
-account_lockouts: Dict[str, datetime] = {}
-failed_attempts: Dict[str, int] = defaultdict(int)
-failed_attempt_timestamps: Dict[str, deque] = defaultdict(deque)
-
-class RateLimitMiddleware(BaseHTTPMiddleware):
-    """Enhanced rate limiting middleware with account lockout and progressive delays."""
-
-    def __init__(self, app, default_requests: int = 100, default_window: int = 60):
-        super().__init__(app)
+# Account lockout storage (bounded, expiring) lives with the in-memory
+# rate limit backend: account_lockouts, failed_attempts
+
+# Per-endpoint rate limits with enhanced security
+DEFAULT_ENDPOINT_LIMITS: Dict[str, Dict[str, int]] = {
+    "/api/v1/auth/login": {"requests": 3, "window": 60},  # 3 login attempts per minute
+    "/api/v1/auth/register": {"requests": 2, "window": 300},  # 2 registrations per 5 minutes
+    "/api/v1/auth/refresh": {"requests": 10, "window": 60},  # 10 token refreshes per minute
+    "/api/v1/auth/logout": {"requests": 5, "window": 60},  # 5 logout attempts per minute
+    "/api/v1/projects/generate": {"requests": 10, "window": 60},  # 10 Excel generations per minute
+    "/health": {"requests": 200, "window": 60},  # High limit for health checks
+}
+
+
+class RateLimitMiddleware:
+    """
+    Enhanced rate limiting middleware with account lockout and progressive delays.
+
+    Pure ASGI middleware; request logs, failures and lockouts are kept in a
+    pluggable backend (in-memory by default, Redis to share limits between
+    workers).
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        default_requests: int = 100,
+        default_window: int = 60,
+        backend: Optional[RateLimitBackend] = None,
+        endpoint_limits: Optional[Dict[str, Dict[str, int]]] = None,
+    ):
+        self.app = app
         self.default_requests = default_requests
         self.default_window = default_window
+        self.backend = backend or MemoryRateLimitBackend()
 
-        # Rate limit storage: {identifier: deque of timestamps}
-        self.requests: Dict[str, deque] = defaultdict(deque)
-
-        # Per-endpoint rate limits with enhanced security
-        self.endpoint_limits = {
-            "/api/v1/auth/login": {"requests": 3, "window": 60},  # 3 login attempts per minute
-            "/api/v1/auth/register": {"requests": 2, "window": 300},  # 2 registrations per 5 minutes
-            "/api/v1/auth/refresh": {"requests": 10, "window": 60},  # 10 token refreshes per minute
-            "/api/v1/auth/logout": {"requests": 5, "window": 60},  # 5 logout attempts per minute
-            "/api/v1/projects/generate": {"requests": 10, "window": 60},  # 10 Excel generations per minute
-            "/health": {"requests": 200, "window": 60},  # High limit for health checks
-        }
+        self.endpoint_limits = (
+            DEFAULT_ENDPOINT_LIMITS if endpoint_limits is None else endpoint_limits
+        )
+        self._route_limits = RouteLimitMatcher(
+            self.endpoint_limits,
+            {"requests": self.default_requests, "window": self.default_window},
+        )
 
         # Account lockout configuration
         self.max_failed_attempts = 5
@@ -59,15 +86,6 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         if hasattr(request.state, "user_id") and request.state.user_id:
             return f"user:{request.state.user_id}"
 
-        # For auth endpoints, use email if available in request body
-        if request.url.path.startswith("/api/v1/auth/"):
-            try:
-                # This would need to be extracted from request body in a real implementation
-                # For now, we'll use IP-based identification for auth endpoints
-                pass
-            except:
-                pass
-
         # Fall back to IP address
         forwarded_for = request.headers.get("x-forwarded-for")
         if forwarded_for:
@@ -79,71 +97,63 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
 
     def _get_rate_limit(self, path: str) -> Dict[str, int]:
         """Get rate limit configuration for a path."""
-        for endpoint_path, limits in self.endpoint_limits.items():
-            if path.startswith(endpoint_path):
-                return limits
+        return self._route_limits.match(path)
+
+    async def _check(self, identifier: str, limits: Dict[str, int], path: str):
+        """
+        Check and record a request.
+
+        Returns:
+            Tuple of (RateLimitDecision, progressive delay in seconds)
+        """
+        decision = await self.backend.check(
+            identifier,
+            limits["requests"],
+            limits["window"],
+            auth=path.startswith("/api/v1/auth/"),
+            max_failed_attempts=self.max_failed_attempts,
+            lockout_duration=self.lockout_duration,
+        )
 
-        return {"requests": self.default_requests, "window": self.default_window}
+        if not decision.limited or not decision.count:
+            # Allowed, or rejected by an existing lockout
+            if decision.locked_until:
+                logger.warning("Account locked out", identifier=identifier)
+            return decision, 0
 
-    def _is_rate_limited(self, identifier: str, limits: Dict[str, int], path: str) -> tuple[bool, int]:
+        # Calculate progressive delay for repeated violations
+        violation_count = decision.count - limits["requests"] + 1
+        delay = min(self.progressive_delay_base ** violation_count, 60)  # Max 60 seconds
+
+        if decision.locked_until:
+            logger.warning(
+                "Account locked due to excessive failures",
+                identifier=identifier,
+                max_attempts=self.max_failed_attempts,
+            )
+
+        return decision, delay
+
+    async def _is_rate_limited(self, identifier: str, limits: Dict[str, int], path: str) -> tuple[bool, int]:
         """Check if identifier is rate limited and return progressive delay."""
-        now = time.time()
-        window_start = now - limits["window"]
-
-        # Clean old requests outside the window
-        request_times = self.requests[identifier]
-        while request_times and request_times[0] < window_start:
-            request_times.popleft()
-
-        # Check account lockout for auth endpoints
-        if path.startswith("/api/v1/auth/"):
-            if identifier in account_lockouts:
-                if datetime.now() < account_lockouts[identifier]:
-                    logger.warning("Account locked out", identifier=identifier)
-                    return True, 0
-                else:
-                    # Lockout expired, remove it
-                    del account_lockouts[identifier]
-                    failed_attempts[identifier] = 0
-
-        # Check if we've exceeded the limit
-        if len(request_times) >= limits["requests"]:
-            # Calculate progressive delay for repeated violations
-            violation_count = len(request_times) - limits["requests"] + 1
-            delay = min(self.progressive_delay_base ** violation_count, 60)  # Max 60 seconds
-
-            # For auth endpoints, track failed attempts
-            if path.startswith("/api/v1/auth/"):
-                failed_attempts[identifier] += 1
-                if failed_attempts[identifier] >= self.max_failed_attempts:
-                    account_lockouts[identifier] = datetime.now() + timedelta(seconds=self.lockout_duration)
-                    logger.warning(
-                        "Account locked due to excessive failures",
-                        identifier=identifier,
-                        attempts=failed_attempts[identifier]
-                    )
-
-            return True, delay
-
-        # Add current request
-        request_times.append(now)
-
-        # Reset failed attempts on successful requests to non-auth endpoints
-        if not path.startswith("/api/v1/auth/") and identifier in failed_attempts:
-            failed_attempts[identifier] = 0
-
-        return False, 0
+        decision, delay = await self._check(identifier, limits, path)
+        return decision.limited, delay
 
-    async def dispatch(self, request: Request, call_next):
-        """Process rate limiting for each request."""
-        path = request.url.path
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Process rate limiting for each HTTP request."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
+        path = scope["path"]
         identifier = self._get_client_identifier(request)
         limits = self._get_rate_limit(path)
 
         # Check rate limit and get progressive delay
-        is_limited, delay = self._is_rate_limited(identifier, limits, path)
+        decision, delay = await self._check(identifier, limits, path)
 
-        if is_limited:
+        if decision.limited:
             logger.warning(
                 "Rate limit exceeded",
                 identifier=identifier,
@@ -157,12 +167,11 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                 await asyncio.sleep(delay)
 
             error_message = "Rate limit exceeded. Please try again later."
-            if identifier in account_lockouts:
-                lockout_time = account_lockouts[identifier]
-                minutes_remaining = int((lockout_time - datetime.now()).total_seconds() / 60)
+            if decision.locked_until:
+                minutes_remaining = int((decision.locked_until - time.time()) / 60)
                 error_message = f"Account temporarily locked. Try again in {minutes_remaining} minutes."
 
-            return Response(
+            response = Response(
                 content=f'{{"detail": "{error_message}"}}',
                 status_code=429,
                 headers={
@@ -173,17 +182,21 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                     "X-Progressive-Delay": str(delay),
                 }
             )
-
-        # Process request
-        response = await call_next(request)
+            await response(scope, receive, send)
+            return
 
         # Add rate limit headers to response
-        remaining = max(0, limits["requests"] - len(self.requests[identifier]))
-        response.headers["X-RateLimit-Limit"] = str(limits["requests"])
-        response.headers["X-RateLimit-Remaining"] = str(remaining)
-        response.headers["X-RateLimit-Window"] = str(limits["window"])
+        remaining = max(0, limits["requests"] - decision.count)
 
-        return response
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers["X-RateLimit-Limit"] = str(limits["requests"])
+                headers["X-RateLimit-Remaining"] = str(remaining)
+                headers["X-RateLimit-Window"] = str(limits["window"])
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
 
 
 class SecurityHeadersMiddleware(BaseHTTPMiddleware):
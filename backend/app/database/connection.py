@@ -1,14 +1,25 @@
 """
 Database connection management for SprintForge.
+
+Writes go to the primary engine through ``get_db``. Read-only endpoints
+use ``get_read_db``, which hands out sessions on the read replicas in
+round-robin order, or on the primary when no replica is configured.
+Pool sizing comes from settings, and ``get_pool_stats`` reports each
+engine's pool usage.
 """
 
 import asyncio
-from typing import AsyncGenerator
+import itertools
+import time
+from typing import Any, AsyncGenerator, Dict, List
 
 import asyncpg
 import structlog
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
-from sqlalchemy.orm import declarative_base
+from sqlalchemy import event
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.orm import Session, declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.core.config import get_settings
 
@@ -20,6 +31,38 @@ Base = declarative_base()
 # Global variables for connection management
 _engine = None
 _session_factory = None
+_read_engines: List[AsyncEngine] = []
+_read_session_factories: List[async_sessionmaker] = []
+_read_counter = itertools.count()
+
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long checkouts wait for a connection."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_count = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            waited = time.perf_counter() - started
+            self.wait_count += 1
+            self.wait_total += waited
+            self.wait_max = max(self.wait_max, waited)
+
+
+class ReadOnlySession(Session):
+    """Session for replica reads; flushing changes is an error."""
+
+
+@event.listens_for(ReadOnlySession, "before_flush")
+def _reject_flush(session, flush_context, instances):
+    raise InvalidRequestError("Read-only session cannot write; use get_db for writes")
 
 
 def get_database_url() -> str:
@@ -28,26 +71,51 @@ def get_database_url() -> str:
     return settings.database_url
 
 
+def get_read_replica_urls() -> List[str]:
+    """Get read replica URLs from settings."""
+    settings = get_settings()
+    return list(settings.database_read_replica_urls)
+
+
+def _build_engine(database_url: str, read_only: bool = False) -> AsyncEngine:
+    """Create an async engine with the configured pool settings."""
+    settings = get_settings()
+
+    # SQLite doesn't support pool configuration
+    engine_kwargs: Dict[str, Any] = {"echo": settings.debug}
+    if "postgresql" in database_url:
+        engine_kwargs.update({
+            "poolclass": TimedQueuePool,
+            "pool_size": settings.database_pool_size,
+            "max_overflow": settings.database_max_overflow,
+            "pool_timeout": settings.database_pool_timeout,
+            "pool_pre_ping": True,
+            "pool_recycle": settings.database_pool_recycle,
+        })
+        if read_only:
+            engine_kwargs["execution_options"] = {"postgresql_readonly": True}
+
+    return create_async_engine(database_url, **engine_kwargs)
+
+
 def create_engine():
     """Create SQLAlchemy async engine."""
     global _engine
     if _engine is None:
-        database_url = get_database_url()
-        settings = get_settings()
+        _engine = _build_engine(get_database_url())
 
-        # SQLite doesn't support pool configuration
-        engine_kwargs = {"echo": settings.debug}
-        if "postgresql" in database_url:
-            engine_kwargs.update({
-                "pool_size": 20,
-                "max_overflow": 30,
-                "pool_pre_ping": True,
-                "pool_recycle": 3600,
-            })
+    return _engine
 
-        _engine = create_async_engine(database_url, **engine_kwargs)
 
-    return _engine
+def create_read_engines() -> List[AsyncEngine]:
+    """Create the read replica engines (empty when none are configured)."""
+    global _read_engines
+    if not _read_engines:
+        _read_engines = [
+            _build_engine(url, read_only=True) for url in get_read_replica_urls()
+        ]
+
+    return _read_engines
 
 
 def get_session_factory():
@@ -66,6 +134,31 @@ def get_session_factory():
     return _session_factory
 
 
+def get_read_session_factory() -> async_sessionmaker:
+    """
+    Get the session factory for the next read-only session.
+
+    Replicas are used in round-robin order; without replicas the
+    primary serves reads.
+    """
+    global _read_session_factories
+    if not _read_session_factories:
+        engines = create_read_engines() or [create_engine()]
+        _read_session_factories = [
+            async_sessionmaker(
+                engine,
+                class_=AsyncSession,
+                sync_session_class=ReadOnlySession,
+                autoflush=False,
+                autocommit=False,
+                expire_on_commit=False,
+            )
+            for engine in engines
+        ]
+
+    return _read_session_factories[next(_read_counter) % len(_read_session_factories)]
+
+
 async def get_database_session() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency to provide database session to FastAPI endpoints.
@@ -90,6 +183,60 @@ async def get_database_session() -> AsyncGenerator[AsyncSession, None]:
 get_db = get_database_session
 
 
+async def get_read_database_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency to provide a read-only database session.
+
+    Use for endpoints that only read, such as analytics and history
+    views. Reads may lag the primary by the replication delay.
+
+    Usage:
+        @app.get("/example")
+        async def example(db: AsyncSession = Depends(get_read_db)):
+            # Read with db here
+    """
+    session_factory = get_read_session_factory()
+    async with session_factory() as session:
+        try:
+            yield session
+        finally:
+            # Nothing is written, so end the read transaction without committing
+            await session.rollback()
+            await session.close()
+
+
+get_read_db = get_read_database_session
+
+
+def _pool_stats(engine: AsyncEngine) -> Dict[str, Any]:
+    """Report the usage of one engine's connection pool."""
+    pool = engine.pool
+    stats: Dict[str, Any] = {"pool": type(pool).__name__}
+    for name in ("size", "checkedin", "checkedout", "overflow"):
+        if hasattr(pool, name):
+            stats[name] = getattr(pool, name)()
+    if isinstance(pool, TimedQueuePool):
+        stats["wait_count"] = pool.wait_count
+        stats["wait_avg_ms"] = (
+            pool.wait_total / pool.wait_count * 1000 if pool.wait_count else 0.0
+        )
+        stats["wait_max_ms"] = pool.wait_max * 1000
+    return stats
+
+
+def get_pool_stats() -> Dict[str, Dict[str, Any]]:
+    """
+    Report connection pool usage of the primary and each read replica.
+
+    Returns:
+        Dict of engine name ("primary", "replica_0", ...) to pool statistics
+    """
+    stats = {"primary": _pool_stats(create_engine())}
+    for i, engine in enumerate(create_read_engines()):
+        stats[f"replica_{i}"] = _pool_stats(engine)
+    return stats
+
+
 async def check_database_connection() -> bool:
     """Check if database connection is working."""
     try:
@@ -117,13 +264,18 @@ async def get_raw_connection() -> asyncpg.Connection:
 
 async def close_database_connections():
     """Close all database connections (for application shutdown)."""
-    global _engine, _session_factory
+    global _engine, _session_factory, _read_engines, _read_session_factories
 
     if _engine:
         await _engine.dispose()
         _engine = None
 
+    for engine in _read_engines:
+        await engine.dispose()
+    _read_engines = []
+
     _session_factory = None
+    _read_session_factories = []
     logger.info("Database connections closed")
 
 
@@ -0,0 +1,152 @@
+"""
+Keyset (cursor) pagination.
+
+Instead of an offset, a page request carries the cursor of the last row
+of the previous page, and the next page starts strictly after that row
+in (sort column, id) order. Every page is an index range scan however
+deep it is, and rows inserted in the meantime do not shift later pages.
+
+Cursors are opaque URL-safe strings. They record the sort they were
+issued for, and using one with a different sort is an error.
+"""
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import Select, and_, or_
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a cursor is malformed or was issued for another sort."""
+
+
+@dataclass(frozen=True)
+class Cursor:
+    """Position after which the next page starts."""
+
+    sort: str
+    value: Any
+    id: Any
+
+
+def _dump(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, UUID):
+        return {"uuid": str(value)}
+    return value
+
+
+def _load(value: Any) -> Any:
+    if isinstance(value, dict):
+        if "dt" in value:
+            return datetime.fromisoformat(value["dt"])
+        if "uuid" in value:
+            return UUID(value["uuid"])
+    return value
+
+
+def encode_cursor(sort: str, value: Any, row_id: Any) -> str:
+    """
+    Encode the position of a row.
+
+    Args:
+        sort: Sort the page was listed with (e.g. "-created_at")
+        value: The row's value of the sort column
+        row_id: The row's primary key
+
+    Returns:
+        Opaque cursor string
+    """
+    payload = json.dumps(
+        {"s": sort, "v": _dump(value), "i": _dump(row_id)}, separators=(",", ":")
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: str) -> Cursor:
+    """
+    Decode a cursor issued for ``sort``.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed or for another sort
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        decoded = Cursor(payload["s"], _load(payload["v"]), _load(payload["i"]))
+    except (binascii.Error, ValueError, KeyError, TypeError) as e:
+        raise InvalidCursorError("Invalid cursor") from e
+    if decoded.sort != sort:
+        raise InvalidCursorError("Cursor was issued for a different sort order")
+    return decoded
+
+
+def apply_keyset(
+    query: Select,
+    sort_column: Any,
+    id_column: Any,
+    desc: bool,
+    cursor: Optional[Cursor],
+) -> Select:
+    """
+    Order a query by (sort column, id) and start it after ``cursor``.
+
+    The id breaks ties so every row has a unique position.
+
+    Args:
+        query: Select to paginate
+        sort_column: Column the page is sorted by
+        id_column: Primary key column
+        desc: Sort in descending order
+        cursor: Position to continue after (None for the first page)
+
+    Returns:
+        Ordered, filtered select; apply the limit separately
+    """
+    if cursor is not None:
+        # Written out rather than as a row comparison so that SQLite and
+        # PostgreSQL both bind the values with the columns' types
+        if desc:
+            query = query.where(
+                and_(
+                    sort_column <= cursor.value,
+                    or_(sort_column < cursor.value, id_column < cursor.id),
+                )
+            )
+        else:
+            query = query.where(
+                and_(
+                    sort_column >= cursor.value,
+                    or_(sort_column > cursor.value, id_column > cursor.id),
+                )
+            )
+
+    if desc:
+        return query.order_by(sort_column.desc(), id_column.desc())
+    return query.order_by(sort_column.asc(), id_column.asc())
+
+
+def next_cursor(
+    rows: Sequence[Any], limit: int, sort: str, sort_attr: str, id_attr: str = "id"
+) -> Optional[str]:
+    """
+    Return the cursor continuing after a page, or None after a short page.
+
+    Args:
+        rows: Rows of the page, in order
+        limit: Page size the rows were fetched with
+        sort: Sort the page was listed with
+        sort_attr: Attribute holding the sort column's value
+        id_attr: Attribute holding the primary key
+    """
+    if not rows or len(rows) < limit:
+        return None
+    last = rows[-1]
+    return encode_cursor(sort, getattr(last, sort_attr), getattr(last, id_attr))
+
@@ -0,0 +1,479 @@
+"""Excel generation benchmark harness.
+
+Generates synthetic projects of increasing size with different feature
+combinations and measures, per scenario:
+
+- template: ExcelTemplateEngine.generate_template (wall time, tracemalloc
+  peak, output size)
+- workbook: ExcelGenerationService PERT task list, with the Monte Carlo
+  results sheet when that feature is on (wall time, peak, output size)
+- parse: ExcelParserService.parse_excel_file on that workbook (wall time,
+  peak)
+- formulas: every formula of each enabled feature's template
+  (app/excel/components/templates) rendered for every task row (wall
+  time, peak, cell count); skipped when no feature is enabled
+
+Feature flags change the synthetic input columns (dates, owners, status),
+add the Monte Carlo results sheet to the workbook, and select the
+formula templates rendered. ExcelTemplateEngine itself only records the
+flags in its sync metadata, so template metrics differ between combos
+only through the input columns.
+
+Results are written as JSON and can be compared against a stored baseline
+with per-metric regression thresholds.
+
+Usage:
+    python -m app.excel.benchmark --sizes 100 1000 --output results.json \\
+        --baseline tests/excel/benchmark_baseline.json
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+BENCHMARK_VERSION = 1
+
+DEFAULT_SIZES: Tuple[int, ...] = (100, 1_000, 10_000, 50_000)
+
+FEATURES: Tuple[str, ...] = ("gantt_chart", "monte_carlo", "resource_leveling", "earned_value")
+
+# Formula template file (app/excel/components/templates) for each feature
+FEATURE_TEMPLATES: Dict[str, str] = {
+    "gantt_chart": "gantt",
+    "monte_carlo": "monte_carlo",
+    "resource_leveling": "resources",
+    "earned_value": "earned_value",
+}
+
+# First column after the project plan's columns; formula parameters are
+# pointed at consecutive columns from here
+FORMULA_FIRST_COLUMN = 10
+
+# Feature combinations benchmarked by default
+DEFAULT_COMBOS: Dict[str, Tuple[str, ...]] = {
+    "basic": (),
+    "gantt": ("gantt_chart",),
+    "monte_carlo": ("monte_carlo",),
+    "resources": ("resource_leveling",),
+    "earned_value": ("earned_value",),
+    "all": FEATURES,
+}
+
+# Allowed current/baseline ratio per metric kind before a regression is flagged
+DEFAULT_THRESHOLDS: Dict[str, float] = {
+    "wall_s": 1.5,
+    "peak_bytes": 1.25,
+    "size_bytes": 1.10,
+}
+
+# Timings below this are too noisy to compare
+MIN_COMPARABLE_WALL_S = 0.05
+
+
+@dataclass
+class ScenarioResult:
+    """Measurements for one (size, feature combo) scenario."""
+
+    scenario: str
+    tasks: int
+    features: List[str]
+    metrics: Dict[str, float] = field(default_factory=dict)
+
+
+@dataclass
+class Regression:
+    """A metric that exceeded its baseline threshold."""
+
+    scenario: str
+    metric: str
+    baseline: float
+    current: float
+    threshold: float
+
+    @property
+    def ratio(self) -> float:
+        """Current value relative to the baseline."""
+        return self.current / self.baseline if self.baseline else float("inf")
+
+
+def scenario_name(size: int, combo: str) -> str:
+    """Stable scenario key used in results and baselines."""
+    return f"{size}-{combo}"
+
+
+def synthetic_tasks(count: int, features: Sequence[str] = ()) -> List[Dict[str, Any]]:
+    """
+    Build a deterministic synthetic project.
+
+    Every task depends on its predecessor, and every tenth task also on the
+    task ten rows earlier, so dependency strings and graphs are realistic
+    without randomness. Feature flags add the columns those features use.
+
+    Args:
+        count: Number of tasks
+        features: Enabled feature names
+
+    Returns:
+        Task dicts usable by both the template engine and the PERT workbook
+    """
+    start = date(2025, 1, 6)
+    tasks: List[Dict[str, Any]] = []
+    for i in range(1, count + 1):
+        deps = []
+        if i > 1:
+            deps.append(f"T{i - 1}")
+        if i > 10 and i % 10 == 0:
+            deps.append(f"T{i - 10}")
+
+        most_likely = float(1 + i % 9)
+        task: Dict[str, Any] = {
+            "id": f"T{i}",
+            "task_id": f"T{i}",
+            "name": f"Task {i}",
+            "task_name": f"Task {i}",
+            "duration": most_likely,
+            "optimistic": most_likely * 0.5,
+            "most_likely": most_likely,
+            "pessimistic": most_likely * 2,
+            "dependencies": deps,
+            "notes": "",
+        }
+        if "gantt_chart" in features:
+            task_start = start + timedelta(days=i % 365)
+            task["start_date"] = task_start.isoformat()
+            task["end_date"] = (task_start + timedelta(days=int(most_likely))).isoformat()
+        if "resource_leveling" in features:
+            task["owner"] = f"member{i % 12}"
+        if "earned_value" in features:
+            task["status"] = ("Not Started", "In Progress", "Done")[i % 3]
+            task["sprint"] = f"25.1.{1 + i // 50}"
+        tasks.append(task)
+    return tasks
+
+
+def _measure(fn: Callable[[], Any], measure_memory: bool) -> Tuple[Any, float, int]:
+    """
+    Run fn and return (result, wall seconds, tracemalloc peak bytes).
+
+    Wall time is measured without tracemalloc, which slows allocation
+    heavily; when memory is measured fn runs a second time under tracing.
+    """
+    started = time.perf_counter()
+    result = fn()
+    wall = time.perf_counter() - started
+
+    peak = 0
+    if measure_memory:
+        tracemalloc.start()
+        try:
+            tracemalloc.reset_peak()
+            fn()
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    return result, wall, peak
+
+
+def render_feature_formulas(size: int, features: Sequence[str]) -> int:
+    """
+    Render every formula of the enabled features' templates for all task rows.
+
+    Each formula parameter is pointed at its own row-relative column
+    (e.g. ``J{row}``), as a worksheet generator would.
+
+    Args:
+        size: Number of task rows (rendered for rows 2..size + 1)
+        features: Enabled feature names
+
+    Returns:
+        Number of formula cells rendered
+    """
+    from openpyxl.utils import get_column_letter
+
+    from app.excel.components.formula_compiler import compile_formula
+    from app.excel.components.templates.formula_loader import FormulaTemplateLoader
+
+    loader = FormulaTemplateLoader()
+    cells = 0
+    for feature in features:
+        template_name = FEATURE_TEMPLATES.get(feature)
+        if template_name is None:
+            continue
+        loader.load_template(template_name)
+        for name, spec in loader.get_template_data(template_name).items():
+            if name.startswith("_") or not isinstance(spec, dict) or "formula" not in spec:
+                continue
+            compiled = compile_formula(spec["formula"])
+            params = {
+                parameter: f"{get_column_letter(FORMULA_FIRST_COLUMN + index)}{{row}}"
+                for index, parameter in enumerate(sorted(compiled.parameters))
+            }
+            cells += len(compiled.render_rows(2, size + 1, params, strict=False))
+    return cells
+
+
+def run_scenario(
+    size: int, combo: str, features: Sequence[str], measure_memory: bool = True
+) -> ScenarioResult:
+    """
+    Benchmark one scenario.
+
+    Args:
+        size: Number of synthetic tasks
+        combo: Feature combination name
+        features: Enabled feature names
+        measure_memory: Whether to record tracemalloc peaks
+
+    Returns:
+        ScenarioResult with template, workbook and parse metrics, plus
+        formula metrics when any feature is enabled
+    """
+    # Imported here so ``--help`` stays fast and app.excel does not depend on services
+    from app.excel.engine import ExcelTemplateEngine, ProjectConfig
+    from app.services.excel_generation_service import ExcelGenerationService
+    from app.services.excel_parser_service import ExcelParserService
+    from app.services.simulation_service import SimulationResult
+
+    tasks = synthetic_tasks(size, features)
+    feature_flags = {name: name in features for name in FEATURES}
+    result = ScenarioResult(
+        scenario=scenario_name(size, combo), tasks=size, features=list(features)
+    )
+
+    engine = ExcelTemplateEngine()
+    config = ProjectConfig(
+        project_id=f"bench_{size}_{combo}",
+        project_name=f"Benchmark {size} {combo}",
+        features=feature_flags,
+        tasks=tasks,
+    )
+    template_bytes, wall, peak = _measure(
+        lambda: engine.generate_template(config), measure_memory
+    )
+    result.metrics.update(
+        template_wall_s=wall,
+        template_peak_bytes=peak,
+        template_size_bytes=len(template_bytes),
+    )
+
+    generation = ExcelGenerationService()
+    pert_tasks = [
+        dict(task, dependencies=",".join(task["dependencies"])) for task in tasks
+    ]
+
+    def build_workbook() -> bytes:
+        workbook = generation.create_template_workbook(
+            project_name=config.project_name, tasks=pert_tasks
+        )
+        if "monte_carlo" in features:
+            generation.add_monte_carlo_results_sheet(
+                workbook,
+                SimulationResult(
+                    project_duration_days=float(size),
+                    confidence_intervals={10: size * 0.9, 50: float(size), 90: size * 1.2},
+                    mean_duration=float(size),
+                    median_duration=float(size),
+                    std_deviation=size * 0.1,
+                    iterations_run=10000,
+                    simulation_date=datetime(2025, 1, 6),
+                    task_count=size,
+                ),
+                pert_tasks,
+                critical_path=[task["task_id"] for task in pert_tasks[:50]],
+            )
+        generation.apply_formatting(workbook)
+        return generation.save_workbook_to_bytes(workbook)
+
+    workbook_bytes, wall, peak = _measure(build_workbook, measure_memory)
+    result.metrics.update(
+        workbook_wall_s=wall,
+        workbook_peak_bytes=peak,
+        workbook_size_bytes=len(workbook_bytes),
+    )
+
+    parser = ExcelParserService()
+    parsed, wall, peak = _measure(
+        lambda: parser.parse_excel_file(workbook_bytes, "benchmark.xlsx"), measure_memory
+    )
+    if len(parsed.tasks) != size:
+        raise RuntimeError(
+            f"Parse-back returned {len(parsed.tasks)} tasks, expected {size}"
+        )
+    result.metrics.update(parse_wall_s=wall, parse_peak_bytes=peak)
+
+    if any(feature in FEATURE_TEMPLATES for feature in features):
+        cells, wall, peak = _measure(
+            lambda: render_feature_formulas(size, features), measure_memory
+        )
+        result.metrics.update(
+            formulas_wall_s=wall, formulas_peak_bytes=peak, formula_cells=cells
+        )
+
+    return result
+
+
+def run_benchmarks(
+    sizes: Sequence[int] = DEFAULT_SIZES,
+    combos: Optional[Dict[str, Sequence[str]]] = None,
+    measure_memory: bool = True,
+    progress: Optional[Callable[[ScenarioResult], None]] = None,
+) -> Dict[str, Any]:
+    """
+    Run the benchmark matrix.
+
+    Args:
+        sizes: Task counts to benchmark
+        combos: Feature combination name to features (default: DEFAULT_COMBOS)
+        measure_memory: Whether to record tracemalloc peaks
+        progress: Optional callback invoked after each scenario
+
+    Returns:
+        JSON-serializable report
+    """
+    combos = DEFAULT_COMBOS if combos is None else combos
+    results = []
+    for size in sizes:
+        for combo, features in combos.items():
+            scenario = run_scenario(size, combo, features, measure_memory)
+            results.append(scenario)
+            if progress:
+                progress(scenario)
+
+    return {
+        "version": BENCHMARK_VERSION,
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": [asdict(result) for result in results],
+    }
+
+
+def _metric_kind(metric: str) -> Optional[str]:
+    """Map a metric name to its threshold kind."""
+    for kind in DEFAULT_THRESHOLDS:
+        if metric.endswith(kind):
+            return kind
+    return None
+
+
+def compare_to_baseline(
+    report: Dict[str, Any],
+    baseline: Dict[str, Any],
+    thresholds: Optional[Dict[str, float]] = None,
+) -> List[Regression]:
+    """
+    Compare a benchmark report against a baseline report.
+
+    Scenarios or metrics missing from the baseline are skipped, as are
+    timings too short to compare reliably and memory metrics recorded
+    without tracemalloc.
+
+    Args:
+        report: Output of run_benchmarks
+        baseline: Previously stored report
+        thresholds: Allowed current/baseline ratio per metric kind
+                    (``wall_s``, ``peak_bytes``, ``size_bytes``)
+
+    Returns:
+        List of regressions (empty if within thresholds)
+    """
+    limits = {**DEFAULT_THRESHOLDS, **(thresholds or {})}
+    baseline_by_scenario = {
+        result["scenario"]: result["metrics"] for result in baseline.get("results", [])
+    }
+
+    regressions: List[Regression] = []
+    for result in report.get("results", []):
+        base_metrics = baseline_by_scenario.get(result["scenario"])
+        if base_metrics is None:
+            continue
+        for metric, current in result["metrics"].items():
+            kind = _metric_kind(metric)
+            base = base_metrics.get(metric)
+            if kind is None or not base or not current:
+                continue
+            if kind == "wall_s" and base < MIN_COMPARABLE_WALL_S:
+                continue
+            if current > base * limits[kind]:
+                regressions.append(
+                    Regression(
+                        scenario=result["scenario"],
+                        metric=metric,
+                        baseline=base,
+                        current=current,
+                        threshold=limits[kind],
+                    )
+                )
+    return regressions
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Command-line entry point; returns a process exit code."""
+    parser = argparse.ArgumentParser(description="Benchmark Excel generation")
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES),
+        help="Task counts to benchmark",
+    )
+    parser.add_argument(
+        "--combos", nargs="+", choices=sorted(DEFAULT_COMBOS), default=list(DEFAULT_COMBOS),
+        help="Feature combinations to benchmark",
+    )
+    parser.add_argument("--output", type=Path, help="Write the JSON report here")
+    parser.add_argument("--baseline", type=Path, help="Baseline report to compare against")
+    parser.add_argument("--no-memory", action="store_true", help="Skip tracemalloc runs")
+    for kind, default in DEFAULT_THRESHOLDS.items():
+        parser.add_argument(
+            f"--{kind.replace('_', '-')}-threshold", type=float, default=default,
+            dest=f"{kind}_threshold",
+            help=f"Allowed current/baseline ratio for *_{kind} (default {default})",
+        )
+    args = parser.parse_args(argv)
+
+    def progress(result: ScenarioResult) -> None:
+        metrics = result.metrics
+        print(
+            f"{result.scenario:>22}  template {metrics['template_wall_s']:7.3f}s  "
+            f"workbook {metrics['workbook_wall_s']:7.3f}s  "
+            f"parse {metrics['parse_wall_s']:7.3f}s  "
+            f"size {metrics['template_size_bytes'] / 1024:9.1f} KiB",
+            flush=True,
+        )
+
+    report = run_benchmarks(
+        sizes=args.sizes,
+        combos={name: DEFAULT_COMBOS[name] for name in args.combos},
+        measure_memory=not args.no_memory,
+        progress=progress,
+    )
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"Report written to {args.output}")
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())
+        thresholds = {kind: getattr(args, f"{kind}_threshold") for kind in DEFAULT_THRESHOLDS}
+        regressions = compare_to_baseline(report, baseline, thresholds)
+        for regression in regressions:
+            print(
+                f"REGRESSION {regression.scenario} {regression.metric}: "
+                f"{regression.baseline:.4g} -> {regression.current:.4g} "
+                f"(x{regression.ratio:.2f}, limit x{regression.threshold:.2f})"
+            )
+        if regressions:
+            return 1
+        print("No regressions against baseline")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
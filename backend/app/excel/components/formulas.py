@@ -5,13 +5,13 @@ with parameter substitution and validation.
 """
 
 import json
-import re
 from pathlib import Path
 from typing import Dict, Any, Optional, List
-from string import Template
 
 import structlog
 
+from app.excel.components.formula_compiler import CompiledFormula, compile_formula
+
 logger = structlog.get_logger(__name__)
 
 
@@ -21,6 +21,8 @@ class FormulaTemplate:
 
     Formula templates use Python string.Template syntax with parameter substitution.
     Templates are stored in JSON files and can be dynamically loaded and applied.
+    Each formula is compiled once into literal segments and parameter slots
+    (see formula_compiler), so applying it does not re-scan the string.
 
     Example template JSON:
         {
@@ -120,6 +122,73 @@ class FormulaTemplate:
             KeyError: If template name not found
             ValueError: If required parameters are missing
         """
+        compiled = self._compile(template_name, parameters)
+
+        try:
+            return compiled.render(parameters)
+        except KeyError as e:
+            raise ValueError(
+                f"Missing required parameter for template '{template_name}': {e}"
+            )
+
+    def render_rows(
+        self, template_name: str, start_row: int, end_row: int, **parameters: Any
+    ) -> List[str]:
+        """
+        Render a formula template for every row in a range in one call.
+
+        Parameter values containing ``{row}`` are expanded per row (e.g.
+        ``task_start="D{row}"``); list or tuple values supply one value per
+        row.
+
+        Args:
+            template_name: Name of the template to apply
+            start_row: First row number
+            end_row: Last row number (inclusive)
+            **parameters: Template parameters as keyword arguments
+
+        Returns:
+            List of formulas, one per row
+
+        Raises:
+            KeyError: If template name not found
+            ValueError: If required parameters are missing or the range is invalid
+        """
+        compiled = self._compile(template_name, parameters)
+
+        try:
+            formulas = compiled.render_rows(start_row, end_row, parameters)
+        except KeyError as e:
+            raise ValueError(
+                f"Missing required parameter for template '{template_name}': {e}"
+            )
+
+        logger.debug(
+            "Template rendered for rows",
+            template_name=template_name,
+            start_row=start_row,
+            end_row=end_row,
+        )
+
+        return formulas
+
+    def _compile(
+        self, template_name: str, parameters: Dict[str, Any]
+    ) -> CompiledFormula:
+        """
+        Look up, compile and parameter-check a template.
+
+        Args:
+            template_name: Name of the template
+            parameters: Provided parameters
+
+        Returns:
+            CompiledFormula for the template
+
+        Raises:
+            KeyError: If template name not found
+            ValueError: If the formula is empty or parameters are missing
+        """
         if template_name not in self.templates:
             available = ", ".join(self.templates.keys())
             raise KeyError(
@@ -132,26 +201,12 @@ class FormulaTemplate:
         if not formula_template:
             raise ValueError(f"Template '{template_name}' has no formula defined")
 
+        compiled = compile_formula(formula_template)
+
         # Validate required parameters
         self._validate_parameters(template_name, template_data, parameters)
 
-        # Apply parameter substitution using string.Template
-        try:
-            template = Template(formula_template)
-            formula = template.substitute(parameters)
-
-            logger.debug(
-                "Template applied",
-                template_name=template_name,
-                parameters=parameters,
-            )
-
-            return formula
-
-        except KeyError as e:
-            raise ValueError(
-                f"Missing required parameter for template '{template_name}': {e}"
-            )
+        return compiled
 
     def _validate_parameters(
         self, template_name: str, template_data: Dict[str, Any], provided: Dict[str, str]
@@ -167,15 +222,12 @@ class FormulaTemplate:
         Raises:
             ValueError: If required parameters are missing
         """
-        required_params = template_data.get("parameters", {})
-
-        if not required_params:
-            # Extract parameters from formula using regex if not documented
-            formula = template_data.get("formula", "")
-            required_params = self._extract_parameters(formula)
+        required_params = template_data.get("parameters") or compile_formula(
+            template_data.get("formula", "")
+        ).parameters
 
         # Check for missing parameters
-        missing = set(required_params.keys()) - set(provided.keys())
+        missing = set(required_params) - set(provided)
 
         if missing:
             raise ValueError(
@@ -192,12 +244,7 @@ class FormulaTemplate:
         Returns:
             Dict mapping parameter names to descriptions (empty strings)
         """
-        # Find all $parameter_name patterns
-        pattern = r"\$([a-zA-Z_][a-zA-Z0-9_]*)"
-        matches = re.findall(pattern, formula)
-
-        # Return unique parameters
-        return {param: "" for param in set(matches)}
+        return {param: "" for param in compile_formula(formula).parameters}
 
     def get_template_info(self, template_name: str) -> Dict[str, Any]:
         """
@@ -7,7 +7,9 @@ Provides templating system for Excel formulas with parameter substitution.
 
 import json
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
+
+from app.excel.components.formula_compiler import compile_formula
 
 
 class FormulaTemplateLoader:
@@ -24,6 +26,8 @@ class FormulaTemplateLoader:
         """Initialize the formula template loader."""
         self.templates: Dict[str, Dict[str, Any]] = {}
         self.template_dir = Path(__file__).parent
+        # formula name -> formula config, first loaded template wins
+        self._formula_index: Dict[str, Dict[str, Any]] = {}
 
     def load_template(self, template_name: str) -> None:
         """
@@ -44,6 +48,19 @@ class FormulaTemplateLoader:
         with open(template_path, 'r') as f:
             self.templates[template_name] = json.load(f)
 
+        self._rebuild_index()
+
+    def _rebuild_index(self) -> None:
+        """Rebuild the formula name index and precompile formulas."""
+        index: Dict[str, Dict[str, Any]] = {}
+        for template_data in self.templates.values():
+            for name, config in template_data.items():
+                if name not in index and isinstance(config, dict):
+                    index[name] = config
+                    if isinstance(config.get("formula"), str):
+                        compile_formula(config["formula"])
+        self._formula_index = index
+
     def get_template_data(self, template_name: str) -> Dict[str, Any]:
         """
         Get the raw template data for a loaded template.
@@ -76,17 +93,62 @@ class FormulaTemplateLoader:
         Raises:
             ValueError: If formula not found in any loaded template
         """
-        # Search all loaded templates for the formula
-        for template_name, template_data in self.templates.items():
-            if formula_name in template_data:
-                formula_config = template_data[formula_name]
-                formula_template = formula_config.get("formula", "")
+        formula_template = self._get_formula(formula_name)
+        return self._substitute_parameters(formula_template, params)
+
+    def render_rows(
+        self, formula_name: str, start_row: int, end_row: int, **params
+    ) -> List[str]:
+        """
+        Apply parameters to a formula template for every row in a range.
+
+        Parameter values containing ``{row}`` are expanded per row (e.g.
+        ``optimistic="B{row}"``); list or tuple values supply one value per
+        row. Like apply_template, placeholders without a parameter are kept.
+
+        Args:
+            formula_name: Name of the formula in the template
+            start_row: First row number
+            end_row: Last row number (inclusive)
+            **params: Parameters to substitute in the formula
+
+        Returns:
+            List of formula strings, one per row
+
+        Raises:
+            ValueError: If formula not found or the row range is invalid
+        """
+        formula_template = self._get_formula(formula_name)
+        return compile_formula(formula_template).render_rows(
+            start_row, end_row, params, strict=False
+        )
+
+    def _get_formula(self, formula_name: str) -> str:
+        """
+        Find a formula template string across loaded templates.
+
+        Args:
+            formula_name: Name of the formula
+
+        Returns:
+            Formula template string
 
-                # Substitute parameters
-                formula = self._substitute_parameters(formula_template, params)
-                return formula
+        Raises:
+            ValueError: If formula not found in any loaded template
+        """
+        formula_config = self._formula_index.get(formula_name)
+        if formula_config is None:
+            # Fall back to a scan in case templates were modified directly
+            for template_data in self.templates.values():
+                if formula_name in template_data:
+                    formula_config = template_data[formula_name]
+                    break
+            else:
+                raise ValueError(
+                    f"Formula '{formula_name}' not found in any loaded template"
+                )
 
-        raise ValueError(f"Formula '{formula_name}' not found in any loaded template")
+        return formula_config.get("formula", "")
 
     def _substitute_parameters(self, template: str, params: Dict[str, str]) -> str:
         """
@@ -98,19 +160,12 @@ class FormulaTemplateLoader:
 
         Returns:
             Formula with parameters substituted
-        """
-        result = template
-
-        # Sort parameters by length (longest first) to avoid substring conflicts
-        # e.g., replace $hours_per_point before $hours
-        sorted_params = sorted(params.items(), key=lambda x: len(x[0]), reverse=True)
 
-        # Replace each parameter
-        for param_name, param_value in sorted_params:
-            placeholder = f"${param_name}"
-            result = result.replace(placeholder, str(param_value))
-
-        return result
+        Placeholders are matched as whole identifiers, so $hours never
+        matches inside $hours_per_point. Placeholders without a value are
+        left unchanged.
+        """
+        return compile_formula(template).render(params, strict=False)
 
     def get_formula_metadata(self, formula_name: str) -> Optional[Dict[str, Any]]:
         """
@@ -7,7 +7,7 @@ with project management formulas, Gantt charts, and sync metadata.
 
 import hashlib
 import json
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
 from io import BytesIO
 from typing import Dict, Any, Optional, List
 from pathlib import Path
@@ -20,6 +20,13 @@ from openpyxl.worksheet.worksheet import Worksheet
 
 from app.excel.components.worksheets import WorksheetComponent
 from app.excel.components.formulas import FormulaTemplate
+from app.excel.sync import (
+    ROW_CHECKSUM_ALGORITHM,
+    ROW_CHECKSUM_HEADER_ROW,
+    ROW_CHECKSUM_START_ROW,
+    calculate_row_checksums,
+    normalize_task,
+)
 
 logger = structlog.get_logger(__name__)
 
@@ -34,12 +41,14 @@ class ProjectConfig:
         sprint_pattern: str = "YY.Q.#",
         features: Optional[Dict[str, bool]] = None,
         metadata: Optional[Dict[str, Any]] = None,
+        tasks: Optional[List[Dict[str, Any]]] = None,
     ):
         self.project_id = project_id
         self.project_name = project_name
         self.sprint_pattern = sprint_pattern
         self.features = features or {}
         self.metadata = metadata or {}
+        self.tasks = tasks or []
 
 
 class ExcelTemplateEngine:
@@ -99,11 +108,14 @@ class ExcelTemplateEngine:
             workbook = Workbook()
             workbook.remove(workbook.active)  # Remove default sheet
 
+            # Project tasks, or a sample task row for template demonstration
+            tasks = config.tasks or [self._sample_task()]
+
             # Generate main worksheet
-            self._create_main_worksheet(workbook, config)
+            self._create_main_worksheet(workbook, config, tasks)
 
             # Add sync metadata worksheet (hidden)
-            self._create_sync_metadata(workbook, config)
+            self._create_sync_metadata(workbook, config, tasks)
 
             # Save to bytes
             excel_bytes = self._save_to_bytes(workbook)
@@ -124,13 +136,16 @@ class ExcelTemplateEngine:
             )
             raise
 
-    def _create_main_worksheet(self, workbook: Workbook, config: ProjectConfig) -> None:
+    def _create_main_worksheet(
+        self, workbook: Workbook, config: ProjectConfig, tasks: List[Dict[str, Any]]
+    ) -> None:
         """
         Create the main project management worksheet.
 
         Args:
             workbook: openpyxl Workbook instance
             config: Project configuration
+            tasks: Task rows to write below the header
         """
         ws = workbook.create_sheet(title="Project Plan")
 
@@ -166,25 +181,103 @@ class ExcelTemplateEngine:
         # Freeze header row
         ws.freeze_panes = "A2"
 
-        # Add sample task row (for template demonstration)
-        ws.cell(row=2, column=1, value="T001")
-        ws.cell(row=2, column=2, value="Sample Task")
-        ws.cell(row=2, column=3, value=5)
-        ws.cell(row=2, column=4, value=datetime.now().date())
-        ws.cell(row=2, column=8, value="Not Started")
+        self._write_task_rows(ws, tasks)
 
         logger.debug("Main worksheet created", sheet_name=ws.title)
 
-    def _create_sync_metadata(self, workbook: Workbook, config: ProjectConfig) -> None:
+    def _write_task_rows(self, ws: Worksheet, tasks: List[Dict[str, Any]]) -> None:
+        """
+        Write project tasks to the main worksheet.
+
+        Values are written in their canonical sync form so the row checksums
+        embedded in _SYNC_META match an untouched row on re-upload.
+
+        Args:
+            ws: Main worksheet
+            tasks: Task dicts from project configuration
+        """
+        for task in tasks:
+            normalized = normalize_task(task)
+            ws.append([
+                normalized["id"],
+                normalized["name"] or None,
+                self._parse_number(normalized["duration"]),
+                self._parse_iso_date(normalized["start_date"]),
+                self._parse_iso_date(normalized["end_date"]),
+                normalized["dependencies"].replace(",", ", ") or None,
+                normalized["sprint"] or None,
+                normalized["status"] or None,
+                normalized["owner"] or None,
+            ])
+
+    @staticmethod
+    def _sample_task() -> Dict[str, Any]:
+        """
+        Build the sample task shown in templates without project tasks.
+
+        Returns:
+            Task dict for the demonstration row
+        """
+        return {
+            "id": "T001",
+            "name": "Sample Task",
+            "duration": 5,
+            "start_date": datetime.now().date().isoformat(),
+            "status": "Not Started",
+        }
+
+    @staticmethod
+    def _parse_number(value: str) -> Any:
+        """
+        Convert a canonical number string back to int or float.
+
+        Args:
+            value: Canonical number string (or any other text)
+
+        Returns:
+            int/float if the value parses, the original text otherwise, None if empty
+        """
+        if not value:
+            return None
+        try:
+            number = float(value)
+        except ValueError:
+            return value
+        return int(number) if number.is_integer() else number
+
+    @staticmethod
+    def _parse_iso_date(value: str) -> Any:
+        """
+        Convert a canonical ISO date string to a date for Excel cells.
+
+        Args:
+            value: ISO date string (or any other text)
+
+        Returns:
+            date if the value parses, the original text otherwise, None if empty
+        """
+        if not value:
+            return None
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            return value
+
+    def _create_sync_metadata(
+        self, workbook: Workbook, config: ProjectConfig, tasks: List[Dict[str, Any]]
+    ) -> None:
         """
         Create hidden metadata worksheet for sync functionality.
 
         This worksheet stores project metadata needed for two-way sync between
         Excel and the server, including project ID, version, and checksums.
+        Below the metadata it holds one content hash per task row, used to
+        skip untouched rows on re-upload.
 
         Args:
             workbook: openpyxl Workbook instance
             config: Project configuration
+            tasks: Task rows written to the main worksheet
         """
         ws = workbook.create_sheet(title="_SYNC_META")
 
@@ -200,8 +293,16 @@ class ExcelTemplateEngine:
             "sprint_pattern": config.sprint_pattern,
             "features": config.features,
             "checksum": self._calculate_checksum(config),
+            "row_checksums": {
+                "algorithm": ROW_CHECKSUM_ALGORITHM,
+                "start_row": ROW_CHECKSUM_START_ROW,
+                "count": 0,
+            },
         }
 
+        row_checksums = calculate_row_checksums(tasks)
+        metadata["row_checksums"]["count"] = len(row_checksums)
+
         # Write metadata as JSON in first cell (A1)
         ws["A1"] = json.dumps(metadata, indent=2)
         ws["A2"] = "DO NOT MODIFY - Required for sync functionality"
@@ -210,7 +311,21 @@ class ExcelTemplateEngine:
         ws["A1"].alignment = Alignment(wrap_text=True, vertical="top")
         ws["A2"].font = Font(italic=True, color="999999")
 
-        logger.debug("Sync metadata worksheet created", project_id=config.project_id)
+        # Per-row content hashes, one row per task (a single cell is limited
+        # to 32,767 characters, which a JSON blob of 10k hashes would exceed)
+        ws.cell(row=ROW_CHECKSUM_HEADER_ROW, column=1, value="Task ID")
+        ws.cell(row=ROW_CHECKSUM_HEADER_ROW, column=2, value="Row Checksum")
+        for row_idx, (task_id, checksum) in enumerate(
+            row_checksums.items(), start=ROW_CHECKSUM_START_ROW
+        ):
+            ws.cell(row=row_idx, column=1, value=task_id)
+            ws.cell(row=row_idx, column=2, value=checksum)
+
+        logger.debug(
+            "Sync metadata worksheet created",
+            project_id=config.project_id,
+            row_checksums=len(row_checksums),
+        )
 
     def _calculate_checksum(self, config: ProjectConfig) -> str:
         """
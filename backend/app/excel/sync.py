@@ -0,0 +1,336 @@
+"""
+Row-level checksums for incremental two-way Excel sync.
+
+Every task row written to the "Project Plan" worksheet gets a content hash
+that is embedded in the hidden _SYNC_META sheet. On re-upload the same hash
+is recomputed from the row values, so rows the user did not touch can be
+skipped without being parsed or revalidated, and only inserted, changed and
+deleted tasks are applied to the server state.
+"""
+
+import hashlib
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Order matches the "Project Plan" columns written by ExcelTemplateEngine
+TASK_SYNC_FIELDS: Tuple[str, ...] = (
+    "id",
+    "name",
+    "duration",
+    "start_date",
+    "end_date",
+    "dependencies",
+    "sprint",
+    "status",
+    "owner",
+)
+
+DATE_FIELDS = frozenset({"start_date", "end_date"})
+
+# Layout of the row checksum table inside the _SYNC_META sheet
+ROW_CHECKSUM_HEADER_ROW = 4
+ROW_CHECKSUM_START_ROW = 5
+ROW_CHECKSUM_ALGORITHM = "sha256-16"
+
+# Field separator that cannot appear in normalized cell values
+_FIELD_SEPARATOR = "\x1f"
+
+
+def _normalize_value(field_name: str, value: Any) -> str:
+    """
+    Normalize a single task value to its canonical string form.
+
+    Values coming from the database (JSON) and from openpyxl cells must hash
+    identically, so numbers, dates and dependency lists are canonicalized.
+
+    Args:
+        field_name: Name of the task field
+        value: Raw value from a task dict or worksheet cell
+
+    Returns:
+        Canonical string representation
+    """
+    if value is None:
+        return ""
+
+    if field_name in DATE_FIELDS:
+        if isinstance(value, datetime):
+            return value.date().isoformat()
+        if isinstance(value, date):
+            return value.isoformat()
+        text = str(value).strip()
+        try:
+            return date.fromisoformat(text[:10]).isoformat()
+        except ValueError:
+            return text
+
+    if field_name == "dependencies":
+        if isinstance(value, (list, tuple)):
+            deps = [str(d).strip() for d in value]
+        else:
+            deps = [d.strip() for d in str(value).split(",")]
+        return ",".join(d for d in deps if d)
+
+    if isinstance(value, bool):
+        return str(value)
+
+    if isinstance(value, (int, float)):
+        number = float(value)
+        return str(int(number)) if number.is_integer() else repr(number)
+
+    return str(value).strip()
+
+
+def normalize_task(task: Dict[str, Any]) -> Dict[str, str]:
+    """
+    Normalize a stored task dict to the canonical sync field set.
+
+    Accepts both ``id`` and ``task_id`` keys, matching how analytics reads
+    tasks from ``Project.configuration["tasks"]``.
+
+    Args:
+        task: Task dict from project configuration
+
+    Returns:
+        Dict with exactly TASK_SYNC_FIELDS keys as canonical strings
+    """
+    values = dict(task)
+    if "id" not in values and "task_id" in values:
+        values["id"] = values["task_id"]
+    return {name: _normalize_value(name, values.get(name)) for name in TASK_SYNC_FIELDS}
+
+
+def normalize_row(row: Sequence[Any]) -> Dict[str, str]:
+    """
+    Normalize a "Project Plan" worksheet row to the canonical sync field set.
+
+    Args:
+        row: Cell values in TASK_SYNC_FIELDS column order
+
+    Returns:
+        Dict with exactly TASK_SYNC_FIELDS keys as canonical strings
+    """
+    padded = list(row[: len(TASK_SYNC_FIELDS)])
+    padded.extend([None] * (len(TASK_SYNC_FIELDS) - len(padded)))
+    return {
+        name: _normalize_value(name, value)
+        for name, value in zip(TASK_SYNC_FIELDS, padded)
+    }
+
+
+def checksum_normalized(normalized: Dict[str, str]) -> str:
+    """
+    Calculate the content hash of a normalized task.
+
+    Args:
+        normalized: Output of normalize_task or normalize_row
+
+    Returns:
+        str: Truncated SHA-256 hex digest (16 chars)
+    """
+    payload = _FIELD_SEPARATOR.join(normalized[name] for name in TASK_SYNC_FIELDS)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def calculate_row_checksum(task: Dict[str, Any]) -> str:
+    """
+    Calculate the content hash for a stored task.
+
+    Args:
+        task: Task dict from project configuration
+
+    Returns:
+        str: Row checksum
+    """
+    return checksum_normalized(normalize_task(task))
+
+
+def calculate_row_checksums(tasks: Iterable[Dict[str, Any]]) -> Dict[str, str]:
+    """
+    Calculate row checksums for a list of stored tasks.
+
+    Args:
+        tasks: Task dicts from project configuration
+
+    Returns:
+        Dict mapping task ID to row checksum
+    """
+    checksums: Dict[str, str] = {}
+    for task in tasks:
+        normalized = normalize_task(task)
+        if normalized["id"]:
+            checksums[normalized["id"]] = checksum_normalized(normalized)
+    return checksums
+
+
+@dataclass
+class TaskDelta:
+    """Change set between an uploaded workbook and stored task state."""
+
+    inserted: List[Dict[str, str]] = field(default_factory=list)
+    updated: List[Dict[str, str]] = field(default_factory=list)
+    deleted: List[str] = field(default_factory=list)
+    conflicts: List[Dict[str, str]] = field(default_factory=list)
+    unchanged_count: int = 0
+    skipped_rows: int = 0
+
+    @property
+    def has_changes(self) -> bool:
+        """Whether the delta contains any task to apply."""
+        return bool(self.inserted or self.updated or self.deleted)
+
+    def to_sync_data(self) -> Dict[str, Any]:
+        """
+        Summarize the delta for ``SyncOperation.sync_data``.
+
+        Returns:
+            JSON-serializable dict of changed task IDs and counts
+        """
+        return {
+            "inserted": [task["id"] for task in self.inserted],
+            "updated": [task["id"] for task in self.updated],
+            "deleted": list(self.deleted),
+            "conflicts": [dict(conflict) for conflict in self.conflicts],
+            "unchanged_count": self.unchanged_count,
+            "skipped_rows": self.skipped_rows,
+        }
+
+
+def diff_task_rows(
+    rows: Iterable[Sequence[Any]],
+    embedded_checksums: Dict[str, str],
+    stored_checksums: Dict[str, str],
+) -> TaskDelta:
+    """
+    Diff uploaded worksheet rows against stored task state.
+
+    A row whose hash matches the checksum embedded at generation time was not
+    edited in Excel and is skipped. Edited rows are compared with the current
+    server state, so re-uploading an already applied change is a no-op.
+    Tasks are only reported as deleted when they were part of the generated
+    workbook, which keeps tasks added on the server since then intact.
+
+    When a task was edited or deleted in Excel and also changed on the server
+    after the workbook was generated (stored checksum differs from the
+    embedded one), neither side wins silently: the task is reported in
+    ``conflicts`` and left untouched.
+
+    Args:
+        rows: "Project Plan" data rows (without header)
+        embedded_checksums: Task ID to checksum from the _SYNC_META sheet
+        stored_checksums: Task ID to checksum of current server tasks
+
+    Returns:
+        TaskDelta with inserted, updated, deleted and conflicting tasks
+    """
+    delta = TaskDelta()
+    seen: set = set()
+
+    for row in rows:
+        normalized = normalize_row(row)
+        task_id = normalized["id"]
+        if not task_id or task_id in seen:
+            delta.skipped_rows += 1
+            continue
+        seen.add(task_id)
+
+        checksum = checksum_normalized(normalized)
+        embedded = embedded_checksums.get(task_id)
+        if embedded == checksum:
+            delta.unchanged_count += 1
+            continue
+
+        stored = stored_checksums.get(task_id)
+        if stored == checksum:
+            delta.unchanged_count += 1
+        elif stored is None:
+            delta.inserted.append(normalized)
+        elif stored != embedded:
+            delta.conflicts.append({"id": task_id, "operation": "update"})
+        else:
+            delta.updated.append(normalized)
+
+    for task_id, embedded in embedded_checksums.items():
+        if task_id in seen or task_id not in stored_checksums:
+            continue
+        if stored_checksums[task_id] != embedded:
+            delta.conflicts.append({"id": task_id, "operation": "delete"})
+        else:
+            delta.deleted.append(task_id)
+
+    return delta
+
+
+def apply_task_delta(
+    tasks: List[Dict[str, Any]], delta: TaskDelta
+) -> List[Dict[str, Any]]:
+    """
+    Apply a delta to stored tasks, preserving fields not managed by sync.
+
+    Args:
+        tasks: Current task dicts from project configuration
+        delta: Change set returned by diff_task_rows
+
+    Returns:
+        New task list with the delta applied
+    """
+    deleted = set(delta.deleted)
+    updates = {task["id"]: task for task in delta.updated}
+
+    result: List[Dict[str, Any]] = []
+    for task in tasks:
+        task_id = str(task.get("id", task.get("task_id", "")))
+        if task_id in deleted:
+            continue
+        if task_id in updates:
+            task = {**task, **_to_task_fields(updates[task_id])}
+        result.append(task)
+
+    result.extend(_to_task_fields(task) for task in delta.inserted)
+    return result
+
+
+def _to_task_fields(normalized: Dict[str, str]) -> Dict[str, Any]:
+    """
+    Convert a normalized row back to the stored task representation.
+
+    Args:
+        normalized: Canonical row values
+
+    Returns:
+        Task dict with typed duration and dependency list
+    """
+    task: Dict[str, Any] = {
+        name: (normalized[name] or None) for name in TASK_SYNC_FIELDS
+    }
+    task["id"] = normalized["id"]
+    task["dependencies"] = (
+        normalized["dependencies"].split(",") if normalized["dependencies"] else []
+    )
+    duration: Optional[float] = None
+    if normalized["duration"]:
+        try:
+            duration = float(normalized["duration"])
+        except ValueError:
+            duration = None
+    task["duration"] = duration
+    return task
+
+
+def read_row_checksums(meta_rows: Iterable[Sequence[Any]]) -> Dict[str, str]:
+    """
+    Read the embedded row checksum table from _SYNC_META rows.
+
+    Args:
+        meta_rows: _SYNC_META row values starting at ROW_CHECKSUM_START_ROW
+
+    Returns:
+        Dict mapping task ID to row checksum
+    """
+    checksums: Dict[str, str] = {}
+    for row in meta_rows:
+        if len(row) < 2 or row[0] is None or row[1] is None:
+            continue
+        checksums[str(row[0]).strip()] = str(row[1]).strip()
+    return checksums
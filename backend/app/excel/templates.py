@@ -8,15 +8,26 @@ Supports template selection, customization, and evolution over time.
 """
 
 from enum import Enum
-from typing import Dict, List, Optional, Any, Set
+from typing import Dict, FrozenSet, List, Optional, Any, Set
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 import json
 from pathlib import Path
+import re
 import structlog
 
 logger = structlog.get_logger(__name__)
 
+# Pattern to match Excel function names (formula is upper-cased first)
+_FUNCTION_PATTERN = re.compile(r"\b([A-Z]+)\s*\(")
+
+
+@lru_cache(maxsize=1024)
+def _extract_formula_functions(formula_upper: str) -> FrozenSet[str]:
+    """Extract function names from an upper-cased formula (cached)."""
+    return frozenset(_FUNCTION_PATTERN.findall(formula_upper))
+
 
 class TemplateVariation(Enum):
     """Template complexity levels."""
@@ -442,8 +453,8 @@ class CustomFormulaValidator:
             if blocked in formula_upper:
                 return False, f"Blocked function detected: {blocked}"
 
-        # Extract function names
-        functions = self._extract_functions(formula)
+        # Extract function names (cached per formula)
+        functions = _extract_formula_functions(formula_upper)
 
         # Check if all functions are allowed
         unknown_functions = functions - self.ALLOWED_FUNCTIONS
@@ -456,15 +467,9 @@ class CustomFormulaValidator:
 
         return True, None
 
-    def _extract_functions(self, formula: str) -> Set[str]:
+    def _extract_functions(self, formula: str) -> FrozenSet[str]:
         """Extract function names from formula."""
-        import re
-
-        # Pattern to match Excel function names
-        pattern = r'\b([A-Z]+)\s*\('
-        matches = re.findall(pattern, formula.upper())
-
-        return set(matches)
+        return _extract_formula_functions(formula.upper())
 
     def add_custom_formula(
         self,
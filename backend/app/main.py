@@ -11,11 +11,14 @@ from app.api import api_router
 from app.database.connection import (
     get_database_session,
     check_database_connection,
+    get_pool_stats,
     initialize_database,
     shutdown_database,
 )
 from app.core.security import RateLimitMiddleware, SecurityHeadersMiddleware
+from app.core.rate_limit_backends import create_rate_limit_backend
 from app.core.auth import AuthenticationMiddleware
+from app.services.share_access_tracker import share_access_tracker
 
 # Configure structured logging
 structlog.configure(
@@ -54,7 +57,12 @@ app.add_middleware(SecurityHeadersMiddleware)
 app.add_middleware(AuthenticationMiddleware)
 
 # 3. Rate limiting
-app.add_middleware(RateLimitMiddleware, default_requests=100, default_window=60)
+app.add_middleware(
+    RateLimitMiddleware,
+    default_requests=100,
+    default_window=60,
+    backend=create_rate_limit_backend(settings.rate_limit_backend, settings.redis_url),
+)
 
 # 4. CORS
 app.add_middleware(
@@ -91,7 +99,8 @@ async def health_check(db: AsyncSession = Depends(get_database_session)):
         db_healthy = await check_database_connection()
         health_status["checks"]["database"] = {
             "status": "healthy" if db_healthy else "unhealthy",
-            "message": "Database connection successful" if db_healthy else "Database connection failed"
+            "message": "Database connection successful" if db_healthy else "Database connection failed",
+            "pools": get_pool_stats(),
         }
     except Exception as e:
         health_status["checks"]["database"] = {
@@ -119,12 +128,21 @@ async def startup_event():
         logger.error("Database initialization failed", error=str(e))
         raise
 
+    # Flush buffered share link hits in the background
+    share_access_tracker.start()
+
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Application shutdown tasks."""
     logger.info("SprintForge API shutting down")
 
+    # Write remaining share link hits before the database goes away
+    try:
+        await share_access_tracker.stop()
+    except Exception as e:
+        logger.error("Share access flush on shutdown failed", error=str(e))
+
     # Shutdown database connections
     try:
         await shutdown_database()
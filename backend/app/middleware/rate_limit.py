@@ -4,13 +4,23 @@ Rate limiting middleware for Excel generation and API endpoints.
 This module implements:
 - Per-user rate limits (10 generations/hour for free tier, unlimited for pro)
 - Per-IP rate limits (20 generations/hour to prevent abuse)
-- Redis-based distributed rate limiting
+- Redis-based distributed rate limiting, one atomic Lua script per check
 - Proper HTTP 429 responses with Retry-After headers
+
+Every check is a list of (key, limit, window) entries evaluated together:
+a request is recorded against all keys only if none of them is over its
+limit. Redis supports three algorithms:
+
+- ``sliding_window``: exact log of request times in a sorted set
+- ``gcra``: generic cell rate algorithm, one timestamp per key
+- ``token_bucket``: token count and refill time in one hash per key
+
+The in-memory fallback always uses the sliding window log.
 """
 
 import time
-from typing import Dict, Optional, Tuple
-from datetime import datetime, timedelta
+import uuid
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from fastapi import HTTPException, Request
 from fastapi.responses import JSONResponse
@@ -21,6 +31,102 @@ from app.core.config import settings
 
 logger = structlog.get_logger(__name__)
 
+# (key, limit, window_seconds)
+LimitCheck = Tuple[str, int, int]
+
+# (is_limited, retry_after_seconds)
+LimitResult = Tuple[bool, int]
+
+# All scripts take ARGV = [now, member, limit_1, window_1, limit_2, window_2, ...]
+# and return one retry-after per key (0 when the key is within its limit).
+# Nothing is recorded unless every key is within its limit.
+
+SLIDING_WINDOW_SCRIPT = """
+local now = tonumber(ARGV[1])
+local retries = {}
+local limited = false
+for i, key in ipairs(KEYS) do
+    local limit = tonumber(ARGV[2 * i + 1])
+    local window = tonumber(ARGV[2 * i + 2])
+    redis.call('ZREMRANGEBYSCORE', key, 0, now - window)
+    retries[i] = 0
+    if redis.call('ZCARD', key) >= limit then
+        limited = true
+        retries[i] = window
+        local oldest = redis.call('ZRANGE', key, 0, 0, 'WITHSCORES')
+        if oldest[2] then
+            retries[i] = math.max(math.floor(tonumber(oldest[2]) + window - now), 1)
+        end
+    end
+end
+if not limited then
+    for i, key in ipairs(KEYS) do
+        redis.call('ZADD', key, now, ARGV[2])
+        redis.call('EXPIRE', key, math.ceil(tonumber(ARGV[2 * i + 2])))
+    end
+end
+return retries
+"""
+
+GCRA_SCRIPT = """
+local now = tonumber(ARGV[1])
+local retries = {}
+local tats = {}
+local limited = false
+for i, key in ipairs(KEYS) do
+    local limit = tonumber(ARGV[2 * i + 1])
+    local window = tonumber(ARGV[2 * i + 2])
+    local tat = math.max(tonumber(redis.call('GET', key) or now), now)
+    tats[i] = tat + window / limit
+    retries[i] = 0
+    local allow_at = tats[i] - window
+    if now < allow_at then
+        limited = true
+        retries[i] = math.max(math.ceil(allow_at - now), 1)
+    end
+end
+if not limited then
+    for i, key in ipairs(KEYS) do
+        redis.call('SET', key, tostring(tats[i]), 'EX', math.ceil(tonumber(ARGV[2 * i + 2])))
+    end
+end
+return retries
+"""
+
+TOKEN_BUCKET_SCRIPT = """
+local now = tonumber(ARGV[1])
+local retries = {}
+local tokens = {}
+local limited = false
+for i, key in ipairs(KEYS) do
+    local limit = tonumber(ARGV[2 * i + 1])
+    local window = tonumber(ARGV[2 * i + 2])
+    local state = redis.call('HMGET', key, 'tokens', 'ts')
+    local available = tonumber(state[1]) or limit
+    local updated = tonumber(state[2]) or now
+    available = math.min(limit, available + math.max(now - updated, 0) * limit / window)
+    tokens[i] = available
+    retries[i] = 0
+    if available < 1 then
+        limited = true
+        retries[i] = math.max(math.ceil((1 - available) * window / limit), 1)
+    end
+end
+if not limited then
+    for i, key in ipairs(KEYS) do
+        redis.call('HSET', key, 'tokens', tostring(tokens[i] - 1), 'ts', ARGV[1])
+        redis.call('EXPIRE', key, math.ceil(tonumber(ARGV[2 * i + 2])))
+    end
+end
+return retries
+"""
+
+RATE_LIMIT_SCRIPTS = {
+    "sliding_window": SLIDING_WINDOW_SCRIPT,
+    "gcra": GCRA_SCRIPT,
+    "token_bucket": TOKEN_BUCKET_SCRIPT,
+}
+
 
 class GenerationRateLimiter:
     """
@@ -33,15 +139,28 @@ class GenerationRateLimiter:
     - Graceful fallback to in-memory if Redis unavailable
     """
 
-    def __init__(self, redis_url: Optional[str] = None):
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        algorithm: Optional[str] = None
+    ):
         """
         Initialize rate limiter.
 
         Args:
             redis_url: Redis connection URL. Uses settings.redis_url if not provided.
+            algorithm: Redis algorithm (sliding_window, gcra, token_bucket).
+                Uses settings.rate_limit_algorithm if not provided.
+
+        Raises:
+            ValueError: If the algorithm is unknown
         """
         self.redis_url = redis_url or settings.redis_url
+        self.algorithm = algorithm or settings.rate_limit_algorithm
+        if self.algorithm not in RATE_LIMIT_SCRIPTS:
+            raise ValueError(f"Unknown rate limit algorithm: {self.algorithm}")
         self.redis_client: Optional[redis.Redis] = None
+        self._script = None
         self.in_memory_store: Dict[str, list] = {}
 
         # Rate limit configuration
@@ -58,18 +177,25 @@ class GenerationRateLimiter:
                 decode_responses=True
             )
             await self.redis_client.ping()
-            logger.info("Rate limiter connected to Redis")
+            self._script = self.redis_client.register_script(
+                RATE_LIMIT_SCRIPTS[self.algorithm]
+            )
+            logger.info(
+                "Rate limiter connected to Redis", algorithm=self.algorithm
+            )
         except Exception as e:
             logger.warning(
                 "Failed to connect to Redis, using in-memory store",
                 error=str(e)
             )
             self.redis_client = None
+            self._script = None
 
     async def close(self):
         """Close Redis connection."""
         if self.redis_client:
             await self.redis_client.close()
+            self._script = None
             logger.info("Rate limiter disconnected from Redis")
 
     def _get_redis_key(self, identifier: str, limit_type: str) -> str:
@@ -85,6 +211,41 @@ class GenerationRateLimiter:
         """
         return f"ratelimit:{limit_type}:{identifier}"
 
+    async def check_limits(self, checks: Sequence[LimitCheck]) -> List[LimitResult]:
+        """
+        Check several rate limits in one atomic step.
+
+        The request is recorded against every key only if all keys are
+        within their limits. With Redis this is a single script call.
+
+        Args:
+            checks: (key, limit, window_seconds) entries
+
+        Returns:
+            (is_limited, retry_after_seconds) per entry, in order
+        """
+        if not checks:
+            return []
+
+        if not self._script:
+            return self._check_memory_limits(checks)
+
+        try:
+            now = time.time()
+            args: list = [now, f"{now}:{uuid.uuid4().hex}"]
+            for _, limit, window in checks:
+                args.extend((limit, window))
+
+            retries = await self._script(
+                keys=[key for key, _, _ in checks], args=args
+            )
+            return [(int(retry) > 0, int(retry)) for retry in retries]
+
+        except Exception as e:
+            logger.error("Redis rate limit check failed", error=str(e))
+            # Fallback to in-memory
+            return self._check_memory_limits(checks)
+
     async def _check_redis_limit(
         self,
         key: str,
@@ -92,7 +253,7 @@ class GenerationRateLimiter:
         window: int
     ) -> Tuple[bool, int]:
         """
-        Check rate limit using Redis.
+        Check a single rate limit using Redis.
 
         Args:
             key: Redis key
@@ -102,40 +263,7 @@ class GenerationRateLimiter:
         Returns:
             Tuple of (is_limited, retry_after_seconds)
         """
-        if not self.redis_client:
-            return await self._check_memory_limit(key, limit, window)
-
-        try:
-            now = time.time()
-            window_start = now - window
-
-            # Remove old entries outside the window
-            await self.redis_client.zremrangebyscore(key, 0, window_start)
-
-            # Count requests in current window
-            count = await self.redis_client.zcard(key)
-
-            if count >= limit:
-                # Get oldest request time to calculate retry-after
-                oldest = await self.redis_client.zrange(key, 0, 0, withscores=True)
-                if oldest:
-                    oldest_time = oldest[0][1]
-                    retry_after = int((oldest_time + window) - now)
-                    return True, max(retry_after, 1)
-                return True, window
-
-            # Add current request
-            await self.redis_client.zadd(key, {str(now): now})
-
-            # Set expiration on key
-            await self.redis_client.expire(key, window)
-
-            return False, 0
-
-        except Exception as e:
-            logger.error("Redis rate limit check failed", error=str(e))
-            # Fallback to in-memory
-            return await self._check_memory_limit(key, limit, window)
+        return (await self.check_limits([(key, limit, window)]))[0]
 
     async def _check_memory_limit(
         self,
@@ -154,28 +282,43 @@ class GenerationRateLimiter:
         Returns:
             Tuple of (is_limited, retry_after_seconds)
         """
+        return self._check_memory_limits([(key, limit, window)])[0]
+
+    def _check_memory_limits(self, checks: Sequence[LimitCheck]) -> List[LimitResult]:
+        """
+        Check rate limits using the in-memory sliding window log (fallback).
+
+        Args:
+            checks: (key, limit, window_seconds) entries
+
+        Returns:
+            (is_limited, retry_after_seconds) per entry, in order
+        """
         now = time.time()
-        window_start = now - window
+        results: List[LimitResult] = []
 
-        # Initialize if not exists
-        if key not in self.in_memory_store:
-            self.in_memory_store[key] = []
+        for key, limit, window in checks:
+            window_start = now - window
 
-        # Remove old entries
-        self.in_memory_store[key] = [
-            ts for ts in self.in_memory_store[key]
-            if ts > window_start
-        ]
+            # Remove old entries
+            timestamps = [
+                ts for ts in self.in_memory_store.get(key, [])
+                if ts > window_start
+            ]
+            self.in_memory_store[key] = timestamps
 
-        if len(self.in_memory_store[key]) >= limit:
-            oldest = min(self.in_memory_store[key])
-            retry_after = int((oldest + window) - now)
-            return True, max(retry_after, 1)
+            if len(timestamps) >= limit:
+                retry_after = int((min(timestamps) + window) - now)
+                results.append((True, max(retry_after, 1)))
+            else:
+                results.append((False, 0))
 
-        # Add current request
-        self.in_memory_store[key].append(now)
+        # Add current request only if every limit allows it
+        if not any(limited for limited, _ in results):
+            for key, _, _ in checks:
+                self.in_memory_store[key].append(now)
 
-        return False, 0
+        return results
 
     async def check_user_limit(
         self,
@@ -237,11 +380,23 @@ class GenerationRateLimiter:
         Raises:
             HTTPException: 429 if rate limit exceeded
         """
-        # Check user limit first
-        user_limited, user_retry = await self.check_user_limit(
-            user_id, subscription_tier
-        )
-
+        # User and IP limits are evaluated together in one call;
+        # pro and enterprise tiers have no user limit
+        checks = [
+            (self._get_redis_key(ip_address, "ip"), self.ip_limit, self.window_seconds)
+        ]
+        if subscription_tier not in ["pro", "enterprise"]:
+            checks.insert(0, (
+                self._get_redis_key(user_id, "user"),
+                self.free_tier_limit,
+                self.window_seconds
+            ))
+
+        results = await self.check_limits(checks)
+        ip_limited, ip_retry = results[-1]
+        user_limited, user_retry = results[0] if len(results) > 1 else (False, 0)
+
+        # Report the user limit first
         if user_limited:
             logger.warning(
                 "User rate limit exceeded",
@@ -259,9 +414,6 @@ class GenerationRateLimiter:
                 }
             )
 
-        # Check IP limit
-        ip_limited, ip_retry = await self.check_ip_limit(ip_address)
-
         if ip_limited:
             logger.warning(
                 "IP rate limit exceeded",
@@ -9,6 +9,7 @@ from .baseline import ProjectBaseline
 from .notification import (
     Notification,
     NotificationRule,
+    NotificationRuleProject,
     NotificationLog,
     NotificationTemplate,
     NotificationType,
@@ -17,10 +18,13 @@ from .notification import (
 )
 from .historical_metrics import (
     HistoricalMetric,
+    MetricRollup,
     SprintVelocity,
     CompletionTrend,
     ForecastData,
+    VelocityForecastModel,
     MetricType,
+    RollupResolution,
     ForecastModelType,
 )
 
@@ -34,15 +38,19 @@ __all__ = [
     "ProjectBaseline",
     "Notification",
     "NotificationRule",
+    "NotificationRuleProject",
     "NotificationLog",
     "NotificationTemplate",
     "NotificationType",
     "NotificationStatus",
     "NotificationChannel",
     "HistoricalMetric",
+    "MetricRollup",
     "SprintVelocity",
     "CompletionTrend",
     "ForecastData",
+    "VelocityForecastModel",
     "MetricType",
+    "RollupResolution",
     "ForecastModelType",
 ]
\ No newline at end of file
@@ -4,9 +4,9 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID, uuid4
 
-from sqlalchemy import String, Text, Boolean, Integer, ForeignKey, CheckConstraint, Index, DateTime
+from sqlalchemy import String, Text, Boolean, Integer, Float, ForeignKey, CheckConstraint, Index, DateTime, LargeBinary
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
 
 from app.database.connection import Base
 from app.database.types import UUID as DBUUIDType, JSONB
@@ -34,6 +34,23 @@ class ProjectBaseline(Base):
     # Contains: project, tasks, critical_path, monte_carlo_results, snapshot_metadata
     snapshot_data: Mapped[dict] = mapped_column(JSONB, nullable=False)
 
+    # Snapshot tasks as a compressed columnar archive (see ColumnarSnapshot);
+    # NULL for baselines whose tasks are still in snapshot_data. For delta
+    # baselines this holds a SnapshotDelta against base_baseline_id.
+    snapshot_columns: Mapped[Optional[bytes]] = mapped_column(LargeBinary, nullable=True)
+
+    # Delta chain: NULL base means a keyframe (full snapshot)
+    base_baseline_id: Mapped[Optional[UUID]] = mapped_column(
+        DBUUIDType,
+        ForeignKey("project_baselines.id", ondelete="SET NULL"),
+        nullable=True,
+        index=True,
+    )
+    delta_depth: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+    # Time spent building and encoding the snapshot
+    write_time_ms: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+
     # Active baseline flag - only one baseline per project can be active
     is_active: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
 
@@ -60,12 +77,16 @@ class ProjectBaseline(Base):
             "unique_active_baseline_per_project",
             "project_id",
             unique=True,
-            postgresql_where="is_active = true"
+            postgresql_where="is_active = true",
+            sqlite_where=text("is_active = 1"),
         ),
-        # GIN index for JSONB queries (optional but useful for future queries)
-        Index("idx_baselines_snapshot_data_gin", "snapshot_data", postgresql_using="gin"),
     )
 
+    @property
+    def is_keyframe(self) -> bool:
+        """Whether this baseline stores a full snapshot rather than a delta."""
+        return self.base_baseline_id is None
+
     def to_summary_dict(self) -> dict:
         """
         Return lightweight dict without snapshot data.
@@ -79,7 +100,10 @@ class ProjectBaseline(Base):
             "description": self.description,
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "is_active": self.is_active,
-            "snapshot_size_bytes": self.snapshot_size_bytes
+            "snapshot_size_bytes": self.snapshot_size_bytes,
+            "is_keyframe": self.is_keyframe,
+            "delta_depth": self.delta_depth,
+            "write_time_ms": self.write_time_ms,
         }
 
     def to_full_dict(self) -> dict:
@@ -5,7 +5,7 @@ from enum import Enum
 from typing import Optional, Any
 from uuid import UUID, uuid4
 
-from sqlalchemy import String, Float, Integer, ForeignKey, Index
+from sqlalchemy import String, Float, Integer, ForeignKey, Index, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
@@ -22,6 +22,14 @@ class MetricType(str, Enum):
     BURNDOWN = "burndown"
 
 
+class RollupResolution(str, Enum):
+    """Bucket sizes for pre-aggregated metric rollups."""
+
+    HOUR = "hour"
+    DAY = "day"
+    WEEK = "week"
+
+
 class ForecastModelType(str, Enum):
     """Types of forecasting models used."""
 
@@ -49,6 +57,9 @@ class HistoricalMetric(Base):
     # Note: We avoid using "metadata" as attribute name since it's reserved by SQLAlchemy
     metric_metadata: Mapped[dict] = mapped_column(JSONB, default=dict, nullable=False)
 
+    # Client-supplied key for deduplicating retried ingest batches
+    idempotency_key: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
         TZDateTime, server_default=func.now(), nullable=False
@@ -63,6 +74,7 @@ class HistoricalMetric(Base):
     # Composite indexes for efficient time-series queries
     __table_args__ = (
         Index('idx_metrics_project_type_time', 'project_id', 'metric_type', 'timestamp'),
+        UniqueConstraint('project_id', 'idempotency_key', name='uq_metrics_idempotency_key'),
     )
 
 
@@ -73,6 +85,50 @@ class HistoricalMetric(Base):
         )
 
 
+class MetricRollup(Base):
+    """Pre-aggregated HistoricalMetric values per time bucket."""
+
+    __tablename__ = "metric_rollups"
+
+    id: Mapped[UUID] = mapped_column(DBUUIDType, primary_key=True, default=uuid4)
+    project_id: Mapped[UUID] = mapped_column(
+        DBUUIDType, ForeignKey("projects.id", ondelete="CASCADE"), nullable=False
+    )
+    metric_type: Mapped[str] = mapped_column(String(100), nullable=False)
+    resolution: Mapped[str] = mapped_column(String(10), nullable=False)
+    bucket_start: Mapped[datetime] = mapped_column(TZDateTime, nullable=False)
+
+    # Aggregates (average is sum / count)
+    count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    sum: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    min: Mapped[float] = mapped_column(Float, nullable=False)
+    max: Mapped[float] = mapped_column(Float, nullable=False)
+    last_value: Mapped[float] = mapped_column(Float, nullable=False)
+    last_timestamp: Mapped[datetime] = mapped_column(TZDateTime, nullable=False)
+
+    # Timestamps
+    created_at: Mapped[datetime] = mapped_column(
+        TZDateTime, server_default=func.now(), nullable=False
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        TZDateTime, server_default=func.now(), onupdate=func.now(), nullable=False
+    )
+
+    # One row per bucket; also serves range scans by project/type/resolution
+    __table_args__ = (
+        UniqueConstraint(
+            'project_id', 'metric_type', 'resolution', 'bucket_start',
+            name='uq_rollup_bucket',
+        ),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<MetricRollup(project_id={self.project_id}, type='{self.metric_type}', "
+            f"resolution='{self.resolution}', bucket={self.bucket_start}, count={self.count})>"
+        )
+
+
 class SprintVelocity(Base):
     """Sprint velocity tracking with points and task completion metrics."""
 
@@ -155,6 +211,55 @@ class CompletionTrend(Base):
         )
 
 
+class VelocityForecastModel(Base):
+    """
+    Fitted linear velocity model per project.
+
+    Stores the OLS sufficient statistics over (sprint index, velocity) so the
+    fit can be updated in closed form when a sprint is added, plus the
+    derived parameters used for forecasting.
+    """
+
+    __tablename__ = "velocity_forecast_models"
+
+    id: Mapped[UUID] = mapped_column(DBUUIDType, primary_key=True, default=uuid4)
+    project_id: Mapped[UUID] = mapped_column(
+        DBUUIDType, ForeignKey("projects.id", ondelete="CASCADE"),
+        nullable=False, unique=True, index=True
+    )
+
+    # Sufficient statistics (x is the 0-based sprint index)
+    n: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    sum_x: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    sum_y: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    sum_xx: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    sum_xy: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    sum_yy: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    last_timestamp: Mapped[Optional[datetime]] = mapped_column(TZDateTime, nullable=True)
+
+    # Fitted parameters
+    slope: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    intercept: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    residual_std: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+
+    # Timestamps
+    created_at: Mapped[datetime] = mapped_column(
+        TZDateTime, server_default=func.now(), nullable=False
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        TZDateTime, server_default=func.now(), onupdate=func.now(), nullable=False
+    )
+
+    # Relationships
+    project = relationship("Project", foreign_keys=[project_id])
+
+    def __repr__(self) -> str:
+        return (
+            f"<VelocityForecastModel(project_id={self.project_id}, n={self.n}, "
+            f"slope={self.slope}, intercept={self.intercept})>"
+        )
+
+
 class ForecastData(Base):
     """Forecasting predictions with confidence intervals."""
 
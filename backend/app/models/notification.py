@@ -5,7 +5,7 @@ from datetime import datetime, timezone
 from typing import Optional
 from uuid import UUID, uuid4
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, String, Text
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, String, Text, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database.types import JSONB
@@ -129,6 +129,11 @@ class NotificationRule(Base):
         JSONB, default=lambda: [NotificationChannel.IN_APP.value], nullable=False
     )
     conditions: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
+    # True when conditions list project_ids; such rules are matched through
+    # notification_rule_projects instead of the wildcard bucket
+    project_scoped: Mapped[bool] = mapped_column(
+        Boolean, default=False, server_default=text("false"), nullable=False
+    )
 
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
@@ -143,10 +148,41 @@ class NotificationRule(Base):
         nullable=False,
     )
 
+    __table_args__ = (
+        # Wildcard bucket: enabled rules that apply to every project
+        Index(
+            "ix_notification_rules_wildcard",
+            "event_type",
+            postgresql_where=text("enabled AND NOT project_scoped"),
+        ),
+    )
+
     def __repr__(self) -> str:
         return f"<NotificationRule(id={self.id}, event_type='{self.event_type}', enabled={self.enabled})>"
 
 
+class NotificationRuleProject(Base):
+    """Index of project-scoped notification rules by (event_type, project_id)."""
+
+    __tablename__ = "notification_rule_projects"
+
+    rule_id: Mapped[UUID] = mapped_column(
+        DBUUIDType,
+        ForeignKey("notification_rules.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    # Stored as text, the form project IDs take in rule conditions
+    project_id: Mapped[str] = mapped_column(String(64), primary_key=True)
+    event_type: Mapped[str] = mapped_column(String(50), nullable=False)
+
+    __table_args__ = (
+        Index("ix_notification_rule_projects_lookup", "event_type", "project_id"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<NotificationRuleProject(rule_id={self.rule_id}, project_id='{self.project_id}')>"
+
+
 class NotificationLog(Base):
     """Log of notification delivery attempts."""
 
@@ -57,6 +57,18 @@ class BaselineResponse(BaselineBase):
         default=None,
         description="Size of snapshot data in bytes"
     )
+    is_keyframe: bool = Field(
+        default=True,
+        description="Whether the snapshot is stored in full rather than as a delta"
+    )
+    delta_depth: int = Field(
+        default=0,
+        description="Number of deltas between this baseline and its keyframe"
+    )
+    write_time_ms: Optional[float] = Field(
+        default=None,
+        description="Time taken to build and store the snapshot in milliseconds"
+    )
 
     model_config = ConfigDict(
         from_attributes=True,
@@ -68,7 +80,10 @@ class BaselineResponse(BaselineBase):
                 "description": "Baseline created before Sprint 5 starts",
                 "created_at": "2025-10-17T14:30:00Z",
                 "is_active": True,
-                "snapshot_size_bytes": 458392
+                "snapshot_size_bytes": 458392,
+                "is_keyframe": False,
+                "delta_depth": 3,
+                "write_time_ms": 41.7
             }
         }
     )
@@ -241,6 +256,10 @@ class BaselineComparisonResponse(BaseModel):
     task_variances: List[TaskVarianceSchema] = Field(..., description="Detailed task variances")
     new_tasks: List[Dict[str, Any]] = Field(..., description="Tasks added after baseline")
     deleted_tasks: List[Dict[str, Any]] = Field(..., description="Tasks deleted after baseline")
+    pagination: Optional[Dict[str, Any]] = Field(
+        default=None,
+        description="Offset, limit and total count of task variances"
+    )
 
     model_config = ConfigDict(
         json_schema_extra={
@@ -1,7 +1,7 @@
 """Pydantic schemas for Excel workflow API endpoints."""
 
 from datetime import date, datetime
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -111,3 +111,63 @@ class ParsedTask(BaseModel):
                 "dependencies": "",
             }
         }
+
+
+class ExcelSyncResponse(BaseModel):
+    """Response from incremental Excel sync endpoint."""
+
+    sync_operation_id: str = Field(..., description="Recorded SyncOperation UUID")
+    project_id: str = Field(..., description="Project UUID")
+    inserted: List[str] = Field(
+        default_factory=list, description="Task IDs added from the workbook"
+    )
+    updated: List[str] = Field(
+        default_factory=list, description="Task IDs changed in the workbook"
+    )
+    deleted: List[str] = Field(
+        default_factory=list, description="Task IDs removed from the workbook"
+    )
+    conflicts: List[Dict[str, str]] = Field(
+        default_factory=list,
+        description="Tasks changed in both Excel and on the server (not applied)",
+    )
+    unchanged_count: int = Field(
+        ..., ge=0, description="Rows skipped because their checksum matched"
+    )
+    completed_at: datetime = Field(..., description="Timestamp when sync completed")
+
+
+class ExcelImportFileReport(BaseModel):
+    """Per-workbook outcome and timings of a batch import."""
+
+    filename: str = Field(..., description="Workbook name (zip entries as archive/entry)")
+    status: str = Field(..., description="'imported' or 'failed'")
+    sheet_count: int = Field(..., ge=0, description="Valid task sheets in the workbook")
+    task_count: int = Field(..., ge=0, description="Tasks across valid sheets")
+    errors: List[str] = Field(default_factory=list, description="Parse/validation errors")
+    parse_ms: float = Field(..., ge=0, description="Time spent parsing sheets")
+    validate_ms: float = Field(..., ge=0, description="Time spent validating dependencies")
+    wall_ms: float = Field(..., ge=0, description="Total worker time for the workbook")
+
+
+class ExcelImportedProject(BaseModel):
+    """Project created from one imported task sheet."""
+
+    project_id: str = Field(..., description="Created project UUID")
+    name: str = Field(..., description="Project name")
+    filename: str = Field(..., description="Source workbook")
+    sheet_name: str = Field(..., description="Source worksheet")
+    task_count: int = Field(..., ge=0, description="Number of imported tasks")
+
+
+class ExcelBatchImportResponse(BaseModel):
+    """Response from the batch Excel import endpoint."""
+
+    imported: bool = Field(..., description="Whether the batch was committed")
+    projects: List[ExcelImportedProject] = Field(
+        default_factory=list, description="Projects created by the import"
+    )
+    files: List[ExcelImportFileReport] = Field(
+        ..., description="Per-workbook status and timings"
+    )
+    total_ms: float = Field(..., ge=0, description="Total request processing time")
@@ -1,7 +1,7 @@
 """Pydantic schemas for historical metrics API."""
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, Field
@@ -97,3 +97,45 @@ class HistoricalMetricsSummaryResponse(BaseModel):
     predicted: Optional[datetime] = None  # Alias for test compatibility
 
     model_config = {"from_attributes": True}
+
+
+class MetricIngestRejection(BaseModel):
+    """A rejected point in an ingest payload."""
+
+    index: int
+    reason: str
+
+
+class MetricIngestResponse(BaseModel):
+    """Response for bulk metric ingestion."""
+
+    project_id: UUID
+    received: int
+    inserted: int
+    duplicates: int = 0
+    rejected: int = 0
+    errors: List[MetricIngestRejection] = []
+    elapsed_ms: float = 0.0
+
+
+class CompletionProbabilityPoint(BaseModel):
+    """Probability of finishing by a sprint boundary."""
+
+    date: datetime
+    sprints: int
+    probability: float
+
+
+class CompletionForecastResponse(BaseModel):
+    """Response for Monte Carlo completion-date forecasts."""
+
+    project_id: UUID
+    remaining_points: float
+    simulations: int = 0
+    history_size: int = 0
+    completion_date: Optional[datetime] = None
+    percentiles: Dict[str, Optional[datetime]] = {}
+    probability_by_date: List[CompletionProbabilityPoint] = []
+    completion_probability: float = 0.0
+    message: Optional[str] = None
+    cached: bool = False
@@ -238,6 +238,9 @@ class ProjectListResponse(BaseModel):
     limit: int = Field(..., description="Results per page")
     offset: int = Field(..., description="Pagination offset")
     projects: List[ProjectResponse] = Field(..., description="List of projects")
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor for the next page; absent on the last page"
+    )
 
     model_config = ConfigDict(
         json_schema_extra={
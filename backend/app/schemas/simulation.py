@@ -238,6 +238,9 @@ class SimulationHistoryResponse(BaseModel):
     total_count: int = Field(..., description="Total number of simulations available")
     page: int = Field(..., description="Current page number (0-indexed)")
     page_size: int = Field(..., description="Number of results per page")
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor for the next page; absent on the last page"
+    )
 
     class Config:
         json_schema_extra = {
@@ -5,11 +5,14 @@ Provides comprehensive analytics including health scores, critical path analysis
 resource utilization, simulation summaries, and progress tracking.
 """
 
+import asyncio
 import json
 import logging
+import random
+import time
 from collections import defaultdict
 from datetime import date, datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Set, Tuple
 from uuid import UUID
 
 import redis.asyncio as redis
@@ -17,6 +20,11 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
+from app.database.connection import (
+    get_read_replica_urls,
+    get_read_session_factory,
+    get_session_factory,
+)
 from app.models.project import Project
 from app.models.simulation_result import SimulationResult
 from app.services.scheduler.cpm import calculate_critical_path
@@ -24,6 +32,21 @@ from app.services.scheduler.task_graph import TaskGraph
 
 logger = logging.getLogger(__name__)
 
+# Fresh lifetimes are spread by +/- this fraction so keys expire apart
+TTL_JITTER = 0.1
+
+# How long a background refresh may hold its Redis lock
+REFRESH_LOCK_SECONDS = 30
+
+# Keys with a refresh in flight in this process (single-flight)
+_refreshing: Set[str] = set()
+
+# Strong references to background refresh tasks
+_background_tasks: Set["asyncio.Task[None]"] = set()
+
+# Returns the new value, or None if it must not be cached
+Refresher = Callable[[], Awaitable[Optional[Dict[str, Any]]]]
+
 
 class AnalyticsError(Exception):
     """Raised when analytics calculation fails."""
@@ -31,14 +54,121 @@ class AnalyticsError(Exception):
     pass
 
 
+class AnalyticsLoader:
+    """
+    Request-scoped loader that fetches each entity and metric at most once.
+
+    Callers asking for the same key share a single in-flight load, so the
+    metrics behind the analytics overview can run concurrently without
+    re-selecting the project or its simulations. Queries are serialized
+    because an AsyncSession does not allow concurrent operations.
+    """
+
+    def __init__(self, db: AsyncSession):
+        """
+        Initialize loader.
+
+        Args:
+            db: Database session shared by all loads
+        """
+        self.db = db
+        self._loads: Dict[Hashable, "asyncio.Future[Any]"] = {}
+        self._computed: Dict[Hashable, Any] = {}
+        self._db_lock = asyncio.Lock()
+
+    async def load(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the value for ``key``, running ``factory`` on first use."""
+        future = self._loads.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._run(key, factory))
+            self._loads[key] = future
+        return await future
+
+    async def _run(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        value = await factory()
+        self._computed[key] = value
+        return value
+
+    def prime(self, key: Hashable, value: Any) -> None:
+        """Seed ``key`` with a value loaded elsewhere (e.g. from cache)."""
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(value)
+        self._loads.setdefault(key, future)
+
+    def computed(self) -> Dict[Hashable, Any]:
+        """Values produced by factories during this request."""
+        return dict(self._computed)
+
+    async def _execute_scalar(self, statement: Any) -> Any:
+        async with self._db_lock:
+            result = await self.db.execute(statement)
+        return result.scalar_one_or_none()
+
+    async def project(self, project_id: UUID) -> Optional[Project]:
+        """Load the project row."""
+        return await self.load(
+            ("project", project_id),
+            lambda: self._execute_scalar(select(Project).where(Project.id == project_id)),
+        )
+
+    async def latest_simulation(self, project_id: UUID) -> Optional[SimulationResult]:
+        """Load the project's most recent simulation result."""
+        return await self.load(
+            ("latest_simulation", project_id),
+            lambda: self._execute_scalar(
+                select(SimulationResult)
+                .where(SimulationResult.project_id == project_id)
+                .order_by(SimulationResult.created_at.desc())
+                .limit(1)
+            ),
+        )
+
+    async def first_simulation(self, project_id: UUID) -> Optional[SimulationResult]:
+        """Load the project's earliest simulation result (the plan baseline)."""
+        return await self.load(
+            ("first_simulation", project_id),
+            lambda: self._execute_scalar(
+                select(SimulationResult)
+                .where(SimulationResult.project_id == project_id)
+                .order_by(SimulationResult.created_at.asc())
+                .limit(1)
+            ),
+        )
+
+
 class AnalyticsService:
     """
     Service for calculating project analytics and metrics.
 
     Provides analytics functions with Redis caching for performance.
     Cache TTL is 5 minutes (300 seconds) by default.
+
+    Caching is stale-while-revalidate: an entry is fresh for a jittered
+    cache_ttl and is then served stale for up to another cache_ttl while
+    exactly one background task recomputes it. Writes to a project's data
+    call invalidate_project_analytics to drop its entries.
+
+    Background recomputes read from a replica. For
+    ``database_replica_max_lag`` seconds after an invalidation a replica
+    may not have the write yet, so recomputes use the primary instead and
+    values computed on the caller's (possibly replica) session are not
+    cached.
+
+    Every metric accepts an optional AnalyticsLoader. Without one, the
+    metric does its own cache lookup and write; with one, it is memoized
+    in the loader and caching is left to the caller (see
+    get_analytics_overview).
     """
 
+    # Overview metric name -> cache key prefix
+    OVERVIEW_METRICS = {
+        "health": "analytics:health",
+        "critical_path": "analytics:critical_path",
+        "resources": "analytics:resources",
+        "simulation": "analytics:simulation",
+        "progress": "analytics:progress",
+    }
+
     def __init__(self, cache_ttl: int = 300):
         """
         Initialize analytics service.
@@ -63,14 +193,44 @@ class AnalyticsService:
                 self._redis_client = None
         return self._redis_client
 
-    async def _get_cached(self, key: str) -> Optional[Dict[str, Any]]:
-        """Get cached value by key."""
+    def _jittered_ttl(self) -> int:
+        """Fresh lifetime for a new entry, spread around cache_ttl."""
+        return max(1, round(self.cache_ttl * random.uniform(1 - TTL_JITTER, 1 + TTL_JITTER)))
+
+    def _encode_entry(self, value: Dict[str, Any]) -> Tuple[str, int]:
+        """Wrap a value with its staleness deadline; returns (payload, Redis TTL)."""
+        fresh_for = self._jittered_ttl()
+        payload = json.dumps({"value": value, "stale_at": time.time() + fresh_for}, default=str)
+        return payload, fresh_for + self.cache_ttl
+
+    def _decode_entry(
+        self, key: str, cached: str, refresh: Optional[Refresher]
+    ) -> Dict[str, Any]:
+        """Unwrap a cached entry, scheduling a refresh if it is stale."""
+        entry = json.loads(cached)
+        if refresh is not None and entry["stale_at"] <= time.time():
+            self._schedule_refresh(key, refresh)
+        return entry["value"]
+
+    async def _get_cached(
+        self, key: str, refresh: Optional[Refresher] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get cached value by key.
+
+        Args:
+            key: Cache key
+            refresh: Recomputes the value when the entry is stale
+
+        Returns:
+            Cached value (possibly stale), or None on a miss
+        """
         try:
             redis_client = await self._get_redis()
             if redis_client:
                 cached = await redis_client.get(key)
                 if cached:
-                    return json.loads(cached)
+                    return self._decode_entry(key, cached, refresh)
         except Exception as e:
             logger.warning(f"Cache get failed for {key}: {e}")
         return None
@@ -80,14 +240,258 @@ class AnalyticsService:
         try:
             redis_client = await self._get_redis()
             if redis_client:
+                payload, ttl = self._encode_entry(value)
+                await redis_client.setex(key, ttl, payload)
+        except Exception as e:
+            logger.warning(f"Cache set failed for {key}: {e}")
+
+    async def _get_many_cached(
+        self, keys: List[str], refreshers: Optional[Dict[str, Refresher]] = None
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Get several cached values in one MGET, refreshing stale ones."""
+        refreshers = refreshers or {}
+        try:
+            redis_client = await self._get_redis()
+            if redis_client:
+                values = await redis_client.mget(keys)
+                return [
+                    self._decode_entry(key, v, refreshers.get(key)) if v else None
+                    for key, v in zip(keys, values)
+                ]
+        except Exception as e:
+            logger.warning(f"Cache mget failed for {keys}: {e}")
+        return [None] * len(keys)
+
+    async def _set_many_cached(self, values: Dict[str, Dict[str, Any]]) -> None:
+        """Set several cached values with TTL in one pipelined round-trip."""
+        if not values:
+            return
+        try:
+            redis_client = await self._get_redis()
+            if redis_client:
+                async with redis_client.pipeline(transaction=False) as pipe:
+                    for key, value in values.items():
+                        payload, ttl = self._encode_entry(value)
+                        pipe.setex(key, ttl, payload)
+                    await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Cache pipeline set failed for {list(values)}: {e}")
+
+    def _schedule_refresh(self, key: str, refresh: Refresher) -> None:
+        """Start a background refresh of ``key`` unless one is in flight here."""
+        if key in _refreshing:
+            return
+        _refreshing.add(key)
+        task = asyncio.get_running_loop().create_task(self._refresh(key, refresh))
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+
+    async def _refresh(self, key: str, refresh: Refresher) -> None:
+        """Recompute ``key`` while holding its Redis lock (one refresh cluster-wide)."""
+        lock_key = f"{key}:refresh_lock"
+        try:
+            redis_client = await self._get_redis()
+            if not redis_client:
+                return
+            if not await redis_client.set(lock_key, "1", nx=True, ex=REFRESH_LOCK_SECONDS):
+                return
+            try:
+                value = await refresh()
+                if value is not None:
+                    await self._set_cached(key, value)
+            finally:
+                await redis_client.delete(lock_key)
+        except Exception as e:
+            logger.warning(f"Background refresh failed for {key}: {e}")
+        finally:
+            _refreshing.discard(key)
+
+    async def _recompute(self, name: str, project_id: UUID) -> Optional[Dict[str, Any]]:
+        """
+        Recompute an overview metric's cache value on a session of its own.
+
+        Runs on a replica, or on the primary shortly after an invalidation.
+
+        Returns:
+            The value, or None if the project was invalidated while it was
+            computed on a replica (the result may predate the write)
+        """
+        on_primary = await self._recently_invalidated(project_id)
+        session_factory = get_session_factory() if on_primary else get_read_session_factory()
+        async with session_factory() as session:
+            loader = AnalyticsLoader(session)
+            if name == "health":
+                value = {"health_score": await self._health_score(project_id, loader)}
+            else:
+                compute = {
+                    "critical_path": self._critical_path_metrics,
+                    "resources": self._resource_utilization,
+                    "simulation": self._simulation_summary,
+                    "progress": self._progress_metrics,
+                }[name]
+                value = await compute(project_id, loader)
+
+        if not on_primary and await self._recently_invalidated(project_id):
+            return None
+        return value
+
+    @staticmethod
+    def _invalidated_key(project_id: UUID) -> str:
+        return f"analytics:invalidated:{project_id}"
+
+    async def _recently_invalidated(self, project_id: UUID) -> bool:
+        """
+        Whether replicas may still lack the write behind the last invalidation.
+
+        Always False without read replicas, since reads then go to the primary.
+        """
+        if not get_read_replica_urls():
+            return False
+        try:
+            redis_client = await self._get_redis()
+            if redis_client:
+                return bool(await redis_client.exists(self._invalidated_key(project_id)))
+        except Exception as e:
+            logger.warning(f"Invalidation check failed for project {project_id}: {e}")
+        return False
+
+    async def invalidate_project(self, project_id: UUID) -> None:
+        """
+        Drop all cached analytics for a project.
+
+        Also marks the project as recently invalidated for
+        ``database_replica_max_lag`` seconds, so recomputes in that window
+        do not cache results read from a lagging replica.
+
+        Args:
+            project_id: UUID of the project
+        """
+        keys = [f"{prefix}:{project_id}" for prefix in self.OVERVIEW_METRICS.values()]
+        try:
+            redis_client = await self._get_redis()
+            if redis_client:
+                # Mark first, so no recompute sees the keys gone but no mark
                 await redis_client.setex(
-                    key, self.cache_ttl, json.dumps(value, default=str)
+                    self._invalidated_key(project_id),
+                    settings.database_replica_max_lag,
+                    "1",
                 )
+                await redis_client.delete(*keys)
         except Exception as e:
-            logger.warning(f"Cache set failed for {key}: {e}")
+            logger.warning(f"Cache invalidation failed for project {project_id}: {e}")
+
+    async def get_analytics_overview(
+        self,
+        project_id: UUID,
+        db: AsyncSession,
+        project: Optional[Project] = None,
+    ) -> Dict[str, Any]:
+        """
+        Compute all overview metrics with shared loads and one cache round-trip each way.
+
+        Cached metrics are read with a single MGET. The missing ones run
+        concurrently on one AnalyticsLoader, so the project and simulation
+        rows are selected once, and are written back in one pipeline.
+
+        Args:
+            project_id: UUID of the project
+            db: Database session
+            project: Project row already loaded by the caller, if any
+
+        Returns:
+            {
+                "health_score": float,
+                "critical_path": Dict (see get_critical_path_metrics),
+                "resources": Dict (see get_resource_utilization),
+                "simulation": Dict (see get_simulation_summary),
+                "progress": Dict (see get_progress_metrics)
+            }
+
+        Raises:
+            AnalyticsError: If calculation fails
+        """
+        loader = AnalyticsLoader(db)
+        if project is not None:
+            loader.prime(("project", project_id), project)
+
+        cache_keys = {
+            name: f"{prefix}:{project_id}" for name, prefix in self.OVERVIEW_METRICS.items()
+        }
+        cached = await self._get_many_cached(
+            list(cache_keys.values()),
+            {
+                cache_key: (lambda name=name: self._recompute(name, project_id))
+                for name, cache_key in cache_keys.items()
+            },
+        )
+        for name, value in zip(cache_keys, cached):
+            if not value:
+                continue
+            if name == "health":
+                value = value["health_score"]
+            elif name == "progress":
+                value = self._restore_progress_dates(value)
+            loader.prime((name, project_id), value)
+
+        health, critical_path, resources, simulation, progress = await asyncio.gather(
+            self.calculate_project_health_score(project_id, db, loader=loader),
+            self.get_critical_path_metrics(project_id, db, loader=loader),
+            self.get_resource_utilization(project_id, db, loader=loader),
+            self.get_simulation_summary(project_id, db, loader=loader),
+            self.get_progress_metrics(project_id, db, loader=loader),
+        )
+
+        computed = loader.computed()
+        if computed and await self._recently_invalidated(project_id):
+            # ``db`` may be a replica that predates the invalidating write
+            computed = {}
+        await self._set_many_cached(
+            {
+                cache_key: {"health_score": computed[(name, project_id)]}
+                if name == "health"
+                else computed[(name, project_id)]
+                for name, cache_key in cache_keys.items()
+                if (name, project_id) in computed
+            }
+        )
+
+        return {
+            "health_score": health,
+            "critical_path": critical_path,
+            "resources": resources,
+            "simulation": simulation,
+            "progress": progress,
+        }
+
+    async def _cached_metric(
+        self,
+        name: str,
+        project_id: UUID,
+        db: AsyncSession,
+        loader: Optional[AnalyticsLoader],
+        compute: Callable[[AnalyticsLoader], Awaitable[Dict[str, Any]]],
+    ) -> Dict[str, Any]:
+        """Memoize a metric in ``loader``, or read and write its own cache entry."""
+        if loader is not None:
+            return await loader.load((name, project_id), lambda: compute(loader))
+
+        cache_key = f"{self.OVERVIEW_METRICS[name]}:{project_id}"
+        cached = await self._get_cached(
+            cache_key, refresh=lambda: self._recompute(name, project_id)
+        )
+        if cached:
+            return cached
+
+        metrics = await compute(AnalyticsLoader(db))
+        if not await self._recently_invalidated(project_id):
+            await self._set_cached(cache_key, metrics)
+        return metrics
 
     async def calculate_project_health_score(
-        self, project_id: UUID, db: AsyncSession
+        self,
+        project_id: UUID,
+        db: AsyncSession,
+        loader: Optional[AnalyticsLoader] = None,
     ) -> float:
         """
         Calculate overall project health score (0-100).
@@ -102,6 +506,7 @@ class AnalyticsService:
         Args:
             project_id: UUID of the project
             db: Database session
+            loader: Request-scoped loader to share loads with other metrics
 
         Returns:
             float: Health score 0-100 (100 = excellent health)
@@ -109,26 +514,37 @@ class AnalyticsService:
         Raises:
             AnalyticsError: If calculation fails
         """
+        if loader is not None:
+            return await loader.load(
+                ("health", project_id), lambda: self._health_score(project_id, loader)
+            )
+
         cache_key = f"analytics:health:{project_id}"
-        cached = await self._get_cached(cache_key)
+        cached = await self._get_cached(
+            cache_key, refresh=lambda: self._recompute("health", project_id)
+        )
         if cached:
             return cached["health_score"]
 
+        health_score = await self._health_score(project_id, AnalyticsLoader(db))
+
+        # Cache result
+        if not await self._recently_invalidated(project_id):
+            await self._set_cached(cache_key, {"health_score": health_score})
+
+        return health_score
+
+    async def _health_score(self, project_id: UUID, loader: AnalyticsLoader) -> float:
+        """Compute the health score from loader-provided data."""
+        db = loader.db
         try:
             # Get project
-            result = await db.execute(select(Project).where(Project.id == project_id))
-            project = result.scalar_one_or_none()
+            project = await loader.project(project_id)
             if not project:
                 raise AnalyticsError(f"Project {project_id} not found")
 
             # Get latest simulation result for risk assessment
-            sim_result = await db.execute(
-                select(SimulationResult)
-                .where(SimulationResult.project_id == project_id)
-                .order_by(SimulationResult.created_at.desc())
-                .limit(1)
-            )
-            latest_sim = sim_result.scalar_one_or_none()
+            latest_sim = await loader.latest_simulation(project_id)
 
             # Calculate component scores
             schedule_score = await self._calculate_schedule_adherence_score(
@@ -138,10 +554,12 @@ class AnalyticsService:
                 project, db
             )
             resource_score = await self._calculate_resource_utilization_score(
-                project, db
+                project, db, loader=loader
             )
             risk_score = self._calculate_risk_score(latest_sim) if latest_sim else 50.0
-            completion_score = await self._calculate_completion_rate_score(project, db)
+            completion_score = await self._calculate_completion_rate_score(
+                project, db, loader=loader
+            )
 
             # Weighted average
             health_score = (
@@ -152,9 +570,6 @@ class AnalyticsService:
                 + completion_score * 0.10
             )
 
-            # Cache result
-            await self._set_cached(cache_key, {"health_score": health_score})
-
             return round(health_score, 2)
 
         except Exception as e:
@@ -162,7 +577,10 @@ class AnalyticsService:
             raise AnalyticsError(f"Failed to calculate health score: {e}") from e
 
     async def get_critical_path_metrics(
-        self, project_id: UUID, db: AsyncSession
+        self,
+        project_id: UUID,
+        db: AsyncSession,
+        loader: Optional[AnalyticsLoader] = None,
     ) -> Dict[str, Any]:
         """
         Get critical path analysis metrics.
@@ -170,6 +588,7 @@ class AnalyticsService:
         Args:
             project_id: UUID of the project
             db: Database session
+            loader: Request-scoped loader to share loads with other metrics
 
         Returns:
             {
@@ -183,15 +602,21 @@ class AnalyticsService:
         Raises:
             AnalyticsError: If calculation fails
         """
-        cache_key = f"analytics:critical_path:{project_id}"
-        cached = await self._get_cached(cache_key)
-        if cached:
-            return cached
-
+        return await self._cached_metric(
+            "critical_path",
+            project_id,
+            db,
+            loader,
+            lambda loader: self._critical_path_metrics(project_id, loader),
+        )
+
+    async def _critical_path_metrics(
+        self, project_id: UUID, loader: AnalyticsLoader
+    ) -> Dict[str, Any]:
+        """Compute critical path metrics from loader-provided data."""
         try:
             # Get project configuration
-            result = await db.execute(select(Project).where(Project.id == project_id))
-            project = result.scalar_one_or_none()
+            project = await loader.project(project_id)
             if not project:
                 raise AnalyticsError(f"Project {project_id} not found")
 
@@ -206,7 +631,6 @@ class AnalyticsService:
                     "risk_tasks": [],
                     "path_stability_score": 100.0,
                 }
-                await self._set_cached(cache_key, metrics)
                 return metrics
 
             # Build task graph
@@ -241,7 +665,7 @@ class AnalyticsService:
 
             # Calculate path stability score
             path_stability_score = await self._calculate_critical_path_stability_score(
-                project, db
+                project, loader.db
             )
 
             metrics = {
@@ -252,7 +676,6 @@ class AnalyticsService:
                 "path_stability_score": round(path_stability_score, 2),
             }
 
-            await self._set_cached(cache_key, metrics)
             return metrics
 
         except Exception as e:
@@ -262,7 +685,10 @@ class AnalyticsService:
             ) from e
 
     async def get_resource_utilization(
-        self, project_id: UUID, db: AsyncSession
+        self,
+        project_id: UUID,
+        db: AsyncSession,
+        loader: Optional[AnalyticsLoader] = None,
     ) -> Dict[str, Any]:
         """
         Calculate resource allocation and utilization metrics.
@@ -270,6 +696,7 @@ class AnalyticsService:
         Args:
             project_id: UUID of the project
             db: Database session
+            loader: Request-scoped loader to share loads with other metrics
 
         Returns:
             {
@@ -284,15 +711,21 @@ class AnalyticsService:
         Raises:
             AnalyticsError: If calculation fails
         """
-        cache_key = f"analytics:resources:{project_id}"
-        cached = await self._get_cached(cache_key)
-        if cached:
-            return cached
-
+        return await self._cached_metric(
+            "resources",
+            project_id,
+            db,
+            loader,
+            lambda loader: self._resource_utilization(project_id, loader),
+        )
+
+    async def _resource_utilization(
+        self, project_id: UUID, loader: AnalyticsLoader
+    ) -> Dict[str, Any]:
+        """Compute resource utilization from loader-provided data."""
         try:
             # Get project
-            result = await db.execute(select(Project).where(Project.id == project_id))
-            project = result.scalar_one_or_none()
+            project = await loader.project(project_id)
             if not project:
                 raise AnalyticsError(f"Project {project_id} not found")
 
@@ -365,7 +798,6 @@ class AnalyticsService:
                 "resource_timeline": resource_timeline,
             }
 
-            await self._set_cached(cache_key, metrics)
             return metrics
 
         except Exception as e:
@@ -375,7 +807,10 @@ class AnalyticsService:
             ) from e
 
     async def get_simulation_summary(
-        self, project_id: UUID, db: AsyncSession
+        self,
+        project_id: UUID,
+        db: AsyncSession,
+        loader: Optional[AnalyticsLoader] = None,
     ) -> Dict[str, Any]:
         """
         Aggregate Monte Carlo simulation results.
@@ -383,6 +818,7 @@ class AnalyticsService:
         Args:
             project_id: UUID of the project
             db: Database session
+            loader: Request-scoped loader to share loads with other metrics
 
         Returns:
             {
@@ -403,20 +839,21 @@ class AnalyticsService:
         Raises:
             AnalyticsError: If calculation fails
         """
-        cache_key = f"analytics:simulation:{project_id}"
-        cached = await self._get_cached(cache_key)
-        if cached:
-            return cached
-
+        return await self._cached_metric(
+            "simulation",
+            project_id,
+            db,
+            loader,
+            lambda loader: self._simulation_summary(project_id, loader),
+        )
+
+    async def _simulation_summary(
+        self, project_id: UUID, loader: AnalyticsLoader
+    ) -> Dict[str, Any]:
+        """Compute the simulation summary from loader-provided data."""
         try:
             # Get latest simulation result
-            result = await db.execute(
-                select(SimulationResult)
-                .where(SimulationResult.project_id == project_id)
-                .order_by(SimulationResult.created_at.desc())
-                .limit(1)
-            )
-            sim_result = result.scalar_one_or_none()
+            sim_result = await loader.latest_simulation(project_id)
 
             if not sim_result:
                 # Return default values if no simulation exists
@@ -434,7 +871,6 @@ class AnalyticsService:
                     "confidence_80pct_range": [0.0, 0.0],
                     "histogram_data": [],
                 }
-                await self._set_cached(cache_key, summary)
                 return summary
 
             # Extract percentiles from confidence_intervals
@@ -498,7 +934,6 @@ class AnalyticsService:
                 "histogram_data": histogram_data,
             }
 
-            await self._set_cached(cache_key, summary)
             return summary
 
         except Exception as e:
@@ -506,7 +941,10 @@ class AnalyticsService:
             raise AnalyticsError(f"Failed to calculate simulation summary: {e}") from e
 
     async def get_progress_metrics(
-        self, project_id: UUID, db: AsyncSession
+        self,
+        project_id: UUID,
+        db: AsyncSession,
+        loader: Optional[AnalyticsLoader] = None,
     ) -> Dict[str, Any]:
         """
         Calculate progress tracking metrics.
@@ -514,6 +952,7 @@ class AnalyticsService:
         Args:
             project_id: UUID of the project
             db: Database session
+            loader: Request-scoped loader to share loads with other metrics
 
         Returns:
             {
@@ -530,20 +969,31 @@ class AnalyticsService:
         Raises:
             AnalyticsError: If calculation fails
         """
-        cache_key = f"analytics:progress:{project_id}"
-        cached = await self._get_cached(cache_key)
-        if cached:
-            # Convert date string back to date object
-            if "estimated_completion_date" in cached and cached["estimated_completion_date"]:
-                cached["estimated_completion_date"] = datetime.fromisoformat(
-                    cached["estimated_completion_date"]
-                ).date()
-            return cached
-
+        metrics = await self._cached_metric(
+            "progress",
+            project_id,
+            db,
+            loader,
+            lambda loader: self._progress_metrics(project_id, loader),
+        )
+        return self._restore_progress_dates(metrics)
+
+    @staticmethod
+    def _restore_progress_dates(metrics: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a cached date string back to a date object."""
+        if isinstance(metrics.get("estimated_completion_date"), str):
+            metrics["estimated_completion_date"] = datetime.fromisoformat(
+                metrics["estimated_completion_date"]
+            ).date()
+        return metrics
+
+    async def _progress_metrics(
+        self, project_id: UUID, loader: AnalyticsLoader
+    ) -> Dict[str, Any]:
+        """Compute progress metrics from loader-provided data."""
         try:
             # Get project
-            result = await db.execute(select(Project).where(Project.id == project_id))
-            project = result.scalar_one_or_none()
+            project = await loader.project(project_id)
             if not project:
                 raise AnalyticsError(f"Project {project_id} not found")
 
@@ -560,7 +1010,6 @@ class AnalyticsService:
                     "estimated_completion_date": None,
                     "variance_from_plan": 0,
                 }
-                await self._set_cached(cache_key, metrics)
                 return metrics
 
             # Calculate completion metrics
@@ -605,13 +1054,7 @@ class AnalyticsService:
 
             # Calculate variance from plan
             # Get baseline from simulation or configuration
-            result = await db.execute(
-                select(SimulationResult)
-                .where(SimulationResult.project_id == project_id)
-                .order_by(SimulationResult.created_at.asc())
-                .limit(1)
-            )
-            baseline_sim = result.scalar_one_or_none()
+            baseline_sim = await loader.first_simulation(project_id)
 
             if baseline_sim and estimated_completion_date:
                 # Compare to baseline median duration
@@ -632,7 +1075,6 @@ class AnalyticsService:
                 "variance_from_plan": variance_from_plan,
             }
 
-            await self._set_cached(cache_key, metrics)
             return metrics
 
         except Exception as e:
@@ -658,11 +1100,14 @@ class AnalyticsService:
         return 85.0
 
     async def _calculate_resource_utilization_score(
-        self, project: Project, db: AsyncSession
+        self,
+        project: Project,
+        db: AsyncSession,
+        loader: Optional[AnalyticsLoader] = None,
     ) -> float:
         """Calculate resource utilization component (0-100)."""
         # Target 70-90% utilization as optimal
-        metrics = await self.get_resource_utilization(project.id, db)
+        metrics = await self.get_resource_utilization(project.id, db, loader=loader)
         utilization = metrics["utilization_pct"]
 
         if 70 <= utilization <= 90:
@@ -695,10 +1140,13 @@ class AnalyticsService:
         return 50.0
 
     async def _calculate_completion_rate_score(
-        self, project: Project, db: AsyncSession
+        self,
+        project: Project,
+        db: AsyncSession,
+        loader: Optional[AnalyticsLoader] = None,
     ) -> float:
         """Calculate completion rate component (0-100)."""
-        metrics = await self.get_progress_metrics(project.id, db)
+        metrics = await self.get_progress_metrics(project.id, db, loader=loader)
         completion_pct = metrics["completion_pct"]
 
         # Higher completion = higher score
@@ -712,3 +1160,17 @@ class AnalyticsService:
         """Close Redis connection if open."""
         if self._redis_client:
             await self._redis_client.close()
+
+
+async def invalidate_project_analytics(project_id: UUID) -> None:
+    """
+    Drop cached analytics after a project's tasks or simulations change.
+
+    Args:
+        project_id: UUID of the project
+    """
+    service = AnalyticsService()
+    try:
+        await service.invalidate_project(project_id)
+    finally:
+        await service.close()
@@ -0,0 +1,140 @@
+"""
+Cache for baseline comparison results.
+
+Entries live in Redis when it is reachable and in a bounded in-process
+LRU otherwise. Comparison pages are keyed by a per-project tasks version,
+so they never need explicit invalidation: changing the tasks bumps the
+version and later lookups miss.
+"""
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+import redis.asyncio as redis
+import structlog
+
+from app.core.config import get_settings
+
+logger = structlog.get_logger(__name__)
+
+# Lifetime of cached comparison pages (their keys are content-versioned)
+COMPARISON_CACHE_TTL = 3600
+
+# Lifetime of a project's tasks version; bounds staleness when a write
+# happens in another process and only the local cache is available
+TASKS_VERSION_TTL = 300
+
+LOCAL_CACHE_SIZE = 256
+
+# Seconds to wait before retrying an unreachable Redis
+REDIS_RETRY_SECONDS = 30
+
+
+class BaselineComparisonCache:
+    """Key-value cache with Redis and an in-process fallback."""
+
+    def __init__(self, max_local_entries: int = LOCAL_CACHE_SIZE):
+        """
+        Initialize the cache.
+
+        Args:
+            max_local_entries: Capacity of the in-process LRU
+        """
+        self.max_local_entries = max_local_entries
+        self._local: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._redis_client: Optional[redis.Redis] = None
+        self._redis_retry_at = 0.0
+
+    async def _get_redis(self) -> Optional[redis.Redis]:
+        """Get Redis client, reconnecting at most every REDIS_RETRY_SECONDS."""
+        if self._redis_client is None and time.monotonic() >= self._redis_retry_at:
+            try:
+                client = redis.from_url(
+                    get_settings().redis_url, encoding="utf-8", decode_responses=True
+                )
+                await client.ping()
+                self._redis_client = client
+            except Exception as e:
+                logger.warning("Redis unavailable for comparison cache", error=str(e))
+                self._redis_retry_at = time.monotonic() + REDIS_RETRY_SECONDS
+        return self._redis_client
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for ``key``, or None."""
+        client = await self._get_redis()
+        if client is not None:
+            try:
+                cached = await client.get(key)
+                return json.loads(cached) if cached else None
+            except Exception as e:
+                logger.warning("Comparison cache get failed", key=key, error=str(e))
+                self._redis_client = None
+
+        entry = self._local.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._local[key]
+            return None
+        self._local.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: Any, ttl: int = COMPARISON_CACHE_TTL) -> None:
+        """Store ``value`` under ``key`` for ``ttl`` seconds."""
+        client = await self._get_redis()
+        if client is not None:
+            try:
+                await client.setex(key, ttl, json.dumps(value, default=str))
+                return
+            except Exception as e:
+                logger.warning("Comparison cache set failed", key=key, error=str(e))
+                self._redis_client = None
+
+        self._local[key] = (time.monotonic() + ttl, value)
+        self._local.move_to_end(key)
+        while len(self._local) > self.max_local_entries:
+            self._local.popitem(last=False)
+
+    def clear_local(self) -> None:
+        """Drop all in-process entries."""
+        self._local.clear()
+
+
+def tasks_version_key(project_id: Any) -> str:
+    """Cache key of a project's tasks version."""
+    return f"baseline:tasks_version:{project_id}"
+
+
+def comparison_key(
+    project_id: Any,
+    baseline_id: Any,
+    version: str,
+    include_unchanged: bool,
+    offset: int,
+    limit: Optional[int],
+) -> str:
+    """Cache key of one comparison page."""
+    return (
+        f"baseline:compare:{project_id}:{baseline_id}:{version}:"
+        f"{int(include_unchanged)}:{offset}:{limit}"
+    )
+
+
+def comparison_etag(cache_key: str) -> str:
+    """Strong ETag for a comparison page; its key already encodes the content."""
+    return '"' + hashlib.sha256(cache_key.encode()).hexdigest()[:32] + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header value against ``etag``."""
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates or f"W/{etag}" in candidates
+
+
+comparison_cache = BaselineComparisonCache()
@@ -5,17 +5,46 @@ Handles creation of project snapshots, baseline activation, and variance analysi
 between current project state and historical baselines.
 """
 
+from collections import OrderedDict
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from uuid import UUID
+import hashlib
 import json
+import time
 
-from sqlalchemy import select, update, text
+import structlog
+from sqlalchemy import select, update, text, desc
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 
 from app.models.baseline import ProjectBaseline
 from app.models.project import Project
+from app.services.baseline_compare_cache import (
+    TASKS_VERSION_TTL,
+    comparison_cache,
+    comparison_etag,
+    comparison_key,
+    etag_matches,
+    tasks_version_key,
+)
+from app.services.baseline_snapshot import ColumnarSnapshot, SnapshotDelta, diff_snapshots
+
+logger = structlog.get_logger(__name__)
+
+# Delta chains are cut with a keyframe after this many deltas
+MAX_DELTA_DEPTH = 10
+
+# A delta touching more than this share of rows is stored as a keyframe
+KEYFRAME_CHANGE_RATIO = 0.5
+
+MATERIALIZED_CACHE_SIZE = 32
+
+# Page size of the comparison precomputed for the active baseline
+DEFAULT_COMPARISON_LIMIT = 500
+
+# Baseline ID -> materialized snapshot (baselines are immutable)
+_materialized_cache: "OrderedDict[UUID, ColumnarSnapshot]" = OrderedDict()
 
 
 class BaselineError(Exception):
@@ -24,6 +53,12 @@ class BaselineError(Exception):
     pass
 
 
+class BaselineNotFoundError(BaselineError):
+    """Raised when a baseline does not exist or belongs to another project."""
+
+    pass
+
+
 class BaselineService:
     """
     Business logic service for project baseline management.
@@ -33,6 +68,11 @@ class BaselineService:
     - Managing active baseline status
     - Computing variance between baseline and current state
     - Caching comparison results
+
+    Snapshot tasks are stored column-wise in ``snapshot_columns`` (see
+    ColumnarSnapshot); ``snapshot_data`` keeps the remaining project state.
+    Each new baseline is stored as a delta against the project's latest
+    baseline, with a full keyframe every MAX_DELTA_DEPTH baselines.
     """
 
     MAX_SNAPSHOT_SIZE = 10 * 1024 * 1024  # 10MB in bytes
@@ -65,17 +105,31 @@ class BaselineService:
         try:
             # Start SERIALIZABLE transaction for consistent snapshot
             async with db.begin_nested():
-                # Set transaction isolation level
-                await db.execute(
-                    text("SET TRANSACTION ISOLATION LEVEL SERIALIZABLE")
-                )
+                # Set transaction isolation level (SQLite transactions
+                # are already serializable and reject the statement)
+                if db.get_bind().dialect.name != "sqlite":
+                    await db.execute(
+                        text("SET TRANSACTION ISOLATION LEVEL SERIALIZABLE")
+                    )
+
+                started = time.perf_counter()
 
                 # Build snapshot data
                 snapshot_data = await self._build_snapshot_data(project_id, db)
 
+                # Tasks are stored column-wise, not in the JSON document
+                columns = ColumnarSnapshot.from_tasks(snapshot_data.get("tasks", []))
+                snapshot_data = {**snapshot_data, "tasks": []}
+                parent = await self._delta_parent(project_id, columns, db)
+                if parent is not None:
+                    parent_baseline, delta = parent
+                    snapshot_columns = delta.to_bytes()
+                else:
+                    snapshot_columns = columns.to_bytes()
+
                 # Validate snapshot size
                 snapshot_json = json.dumps(snapshot_data)
-                snapshot_size = len(snapshot_json.encode("utf-8"))
+                snapshot_size = len(snapshot_json.encode("utf-8")) + len(snapshot_columns)
 
                 if snapshot_size > self.MAX_SNAPSHOT_SIZE:
                     raise ValueError(
@@ -89,8 +143,12 @@ class BaselineService:
                     name=name,
                     description=description,
                     snapshot_data=snapshot_data,
+                    snapshot_columns=snapshot_columns,
+                    base_baseline_id=parent_baseline.id if parent else None,
+                    delta_depth=parent_baseline.delta_depth + 1 if parent else 0,
                     is_active=False,
                     snapshot_size_bytes=snapshot_size,
+                    write_time_ms=round((time.perf_counter() - started) * 1000, 2),
                 )
 
                 db.add(baseline)
@@ -102,6 +160,16 @@ class BaselineService:
             # Refresh to get all computed fields
             await db.refresh(baseline)
 
+            _remember(baseline.id, columns)
+            logger.info(
+                "Baseline stored",
+                baseline_id=str(baseline.id),
+                is_keyframe=baseline.base_baseline_id is None,
+                delta_depth=baseline.delta_depth,
+                snapshot_size_bytes=baseline.snapshot_size_bytes,
+                write_time_ms=baseline.write_time_ms,
+            )
+
             return baseline
 
         except IntegrityError as e:
@@ -160,30 +228,130 @@ class BaselineService:
             await db.commit()
             await db.refresh(baseline)
 
-            return baseline
-
         except Exception as e:
             await db.rollback()
             raise BaselineError(f"Failed to activate baseline: {e}") from e
 
+        await self.refresh_active_comparison(project_id, db)
+
+        return baseline
+
+    async def delete_baseline(
+        self,
+        baseline_id: UUID,
+        project_id: UUID,
+        db: AsyncSession,
+    ) -> None:
+        """
+        Delete a baseline, re-encoding the deltas that depend on it.
+
+        Each dependent baseline is rebased onto the deleted baseline's own
+        parent, or stored as a keyframe when the deleted one was a keyframe.
+
+        Args:
+            baseline_id: Baseline UUID to delete
+            project_id: Project UUID
+            db: Database session
+
+        Raises:
+            BaselineNotFoundError: If baseline not found
+            BaselineError: If deletion fails
+        """
+        result = await db.execute(
+            select(ProjectBaseline).where(
+                ProjectBaseline.id == baseline_id,
+                ProjectBaseline.project_id == project_id,
+            )
+        )
+        baseline = result.scalar_one_or_none()
+
+        if not baseline:
+            raise BaselineNotFoundError(
+                f"Baseline {baseline_id} not found or does not belong to project {project_id}"
+            )
+
+        try:
+            children = (
+                await db.execute(
+                    select(ProjectBaseline).where(
+                        ProjectBaseline.base_baseline_id == baseline_id
+                    )
+                )
+            ).scalars().all()
+
+            if children:
+                parent_columns = None
+                if baseline.base_baseline_id is not None:
+                    parent = await db.get(ProjectBaseline, baseline.base_baseline_id)
+                    parent_columns = await self.load_snapshot(parent, db)
+
+                for child in children:
+                    columns = await self.load_snapshot(child, db)
+                    if parent_columns is None:
+                        child.snapshot_columns = columns.to_bytes()
+                        child.base_baseline_id = None
+                    else:
+                        child.snapshot_columns = SnapshotDelta.between(
+                            parent_columns, columns
+                        ).to_bytes()
+                        child.base_baseline_id = baseline.base_baseline_id
+                    child.snapshot_size_bytes = len(
+                        json.dumps(child.snapshot_data).encode("utf-8")
+                    ) + len(child.snapshot_columns)
+
+                # Depths below the deleted baseline shrink by one
+                await self._shift_depths([c.id for c in children], db)
+
+            await db.delete(baseline)
+            await db.commit()
+            _materialized_cache.pop(baseline_id, None)
+
+        except Exception as e:
+            await db.rollback()
+            raise BaselineError(f"Failed to delete baseline: {e}") from e
+
+    async def _shift_depths(self, baseline_ids: List[UUID], db: AsyncSession) -> None:
+        """Decrement delta_depth for the given baselines and their descendants."""
+        while baseline_ids:
+            await db.execute(
+                update(ProjectBaseline)
+                .where(ProjectBaseline.id.in_(baseline_ids))
+                .values(delta_depth=ProjectBaseline.delta_depth - 1)
+                .execution_options(synchronize_session="fetch")
+            )
+            baseline_ids = list(
+                (
+                    await db.execute(
+                        select(ProjectBaseline.id).where(
+                            ProjectBaseline.base_baseline_id.in_(baseline_ids)
+                        )
+                    )
+                ).scalars()
+            )
+
     async def compare_to_baseline(
         self,
         baseline_id: UUID,
         project_id: UUID,
         db: AsyncSession,
         include_unchanged: bool = False,
+        offset: int = 0,
+        limit: Optional[int] = None,
     ) -> Dict[str, Any]:
         """
         Compare current project state against a baseline.
 
         Calculates task-level variances, identifies new/deleted tasks,
-        and provides summary statistics.
+        and provides summary statistics. Only the requested page of task
+        variances is materialized.
 
         Args:
             baseline_id: Baseline UUID to compare against
             project_id: Project UUID
             db: Database session
             include_unchanged: Include tasks with zero variance
+            offset: Index of the first task variance to return
+            limit: Maximum task variances to return (None for all)
 
         Returns:
             Dictionary with comparison results
@@ -204,13 +372,16 @@ class BaselineService:
                 )
 
             # Get current project state
-            current_snapshot = await self._build_snapshot_data(project_id, db)
+            project = await self._get_project(project_id, db)
+            current = ColumnarSnapshot.from_tasks(self._project_tasks(project))
 
             # Perform variance analysis
-            comparison = self._calculate_variance(
-                baseline.snapshot_data,
-                current_snapshot,
+            comparison = diff_snapshots(
+                await self.load_snapshot(baseline, db),
+                current,
                 include_unchanged=include_unchanged,
+                offset=offset,
+                limit=limit,
             )
 
             # Add baseline metadata
@@ -228,6 +399,248 @@ class BaselineService:
         except Exception as e:
             raise BaselineError(f"Comparison failed: {e}") from e
 
+    async def get_comparison(
+        self,
+        baseline_id: UUID,
+        project_id: UUID,
+        db: AsyncSession,
+        include_unchanged: bool = False,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        if_none_match: Optional[str] = None,
+    ) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """
+        Return a comparison page from cache, computing it on a miss.
+
+        Pages are keyed by the project's tasks version, so the ETag changes
+        exactly when the tasks or the requested page change.
+
+        Args:
+            baseline_id: Baseline UUID to compare against
+            project_id: Project UUID
+            db: Database session
+            include_unchanged: Include tasks with zero variance
+            offset: Index of the first task variance to return
+            limit: Maximum task variances to return (None for all)
+            if_none_match: Client's If-None-Match header
+
+        Returns:
+            (ETag, comparison); comparison is None when ``if_none_match``
+            already matches the ETag
+
+        Raises:
+            BaselineError: If baseline not found or comparison fails
+        """
+        result = await db.execute(
+            select(ProjectBaseline.project_id).where(ProjectBaseline.id == baseline_id)
+        )
+        if result.scalar_one_or_none() != project_id:
+            raise BaselineError(
+                f"Baseline {baseline_id} not found or does not belong to project {project_id}"
+            )
+
+        version = await self._tasks_version(project_id, db)
+        key = comparison_key(
+            project_id, baseline_id, version, include_unchanged, offset, limit
+        )
+        etag = comparison_etag(key)
+        if etag_matches(if_none_match, etag):
+            return etag, None
+
+        comparison = await comparison_cache.get(key)
+        if comparison is None:
+            comparison = await self.compare_to_baseline(
+                baseline_id,
+                project_id,
+                db,
+                include_unchanged=include_unchanged,
+                offset=offset,
+                limit=limit,
+            )
+            await comparison_cache.set(key, comparison)
+
+        return etag, comparison
+
+    async def refresh_active_comparison(self, project_id: UUID, db: AsyncSession) -> None:
+        """
+        Precompute the default comparison page against the active baseline.
+
+        Called when a baseline is activated and whenever the project's
+        tasks change. The baseline side comes from the materialized
+        snapshot cache, so only the current tasks are re-read. Failures
+        are logged and leave the comparison to be computed on request.
+
+        Args:
+            project_id: Project UUID
+            db: Database session
+        """
+        try:
+            project = await self._get_project(project_id, db)
+            version = self._tasks_hash(self._project_tasks(project))
+            await comparison_cache.set(
+                tasks_version_key(project_id), version, ttl=TASKS_VERSION_TTL
+            )
+
+            result = await db.execute(
+                select(ProjectBaseline.id).where(
+                    ProjectBaseline.project_id == project_id,
+                    ProjectBaseline.is_active.is_(True),
+                )
+            )
+            baseline_id = result.scalar_one_or_none()
+            if baseline_id is None:
+                return
+
+            comparison = await self.compare_to_baseline(
+                baseline_id, project_id, db, limit=DEFAULT_COMPARISON_LIMIT
+            )
+            await comparison_cache.set(
+                comparison_key(
+                    project_id, baseline_id, version, False, 0, DEFAULT_COMPARISON_LIMIT
+                ),
+                comparison,
+            )
+        except Exception as e:
+            logger.warning(
+                "Failed to precompute baseline comparison",
+                project_id=str(project_id),
+                error=str(e),
+            )
+
+    async def _tasks_version(self, project_id: UUID, db: AsyncSession) -> str:
+        """Return the cached tasks version, hashing the tasks on a miss."""
+        key = tasks_version_key(project_id)
+        version = await comparison_cache.get(key)
+        if version is None:
+            project = await self._get_project(project_id, db)
+            version = self._tasks_hash(self._project_tasks(project))
+            await comparison_cache.set(key, version, ttl=TASKS_VERSION_TTL)
+        return version
+
+    @staticmethod
+    def _tasks_hash(tasks: List[Dict[str, Any]]) -> str:
+        """Content hash of a task list."""
+        payload = json.dumps(tasks, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+    async def load_snapshot(
+        self, baseline: ProjectBaseline, db: AsyncSession
+    ) -> ColumnarSnapshot:
+        """
+        Load a baseline's tasks in columnar form.
+
+        Delta baselines are rebuilt by walking up to the nearest keyframe
+        (or cached ancestor) and applying deltas downwards. Baselines
+        created before columnar storage keep their tasks in
+        ``snapshot_data``; those are converted on the fly.
+
+        Args:
+            baseline: Baseline to load
+            db: Database session
+
+        Returns:
+            ColumnarSnapshot of the baseline's tasks
+
+        Raises:
+            BaselineError: If the delta chain is broken
+        """
+        # Collect the chain of deltas up to a keyframe or cached snapshot
+        chain: List[ProjectBaseline] = []
+        node = baseline
+
+        while True:
+            cached = _materialized_cache.get(node.id)
+            if cached is not None:
+                _materialized_cache.move_to_end(node.id)
+                snapshot = cached
+                break
+            if node.base_baseline_id is None:
+                if node.delta_depth:
+                    raise BaselineError(f"Baseline {node.id} is missing its delta base")
+                snapshot = (
+                    ColumnarSnapshot.from_bytes(node.snapshot_columns)
+                    if node.snapshot_columns
+                    else ColumnarSnapshot.from_tasks(node.snapshot_data.get("tasks", []))
+                )
+                _remember(node.id, snapshot)
+                break
+
+            chain.append(node)
+            parent = await db.get(ProjectBaseline, node.base_baseline_id)
+            if parent is None:
+                raise BaselineError(f"Baseline {node.id} is missing its delta base")
+            node = parent
+
+        for node in reversed(chain):
+            snapshot = SnapshotDelta.from_bytes(node.snapshot_columns).apply(snapshot)
+            _remember(node.id, snapshot)
+
+        return snapshot
+
+    async def materialize_snapshot(
+        self, baseline: ProjectBaseline, db: AsyncSession
+    ) -> Dict[str, Any]:
+        """
+        Return the full snapshot document with tasks restored.
+
+        Args:
+            baseline: Baseline to materialize
+            db: Database session
+
+        Returns:
+            Snapshot dictionary including the ``tasks`` list
+        """
+        if not baseline.snapshot_columns:
+            return baseline.snapshot_data
+        columns = await self.load_snapshot(baseline, db)
+        return {**baseline.snapshot_data, "tasks": columns.to_tasks()}
+
+    async def _delta_parent(
+        self, project_id: UUID, columns: ColumnarSnapshot, db: AsyncSession
+    ) -> Optional[tuple]:
+        """
+        Choose the baseline a new snapshot is stored as a delta against.
+
+        Args:
+            project_id: Project UUID
+            columns: New snapshot
+            db: Database session
+
+        Returns:
+            (parent baseline, delta) or None when a keyframe should be stored
+        """
+        result = await db.execute(
+            select(ProjectBaseline)
+            .where(ProjectBaseline.project_id == project_id)
+            .order_by(desc(ProjectBaseline.created_at), desc(ProjectBaseline.delta_depth))
+            .limit(1)
+        )
+        latest = result.scalar_one_or_none()
+
+        if latest is None or latest.delta_depth + 1 > MAX_DELTA_DEPTH:
+            return None
+
+        delta = SnapshotDelta.between(await self.load_snapshot(latest, db), columns)
+        if delta.changed_rows > KEYFRAME_CHANGE_RATIO * max(len(columns), 1):
+            return None
+
+        return latest, delta
+
+    async def _get_project(self, project_id: UUID, db: AsyncSession) -> Project:
+        """Fetch a project or raise BaselineError."""
+        result = await db.execute(select(Project).where(Project.id == project_id))
+        project = result.scalar_one_or_none()
+
+        if not project:
+            raise BaselineError(f"Project {project_id} not found")
+
+        return project
+
+    @staticmethod
+    def _project_tasks(project: Project) -> List[Dict[str, Any]]:
+        """Return the tasks stored in the project configuration."""
+        return list((project.configuration or {}).get("tasks") or [])
+
     async def _build_snapshot_data(
         self, project_id: UUID, db: AsyncSession
     ) -> Dict[str, Any]:
@@ -247,34 +660,29 @@ class BaselineService:
         Raises:
             BaselineError: If project not found
         """
-        # Get project
-        result = await db.execute(select(Project).where(Project.id == project_id))
-        project = result.scalar_one_or_none()
+        project = await self._get_project(project_id, db)
+        tasks = self._project_tasks(project)
+        completed = sum(1 for t in tasks if t.get("status") == "completed")
 
-        if not project:
-            raise BaselineError(f"Project {project_id} not found")
-
-        # For MVP, we're capturing basic project metadata
-        # In production, this would include:
-        # - All tasks with dependencies, dates, status
-        # - Critical path calculation
-        # - Monte Carlo results
-        # - Resource assignments
+        # Tasks are captured once, not again inside the configuration
+        configuration = {
+            k: v for k, v in (project.configuration or {}).items() if k != "tasks"
+        }
 
         snapshot = {
             "project": {
                 "id": str(project.id),
                 "name": project.name,
                 "description": project.description,
-                "configuration": project.configuration,
+                "configuration": configuration,
                 "template_version": project.template_version,
             },
-            "tasks": [],  # TODO: Implement task retrieval
+            "tasks": tasks,
             "critical_path": [],  # TODO: Implement critical path calculation
             "monte_carlo_results": {},  # TODO: Implement MC results retrieval
             "snapshot_metadata": {
-                "total_tasks": 0,  # TODO: Calculate from actual tasks
-                "completion_pct": 0.0,  # TODO: Calculate from task statuses
+                "total_tasks": len(tasks),
+                "completion_pct": round(100.0 * completed / len(tasks), 1) if tasks else 0.0,
                 "snapshot_timestamp": datetime.utcnow().isoformat(),
             },
         }
@@ -288,7 +696,10 @@ class BaselineService:
         include_unchanged: bool = False,
     ) -> Dict[str, Any]:
         """
-        Calculate variance between baseline and current state.
+        Calculate variance between two snapshot documents.
+
+        Converts both task lists to columnar form and delegates to
+        diff_snapshots.
 
         Args:
             baseline_snapshot: Historical baseline snapshot data
@@ -298,103 +709,18 @@ class BaselineService:
         Returns:
             Dictionary with variance analysis
         """
-        # Build task lookup dictionaries
-        baseline_tasks = {
-            t["id"]: t for t in baseline_snapshot.get("tasks", [])
-        }
-        current_tasks = {
-            t["id"]: t for t in current_snapshot.get("tasks", [])
-        }
-
-        # Calculate task variances
-        task_variances = []
-        for task_id, baseline_task in baseline_tasks.items():
-            if task_id in current_tasks:
-                current_task = current_tasks[task_id]
-                variance = self._calculate_task_variance(baseline_task, current_task)
-
-                # Filter unchanged tasks if requested
-                if include_unchanged or variance["variance_days"] != 0:
-                    task_variances.append(variance)
-
-        # Find new and deleted tasks
-        new_task_ids = set(current_tasks.keys()) - set(baseline_tasks.keys())
-        deleted_task_ids = set(baseline_tasks.keys()) - set(current_tasks.keys())
-
-        new_tasks = [
-            {
-                "task_id": tid,
-                "task_name": current_tasks[tid].get("name", "Unknown"),
-                "added_after_baseline": True,
-            }
-            for tid in new_task_ids
-        ]
-
-        deleted_tasks = [
-            {
-                "task_id": tid,
-                "task_name": baseline_tasks[tid].get("name", "Unknown"),
-                "existed_in_baseline": True,
-            }
-            for tid in deleted_task_ids
-        ]
-
-        # Calculate summary statistics
-        tasks_ahead = sum(1 for v in task_variances if v["is_ahead"])
-        tasks_behind = sum(1 for v in task_variances if v["is_behind"])
-        tasks_on_track = sum(1 for v in task_variances if v["variance_days"] == 0)
-
-        avg_variance = (
-            sum(v["variance_days"] for v in task_variances) / len(task_variances)
-            if task_variances
-            else 0.0
+        comparison = diff_snapshots(
+            ColumnarSnapshot.from_tasks(baseline_snapshot.get("tasks", [])),
+            ColumnarSnapshot.from_tasks(current_snapshot.get("tasks", [])),
+            include_unchanged=include_unchanged,
         )
+        comparison.pop("pagination")
+        return comparison
 
-        summary = {
-            "total_tasks": len(current_tasks),
-            "tasks_ahead": tasks_ahead,
-            "tasks_behind": tasks_behind,
-            "tasks_on_track": tasks_on_track,
-            "avg_variance_days": round(avg_variance, 2),
-            "critical_path_variance_days": 0.0,  # TODO: Calculate from critical path
-        }
-
-        return {
-            "summary": summary,
-            "task_variances": task_variances,
-            "new_tasks": new_tasks,
-            "deleted_tasks": deleted_tasks,
-        }
-
-    def _calculate_task_variance(
-        self, baseline_task: Dict[str, Any], current_task: Dict[str, Any]
-    ) -> Dict[str, Any]:
-        """
-        Calculate variance for a single task.
-
-        Args:
-            baseline_task: Task data from baseline
-            current_task: Current task data
 
-        Returns:
-            Dictionary with task variance details
-        """
-        # For MVP with minimal task data, use placeholder calculations
-        # In production, this would parse dates and calculate actual variances
-
-        # Placeholder variance calculation
-        variance_days = 0  # TODO: Calculate from actual dates
-
-        return {
-            "task_id": current_task.get("id", "unknown"),
-            "task_name": current_task.get("name", "Unknown Task"),
-            "variance_days": variance_days,
-            "is_ahead": variance_days < 0,
-            "is_behind": variance_days > 0,
-            "start_date_variance": 0,  # TODO: Calculate from dates
-            "end_date_variance": 0,  # TODO: Calculate from dates
-            "duration_variance": 0,  # TODO: Calculate from durations
-            "status_changed": baseline_task.get("status") != current_task.get("status"),
-            "dependencies_changed": baseline_task.get("dependencies", [])
-            != current_task.get("dependencies", []),
-        }
+def _remember(baseline_id: UUID, snapshot: ColumnarSnapshot) -> None:
+    """Add a materialized snapshot to the LRU cache."""
+    _materialized_cache[baseline_id] = snapshot
+    _materialized_cache.move_to_end(baseline_id)
+    while len(_materialized_cache) > MATERIALIZED_CACHE_SIZE:
+        _materialized_cache.popitem(last=False)
@@ -0,0 +1,488 @@
+"""
+Columnar baseline snapshots.
+
+A snapshot's tasks are stored as parallel arrays sorted by task ID (dates
+as epoch days, durations, status codes, dependency hashes) and serialized
+as a compressed ``.npz`` archive. Comparing two snapshots is a vectorized
+merge-join over the sorted IDs; only the rows of the requested page are
+turned back into dicts, and the full task JSON is never rebuilt.
+
+Successive baselines are stored as deltas (removed IDs plus new or changed
+rows) against the previous one; see SnapshotDelta.
+"""
+
+import hashlib
+import io
+import json
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+# Epoch-day value for a missing date
+MISSING_DAY = np.iinfo(np.int32).min
+
+# Task fields held in dedicated columns; everything else goes to ``extra``
+_COLUMN_FIELDS = {"id", "name", "start_date", "end_date", "duration", "status"}
+
+FORMAT_VERSION = 1
+
+
+def _day_text(value: Any) -> str:
+    """ISO day string for a date value, or "NaT" if there is none."""
+    if isinstance(value, date):  # includes datetime
+        return value.isoformat()[:10]
+    if isinstance(value, str) and value:
+        return value[:10]
+    return "NaT"
+
+
+def _parse_day(text: str) -> np.datetime64:
+    """Parse one ISO day, mapping unparseable text to NaT."""
+    try:
+        return np.datetime64(text, "D")
+    except ValueError:
+        return np.datetime64("NaT", "D")
+
+
+def _parse_days(values: Sequence[Any]) -> np.ndarray:
+    """Convert ISO date strings, dates or datetimes to int32 epoch days."""
+    text = [_day_text(v) for v in values]
+    try:
+        parsed = np.array(text, dtype="datetime64[D]")
+    except ValueError:
+        # A malformed date somewhere; parse one by one so only it is missing
+        parsed = np.array([_parse_day(t) for t in text], dtype="datetime64[D]")
+    days = parsed.astype(np.int64)
+    days[np.isnat(parsed)] = MISSING_DAY
+    return days.astype(np.int32)
+
+
+def _dependency_hash(dependencies: Any) -> int:
+    """Order-insensitive 64-bit hash of a task's dependencies."""
+    if not dependencies:
+        return 0
+    if isinstance(dependencies, str):
+        dependencies = [d.strip() for d in dependencies.split(",") if d.strip()]
+    joined = "\x1f".join(sorted(str(d) for d in dependencies))
+    return int.from_bytes(hashlib.blake2b(joined.encode(), digest_size=8).digest(), "big")
+
+
+def _pack_strings(values: Iterable[str]) -> tuple:
+    """Pack strings into one UTF-8 blob plus offsets."""
+    encoded = [v.encode("utf-8") for v in values]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    if encoded:
+        np.cumsum([len(e) for e in encoded], out=offsets[1:])
+    return np.frombuffer(b"".join(encoded), dtype=np.uint8), offsets
+
+
+def _take_strings(blob: np.ndarray, offsets: np.ndarray, indices: np.ndarray) -> tuple:
+    """Select packed strings by index, returning a new blob and offsets."""
+    lengths = (offsets[1:] - offsets[:-1])[indices]
+    new_offsets = np.zeros(len(indices) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=new_offsets[1:])
+    # Byte positions of every selected string, gathered in one pass
+    gather = np.repeat(offsets[:-1][indices] - new_offsets[:-1], lengths) + np.arange(
+        new_offsets[-1]
+    )
+    return blob[gather], new_offsets
+
+
+def _row_strings(blob: np.ndarray, offsets: np.ndarray, indices: np.ndarray) -> List[bytes]:
+    return [blob[offsets[i]:offsets[i + 1]].tobytes() for i in indices]
+
+
+def _merge_join(left_ids: np.ndarray, right_ids: np.ndarray) -> tuple:
+    """
+    Match two sorted ID arrays.
+
+    Returns:
+        (left_idx, right_idx, left_matched) where left_idx/right_idx are
+        the positions of the common IDs and left_matched flags each left row
+    """
+    position = np.searchsorted(right_ids, left_ids)
+    if len(right_ids):
+        clipped = np.minimum(position, len(right_ids) - 1)
+        left_matched = (position < len(right_ids)) & (right_ids[clipped] == left_ids)
+    else:
+        left_matched = np.zeros(len(left_ids), dtype=bool)
+    left_idx = np.flatnonzero(left_matched)
+    return left_idx, position[left_idx], left_matched
+
+
+def _format_day(day: int) -> Optional[str]:
+    if day == MISSING_DAY:
+        return None
+    return str(np.datetime64(int(day), "D"))
+
+
+@dataclass
+class ColumnarSnapshot:
+    """Tasks of one snapshot as parallel arrays sorted by task ID."""
+
+    task_ids: np.ndarray
+    start_days: np.ndarray
+    end_days: np.ndarray
+    durations: np.ndarray
+    status_codes: np.ndarray
+    statuses: np.ndarray
+    dependency_hashes: np.ndarray
+    name_blob: np.ndarray
+    name_offsets: np.ndarray
+    extra_blob: np.ndarray
+    extra_offsets: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.task_ids)
+
+    @classmethod
+    def from_tasks(cls, tasks: Sequence[Dict[str, Any]]) -> "ColumnarSnapshot":
+        """
+        Build a columnar snapshot from task dicts.
+
+        Args:
+            tasks: Tasks with ``id`` and optional name, start_date, end_date,
+                   duration, status and dependencies
+
+        Returns:
+            ColumnarSnapshot sorted by task ID
+        """
+        tasks = [t for t in tasks if t.get("id") is not None]
+        ids = np.array([str(t["id"]) for t in tasks], dtype=str)
+        order = np.argsort(ids, kind="stable")
+        tasks = [tasks[i] for i in order]
+
+        durations = np.array(
+            [
+                float(t["duration"]) if isinstance(t.get("duration"), (int, float)) else np.nan
+                for t in tasks
+            ],
+            dtype=np.float64,
+        )
+        status_values = np.array([str(t.get("status") or "") for t in tasks], dtype=str)
+        statuses, status_codes = np.unique(status_values, return_inverse=True)
+
+        name_blob, name_offsets = _pack_strings(str(t.get("name") or "") for t in tasks)
+        extra_blob, extra_offsets = _pack_strings(
+            json.dumps(
+                {k: v for k, v in t.items() if k not in _COLUMN_FIELDS},
+                separators=(",", ":"),
+                default=str,
+            )
+            for t in tasks
+        )
+
+        return cls(
+            task_ids=ids[order],
+            start_days=_parse_days([t.get("start_date") for t in tasks]),
+            end_days=_parse_days([t.get("end_date") for t in tasks]),
+            durations=durations,
+            status_codes=status_codes.astype(np.int16),
+            statuses=statuses if len(statuses) else np.array([""], dtype=str),
+            dependency_hashes=np.array(
+                [_dependency_hash(t.get("dependencies")) for t in tasks], dtype=np.uint64
+            ),
+            name_blob=name_blob,
+            name_offsets=name_offsets,
+            extra_blob=extra_blob,
+            extra_offsets=extra_offsets,
+        )
+
+    def _arrays(self) -> Dict[str, np.ndarray]:
+        return {name: getattr(self, name) for name in self.__dataclass_fields__}
+
+    def to_bytes(self) -> bytes:
+        """Serialize as a compressed .npz archive (no pickled objects)."""
+        buffer = io.BytesIO()
+        np.savez_compressed(buffer, version=np.array([FORMAT_VERSION]), **self._arrays())
+        return buffer.getvalue()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "ColumnarSnapshot":
+        """Load a snapshot written by to_bytes."""
+        with np.load(io.BytesIO(data), allow_pickle=False) as archive:
+            return cls(**{name: archive[name] for name in cls.__dataclass_fields__})
+
+    def take(self, indices: np.ndarray) -> "ColumnarSnapshot":
+        """Return the rows at ``indices`` (in that order) as a new snapshot."""
+        indices = np.asarray(indices, dtype=np.int64)
+        name_blob, name_offsets = _take_strings(self.name_blob, self.name_offsets, indices)
+        extra_blob, extra_offsets = _take_strings(self.extra_blob, self.extra_offsets, indices)
+        return ColumnarSnapshot(
+            task_ids=self.task_ids[indices],
+            start_days=self.start_days[indices],
+            end_days=self.end_days[indices],
+            durations=self.durations[indices],
+            status_codes=self.status_codes[indices],
+            statuses=self.statuses,
+            dependency_hashes=self.dependency_hashes[indices],
+            name_blob=name_blob,
+            name_offsets=name_offsets,
+            extra_blob=extra_blob,
+            extra_offsets=extra_offsets,
+        )
+
+    @staticmethod
+    def concat(first: "ColumnarSnapshot", second: "ColumnarSnapshot") -> "ColumnarSnapshot":
+        """Concatenate two snapshots with disjoint IDs, re-sorted by ID."""
+        statuses = np.union1d(first.statuses, second.statuses)
+        status_codes = np.concatenate(
+            [
+                np.searchsorted(statuses, first.statuses)[first.status_codes],
+                np.searchsorted(statuses, second.statuses)[second.status_codes],
+            ]
+        ).astype(np.int16)
+        combined = ColumnarSnapshot(
+            task_ids=np.concatenate([first.task_ids, second.task_ids]),
+            start_days=np.concatenate([first.start_days, second.start_days]),
+            end_days=np.concatenate([first.end_days, second.end_days]),
+            durations=np.concatenate([first.durations, second.durations]),
+            status_codes=status_codes,
+            statuses=statuses,
+            dependency_hashes=np.concatenate(
+                [first.dependency_hashes, second.dependency_hashes]
+            ),
+            name_blob=np.concatenate([first.name_blob, second.name_blob]),
+            name_offsets=np.concatenate(
+                [first.name_offsets[:-1], second.name_offsets + first.name_offsets[-1]]
+            ),
+            extra_blob=np.concatenate([first.extra_blob, second.extra_blob]),
+            extra_offsets=np.concatenate(
+                [first.extra_offsets[:-1], second.extra_offsets + first.extra_offsets[-1]]
+            ),
+        )
+        return combined.take(np.argsort(combined.task_ids, kind="stable"))
+
+    def name(self, index: int) -> str:
+        """Decode the name of the task at ``index``."""
+        start, end = self.name_offsets[index], self.name_offsets[index + 1]
+        return self.name_blob[start:end].tobytes().decode("utf-8")
+
+    def task(self, index: int) -> Dict[str, Any]:
+        """Rebuild the task dict at ``index``."""
+        start, end = self.extra_offsets[index], self.extra_offsets[index + 1]
+        task: Dict[str, Any] = {"id": str(self.task_ids[index]), "name": self.name(index)}
+        start_date = _format_day(self.start_days[index])
+        end_date = _format_day(self.end_days[index])
+        if start_date:
+            task["start_date"] = start_date
+        if end_date:
+            task["end_date"] = end_date
+        if not np.isnan(self.durations[index]):
+            duration = float(self.durations[index])
+            task["duration"] = int(duration) if duration.is_integer() else duration
+        status = str(self.statuses[self.status_codes[index]])
+        if status:
+            task["status"] = status
+        task.update(json.loads(self.extra_blob[start:end].tobytes() or b"{}"))
+        return task
+
+    def to_tasks(self) -> List[Dict[str, Any]]:
+        """Rebuild all task dicts (sorted by ID)."""
+        return [self.task(i) for i in range(len(self))]
+
+
+@dataclass
+class SnapshotDelta:
+    """Changes from a parent snapshot: removed task IDs plus new or changed rows."""
+
+    removed_ids: np.ndarray
+    upserts: ColumnarSnapshot
+
+    @property
+    def changed_rows(self) -> int:
+        return len(self.removed_ids) + len(self.upserts)
+
+    @classmethod
+    def between(cls, parent: ColumnarSnapshot, child: ColumnarSnapshot) -> "SnapshotDelta":
+        """
+        Compute the delta that turns ``parent`` into ``child``.
+
+        Args:
+            parent: Earlier snapshot
+            child: Later snapshot
+
+        Returns:
+            SnapshotDelta with rows of ``child`` that are new or differ
+        """
+        child_idx, parent_idx, child_matched = _merge_join(child.task_ids, parent.task_ids)
+        _, _, parent_matched = _merge_join(parent.task_ids, child.task_ids)
+
+        same = (
+            (child.start_days[child_idx] == parent.start_days[parent_idx])
+            & (child.end_days[child_idx] == parent.end_days[parent_idx])
+            & (
+                (child.durations[child_idx] == parent.durations[parent_idx])
+                | (np.isnan(child.durations[child_idx]) & np.isnan(parent.durations[parent_idx]))
+            )
+            & (
+                child.statuses[child.status_codes[child_idx]]
+                == parent.statuses[parent.status_codes[parent_idx]]
+            )
+            & (child.dependency_hashes[child_idx] == parent.dependency_hashes[parent_idx])
+        )
+        # Names and extra fields are compared only where the columns agree
+        candidates = np.flatnonzero(same)
+        if len(candidates):
+            for blob, offsets, parent_blob, parent_offsets in (
+                (child.name_blob, child.name_offsets, parent.name_blob, parent.name_offsets),
+                (child.extra_blob, child.extra_offsets, parent.extra_blob, parent.extra_offsets),
+            ):
+                child_rows = _row_strings(blob, offsets, child_idx[candidates])
+                parent_rows = _row_strings(parent_blob, parent_offsets, parent_idx[candidates])
+                same[candidates] &= np.array(
+                    [a == b for a, b in zip(child_rows, parent_rows)], dtype=bool
+                )
+
+        unchanged = np.zeros(len(child), dtype=bool)
+        unchanged[child_idx[same]] = True
+        return cls(
+            removed_ids=parent.task_ids[~parent_matched],
+            upserts=child.take(np.flatnonzero(~unchanged)),
+        )
+
+    def apply(self, parent: ColumnarSnapshot) -> ColumnarSnapshot:
+        """Rebuild the child snapshot from ``parent``."""
+        replaced = np.union1d(self.removed_ids, self.upserts.task_ids)
+        _, _, dropped = _merge_join(parent.task_ids, replaced)
+        return ColumnarSnapshot.concat(
+            parent.take(np.flatnonzero(~dropped)), self.upserts
+        )
+
+    def to_bytes(self) -> bytes:
+        """Serialize as a compressed .npz archive."""
+        buffer = io.BytesIO()
+        np.savez_compressed(
+            buffer,
+            version=np.array([FORMAT_VERSION]),
+            removed_ids=self.removed_ids,
+            **self.upserts._arrays(),
+        )
+        return buffer.getvalue()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "SnapshotDelta":
+        """Load a delta written by to_bytes."""
+        with np.load(io.BytesIO(data), allow_pickle=False) as archive:
+            return cls(
+                removed_ids=archive["removed_ids"],
+                upserts=ColumnarSnapshot(
+                    **{name: archive[name] for name in ColumnarSnapshot.__dataclass_fields__}
+                ),
+            )
+
+
+def _date_variance(current: np.ndarray, baseline: np.ndarray) -> np.ndarray:
+    """Day differences where both dates are present, else 0."""
+    present = (current != MISSING_DAY) & (baseline != MISSING_DAY)
+    return np.where(present, current.astype(np.int64) - baseline.astype(np.int64), 0)
+
+
+def diff_snapshots(
+    baseline: ColumnarSnapshot,
+    current: ColumnarSnapshot,
+    include_unchanged: bool = False,
+    offset: int = 0,
+    limit: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Compare two snapshots with a vectorized merge-join on task ID.
+
+    A task's variance is its end-date slip in days, or its duration change
+    when either snapshot lacks an end date. Summary statistics cover every
+    task present in both snapshots; ``task_variances`` lists changed tasks
+    (all matched tasks with include_unchanged) in task ID order, paginated.
+
+    Args:
+        baseline: Baseline snapshot
+        current: Current snapshot
+        include_unchanged: List tasks with zero variance too
+        offset: First listed variance to return
+        limit: Maximum variances to return (None for all)
+
+    Returns:
+        Dictionary with summary, task_variances, new_tasks, deleted_tasks
+        and pagination
+    """
+    # Merge-join: both ID arrays are sorted
+    base_idx, cur_idx, matched = _merge_join(baseline.task_ids, current.task_ids)
+
+    in_baseline = np.zeros(len(current), dtype=bool)
+    in_baseline[cur_idx] = True
+
+    start_var = _date_variance(current.start_days[cur_idx], baseline.start_days[base_idx])
+    end_var = _date_variance(current.end_days[cur_idx], baseline.end_days[base_idx])
+    cur_dur = current.durations[cur_idx]
+    base_dur = baseline.durations[base_idx]
+    duration_var = np.where(
+        np.isnan(cur_dur) | np.isnan(base_dur), 0, np.rint(cur_dur - base_dur)
+    ).astype(np.int64)
+
+    has_end = (current.end_days[cur_idx] != MISSING_DAY) & (
+        baseline.end_days[base_idx] != MISSING_DAY
+    )
+    variance = np.where(has_end, end_var, duration_var)
+
+    status_changed = (
+        current.statuses[current.status_codes[cur_idx]]
+        != baseline.statuses[baseline.status_codes[base_idx]]
+    )
+    dependencies_changed = (
+        current.dependency_hashes[cur_idx] != baseline.dependency_hashes[base_idx]
+    )
+
+    listed = np.arange(len(cur_idx)) if include_unchanged else np.flatnonzero(variance != 0)
+    end = None if limit is None else offset + limit
+    page = listed[offset:end]
+
+    task_variances = [
+        {
+            "task_id": str(current.task_ids[cur_idx[i]]),
+            "task_name": current.name(cur_idx[i]) or "Unknown Task",
+            "variance_days": int(variance[i]),
+            "is_ahead": bool(variance[i] < 0),
+            "is_behind": bool(variance[i] > 0),
+            "start_date_variance": int(start_var[i]),
+            "end_date_variance": int(end_var[i]),
+            "duration_variance": int(duration_var[i]),
+            "status_changed": bool(status_changed[i]),
+            "dependencies_changed": bool(dependencies_changed[i]),
+        }
+        for i in page
+    ]
+
+    new_tasks = [
+        {
+            "task_id": str(current.task_ids[i]),
+            "task_name": current.name(i) or "Unknown",
+            "added_after_baseline": True,
+        }
+        for i in np.flatnonzero(~in_baseline)
+    ]
+    deleted_tasks = [
+        {
+            "task_id": str(baseline.task_ids[i]),
+            "task_name": baseline.name(i) or "Unknown",
+            "existed_in_baseline": True,
+        }
+        for i in np.flatnonzero(~matched)
+    ]
+
+    summary = {
+        "total_tasks": len(current),
+        "tasks_ahead": int((variance < 0).sum()),
+        "tasks_behind": int((variance > 0).sum()),
+        "tasks_on_track": int((variance == 0).sum()),
+        "avg_variance_days": round(float(variance.mean()), 2) if len(variance) else 0.0,
+        "critical_path_variance_days": 0.0,
+    }
+
+    return {
+        "summary": summary,
+        "task_variances": task_variances,
+        "new_tasks": new_tasks,
+        "deleted_tasks": deleted_tasks,
+        "pagination": {"offset": offset, "limit": limit, "total": int(len(listed))},
+    }
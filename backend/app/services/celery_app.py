@@ -1,7 +1,15 @@
 """Celery application configuration for background tasks."""
 
+import asyncio
+from typing import Any, Coroutine, Optional, TypeVar
+
 from celery import Celery
+from celery.signals import worker_process_init, worker_process_shutdown
+
 from app.core.config import get_settings
+from app.services.smtp_pool import close_smtp_pools
+
+T = TypeVar("T")
 
 settings = get_settings()
 
@@ -31,3 +39,46 @@ celery_app.conf.update(
 celery_app.conf.task_routes = {
     'app.tasks.notification_tasks.*': {'queue': 'notifications'},
 }
+
+
+# Persistent event loop of this worker process. Pooled SMTP sessions and
+# database connections are bound to the loop that opened them, so tasks
+# share one loop instead of creating a new one per call with asyncio.run.
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion on the worker's persistent event loop.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    global _worker_loop
+    if _worker_loop is None or _worker_loop.is_closed():
+        _worker_loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_worker_loop)
+    return _worker_loop.run_until_complete(coro)
+
+
+@worker_process_init.connect
+def _reset_worker_loop(**kwargs: Any) -> None:
+    """Give each forked worker process its own event loop."""
+    global _worker_loop
+    _worker_loop = None
+
+
+@worker_process_shutdown.connect
+def _close_worker_loop(**kwargs: Any) -> None:
+    """Close pooled SMTP sessions and the event loop on worker exit."""
+    global _worker_loop
+    if _worker_loop is None or _worker_loop.is_closed():
+        return
+    try:
+        _worker_loop.run_until_complete(close_smtp_pools())
+    finally:
+        _worker_loop.close()
+        _worker_loop = None
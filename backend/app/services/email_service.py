@@ -4,12 +4,13 @@ import re
 from dataclasses import dataclass
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
-from typing import List, Optional, Union
+from typing import List, Optional, Sequence, Tuple, Union
 
-import aiosmtplib
 import structlog
 from jinja2 import Template
 
+from app.services.smtp_pool import SMTPConnectionPool, get_smtp_pool
+
 logger = structlog.get_logger(__name__)
 
 
@@ -30,6 +31,20 @@ class EmailConfig:
     smtp_from_email: str
     smtp_from_name: str = "SprintForge"
     use_tls: bool = True
+    pool_size: int = 4
+    max_messages_per_connection: int = 100
+    keepalive_interval: float = 30.0
+    max_idle: float = 300.0
+
+
+@dataclass
+class OutgoingEmail:
+    """A single message for EmailService.send_batch."""
+
+    to: Union[str, List[str]]
+    subject: str
+    body_html: str
+    body_text: Optional[str] = None
 
 
 class EmailService:
@@ -38,14 +53,23 @@ class EmailService:
     # Email validation regex pattern
     EMAIL_PATTERN = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
 
-    def __init__(self, config: EmailConfig):
+    def __init__(self, config: EmailConfig, pool: Optional[SMTPConnectionPool] = None):
         """
         Initialize email service with configuration.
 
         Args:
             config: EmailConfig instance with SMTP settings
+            pool: SMTP connection pool (defaults to the shared pool for config)
         """
         self.config = config
+        self._pool = pool
+
+    @property
+    def pool(self) -> SMTPConnectionPool:
+        """SMTP connection pool used for delivery."""
+        if self._pool is None:
+            self._pool = get_smtp_pool(self.config)
+        return self._pool
 
     def _validate_email(self, email: str) -> bool:
         """
@@ -106,41 +130,18 @@ class EmailService:
             # Validate recipient email(s)
             self._validate_emails(to)
 
-            # Normalize recipients to list
-            recipients = [to] if isinstance(to, str) else to
-
-            from_email = from_email or self.config.smtp_from_email
-            from_name = from_name or self.config.smtp_from_name
-            from_address = f"{from_name} <{from_email}>"
-
-            # Create message
-            message = MIMEMultipart("alternative")
-            message["Subject"] = subject
-            message["From"] = from_address
-            message["To"] = ", ".join(recipients)
-
-            # Attach plain text version (if provided)
-            if body_text:
-                part_text = MIMEText(body_text, "plain")
-                message.attach(part_text)
-
-            # Attach HTML version
-            part_html = MIMEText(body_html, "html")
-            message.attach(part_html)
-
-            # Send email via SMTP
-            async with aiosmtplib.SMTP(
-                hostname=self.config.smtp_host,
-                port=self.config.smtp_port,
-                use_tls=self.config.use_tls,
-            ) as smtp:
-                if self.config.smtp_user and self.config.smtp_password:
-                    await smtp.login(self.config.smtp_user, self.config.smtp_password)
+            from_address, recipients, message = self._build_message(
+                to, subject, body_html, body_text, from_email, from_name
+            )
 
-                await smtp.sendmail(from_address, recipients, message.as_string())
+            # Send email over a pooled SMTP session
+            await self.pool.send(from_address, recipients, message)
 
             logger.info(
-                "email_sent", to=recipients, subject=subject, from_email=from_email
+                "email_sent",
+                to=recipients,
+                subject=subject,
+                from_email=from_email or self.config.smtp_from_email,
             )
             return True
 
@@ -154,6 +155,95 @@ class EmailService:
             )
             raise EmailSendError(f"Failed to send email: {str(e)}") from e
 
+    async def send_batch(self, emails: Sequence[OutgoingEmail]) -> List[bool]:
+        """
+        Send many emails over shared SMTP sessions.
+
+        Unlike send_email, a failed message does not raise; its result is
+        False and the rest of the batch is still sent.
+
+        Args:
+            emails: Messages to send
+
+        Returns:
+            One flag per message, True if it was accepted by the server
+        """
+        results: List[bool] = [False] * len(emails)
+        envelopes = []
+        positions = []
+
+        for position, email in enumerate(emails):
+            try:
+                self._validate_emails(email.to)
+            except ValueError as e:
+                logger.warning("email_skipped_invalid_recipient", error=str(e))
+                continue
+            envelopes.append(
+                self._build_message(
+                    email.to, email.subject, email.body_html, email.body_text
+                )
+            )
+            positions.append(position)
+
+        try:
+            errors = await self.pool.send_many(envelopes)
+        except Exception as e:
+            logger.error(
+                "email_batch_failed", count=len(envelopes), error=str(e), exc_info=True
+            )
+            return results
+
+        for position, error in zip(positions, errors):
+            if error is None:
+                results[position] = True
+            else:
+                logger.error(
+                    "email_send_failed",
+                    to=emails[position].to,
+                    subject=emails[position].subject,
+                    error=str(error),
+                )
+
+        logger.info("email_batch_sent", total=len(emails), sent=sum(results))
+        return results
+
+    def _build_message(
+        self,
+        to: Union[str, List[str]],
+        subject: str,
+        body_html: str,
+        body_text: Optional[str] = None,
+        from_email: Optional[str] = None,
+        from_name: Optional[str] = None,
+    ) -> Tuple[str, List[str], str]:
+        """
+        Build a multipart message and its envelope.
+
+        Returns:
+            Tuple of (sender address, recipient list, serialized message)
+        """
+        # Normalize recipients to list
+        recipients = [to] if isinstance(to, str) else to
+
+        from_email = from_email or self.config.smtp_from_email
+        from_name = from_name or self.config.smtp_from_name
+        from_address = f"{from_name} <{from_email}>"
+
+        # Create message
+        message = MIMEMultipart("alternative")
+        message["Subject"] = subject
+        message["From"] = from_address
+        message["To"] = ", ".join(recipients)
+
+        # Attach plain text version (if provided)
+        if body_text:
+            message.attach(MIMEText(body_text, "plain"))
+
+        # Attach HTML version
+        message.attach(MIMEText(body_html, "html"))
+
+        return from_address, recipients, message.as_string()
+
     def render_template(self, template_string: str, context: dict) -> str:
         """
         Render email template string with context.
@@ -50,7 +50,10 @@ class ExcelGenerationService:
     )
 
     def create_template_workbook(
-        self, project_name: str = "New Project", include_sample_data: bool = False
+        self,
+        project_name: str = "New Project",
+        include_sample_data: bool = False,
+        tasks: Optional[List[Dict[str, Any]]] = None,
     ) -> Workbook:
         """
         Create Excel template with enhanced PERT columns.
@@ -58,6 +61,8 @@ class ExcelGenerationService:
         Args:
             project_name: Name of the project for the template
             include_sample_data: Whether to include sample task rows
+            tasks: Task rows to write (same keys as the sample tasks);
+                   takes precedence over include_sample_data
 
         Returns:
             Workbook with Task List sheet configured
@@ -88,8 +93,10 @@ class ExcelGenerationService:
             cell.fill = self.HEADER_FILL
             cell.alignment = Alignment(horizontal="center", vertical="center")
 
-        # Add sample data if requested
-        if include_sample_data:
+        # Add task rows, or sample data if requested
+        if tasks:
+            self._populate_task_sheet(task_sheet, tasks, start_row=2)
+        elif include_sample_data:
             sample_tasks = self._generate_sample_tasks(count=5)
             self._populate_task_sheet(task_sheet, sample_tasks, start_row=2)
 
@@ -0,0 +1,448 @@
+"""
+Batch Excel import service for portfolio onboarding.
+
+Accepts many workbooks (or zip archives of workbooks), parses every task
+sheet of every file in parallel across a process pool, validates each
+sheet's dependency graph, and inserts one project per task sheet in a
+single transaction.
+
+Parsing runs in two rounds: workers first list the task sheets of each
+workbook, then every task sheet is parsed and validated as its own job.
+Each sheet job reopens its workbook in read-only mode, which costs a
+little extra I/O but lets one large multi-sheet workbook use every worker.
+"""
+
+import asyncio
+import io
+import os
+import time
+import zipfile
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import PurePosixPath
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+import structlog
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.project import Project
+from app.schemas.project import ProjectConfigSchema
+from app.services.project_service import invalidate_project_counts
+from app.services.quota_service import QuotaService
+from app.services.excel_parser_service import (
+    ExcelParseError,
+    ExcelParserService,
+    ParsedTask,
+)
+
+logger = structlog.get_logger(__name__)
+
+EXCEL_EXTENSIONS = (".xlsx", ".xlsm")
+
+# Batch limits (zip contents are checked before decompression)
+MAX_IMPORT_FILES = 50
+MAX_IMPORT_UNCOMPRESSED_SIZE = 100 * 1024 * 1024  # 100MB
+MAX_IMPORT_WORKERS = min(4, os.cpu_count() or 1)
+
+_process_pool: Optional[ProcessPoolExecutor] = None
+
+
+class ExcelImportError(Exception):
+    """Raised when a batch import cannot be processed."""
+
+    pass
+
+
+@dataclass
+class ImportedSheet:
+    """A validated task sheet ready to become a project."""
+
+    sheet_name: str
+    tasks: List[Dict[str, Any]]
+
+
+@dataclass
+class FileImportResult:
+    """Parse and validation outcome for one uploaded workbook."""
+
+    filename: str
+    sheets: List[ImportedSheet] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)
+    parse_ms: float = 0.0
+    validate_ms: float = 0.0
+    wall_ms: float = 0.0
+
+    @property
+    def task_count(self) -> int:
+        """Total number of tasks across all sheets."""
+        return sum(len(sheet.tasks) for sheet in self.sheets)
+
+
+@dataclass
+class BatchImportResult:
+    """Outcome of a batch import."""
+
+    files: List[FileImportResult]
+    projects: List[Tuple[Project, FileImportResult, ImportedSheet]]
+    total_ms: float
+
+    @property
+    def errors(self) -> Dict[str, List[str]]:
+        """Validation errors keyed by file name."""
+        return {f.filename: f.errors for f in self.files if f.errors}
+
+
+def _task_to_dict(task: ParsedTask) -> Dict[str, Any]:
+    """
+    Convert a parsed task to the stored ``configuration["tasks"]`` form.
+
+    Args:
+        task: Parsed task from the workbook
+
+    Returns:
+        Task dict with dependency list and PERT estimates
+    """
+    return {
+        "id": task.task_id,
+        "name": task.task_name,
+        "duration": task.most_likely,
+        "optimistic": task.optimistic,
+        "most_likely": task.most_likely,
+        "pessimistic": task.pessimistic,
+        "dependencies": [d.strip() for d in task.dependencies.split(",") if d.strip()],
+        "notes": task.notes,
+    }
+
+
+def parse_import_file(
+    filename: str, file_bytes: bytes, sheet_names: Optional[Sequence[str]] = None
+) -> FileImportResult:
+    """
+    Parse and validate the task sheets of one workbook.
+
+    Runs inside a worker process, so it only takes and returns picklable
+    values. Dependency graphs are validated per sheet, since each sheet
+    becomes its own project.
+
+    Args:
+        filename: Name of the workbook (for reporting)
+        file_bytes: Raw .xlsx content
+        sheet_names: Only parse these sheets (default: every task sheet)
+
+    Returns:
+        FileImportResult with sheets, errors and timings
+    """
+    result = FileImportResult(filename=filename)
+    parser = ExcelParserService()
+
+    started = time.perf_counter()
+    try:
+        parsed_sheets = parser.parse_excel_sheets(file_bytes, filename, sheet_names)
+    except ExcelParseError as e:
+        result.errors.append(str(e))
+        result.parse_ms = (time.perf_counter() - started) * 1000
+        return result
+    result.parse_ms = (time.perf_counter() - started) * 1000
+
+    started = time.perf_counter()
+    for sheet in parsed_sheets:
+        validation = parser.build_dependency_graph(sheet.tasks)
+        if validation.errors:
+            result.errors.extend(
+                f"Sheet '{sheet.sheet_name}': {error}" for error in validation.errors
+            )
+            continue
+        result.sheets.append(
+            ImportedSheet(
+                sheet_name=sheet.sheet_name,
+                tasks=[_task_to_dict(task) for task in sheet.tasks],
+            )
+        )
+    result.validate_ms = (time.perf_counter() - started) * 1000
+
+    return result
+
+
+def find_import_sheets(
+    filename: str, file_bytes: bytes
+) -> Tuple[List[str], FileImportResult]:
+    """
+    List the task sheets of one workbook in a worker process.
+
+    Args:
+        filename: Name of the workbook (for reporting)
+        file_bytes: Raw .xlsx content
+
+    Returns:
+        Task sheet names, and a FileImportResult holding the time spent
+        and, if the workbook cannot be read, the error
+    """
+    result = FileImportResult(filename=filename)
+
+    started = time.perf_counter()
+    try:
+        sheet_names = ExcelParserService().find_task_sheets(file_bytes, filename)
+    except ExcelParseError as e:
+        sheet_names = []
+        result.errors.append(str(e))
+    result.parse_ms = result.wall_ms = (time.perf_counter() - started) * 1000
+
+    return sheet_names, result
+
+
+def _timed_parse(
+    filename: str, file_bytes: bytes, sheet_names: Optional[Sequence[str]] = None
+) -> FileImportResult:
+    """Run parse_import_file and record its wall time in the worker."""
+    started = time.perf_counter()
+    result = parse_import_file(filename, file_bytes, sheet_names)
+    result.wall_ms = (time.perf_counter() - started) * 1000
+    return result
+
+
+def _merge_sheet_result(result: FileImportResult, sheet_result: FileImportResult) -> None:
+    """Add one sheet job's outcome to its workbook's result."""
+    result.sheets.extend(sheet_result.sheets)
+    result.errors.extend(sheet_result.errors)
+    result.parse_ms += sheet_result.parse_ms
+    result.validate_ms += sheet_result.validate_ms
+    result.wall_ms += sheet_result.wall_ms
+
+
+def get_import_executor() -> ProcessPoolExecutor:
+    """
+    Get the shared process pool for workbook parsing.
+
+    Created lazily so API workers that never import do not fork.
+
+    Returns:
+        ProcessPoolExecutor instance
+    """
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(max_workers=MAX_IMPORT_WORKERS)
+    return _process_pool
+
+
+def expand_uploads(uploads: List[Tuple[str, bytes]]) -> List[Tuple[str, bytes]]:
+    """
+    Flatten uploaded workbooks and zip archives into a list of workbooks.
+
+    Zip entries are filtered by extension and their declared sizes are
+    checked against the batch limits before anything is decompressed.
+
+    Args:
+        uploads: (filename, content) pairs as uploaded
+
+    Returns:
+        (filename, content) pairs of Excel workbooks
+
+    Raises:
+        ExcelImportError: If an archive is invalid, a file type is not
+            supported, or batch limits are exceeded
+    """
+    files: List[Tuple[str, bytes]] = []
+    total_size = 0
+
+    for filename, content in uploads:
+        lower_name = filename.lower()
+        if lower_name.endswith(".zip"):
+            try:
+                archive = zipfile.ZipFile(io.BytesIO(content))
+            except zipfile.BadZipFile as e:
+                raise ExcelImportError(f"Invalid zip archive {filename}: {e}")
+
+            with archive:
+                for info in archive.infolist():
+                    path = PurePosixPath(info.filename)
+                    if (
+                        info.is_dir()
+                        or path.parts[0] == "__MACOSX"
+                        or path.name.startswith((".", "~$"))
+                        or not path.name.lower().endswith(EXCEL_EXTENSIONS)
+                    ):
+                        continue
+                    total_size += info.file_size
+                    if total_size > MAX_IMPORT_UNCOMPRESSED_SIZE:
+                        raise ExcelImportError(
+                            "Uncompressed import exceeds "
+                            f"{MAX_IMPORT_UNCOMPRESSED_SIZE} bytes"
+                        )
+                    files.append((f"{filename}/{info.filename}", archive.read(info)))
+        elif lower_name.endswith(EXCEL_EXTENSIONS):
+            total_size += len(content)
+            if total_size > MAX_IMPORT_UNCOMPRESSED_SIZE:
+                raise ExcelImportError(
+                    f"Uncompressed import exceeds {MAX_IMPORT_UNCOMPRESSED_SIZE} bytes"
+                )
+            files.append((filename, content))
+        else:
+            raise ExcelImportError(f"Unsupported file type: {filename}")
+
+        if len(files) > MAX_IMPORT_FILES:
+            raise ExcelImportError(
+                f"Too many workbooks (maximum {MAX_IMPORT_FILES} per import)"
+            )
+
+    if not files:
+        raise ExcelImportError("No Excel workbooks found in upload")
+
+    return files
+
+
+class ExcelBatchImportService:
+    """Service for importing many workbooks as projects in one request."""
+
+    def __init__(self, db: AsyncSession, executor: Optional[Executor] = None):
+        """
+        Initialize service with database session.
+
+        Args:
+            db: Database session
+            executor: Executor for parsing (defaults to the shared process pool)
+        """
+        self.db = db
+        self.executor = executor
+
+    async def parse_files(
+        self, files: List[Tuple[str, bytes]]
+    ) -> List[FileImportResult]:
+        """
+        Parse and validate workbooks in parallel, one job per task sheet.
+
+        Timings of a workbook add up the worker time of all its jobs.
+
+        Args:
+            files: (filename, content) pairs of Excel workbooks
+
+        Returns:
+            One FileImportResult per workbook, in input order
+        """
+        executor = self.executor or get_import_executor()
+        loop = asyncio.get_running_loop()
+
+        scans = await asyncio.gather(
+            *(
+                loop.run_in_executor(executor, find_import_sheets, filename, content)
+                for filename, content in files
+            )
+        )
+
+        jobs: List[Tuple[int, "asyncio.Future[FileImportResult]"]] = [
+            (
+                index,
+                loop.run_in_executor(
+                    executor, _timed_parse, filename, content, [sheet_name]
+                ),
+            )
+            for index, ((filename, content), (sheet_names, _)) in enumerate(
+                zip(files, scans)
+            )
+            for sheet_name in sheet_names
+        ]
+        sheet_results = await asyncio.gather(*(job for _, job in jobs))
+
+        results = [result for _, result in scans]
+        for (index, _), sheet_result in zip(jobs, sheet_results):
+            _merge_sheet_result(results[index], sheet_result)
+
+        # Task sheets with a header but no task rows are skipped
+        for result in results:
+            if not result.sheets and not result.errors:
+                result.errors.append(f"No tasks found in Excel file {result.filename}")
+
+        return results
+
+    async def import_files(
+        self, owner_id: UUID, uploads: List[Tuple[str, bytes]]
+    ) -> BatchImportResult:
+        """
+        Import uploaded workbooks as projects.
+
+        Every task sheet becomes one project. The batch is all-or-nothing:
+        if any workbook fails to parse or validate, nothing is inserted and
+        the per-file errors are returned. Likewise, if the owner's project
+        quota cannot take every project of the batch, none are created.
+
+        Args:
+            owner_id: Owner of the created projects
+            uploads: (filename, content) pairs; zip archives are expanded
+
+        Returns:
+            BatchImportResult with per-file timings and created projects
+
+        Raises:
+            ExcelImportError: If the upload itself is invalid
+            HTTPException: 403 if the projects would exceed the owner's quota
+        """
+        started = time.perf_counter()
+        files = expand_uploads(uploads)
+        results = await self.parse_files(files)
+
+        projects: List[Tuple[Project, FileImportResult, ImportedSheet]] = []
+        if not any(result.errors for result in results):
+            for result in results:
+                for sheet in result.sheets:
+                    project = self._build_project(
+                        owner_id, result, sheet, multi_sheet=len(result.sheets) > 1
+                    )
+                    projects.append((project, result, sheet))
+
+            # The whole batch must fit in the owner's project quota
+            await QuotaService(self.db).check_project_quota(
+                owner_id, new_projects=len(projects)
+            )
+
+            self.db.add_all([project for project, _, _ in projects])
+            await self.db.commit()
+            invalidate_project_counts(owner_id)
+
+        total_ms = (time.perf_counter() - started) * 1000
+
+        logger.info(
+            "Excel batch import completed",
+            owner_id=str(owner_id),
+            file_count=len(results),
+            project_count=len(projects),
+            failed_files=sum(1 for result in results if result.errors),
+            total_ms=round(total_ms, 1),
+        )
+
+        return BatchImportResult(files=results, projects=projects, total_ms=total_ms)
+
+    @staticmethod
+    def _build_project(
+        owner_id: UUID,
+        result: FileImportResult,
+        sheet: ImportedSheet,
+        multi_sheet: bool,
+    ) -> Project:
+        """
+        Build an unsaved Project for an imported sheet.
+
+        Args:
+            owner_id: Owner user ID
+            result: File the sheet came from
+            sheet: Validated sheet
+            multi_sheet: Whether the workbook has several task sheets
+
+        Returns:
+            Project model instance
+        """
+        stem = PurePosixPath(result.filename).stem
+        name = f"{stem} - {sheet.sheet_name}" if multi_sheet else stem
+        name = name[:255]
+
+        config = ProjectConfigSchema(project_name=name).model_dump()
+        config["project_id"] = f"proj_{name.lower().replace(' ', '_')}"
+        config["tasks"] = sheet.tasks
+        config["import"] = {"filename": result.filename, "sheet_name": sheet.sheet_name}
+
+        return Project(
+            name=name,
+            description=f"Imported from {result.filename}",
+            owner_id=owner_id,
+            configuration=config,
+            template_version="1.0",
+        )
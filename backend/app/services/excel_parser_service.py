@@ -6,14 +6,20 @@ structure and constraints, and converts to TaskDistributionInput for simulation.
 """
 
 import io
-from typing import Any, Dict, List, Optional, Set
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence
 
 import openpyxl  # type: ignore
 from openpyxl.workbook import Workbook  # type: ignore
 from openpyxl.worksheet.worksheet import Worksheet  # type: ignore
 from pydantic import BaseModel, model_validator
 
+from app.services.scheduler.dependency_parser import (
+    DependencyParseError,
+    parse_dependencies,
+)
 from app.services.scheduler.monte_carlo import TaskDistributionInput
+from app.services.scheduler.task_graph import TaskGraph
 
 
 class ExcelParseError(Exception):
@@ -52,6 +58,26 @@ class ParsedExcelData(BaseModel):
     metadata: Dict[str, Any] = {}
 
 
+class ParsedSheet(BaseModel):
+    """Tasks parsed from a single worksheet."""
+
+    sheet_name: str
+    tasks: List[ParsedTask]
+
+
+@dataclass
+class DependencyValidation:
+    """Result of dependency validation with the graph it built."""
+
+    graph: TaskGraph
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def is_valid(self) -> bool:
+        """Whether no validation errors were found."""
+        return not self.errors
+
+
 # Column mapping for flexible header matching
 COLUMN_MAPPINGS = {
     "task_id": ["Task ID", "ID", "Task", "TaskID"],
@@ -113,6 +139,110 @@ class ExcelParserService:
 
         return ParsedExcelData(tasks=tasks)
 
+    def parse_excel_sheets(
+        self,
+        file_bytes: bytes,
+        filename: str,
+        sheet_names: Optional[Sequence[str]] = None,
+    ) -> List[ParsedSheet]:
+        """
+        Parse every task sheet in an Excel file.
+
+        A sheet is a task sheet when its header row has all required columns;
+        other sheets (instructions, lookups, charts) are skipped. Used for
+        batch import, where one workbook may hold several projects.
+
+        Args:
+            file_bytes: Raw Excel file bytes
+            filename: Name of the file (for error messages)
+            sheet_names: Only parse these sheets (default: all sheets)
+
+        Returns:
+            One ParsedSheet per task sheet with tasks, in workbook order
+
+        Raises:
+            ExcelParseError: If the file is invalid, a task sheet has bad
+                rows, or, when parsing all sheets, no sheet contains tasks
+        """
+        wb = self._load_read_only(file_bytes)
+
+        sheets: List[ParsedSheet] = []
+        try:
+            for ws in wb.worksheets:
+                if sheet_names is not None and ws.title not in sheet_names:
+                    continue
+                try:
+                    column_indices = self._parse_headers(ws)
+                except ExcelParseError:
+                    continue  # Not a task sheet
+
+                try:
+                    tasks = self._parse_task_rows(ws, column_indices)
+                except ExcelParseError as e:
+                    raise ExcelParseError(f"Sheet '{ws.title}': {e}")
+
+                if tasks:
+                    sheets.append(ParsedSheet(sheet_name=ws.title, tasks=tasks))
+        finally:
+            wb.close()
+
+        if not sheets and sheet_names is None:
+            raise ExcelParseError(f"No tasks found in Excel file {filename}")
+
+        return sheets
+
+    def find_task_sheets(self, file_bytes: bytes, filename: str) -> List[str]:
+        """
+        List the task sheets of an Excel file without parsing their rows.
+
+        Lets batch import parse the sheets of one workbook separately.
+
+        Args:
+            file_bytes: Raw Excel file bytes
+            filename: Name of the file (for error messages)
+
+        Returns:
+            Names of the sheets whose header row has all required columns,
+            in workbook order
+
+        Raises:
+            ExcelParseError: If the file is invalid or has no task sheet
+        """
+        wb = self._load_read_only(file_bytes)
+
+        names: List[str] = []
+        try:
+            for ws in wb.worksheets:
+                try:
+                    self._parse_headers(ws)
+                except ExcelParseError:
+                    continue  # Not a task sheet
+                names.append(ws.title)
+        finally:
+            wb.close()
+
+        if not names:
+            raise ExcelParseError(f"No tasks found in Excel file {filename}")
+
+        return names
+
+    def _load_read_only(self, file_bytes: bytes) -> Workbook:
+        """
+        Open a workbook in read-only mode for batch parsing.
+
+        Raises:
+            ExcelParseError: If the file is empty or not a valid workbook
+        """
+        if not file_bytes:
+            raise ExcelParseError("Empty file")
+
+        try:
+            return openpyxl.load_workbook(
+                io.BytesIO(file_bytes), read_only=True, data_only=True
+            )
+        except Exception as e:
+            raise ExcelParseError(f"Not a valid Excel file: {e}")
+
     def _find_task_sheet(self, wb: Workbook) -> Optional[Worksheet]:
         """
         Find the sheet containing task data.
@@ -296,86 +426,69 @@ class ExcelParserService:
                 f"Cannot convert '{cell_value}' to {target_type.__name__}: {e}"
             )
 
-    def validate_task_structure(self, tasks: List[ParsedTask]) -> List[str]:
+    def build_dependency_graph(self, tasks: List[ParsedTask]) -> DependencyValidation:
         """
-        Validate task data structure and dependencies.
+        Validate task IDs and dependencies in a single pass.
+
+        Dependency strings are parsed once with ``parse_dependencies`` into a
+        shared adjacency index (a TaskGraph), then an iterative Tarjan SCC pass reports every
+        cycle. Duplicate IDs, unknown references and all cycles are
+        reported together rather than stopping at the first problem. Tasks
+        with a malformed dependency string are reported and get no edges.
 
         Args:
             tasks: List of parsed tasks to validate
 
         Returns:
-            List of error messages (empty if valid)
+            DependencyValidation with the graph and any error messages
         """
         errors: List[str] = []
+        graph = TaskGraph()
+        dependencies: Dict[str, List[str]] = {}
 
-        # Build task ID set for validation
-        task_ids = {task.task_id for task in tasks}
-
-        # Check for unknown dependencies
         for task in tasks:
-            if task.dependencies:
-                deps = [d.strip() for d in task.dependencies.split(",") if d.strip()]
-                for dep in deps:
-                    if dep not in task_ids:
-                        errors.append(
-                            f"Task {task.task_id}: Unknown dependency "
-                            f"'{dep}' does not exist"
-                        )
-
-        # Check for circular dependencies
-        circular_error = self._detect_circular_dependencies(tasks)
-        if circular_error:
-            errors.append(circular_error)
-
-        return errors
-
-    def _detect_circular_dependencies(self, tasks: List[ParsedTask]) -> Optional[str]:
+            if task.task_id in graph.nodes:
+                errors.append(f"Task {task.task_id}: Duplicate task ID")
+                continue
+            graph.add_node(task.task_id)
+            try:
+                dependencies[task.task_id] = parse_dependencies(task.dependencies)
+            except DependencyParseError as e:
+                errors.append(f"Task {task.task_id}: {e}")
+                dependencies[task.task_id] = []
+
+        for task_id, deps in dependencies.items():
+            for dep in deps:
+                if dep not in graph.nodes:
+                    errors.append(
+                        f"Task {task_id}: Unknown dependency "
+                        f"'{dep}' does not exist"
+                    )
+                elif dep == task_id:
+                    errors.append(
+                        f"Circular dependency detected involving task {task_id}"
+                    )
+                else:
+                    graph.add_edge(dep, task_id)
+
+        for cycle in graph.find_cycles():
+            errors.append(
+                f"Circular dependency detected involving tasks: {', '.join(cycle)}"
+            )
+
+        return DependencyValidation(graph=graph, errors=errors)
+
+    def validate_task_structure(self, tasks: List[ParsedTask]) -> List[str]:
         """
-        Detect circular dependencies using DFS.
+        Validate task data structure and dependencies.
 
         Args:
-            tasks: List of tasks to check
+            tasks: List of parsed tasks to validate
 
         Returns:
-            Error message if circular dependency found, None otherwise
+            List of error messages (empty if valid)
         """
-        # Build adjacency list
-        graph: Dict[str, List[str]] = {}
-        for task in tasks:
-            if task.dependencies:
-                deps = [d.strip() for d in task.dependencies.split(",") if d.strip()]
-                graph[task.task_id] = deps
-            else:
-                graph[task.task_id] = []
-
-        # DFS to detect cycles
-        visited: Set[str] = set()
-        rec_stack: Set[str] = set()
-
-        def has_cycle(task_id: str) -> Optional[str]:
-            visited.add(task_id)
-            rec_stack.add(task_id)
-
-            # Check all neighbors
-            for neighbor in graph.get(task_id, []):
-                if neighbor not in visited:
-                    result = has_cycle(neighbor)
-                    if result:
-                        return result
-                elif neighbor in rec_stack:
-                    return f"Circular dependency detected involving task {neighbor}"
-
-            rec_stack.remove(task_id)
-            return None
-
-        # Check all nodes
-        for task_id in graph:
-            if task_id not in visited:
-                error = has_cycle(task_id)
-                if error:
-                    return error
-
-        return None
+        return self.build_dependency_graph(tasks).errors
 
     def convert_to_distribution_input(
         self, parsed_tasks: List[ParsedTask]
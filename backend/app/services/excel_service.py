@@ -46,6 +46,7 @@ class ExcelService:
                 "created_at": project.created_at.isoformat() if project.created_at else None,
                 "owner_id": str(project.owner_id),
             },
+            tasks=config_data.get("tasks", []),
         )
 
     async def generate_excel(self, project: Project) -> bytes:
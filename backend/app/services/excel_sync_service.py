@@ -0,0 +1,209 @@
+"""
+Incremental Excel-to-server sync service.
+
+Diffs an uploaded SprintForge workbook against the stored project tasks using
+the row checksums embedded in the _SYNC_META sheet, applies only inserted,
+changed and deleted tasks, and records the delta as a SyncOperation.
+Tasks edited both in Excel and on the server since generation are reported
+as conflicts and left unchanged.
+"""
+
+import asyncio
+import hashlib
+import io
+import json
+from datetime import datetime, timezone
+from typing import Any, Dict, Tuple
+from uuid import UUID
+
+import openpyxl  # type: ignore
+import structlog
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.excel.sync import (
+    ROW_CHECKSUM_START_ROW,
+    TASK_SYNC_FIELDS,
+    TaskDelta,
+    apply_task_delta,
+    calculate_row_checksums,
+    diff_task_rows,
+    read_row_checksums,
+)
+from app.models.project import Project
+from app.models.sync import SyncOperation
+from app.services.analytics_service import invalidate_project_analytics
+from app.services.baseline_service import BaselineService
+
+logger = structlog.get_logger(__name__)
+
+MAIN_SHEET_NAME = "Project Plan"
+META_SHEET_NAME = "_SYNC_META"
+
+
+class ExcelSyncError(Exception):
+    """Raised when an uploaded workbook cannot be synced."""
+
+    pass
+
+
+class ExcelSyncService:
+    """Service for incremental two-way sync of project tasks."""
+
+    def __init__(self, db: AsyncSession):
+        """Initialize service with database session."""
+        self.db = db
+
+    def diff_workbook(
+        self, project: Project, file_bytes: bytes
+    ) -> Tuple[Dict[str, Any], TaskDelta]:
+        """
+        Diff an uploaded workbook against the project's stored tasks.
+
+        Args:
+            project: Project the workbook was generated for
+            file_bytes: Uploaded .xlsx content
+
+        Returns:
+            Tuple of (sync metadata from the workbook, task delta)
+
+        Raises:
+            ExcelSyncError: If the workbook is not a SprintForge file for this project
+        """
+        if not file_bytes:
+            raise ExcelSyncError("Empty file")
+
+        try:
+            wb = openpyxl.load_workbook(
+                io.BytesIO(file_bytes), read_only=True, data_only=True
+            )
+        except Exception as e:
+            raise ExcelSyncError(f"Not a valid Excel file: {e}")
+
+        try:
+            if META_SHEET_NAME not in wb.sheetnames:
+                raise ExcelSyncError(
+                    "Missing _SYNC_META worksheet - file not generated by SprintForge"
+                )
+            if MAIN_SHEET_NAME not in wb.sheetnames:
+                raise ExcelSyncError(f"Missing '{MAIN_SHEET_NAME}' worksheet")
+
+            meta_sheet = wb[META_SHEET_NAME]
+            metadata = self._read_metadata(meta_sheet)
+
+            config = project.configuration or {}
+            expected_id = config.get("project_id", f"proj_{project.id}")
+            if metadata.get("project_id") != expected_id:
+                raise ExcelSyncError(
+                    "Workbook belongs to a different project "
+                    f"({metadata.get('project_id')})"
+                )
+
+            embedded_checksums = read_row_checksums(
+                meta_sheet.iter_rows(
+                    min_row=ROW_CHECKSUM_START_ROW, max_col=2, values_only=True
+                )
+            )
+            stored_checksums = calculate_row_checksums(config.get("tasks", []))
+
+            rows = wb[MAIN_SHEET_NAME].iter_rows(
+                min_row=2, max_col=len(TASK_SYNC_FIELDS), values_only=True
+            )
+            delta = diff_task_rows(rows, embedded_checksums, stored_checksums)
+        finally:
+            wb.close()
+
+        return metadata, delta
+
+    async def sync_workbook(
+        self,
+        project: Project,
+        user_id: UUID,
+        file_bytes: bytes,
+        filename: str,
+    ) -> SyncOperation:
+        """
+        Apply the changes in an uploaded workbook to the project's tasks.
+
+        Args:
+            project: Project to sync
+            user_id: User performing the upload
+            file_bytes: Uploaded .xlsx content
+            filename: Original file name
+
+        Returns:
+            Completed SyncOperation with the delta in sync_data
+
+        Raises:
+            ExcelSyncError: If the workbook cannot be synced
+        """
+        # openpyxl parsing is CPU-bound; keep it off the event loop
+        metadata, delta = await asyncio.to_thread(
+            self.diff_workbook, project, file_bytes
+        )
+
+        if delta.has_changes:
+            config = dict(project.configuration or {})
+            config["tasks"] = apply_task_delta(config.get("tasks", []), delta)
+            # Reassign so SQLAlchemy detects the JSON change
+            project.configuration = config
+
+        sync_data = delta.to_sync_data()
+        sync_data["workbook_generated_at"] = metadata.get("generated_at")
+
+        operation = SyncOperation(
+            project_id=project.id,
+            user_id=user_id,
+            operation_type="sync",
+            status="completed",
+            file_name=filename,
+            file_size=len(file_bytes),
+            file_checksum=hashlib.sha256(file_bytes).hexdigest(),
+            sync_data=sync_data,
+            completed_at=datetime.now(timezone.utc),
+        )
+        self.db.add(operation)
+        await self.db.commit()
+        await self.db.refresh(operation)
+
+        if delta.has_changes:
+            await invalidate_project_analytics(project.id)
+            await BaselineService().refresh_active_comparison(project.id, self.db)
+
+        logger.info(
+            "Excel sync completed",
+            project_id=str(project.id),
+            user_id=str(user_id),
+            inserted=len(delta.inserted),
+            updated=len(delta.updated),
+            deleted=len(delta.deleted),
+            conflicts=len(delta.conflicts),
+            unchanged=delta.unchanged_count,
+        )
+
+        return operation
+
+    @staticmethod
+    def _read_metadata(meta_sheet: Any) -> Dict[str, Any]:
+        """
+        Read the JSON metadata cell from the _SYNC_META sheet.
+
+        Args:
+            meta_sheet: _SYNC_META worksheet
+
+        Returns:
+            Parsed metadata dict
+
+        Raises:
+            ExcelSyncError: If the metadata is missing or malformed
+        """
+        first_row = next(
+            meta_sheet.iter_rows(max_row=1, max_col=1, values_only=True), None
+        )
+        metadata_json = first_row[0] if first_row else None
+        if not metadata_json:
+            raise ExcelSyncError("Empty metadata in _SYNC_META worksheet")
+
+        try:
+            return json.loads(metadata_json)
+        except json.JSONDecodeError as e:
+            raise ExcelSyncError(f"Invalid metadata format: {e}")
@@ -1,21 +1,177 @@
 """
-Forecast Engine Service - GREEN PHASE IMPLEMENTATION
+Forecast Engine Service.
 
-This service provides forecasting capabilities using statistical models.
-Implements statistical analysis with scipy and scikit-learn.
+This service provides velocity forecasting with linear models. Each
+project's fit is persisted as OLS sufficient statistics
+(VelocityForecastModel), updated in closed form when a sprint is recorded
+and refit from history only when it is missing or stale. Forecasts for
+many projects are computed in one vectorized NumPy pass. Completion dates
+can also be forecast by bootstrap Monte Carlo over the sprint history.
+
+scipy and scikit-learn are imported lazily by the helpers that need them.
 """
 
+import hashlib
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
-from typing import List, Tuple, Dict, Union
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 from uuid import UUID
 
 import numpy as np
-from scipy import stats
-from sklearn.linear_model import LinearRegression
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+import structlog
+
+from app.models.historical_metrics import (
+    ForecastData,
+    ForecastModelType,
+    SprintVelocity,
+    VelocityForecastModel,
+)
+
+logger = structlog.get_logger(__name__)
+
+# Assume 2-week sprints
+SPRINT_DURATION_DAYS = 14
+
+# Minimum sprints before forecasting
+MIN_FORECAST_HISTORY = 3
+
+# z-value for 95% prediction intervals
+CONFIDENCE_Z = 1.96
+
+# Monte Carlo completion forecasts
+DEFAULT_SIMULATIONS = 20_000
+MAX_SIMULATIONS = 200_000
+MAX_SIMULATED_SPRINTS = 520  # 20 years of 2-week sprints
+COMPLETION_PERCENTILES = (50, 70, 85, 95)
+SIMULATION_CACHE_SIZE = 256
+
+# (project, remaining points, simulations, history version) -> result
+_simulation_cache: "OrderedDict[Tuple[Any, ...], Dict[str, Any]]" = OrderedDict()
+
+
+def ols_parameters(
+    n: np.ndarray,
+    sum_x: np.ndarray,
+    sum_y: np.ndarray,
+    sum_xx: np.ndarray,
+    sum_xy: np.ndarray,
+    sum_yy: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Closed-form OLS fit from sufficient statistics.
+
+    Works element-wise on arrays, so many projects are fitted at once.
+
+    Args:
+        n: Number of points
+        sum_x, sum_y, sum_xx, sum_xy, sum_yy: Sums of x, y, x², xy and y²
+
+    Returns:
+        (slope, intercept, residual_std) where residual_std is the population
+        standard deviation of the residuals
+    """
+    n = np.asarray(n, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        denominator = n * sum_xx - sum_x * sum_x
+        slope = np.where(denominator != 0, (n * sum_xy - sum_x * sum_y) / denominator, 0.0)
+        intercept = np.where(n > 0, (sum_y - slope * sum_x) / n, 0.0)
+        sse = (
+            sum_yy
+            - 2 * intercept * sum_y
+            - 2 * slope * sum_xy
+            + n * intercept * intercept
+            + 2 * intercept * slope * sum_x
+            + slope * slope * sum_xx
+        )
+        residual_std = np.where(n > 0, np.sqrt(np.maximum(sse, 0.0) / n), 0.0)
+    return slope, intercept, residual_std
+
+
+def simulate_sprints_needed(
+    velocities: Sequence[float],
+    remaining_points: float,
+    num_simulations: int,
+    rng: np.random.Generator,
+    max_sprints: int = MAX_SIMULATED_SPRINTS,
+) -> np.ndarray:
+    """
+    Bootstrap the number of sprints needed to burn down remaining work.
+
+    Each simulated future draws sprint velocities with replacement from the
+    history. Futures are simulated together as one (simulations x sprints)
+    matrix; sprints are added in blocks only while some futures are still
+    unfinished. The last sprint counts fractionally, so results are
+    continuous rather than whole sprints.
+
+    Args:
+        velocities: Historical sprint velocities
+        remaining_points: Work left to complete
+        num_simulations: Number of futures to simulate
+        rng: NumPy random generator
+        max_sprints: Futures not finished after this many sprints are np.inf
+
+    Returns:
+        Array of sprints needed, one per simulated future
+    """
+    history = np.asarray(velocities, dtype=float)
+    needed = np.full(num_simulations, np.inf)
+    if remaining_points <= 0:
+        return np.zeros(num_simulations)
+
+    mean = max(float(history.mean()), 1e-9)
+    block = int(min(max_sprints, max(8, np.ceil(2 * remaining_points / mean))))
+
+    done_before = np.zeros(num_simulations)
+    active = np.arange(num_simulations)
+    simulated = 0
+    while active.size and simulated < max_sprints:
+        width = min(block, max_sprints - simulated)
+        draws = rng.choice(history, size=(active.size, width))
+        totals = done_before[active, None] + np.cumsum(draws, axis=1)
+
+        finished = totals >= remaining_points
+        has_finished = finished.any(axis=1)
+        rows = np.flatnonzero(has_finished)
+        if rows.size:
+            last = finished[rows].argmax(axis=1)
+            before = np.where(
+                last > 0,
+                totals[rows, np.maximum(last - 1, 0)],
+                done_before[active[rows]],
+            )
+            fraction = (remaining_points - before) / draws[rows, last]
+            needed[active[rows]] = simulated + last + fraction
+
+        done_before[active] = totals[:, -1]
+        active = active[~has_finished]
+        simulated += width
+
+    return needed
+
 
-from app.models.historical_metrics import ForecastData, SprintVelocity, ForecastModelType
+def _set_statistics(model: VelocityForecastModel, values: Sequence[float]) -> None:
+    """Reset a model's sufficient statistics from a full velocity history."""
+    y = np.asarray(values, dtype=float)
+    x = np.arange(len(y), dtype=float)
+    model.n = len(y)
+    model.sum_x = float(x.sum())
+    model.sum_y = float(y.sum())
+    model.sum_xx = float((x * x).sum())
+    model.sum_xy = float((x * y).sum())
+    model.sum_yy = float((y * y).sum())
+
+
+def _refresh_parameters(model: VelocityForecastModel) -> None:
+    """Recompute slope, intercept and residual std from the statistics."""
+    slope, intercept, residual_std = ols_parameters(
+        model.n, model.sum_x, model.sum_y, model.sum_xx, model.sum_xy, model.sum_yy
+    )
+    model.slope = float(slope)
+    model.intercept = float(intercept)
+    model.residual_std = float(residual_std)
 
 
 class ForecastEngine:
@@ -29,103 +185,212 @@ class ForecastEngine:
         """
         self.db_session = db_session
 
-    async def forecast_velocity(
-        self, project_id: UUID, periods_ahead: int = 5
-    ) -> List[ForecastData]:
-        """Forecast future velocity using historical data and linear regression.
+    async def record_velocity(
+        self, project_id: UUID, velocity_points: float, timestamp: datetime
+    ) -> VelocityForecastModel:
+        """Update a project's model for a newly recorded sprint.
+
+        Appending a sprint adds one point at x = n, so the fit is updated in
+        closed form without reading history. A sprint dated before the last
+        one changes every index and triggers a refit instead. Does not commit.
 
         Args:
-            project_id: UUID of the project to forecast
-            periods_ahead: Number of future periods to forecast (default 5)
+            project_id: Project UUID
+            velocity_points: Velocity of the new sprint
+            timestamp: Sprint timestamp
 
         Returns:
-            List of ForecastData objects with predictions and confidence intervals
+            Updated VelocityForecastModel
+        """
+        model = await self._get_model(project_id)
+        if model is None or model.n == 0 or (
+            model.last_timestamp is not None and timestamp < model.last_timestamp
+        ):
+            await self.db_session.flush()
+            return await self.refit_model(project_id, model)
+
+        x = float(model.n)
+        y = float(velocity_points)
+        model.n += 1
+        model.sum_x += x
+        model.sum_y += y
+        model.sum_xx += x * x
+        model.sum_xy += x * y
+        model.sum_yy += y * y
+        model.last_timestamp = timestamp
+        _refresh_parameters(model)
+        return model
+
+    async def refit_model(
+        self, project_id: UUID, model: Optional[VelocityForecastModel] = None
+    ) -> VelocityForecastModel:
+        """Fit a project's model from its full velocity history. Does not commit.
+
+        Args:
+            project_id: Project UUID
+            model: Existing model to overwrite, if already loaded
+
+        Returns:
+            Fitted VelocityForecastModel
         """
-        # 1. Get historical velocity data
-        query = (
-            select(SprintVelocity)
+        result = await self.db_session.execute(
+            select(SprintVelocity.velocity_points, SprintVelocity.timestamp)
             .where(SprintVelocity.project_id == project_id)
             .order_by(SprintVelocity.timestamp)
         )
-        result = await self.db_session.execute(query)
-        velocities = result.scalars().all()
-
-        # Handle no history case
-        if len(velocities) == 0:
-            return []
-
-        # Handle insufficient data case (less than 3 points)
-        if len(velocities) < 3:
-            # Return empty list for insufficient data
-            return []
-
-        # 2. Prepare data for linear regression
-        x_data = np.arange(len(velocities))
-        y_data = np.array([v.velocity_points for v in velocities])
-
-        # 3. Fit linear regression model
-        regression_result = await self.fit_linear_regression(x_data, y_data)
-        slope = regression_result['slope']
-        intercept = regression_result['intercept']
-
-        # 4. Calculate confidence intervals from historical data
-        residuals = y_data - (slope * x_data + intercept)
-        std_error = np.std(residuals)
-
-        # Handle perfect fit case - use small percentage of mean as minimum error
-        if std_error == 0 or std_error < 1e-10:
-            std_error = max(0.05 * np.mean(y_data), 0.1)  # 5% of mean or 0.1 minimum
-
-        # 5. Create forecast objects
-        forecasts = []
-        last_timestamp = velocities[-1].timestamp
-
-        # Use current time for forecast baseline to ensure future dates
-        current_time = datetime.now(timezone.utc)
-
-        # Start forecasts from the later of last_timestamp or current_time
-        forecast_baseline = max(last_timestamp, current_time)
-
-        # Assume 2-week sprints (14 days)
-        sprint_duration_days = 14
-
-        for i in range(1, periods_ahead + 1):
-            # Predict future value
-            future_x = len(velocities) + i - 1
-            predicted_value = slope * future_x + intercept
-
-            # Calculate confidence intervals (95% default)
-            # Wider intervals for further predictions
-            confidence_margin = 1.96 * std_error * np.sqrt(1 + 1/len(velocities))
-            confidence_lower = predicted_value - confidence_margin
-            confidence_upper = predicted_value + confidence_margin
-
-            # Ensure non-negative values
-            confidence_lower = max(0.0, confidence_lower)
-            predicted_value = max(0.0, predicted_value)
-
-            # Calculate forecast date from baseline
-            forecast_date = forecast_baseline + timedelta(days=sprint_duration_days * i)
-
-            # Create ForecastData object
-            forecast = ForecastData(
-                project_id=project_id,
-                forecast_date=forecast_date,
-                predicted_value=float(predicted_value),
-                confidence_lower=float(confidence_lower),
-                confidence_upper=float(confidence_upper),
-                model_type=ForecastModelType.LINEAR_REGRESSION.value
+        rows = result.all()
+
+        if model is None:
+            model = await self._get_model(project_id)
+        if model is None:
+            model = VelocityForecastModel(project_id=project_id)
+            self.db_session.add(model)
+
+        _set_statistics(model, [row.velocity_points for row in rows])
+        model.last_timestamp = rows[-1].timestamp if rows else None
+        _refresh_parameters(model)
+        return model
+
+    async def get_models(
+        self, project_ids: Iterable[UUID]
+    ) -> Dict[UUID, VelocityForecastModel]:
+        """Load fitted models, refitting any that are missing or stale.
+
+        A model is stale when its point count or last timestamp no longer
+        matches the project's SprintVelocity rows (e.g. rows inserted without
+        going through record_velocity). Freshness is checked with one
+        aggregate query for all projects.
+
+        Args:
+            project_ids: Project UUIDs
+
+        Returns:
+            Models keyed by project ID
+        """
+        project_ids = list(dict.fromkeys(project_ids))
+        if not project_ids:
+            return {}
+
+        result = await self.db_session.execute(
+            select(VelocityForecastModel).where(
+                VelocityForecastModel.project_id.in_(project_ids)
             )
+        )
+        models = {model.project_id: model for model in result.scalars().all()}
 
-            # Add to session
-            self.db_session.add(forecast)
-            forecasts.append(forecast)
+        result = await self.db_session.execute(
+            select(
+                SprintVelocity.project_id,
+                func.count(SprintVelocity.id),
+                func.max(SprintVelocity.timestamp),
+            )
+            .where(SprintVelocity.project_id.in_(project_ids))
+            .group_by(SprintVelocity.project_id)
+        )
+        history = {row[0]: (row[1], row[2]) for row in result.all()}
+
+        refitted = 0
+        for project_id in project_ids:
+            count, last_timestamp = history.get(project_id, (0, None))
+            model = models.get(project_id)
+            if (
+                model is None
+                or model.n != count
+                or model.last_timestamp != last_timestamp
+            ):
+                models[project_id] = await self.refit_model(project_id, model)
+                refitted += 1
+
+        if refitted:
+            logger.info("Refitted velocity models", count=refitted)
+        return models
+
+    async def forecast_projects(
+        self,
+        project_ids: Iterable[UUID],
+        periods_ahead: int = 5,
+        persist: bool = False,
+    ) -> Dict[UUID, List[ForecastData]]:
+        """Forecast velocity for many projects in one vectorized pass.
 
-        # Commit to database
-        await self.db_session.commit()
+        Args:
+            project_ids: Project UUIDs
+            periods_ahead: Number of future sprints to forecast
+            persist: Store the forecasts as ForecastData rows
+
+        Returns:
+            Forecasts keyed by project ID (empty list for projects with fewer
+            than three sprints)
+        """
+        models = await self.get_models(project_ids)
+        ready = [m for m in models.values() if m.n >= MIN_FORECAST_HISTORY]
+        forecasts: Dict[UUID, List[ForecastData]] = {pid: [] for pid in models}
+
+        if ready:
+            n = np.array([m.n for m in ready], dtype=float)
+            slope = np.array([m.slope for m in ready])
+            intercept = np.array([m.intercept for m in ready])
+            mean_y = np.array([m.sum_y for m in ready]) / n
+            std_error = np.array([m.residual_std for m in ready])
+
+            # Perfect fits get a small error: 5% of the mean, at least 0.1
+            std_error = np.where(
+                std_error < 1e-10, np.maximum(0.05 * mean_y, 0.1), std_error
+            )
+
+            steps = np.arange(1, periods_ahead + 1)
+            future_x = n[:, None] + steps[None, :] - 1
+            predicted = slope[:, None] * future_x + intercept[:, None]
+            margin = (CONFIDENCE_Z * std_error * np.sqrt(1 + 1 / n))[:, None]
+            lower = np.maximum(predicted - margin, 0.0)
+            upper = predicted + margin
+            predicted = np.maximum(predicted, 0.0)
+
+            # Forecast from the later of the last sprint or now
+            now = datetime.now(timezone.utc)
+            for row, model in enumerate(ready):
+                baseline = max(model.last_timestamp or now, now)
+                forecasts[model.project_id] = [
+                    ForecastData(
+                        project_id=model.project_id,
+                        forecast_date=baseline
+                        + timedelta(days=SPRINT_DURATION_DAYS * int(step)),
+                        predicted_value=float(predicted[row, col]),
+                        confidence_lower=float(lower[row, col]),
+                        confidence_upper=float(upper[row, col]),
+                        model_type=ForecastModelType.LINEAR_REGRESSION.value,
+                    )
+                    for col, step in enumerate(steps)
+                ]
+
+            if persist:
+                self.db_session.add_all(
+                    forecast for items in forecasts.values() for forecast in items
+                )
+
+        if self.db_session.new or self.db_session.dirty:
+            await self.db_session.commit()
 
         return forecasts
 
+    async def forecast_velocity(
+        self, project_id: UUID, periods_ahead: int = 5
+    ) -> List[ForecastData]:
+        """Forecast future velocity using the project's linear model.
+
+        Args:
+            project_id: UUID of the project to forecast
+            periods_ahead: Number of future periods to forecast (default 5)
+
+        Returns:
+            List of ForecastData objects with predictions and confidence intervals
+            (empty with fewer than three sprints of history)
+        """
+        forecasts = await self.forecast_projects(
+            [project_id], periods_ahead=periods_ahead, persist=True
+        )
+        return forecasts[project_id]
+
     async def forecast_completion_date(
         self, project_id: UUID, remaining_tasks: int
     ) -> Dict[str, Union[datetime, float, str]]:
@@ -147,26 +412,22 @@ class ForecastEngine:
                 "message": "All tasks completed"
             }
 
-        # Get historical velocity data
-        query = (
-            select(SprintVelocity)
-            .where(SprintVelocity.project_id == project_id)
-            .order_by(SprintVelocity.timestamp)
-        )
-        result = await self.db_session.execute(query)
-        velocities = result.scalars().all()
+        models = await self.get_models([project_id])
+        model = models[project_id]
+        if self.db_session.new or self.db_session.dirty:
+            await self.db_session.commit()
 
         # Handle no velocity history
-        if len(velocities) == 0:
+        if model.n == 0:
             return {
                 "completion_date": None,
                 "confidence": 0.0,
                 "message": "Insufficient velocity history"
             }
 
-        # Calculate average velocity
-        velocity_values = np.array([v.velocity_points for v in velocities])
-        avg_velocity = np.mean(velocity_values)
+        # Mean and population std from the stored sums
+        avg_velocity = model.sum_y / model.n
+        variance = max(model.sum_yy / model.n - avg_velocity * avg_velocity, 0.0)
 
         # Handle zero velocity case
         if avg_velocity <= 0:
@@ -178,19 +439,11 @@ class ForecastEngine:
 
         # Calculate sprints needed
         sprints_needed = remaining_tasks / avg_velocity
-
-        # Calculate completion date (assume 2-week sprints)
-        sprint_duration_days = 14
-        days_until_completion = sprints_needed * sprint_duration_days
-
-        last_timestamp = velocities[-1].timestamp
-        completion_date = last_timestamp + timedelta(days=days_until_completion)
-
-        # Calculate confidence based on velocity consistency
-        velocity_std = np.std(velocity_values)
-        coefficient_of_variation = velocity_std / avg_velocity if avg_velocity > 0 else 1.0
+        days_until_completion = sprints_needed * SPRINT_DURATION_DAYS
+        completion_date = model.last_timestamp + timedelta(days=days_until_completion)
 
         # Higher consistency = higher confidence (inverse of CV)
+        coefficient_of_variation = np.sqrt(variance) / avg_velocity
         confidence = max(0.0, min(1.0, 1.0 - coefficient_of_variation))
 
         return {
@@ -200,6 +453,128 @@ class ForecastEngine:
             "avg_velocity": float(avg_velocity)
         }
 
+    async def simulate_completion_date(
+        self,
+        project_id: UUID,
+        remaining_points: float,
+        num_simulations: int = DEFAULT_SIMULATIONS,
+    ) -> Dict[str, Any]:
+        """Forecast the completion date by bootstrap Monte Carlo.
+
+        Resamples historical sprint velocities to simulate many burn-down
+        futures and reports date percentiles and the probability of
+        finishing by each upcoming sprint boundary. Results are cached per
+        (project, remaining points, simulations, history version), where the
+        history version changes whenever a sprint is recorded; the random
+        seed derives from the same key, so results are reproducible.
+
+        Args:
+            project_id: UUID of the project
+            remaining_points: Story points (or tasks) left to complete
+            num_simulations: Number of simulated futures
+
+        Returns:
+            Dictionary with percentiles, probability_by_date and metadata
+        """
+        num_simulations = max(1, min(int(num_simulations), MAX_SIMULATIONS))
+        models = await self.get_models([project_id])
+        model = models[project_id]
+        if self.db_session.new or self.db_session.dirty:
+            await self.db_session.commit()
+
+        if model.n == 0:
+            return {
+                "completion_date": None,
+                "confidence": 0.0,
+                "message": "Insufficient velocity history"
+            }
+
+        last_timestamp = model.last_timestamp
+        history_version = f"{model.n}:{last_timestamp.isoformat()}:{model.sum_y:.6f}"
+        key = (str(project_id), float(remaining_points), num_simulations, history_version)
+        cached = _simulation_cache.get(key)
+        if cached is not None:
+            _simulation_cache.move_to_end(key)
+            return {**cached, "cached": True}
+
+        result = await self.db_session.execute(
+            select(SprintVelocity.velocity_points)
+            .where(SprintVelocity.project_id == project_id)
+            .order_by(SprintVelocity.timestamp)
+        )
+        velocities = np.array(result.scalars().all(), dtype=float)
+
+        if velocities.max() <= 0:
+            return {
+                "completion_date": None,
+                "confidence": 0.0,
+                "message": "Zero average velocity"
+            }
+
+        started = time.perf_counter()
+        seed = int.from_bytes(hashlib.sha256(repr(key).encode()).digest()[:8], "big")
+        needed = simulate_sprints_needed(
+            velocities, float(remaining_points), num_simulations, np.random.default_rng(seed)
+        )
+        finished = needed[np.isfinite(needed)]
+
+        def to_date(sprints: float) -> datetime:
+            return last_timestamp + timedelta(days=float(sprints) * SPRINT_DURATION_DAYS)
+
+        percentiles: Dict[str, Optional[datetime]] = {}
+        for pct in COMPLETION_PERCENTILES:
+            value = np.percentile(needed, pct) if finished.size else np.inf
+            percentiles[f"p{pct}"] = to_date(value) if np.isfinite(value) else None
+
+        # P(done by the end of sprint k) from the earliest to the last finish
+        probability_by_date = []
+        if finished.size:
+            first = max(1, int(np.floor(finished.min())))
+            horizon = int(np.ceil(finished.max()))
+            boundaries = np.arange(first, horizon + 1)
+            probabilities = np.searchsorted(np.sort(finished), boundaries, side="right")
+            probabilities = probabilities / num_simulations
+            probability_by_date = [
+                {"date": to_date(k), "sprints": int(k), "probability": float(p)}
+                for k, p in zip(boundaries, probabilities)
+            ]
+
+        forecast = {
+            "project_id": str(project_id),
+            "remaining_points": float(remaining_points),
+            "simulations": num_simulations,
+            "history_size": int(velocities.size),
+            "history_version": history_version,
+            "completion_date": percentiles["p50"],
+            "percentiles": percentiles,
+            "probability_by_date": probability_by_date,
+            "completion_probability": float(finished.size / num_simulations),
+            "elapsed_ms": (time.perf_counter() - started) * 1000,
+            "cached": False,
+        }
+
+        _simulation_cache[key] = forecast
+        while len(_simulation_cache) > SIMULATION_CACHE_SIZE:
+            _simulation_cache.popitem(last=False)
+
+        logger.info(
+            "Simulated completion date",
+            project_id=str(project_id),
+            remaining_points=float(remaining_points),
+            simulations=num_simulations,
+            elapsed_ms=round(forecast["elapsed_ms"], 2),
+        )
+        return forecast
+
+    async def _get_model(self, project_id: UUID) -> Optional[VelocityForecastModel]:
+        """Load a project's stored model."""
+        result = await self.db_session.execute(
+            select(VelocityForecastModel).where(
+                VelocityForecastModel.project_id == project_id
+            )
+        )
+        return result.scalar_one_or_none()
+
     async def calculate_confidence_intervals(
         self, data: Union[List[float], np.ndarray], confidence_level: float = 0.95
     ) -> Tuple[float, float]:
@@ -226,6 +601,9 @@ class ForecastEngine:
                 return (float(data[0]), float(data[0]))
             raise ValueError("Insufficient data for confidence interval calculation")
 
+        # Imported lazily: scipy is only needed for interval calculations
+        from scipy import stats
+
         # Calculate mean and standard error
         mean = np.mean(data)
         std_err = stats.sem(data)
@@ -270,6 +648,9 @@ class ForecastEngine:
         if len(x_data) < 2:
             raise ValueError("Insufficient data for linear regression (need at least 2 points)")
 
+        # Imported lazily so workers that never forecast skip loading sklearn
+        from sklearn.linear_model import LinearRegression
+
         # Reshape data for sklearn (expects 2D array)
         X = x_data.reshape(-1, 1)
 
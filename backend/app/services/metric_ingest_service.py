@@ -0,0 +1,518 @@
+"""
+Bulk ingestion service for historical metrics.
+
+Accepts NDJSON (one point per line) or columnar JSON payloads from CI and
+tracker integrations, validates whole columns at once with NumPy, drops
+points whose idempotency key was already stored, and writes the rest in
+bulk. On PostgreSQL (asyncpg) rows are streamed into a staging table with
+COPY and merged with INSERT ... ON CONFLICT DO NOTHING; other databases
+(SQLite in local tests) use batched multi-row INSERT ... ON CONFLICT DO
+NOTHING. Rollups are updated in the same transaction.
+"""
+
+import json
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from uuid import UUID, uuid4
+
+import numpy as np
+from sqlalchemy import select, text
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+import structlog
+
+from app.models.historical_metrics import HistoricalMetric, MetricType
+from app.services.metric_rollup_service import MetricRollupService
+
+logger = structlog.get_logger(__name__)
+
+MAX_INGEST_POINTS = 50_000
+MAX_INGEST_BODY_SIZE = 10 * 1024 * 1024  # 10MB
+MAX_REPORTED_ERRORS = 100
+
+# Rows per multi-row INSERT / idempotency lookup on the fallback path
+INSERT_BATCH_SIZE = 500
+
+# Points more than this far in the future are rejected as clock errors
+MAX_FUTURE_SKEW = timedelta(days=1)
+
+VALID_METRIC_TYPES = np.array([m.value for m in MetricType])
+
+_STAGING_TABLE = "historical_metrics_ingest"
+_COPY_COLUMNS = (
+    "id",
+    "project_id",
+    "metric_type",
+    "value",
+    "timestamp",
+    "metric_metadata",
+    "idempotency_key",
+    "created_at",
+    "updated_at",
+)
+
+
+class MetricIngestError(Exception):
+    """Raised when an ingest payload cannot be processed."""
+
+    pass
+
+
+@dataclass
+class MetricColumns:
+    """Parsed, not yet validated, ingest payload in columnar form."""
+
+    metric_types: List[Any]
+    values: List[Any]
+    timestamps: List[Any]
+    idempotency_keys: List[Optional[str]]
+    metadata: List[Dict[str, Any]]
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+@dataclass
+class IngestResult:
+    """Outcome of one ingest request."""
+
+    received: int
+    inserted: int = 0
+    duplicates: int = 0
+    rejected: int = 0
+    errors: List[Dict[str, Any]] = field(default_factory=list)
+    elapsed_ms: float = 0.0
+
+
+def _check_size(count: int) -> None:
+    if count == 0:
+        raise MetricIngestError("Payload contains no metric points")
+    if count > MAX_INGEST_POINTS:
+        raise MetricIngestError(
+            f"Too many points ({count}); maximum is {MAX_INGEST_POINTS} per request"
+        )
+
+
+def parse_ndjson(body: bytes) -> MetricColumns:
+    """
+    Parse an NDJSON payload (one JSON object per line) into columns.
+
+    Each line has ``metric_type``, ``value``, ``timestamp`` and optional
+    ``idempotency_key`` and ``metadata``. Blank lines are ignored.
+
+    Args:
+        body: Raw request body
+
+    Returns:
+        MetricColumns
+
+    Raises:
+        MetricIngestError: If a line is not a JSON object or limits are exceeded
+    """
+    columns = MetricColumns([], [], [], [], [])
+    for line_number, line in enumerate(body.splitlines(), start=1):
+        if not line.strip():
+            continue
+        try:
+            point = json.loads(line)
+        except ValueError as e:
+            raise MetricIngestError(f"Line {line_number}: invalid JSON ({e})")
+        if not isinstance(point, dict):
+            raise MetricIngestError(f"Line {line_number}: expected a JSON object")
+
+        columns.metric_types.append(point.get("metric_type"))
+        columns.values.append(point.get("value"))
+        columns.timestamps.append(point.get("timestamp"))
+        columns.idempotency_keys.append(point.get("idempotency_key"))
+        columns.metadata.append(point.get("metadata") or {})
+
+        if len(columns) > MAX_INGEST_POINTS:
+            _check_size(len(columns))
+
+    _check_size(len(columns))
+    return columns
+
+
+def parse_columnar(payload: Any) -> MetricColumns:
+    """
+    Parse a columnar JSON payload.
+
+    Expected shape::
+
+        {"metric_type": "velocity" | [...], "values": [...],
+         "timestamps": [...], "idempotency_keys": [...], "metadata": {...}}
+
+    ``metric_type`` may be a single type for the whole batch; ``metadata``
+    is shared by every point.
+
+    Args:
+        payload: Decoded JSON body
+
+    Returns:
+        MetricColumns
+
+    Raises:
+        MetricIngestError: If columns are missing or have mismatched lengths
+    """
+    if not isinstance(payload, dict):
+        raise MetricIngestError("Columnar payload must be a JSON object")
+
+    values = payload.get("values")
+    timestamps = payload.get("timestamps")
+    if not isinstance(values, list) or not isinstance(timestamps, list):
+        raise MetricIngestError("'values' and 'timestamps' must be arrays")
+
+    count = len(values)
+    _check_size(count)
+
+    metric_types = payload.get("metric_type", payload.get("metric_types"))
+    if not isinstance(metric_types, list):
+        metric_types = [metric_types] * count
+
+    keys = payload.get("idempotency_keys")
+    if keys is None:
+        keys = [None] * count
+
+    for name, column in (
+        ("timestamps", timestamps),
+        ("metric_type", metric_types),
+        ("idempotency_keys", keys),
+    ):
+        if not isinstance(column, list) or len(column) != count:
+            raise MetricIngestError(f"'{name}' must have {count} entries")
+
+    metadata = payload.get("metadata") or {}
+    if not isinstance(metadata, dict):
+        raise MetricIngestError("'metadata' must be an object")
+
+    return MetricColumns(metric_types, values, timestamps, keys, [metadata] * count)
+
+
+def _to_float_array(values: Sequence[Any]) -> np.ndarray:
+    """Convert values to float64, mapping unconvertible entries to NaN."""
+    try:
+        return np.asarray(values, dtype=np.float64)
+    except (TypeError, ValueError):
+        out = np.full(len(values), np.nan)
+        for i, value in enumerate(values):
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                out[i] = value
+        return out
+
+
+def _to_epoch_us(timestamps: Sequence[Any]) -> np.ndarray:
+    """
+    Convert timestamps to UTC epoch microseconds (int64, -1 if invalid).
+
+    Numeric entries are epoch seconds; strings are ISO 8601 (naive means UTC).
+    """
+    try:
+        seconds = np.asarray(timestamps, dtype=np.float64)
+    except (TypeError, ValueError):
+        seconds = None
+
+    if seconds is not None:
+        out = np.full(len(seconds), -1, dtype=np.int64)
+        ok = np.isfinite(seconds) & (seconds >= 0)
+        out[ok] = np.round(seconds[ok] * 1_000_000).astype(np.int64)
+        return out
+
+    out = np.full(len(timestamps), -1, dtype=np.int64)
+    for i, value in enumerate(timestamps):
+        try:
+            if isinstance(value, str):
+                parsed = datetime.fromisoformat(value)
+                if parsed.tzinfo is None:
+                    parsed = parsed.replace(tzinfo=timezone.utc)
+                out[i] = round(parsed.timestamp() * 1_000_000)
+            elif isinstance(value, (int, float)) and not isinstance(value, bool):
+                out[i] = round(value * 1_000_000)
+        except (ValueError, OverflowError):
+            pass
+    return out
+
+
+@dataclass
+class ValidatedBatch:
+    """Rows that passed validation, as parallel arrays."""
+
+    indices: np.ndarray
+    metric_types: np.ndarray
+    values: np.ndarray
+    epoch_us: np.ndarray
+    idempotency_keys: List[Optional[str]]
+    metadata: List[Dict[str, Any]]
+
+
+def validate_columns(
+    columns: MetricColumns, now: Optional[datetime] = None
+) -> Tuple[ValidatedBatch, List[Dict[str, Any]]]:
+    """
+    Validate all points at once.
+
+    Checks are column-wise array operations: metric types against
+    MetricType, values finite, timestamps parseable and not in the future.
+    Duplicate idempotency keys within the payload keep their first point.
+
+    Args:
+        columns: Parsed payload
+        now: Reference time for the future-timestamp check
+
+    Returns:
+        (valid rows, errors) where each error has ``index`` and ``reason``
+    """
+    count = len(columns)
+    now = now or datetime.now(timezone.utc)
+
+    types = np.char.lower(
+        np.asarray(["" if t is None else str(t) for t in columns.metric_types], dtype=str)
+    )
+    values = _to_float_array(columns.values)
+    epoch_us = _to_epoch_us(columns.timestamps)
+    max_epoch_us = int((now + MAX_FUTURE_SKEW).timestamp() * 1_000_000)
+
+    checks = (
+        (~np.isin(types, VALID_METRIC_TYPES), "invalid metric_type"),
+        (~np.isfinite(values), "value must be a finite number"),
+        (epoch_us < 0, "invalid timestamp"),
+        (epoch_us > max_epoch_us, "timestamp is in the future"),
+    )
+
+    reasons = np.full(count, "", dtype=object)
+    for failed, reason in checks:
+        reasons[failed & (reasons == "")] = reason
+
+    keys = np.asarray(
+        ["" if k is None else str(k) for k in columns.idempotency_keys], dtype=object
+    )
+    too_long = np.fromiter((len(k) > 255 for k in keys), dtype=bool, count=count)
+    reasons[too_long & (reasons == "")] = "idempotency_key is too long"
+
+    valid = reasons == ""
+    errors = [
+        {"index": int(i), "reason": reasons[i]} for i in np.flatnonzero(~valid)
+    ]
+
+    # First occurrence wins for repeated keys in the same payload
+    keyed = np.flatnonzero(valid & (keys != ""))
+    if len(keyed):
+        _, first = np.unique(keys[keyed].astype(str), return_index=True)
+        repeated = np.setdiff1d(keyed, keyed[first])
+        valid[repeated] = False
+
+    indices = np.flatnonzero(valid)
+    return (
+        ValidatedBatch(
+            indices=indices,
+            metric_types=types[indices],
+            values=values[indices],
+            epoch_us=epoch_us[indices],
+            idempotency_keys=[columns.idempotency_keys[i] for i in indices],
+            metadata=[columns.metadata[i] for i in indices],
+        ),
+        errors,
+    )
+
+
+class MetricIngestService:
+    """Service for bulk-ingesting historical metric points."""
+
+    def __init__(self, db_session: AsyncSession):
+        """
+        Initialize ingest service with database session.
+
+        Args:
+            db_session: Async SQLAlchemy database session
+        """
+        self.db_session = db_session
+
+    async def ingest(self, project_id: UUID, columns: MetricColumns) -> IngestResult:
+        """
+        Validate and store a batch of metric points.
+
+        Invalid points are reported and skipped; points whose idempotency key
+        is already stored are counted as duplicates, so a retried batch is a
+        no-op. Valid points and their rollups are committed together.
+
+        Args:
+            project_id: Project UUID
+            columns: Parsed payload
+
+        Returns:
+            IngestResult with counts and per-point errors
+        """
+        started = time.perf_counter()
+        result = IngestResult(received=len(columns))
+
+        batch, errors = validate_columns(columns)
+        result.rejected = len(errors)
+        result.errors = errors[:MAX_REPORTED_ERRORS]
+        in_payload_duplicates = len(columns) - len(errors) - len(batch.indices)
+
+        existing = await self._existing_keys(
+            project_id, [k for k in batch.idempotency_keys if k]
+        )
+        rows = self._build_rows(project_id, batch, existing)
+
+        if rows:
+            if self._use_copy():
+                stored = await self._write_copy(rows)
+            else:
+                stored = await self._write_batched(rows)
+
+            await MetricRollupService(self.db_session).apply_rollups(stored)
+            await self.db_session.commit()
+            result.inserted = len(stored)
+
+        result.duplicates = len(batch.indices) - result.inserted + in_payload_duplicates
+        result.elapsed_ms = (time.perf_counter() - started) * 1000
+
+        logger.info(
+            "Ingested historical metrics",
+            project_id=str(project_id),
+            received=result.received,
+            inserted=result.inserted,
+            duplicates=result.duplicates,
+            rejected=result.rejected,
+            elapsed_ms=round(result.elapsed_ms, 1),
+        )
+        return result
+
+    async def _existing_keys(self, project_id: UUID, keys: List[str]) -> set:
+        """Return which of ``keys`` are already stored for the project."""
+        existing = set()
+        for offset in range(0, len(keys), INSERT_BATCH_SIZE):
+            chunk = keys[offset:offset + INSERT_BATCH_SIZE]
+            result = await self.db_session.execute(
+                select(HistoricalMetric.idempotency_key).where(
+                    HistoricalMetric.project_id == project_id,
+                    HistoricalMetric.idempotency_key.in_(chunk),
+                )
+            )
+            existing.update(result.scalars().all())
+        return existing
+
+    @staticmethod
+    def _build_rows(
+        project_id: UUID, batch: ValidatedBatch, existing: set
+    ) -> List[Dict[str, Any]]:
+        """Build insert rows, skipping already-stored idempotency keys."""
+        # datetime64 -> naive UTC datetimes in one conversion
+        timestamps = batch.epoch_us.astype("datetime64[us]").tolist()
+        now = datetime.now(timezone.utc)
+
+        rows = []
+        for metric_type, value, timestamp, key, metadata in zip(
+            batch.metric_types.tolist(),
+            batch.values.tolist(),
+            timestamps,
+            batch.idempotency_keys,
+            batch.metadata,
+        ):
+            if key and key in existing:
+                continue
+            rows.append(
+                {
+                    "id": uuid4(),
+                    "project_id": project_id,
+                    "metric_type": metric_type,
+                    "value": value,
+                    "timestamp": timestamp.replace(tzinfo=timezone.utc),
+                    "metric_metadata": metadata,
+                    "idempotency_key": key or None,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+            )
+        return rows
+
+    def _use_copy(self) -> bool:
+        """COPY is available on PostgreSQL through asyncpg."""
+        dialect = self.db_session.bind.dialect
+        return dialect.name == "postgresql" and dialect.driver == "asyncpg"
+
+    async def _write_batched(
+        self, rows: List[Dict[str, Any]]
+    ) -> List[Tuple[UUID, str, float, datetime]]:
+        """
+        Insert rows with multi-row INSERT ... ON CONFLICT DO NOTHING statements.
+
+        Like the COPY path, keys inserted concurrently since the idempotency
+        lookup are skipped rather than failing the batch, and only rows
+        actually inserted are returned.
+
+        Args:
+            rows: Rows to insert
+
+        Returns:
+            (project_id, metric_type, value, timestamp) of inserted rows
+        """
+        dialect = self.db_session.bind.dialect.name
+        insert = sqlite.insert if dialect == "sqlite" else postgresql.insert
+
+        stored: List[Tuple[UUID, str, float, datetime]] = []
+        for offset in range(0, len(rows), INSERT_BATCH_SIZE):
+            result = await self.db_session.execute(
+                insert(HistoricalMetric)
+                .values(rows[offset:offset + INSERT_BATCH_SIZE])
+                .on_conflict_do_nothing(index_elements=["project_id", "idempotency_key"])
+                .returning(
+                    HistoricalMetric.project_id,
+                    HistoricalMetric.metric_type,
+                    HistoricalMetric.value,
+                    HistoricalMetric.timestamp,
+                )
+            )
+            stored.extend(tuple(row) for row in result.all())
+        return stored
+
+    async def _write_copy(
+        self, rows: List[Dict[str, Any]]
+    ) -> List[Tuple[UUID, str, float, datetime]]:
+        """
+        Stream rows into a staging table with COPY and merge them.
+
+        Runs on the session's connection, so it shares the transaction.
+        ON CONFLICT DO NOTHING covers keys inserted concurrently since the
+        idempotency lookup.
+
+        Args:
+            rows: Rows to insert
+
+        Returns:
+            (project_id, metric_type, value, timestamp) of inserted rows
+        """
+        connection = await self.db_session.connection()
+        raw = await connection.get_raw_connection()
+        driver = raw.driver_connection
+
+        await driver.execute(
+            f"CREATE TEMP TABLE IF NOT EXISTS {_STAGING_TABLE} "
+            "(LIKE historical_metrics INCLUDING DEFAULTS) ON COMMIT DROP"
+        )
+        await driver.copy_records_to_table(
+            _STAGING_TABLE,
+            records=[
+                tuple(
+                    json.dumps(row[c]) if c == "metric_metadata" else row[c]
+                    for c in _COPY_COLUMNS
+                )
+                for row in rows
+            ],
+            columns=list(_COPY_COLUMNS),
+        )
+
+        columns = ", ".join(_COPY_COLUMNS)
+        result = await self.db_session.execute(
+            text(
+                f"INSERT INTO historical_metrics ({columns}) "
+                f"SELECT {columns} FROM {_STAGING_TABLE} "
+                "ON CONFLICT (project_id, idempotency_key) DO NOTHING "
+                "RETURNING project_id, metric_type, value, timestamp"
+            )
+        )
+        stored = [tuple(row) for row in result.all()]
+        await self.db_session.execute(text(f"DELETE FROM {_STAGING_TABLE}"))
+        return stored
@@ -0,0 +1,583 @@
+"""
+Metric Rollup Service.
+
+Maintains hourly, daily and weekly aggregates (count, sum, min, max, last)
+of HistoricalMetric values per project and metric type, and serves
+downsampled time series from the coarsest table that fits a point budget.
+
+Rollups are updated incrementally when metrics are recorded: new points
+are pre-aggregated per bucket and merged into existing rows with a single
+INSERT ... ON CONFLICT DO UPDATE per batch, so concurrent writers never
+lose counts. Points stored without going through the rollups (e.g. rows
+that predate them) are still served: when the rollups do not account for
+every raw point in range, the series is aggregated from the raw rows
+with GROUP BY instead.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import case, delete, func, literal_column, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+import structlog
+
+from app.models.historical_metrics import (
+    HistoricalMetric,
+    MetricRollup,
+    RollupResolution,
+)
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_MAX_POINTS = 500
+
+# Finest to coarsest
+ROLLUP_RESOLUTIONS = (
+    RollupResolution.HOUR,
+    RollupResolution.DAY,
+    RollupResolution.WEEK,
+)
+
+# Rows per upsert statement (keeps bind parameter counts well below limits)
+UPSERT_BATCH_SIZE = 500
+REBUILD_CHUNK_SIZE = 5000
+
+
+@dataclass
+class RollupBucket:
+    """Aggregates for one (project, metric type, resolution, bucket)."""
+
+    count: int
+    sum: float
+    min: float
+    max: float
+    last_value: float
+    last_timestamp: datetime
+
+    def add(self, value: float, timestamp: datetime) -> None:
+        """Fold one value into the bucket."""
+        self.count += 1
+        self.sum += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        if timestamp >= self.last_timestamp:
+            self.last_value = value
+            self.last_timestamp = timestamp
+
+    def merge(self, other: "RollupBucket") -> None:
+        """Fold another bucket's aggregates into this one."""
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        if other.last_timestamp >= self.last_timestamp:
+            self.last_value = other.last_value
+            self.last_timestamp = other.last_timestamp
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Treat naive datetimes as UTC, matching TZDateTime."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def bucket_start(timestamp: datetime, resolution: str) -> datetime:
+    """
+    Floor a timestamp to the start of its bucket (UTC, weeks start Monday).
+
+    Args:
+        timestamp: Point in time
+        resolution: RollupResolution value
+
+    Returns:
+        Bucket start as an aware UTC datetime
+    """
+    ts = _as_utc(timestamp)
+    if resolution == RollupResolution.HOUR:
+        return ts.replace(minute=0, second=0, microsecond=0)
+    day = ts.replace(hour=0, minute=0, second=0, microsecond=0)
+    if resolution == RollupResolution.DAY:
+        return day
+    if resolution == RollupResolution.WEEK:
+        return day - timedelta(days=day.weekday())
+    raise ValueError(f"Unknown rollup resolution: {resolution}")
+
+
+def aggregate_points(
+    points: Iterable[Tuple[UUID, str, float, datetime]],
+) -> Dict[Tuple[UUID, str, str, datetime], RollupBucket]:
+    """
+    Pre-aggregate raw points into buckets for every resolution.
+
+    Args:
+        points: (project_id, metric_type, value, timestamp) tuples
+
+    Returns:
+        Buckets keyed by (project_id, metric_type, resolution, bucket_start)
+    """
+    buckets: Dict[Tuple[UUID, str, str, datetime], RollupBucket] = {}
+    for project_id, metric_type, value, timestamp in points:
+        value = float(value)
+        timestamp = _as_utc(timestamp)
+        for resolution in ROLLUP_RESOLUTIONS:
+            key = (
+                project_id,
+                str(metric_type),
+                resolution.value,
+                bucket_start(timestamp, resolution),
+            )
+            bucket = buckets.get(key)
+            if bucket is None:
+                buckets[key] = RollupBucket(1, value, value, value, value, timestamp)
+            else:
+                bucket.add(value, timestamp)
+    return buckets
+
+
+class MetricRollupService:
+    """Service for maintaining and querying metric rollups."""
+
+    def __init__(self, db_session: AsyncSession):
+        """
+        Initialize rollup service with database session.
+
+        Args:
+            db_session: Async SQLAlchemy database session
+        """
+        self.db_session = db_session
+
+    async def record_metrics(
+        self,
+        project_id: UUID,
+        metric_type: str,
+        points: Iterable[Tuple[float, datetime]],
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> List[HistoricalMetric]:
+        """
+        Store raw metric points and update their rollups in one transaction.
+
+        Args:
+            project_id: Project UUID
+            metric_type: Metric type
+            points: (value, timestamp) pairs
+            metadata: Optional metadata stored on every point
+
+        Returns:
+            Created HistoricalMetric rows
+        """
+        metrics = [
+            HistoricalMetric(
+                project_id=project_id,
+                metric_type=str(metric_type),
+                value=float(value),
+                timestamp=_as_utc(timestamp),
+                metric_metadata=dict(metadata or {}),
+            )
+            for value, timestamp in points
+        ]
+        if not metrics:
+            return []
+
+        self.db_session.add_all(metrics)
+        await self.apply_rollups(
+            (m.project_id, m.metric_type, m.value, m.timestamp) for m in metrics
+        )
+        await self.db_session.commit()
+
+        logger.info(
+            "Recorded historical metrics",
+            project_id=str(project_id),
+            metric_type=str(metric_type),
+            count=len(metrics),
+        )
+        return metrics
+
+    async def apply_rollups(
+        self, points: Iterable[Tuple[UUID, str, float, datetime]]
+    ) -> int:
+        """
+        Merge raw points into the rollup tables without committing.
+
+        Points are pre-aggregated per bucket in memory, then merged into
+        existing rows atomically with INSERT ... ON CONFLICT DO UPDATE.
+
+        Args:
+            points: (project_id, metric_type, value, timestamp) tuples
+
+        Returns:
+            Number of rollup buckets touched
+        """
+        buckets = aggregate_points(points)
+        rows = [
+            {
+                "project_id": project_id,
+                "metric_type": metric_type,
+                "resolution": resolution,
+                "bucket_start": start,
+                "count": bucket.count,
+                "sum": bucket.sum,
+                "min": bucket.min,
+                "max": bucket.max,
+                "last_value": bucket.last_value,
+                "last_timestamp": bucket.last_timestamp,
+            }
+            for (project_id, metric_type, resolution, start), bucket in buckets.items()
+        ]
+
+        for offset in range(0, len(rows), UPSERT_BATCH_SIZE):
+            await self.db_session.execute(
+                self._upsert_statement(rows[offset:offset + UPSERT_BATCH_SIZE])
+            )
+        return len(rows)
+
+    def _upsert_statement(self, rows: List[Dict[str, Any]]):
+        """
+        Build a multi-row upsert that merges aggregates into existing buckets.
+
+        Args:
+            rows: Pre-aggregated bucket rows (unique per bucket key)
+
+        Returns:
+            Executable INSERT ... ON CONFLICT statement
+        """
+        dialect = self.db_session.bind.dialect.name
+        insert = sqlite.insert if dialect == "sqlite" else postgresql.insert
+
+        stmt = insert(MetricRollup).values(rows)
+        new = stmt.excluded
+        return stmt.on_conflict_do_update(
+            index_elements=["project_id", "metric_type", "resolution", "bucket_start"],
+            set_={
+                "count": MetricRollup.count + new["count"],
+                "sum": MetricRollup.sum + new["sum"],
+                "min": case((new["min"] < MetricRollup.min, new["min"]), else_=MetricRollup.min),
+                "max": case((new["max"] > MetricRollup.max, new["max"]), else_=MetricRollup.max),
+                "last_value": case(
+                    (new.last_timestamp >= MetricRollup.last_timestamp, new.last_value),
+                    else_=MetricRollup.last_value,
+                ),
+                "last_timestamp": case(
+                    (new.last_timestamp >= MetricRollup.last_timestamp, new.last_timestamp),
+                    else_=MetricRollup.last_timestamp,
+                ),
+                "updated_at": func.now(),
+            },
+        )
+
+    async def rebuild_rollups(self, project_id: UUID) -> int:
+        """
+        Recompute all rollups for a project from raw metrics.
+
+        Used to backfill projects whose metrics predate rollups.
+
+        Args:
+            project_id: Project UUID
+
+        Returns:
+            Number of raw points processed
+        """
+        await self.db_session.execute(
+            delete(MetricRollup).where(MetricRollup.project_id == project_id)
+        )
+
+        result = await self.db_session.stream(
+            select(
+                HistoricalMetric.project_id,
+                HistoricalMetric.metric_type,
+                HistoricalMetric.value,
+                HistoricalMetric.timestamp,
+            ).where(HistoricalMetric.project_id == project_id)
+        )
+        processed = 0
+        async for chunk in result.partitions(REBUILD_CHUNK_SIZE):
+            await self.apply_rollups(tuple(row) for row in chunk)
+            processed += len(chunk)
+
+        await self.db_session.commit()
+        logger.info("Rebuilt metric rollups", project_id=str(project_id), points=processed)
+        return processed
+
+    async def get_series(
+        self,
+        project_id: UUID,
+        metric_type: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        max_points: int = DEFAULT_MAX_POINTS,
+    ) -> Tuple[str, List[Dict[str, Any]]]:
+        """
+        Get a metric series at the finest resolution within the point budget.
+
+        Raw points are returned when they fit; otherwise the hourly, daily
+        and weekly rollups are tried in turn. If even weekly buckets exceed
+        the budget, consecutive weekly buckets are merged. If the rollups
+        miss some of the raw points in range, the same buckets are
+        aggregated from the raw rows in SQL instead.
+
+        Args:
+            project_id: Project UUID
+            metric_type: Optional metric type filter
+            start_date: Optional inclusive range start
+            end_date: Optional inclusive range end
+            max_points: Maximum number of points to return
+
+        Returns:
+            (resolution, points) where resolution is "raw" or a RollupResolution value
+        """
+        raw_filters = [HistoricalMetric.project_id == project_id]
+        if metric_type:
+            raw_filters.append(HistoricalMetric.metric_type == metric_type)
+        if start_date:
+            raw_filters.append(HistoricalMetric.timestamp >= start_date)
+        if end_date:
+            raw_filters.append(HistoricalMetric.timestamp <= end_date)
+
+        raw_count = await self.db_session.scalar(
+            select(func.count()).select_from(HistoricalMetric).where(*raw_filters)
+        )
+        if raw_count <= max_points:
+            result = await self.db_session.execute(
+                select(HistoricalMetric)
+                .where(*raw_filters)
+                .order_by(HistoricalMetric.timestamp)
+            )
+            return "raw", [
+                {
+                    "id": str(m.id),
+                    "project_id": str(m.project_id),
+                    "metric_type": m.metric_type,
+                    "value": m.value,
+                    "timestamp": m.timestamp.isoformat(),
+                }
+                for m in result.scalars().all()
+            ]
+
+        for resolution in ROLLUP_RESOLUTIONS:
+            filters = self._rollup_filters(
+                project_id, resolution, metric_type, start_date, end_date
+            )
+            count, covered = (
+                await self.db_session.execute(
+                    select(func.count(), func.coalesce(func.sum(MetricRollup.count), 0))
+                    .select_from(MetricRollup)
+                    .where(*filters)
+                )
+            ).one()
+            # Edge buckets may hold points outside the range, so complete
+            # rollups cover at least raw_count points
+            if covered < raw_count:
+                return await self._get_raw_series(
+                    project_id, raw_filters, raw_count, covered, max_points
+                )
+            if count <= max_points or resolution == ROLLUP_RESOLUTIONS[-1]:
+                break
+
+        result = await self.db_session.execute(
+            select(MetricRollup)
+            .where(*filters)
+            .order_by(MetricRollup.metric_type, MetricRollup.bucket_start)
+        )
+        rollups = result.scalars().all()
+
+        series: List[Tuple[str, datetime, RollupBucket]] = [
+            (
+                r.metric_type,
+                r.bucket_start,
+                RollupBucket(r.count, r.sum, r.min, r.max, r.last_value, r.last_timestamp),
+            )
+            for r in rollups
+        ]
+        return self._series_points(project_id, resolution, series, max_points)
+
+    async def _get_raw_series(
+        self,
+        project_id: UUID,
+        raw_filters: list,
+        raw_count: int,
+        covered: int,
+        max_points: int,
+    ) -> Tuple[str, List[Dict[str, Any]]]:
+        """
+        Aggregate raw points into rollup-style buckets with GROUP BY.
+
+        Used when the rollup tables miss points, e.g. metrics stored before
+        rollups existed (rebuild_rollups backfills them). Resolutions are
+        tried finest first, as for the rollup tables.
+
+        Args:
+            project_id: Project UUID
+            raw_filters: Filters selecting the raw points in range
+            raw_count: Number of raw points in range
+            covered: Number of points the rollups account for
+            max_points: Maximum number of points to return
+
+        Returns:
+            (resolution, points) in the same form as rollup-based series
+        """
+        logger.info(
+            "Metric rollups incomplete, aggregating raw points",
+            project_id=str(project_id),
+            raw_points=raw_count,
+            rollup_points=covered,
+        )
+
+        for resolution in ROLLUP_RESOLUTIONS:
+            bucket = self._raw_bucket_expression(resolution)
+            buckets = (
+                select(HistoricalMetric.metric_type, bucket)
+                .where(*raw_filters)
+                .distinct()
+                .subquery()
+            )
+            count = await self.db_session.scalar(
+                select(func.count()).select_from(buckets)
+            )
+            if count <= max_points or resolution == ROLLUP_RESOLUTIONS[-1]:
+                break
+
+        ranked = (
+            select(
+                HistoricalMetric.metric_type,
+                HistoricalMetric.value,
+                HistoricalMetric.timestamp,
+                bucket.label("bucket"),
+                func.row_number()
+                .over(
+                    partition_by=(HistoricalMetric.metric_type, bucket),
+                    order_by=(HistoricalMetric.timestamp.desc(), HistoricalMetric.id.desc()),
+                )
+                .label("recency"),
+            )
+            .where(*raw_filters)
+            .subquery()
+        )
+        result = await self.db_session.execute(
+            select(
+                ranked.c.metric_type,
+                ranked.c.bucket,
+                func.count(),
+                func.sum(ranked.c.value),
+                func.min(ranked.c.value),
+                func.max(ranked.c.value),
+                func.max(case((ranked.c.recency == 1, ranked.c.value))),
+                func.max(ranked.c.timestamp),
+            )
+            .group_by(ranked.c.metric_type, ranked.c.bucket)
+            .order_by(ranked.c.metric_type, ranked.c.bucket)
+        )
+
+        series: List[Tuple[str, datetime, RollupBucket]] = [
+            (
+                row_type,
+                self._parse_bucket(start),
+                RollupBucket(points, total, low, high, last, self._parse_bucket(last_ts)),
+            )
+            for row_type, start, points, total, low, high, last, last_ts in result.all()
+        ]
+        return self._series_points(project_id, resolution, series, max_points)
+
+    def _raw_bucket_expression(self, resolution: RollupResolution):
+        """
+        SQL expression flooring HistoricalMetric.timestamp to its UTC bucket.
+
+        Matches bucket_start: hours, days, and weeks starting Monday.
+        """
+        timestamp = HistoricalMetric.timestamp
+        if self.db_session.bind.dialect.name == "sqlite":
+            # Timestamps are stored as UTC text; 'weekday 0' moves to the
+            # next Sunday (or stays), '-6 days' back to that week's Monday
+            if resolution == RollupResolution.HOUR:
+                return func.strftime("%Y-%m-%d %H:00:00", timestamp)
+            if resolution == RollupResolution.DAY:
+                return func.strftime("%Y-%m-%d 00:00:00", timestamp)
+            return func.strftime("%Y-%m-%d 00:00:00", timestamp, "weekday 0", "-6 days")
+
+        # Literals rather than bind parameters, so PostgreSQL sees the same
+        # expression wherever it is repeated
+        return func.date_trunc(
+            literal_column(f"'{resolution.value}'"),
+            func.timezone(literal_column("'UTC'"), timestamp),
+        )
+
+    @staticmethod
+    def _parse_bucket(value: Any) -> datetime:
+        """Convert a bucket value from SQL (text on SQLite) to a UTC datetime."""
+        if isinstance(value, str):
+            value = datetime.fromisoformat(value)
+        return _as_utc(value)
+
+    def _series_points(
+        self,
+        project_id: UUID,
+        resolution: RollupResolution,
+        series: List[Tuple[str, datetime, RollupBucket]],
+        max_points: int,
+    ) -> Tuple[str, List[Dict[str, Any]]]:
+        """Merge buckets down to the point budget and format them for the API."""
+        if len(series) > max_points:
+            series = self._merge_consecutive(series, -(-len(series) // max_points))
+
+        return resolution.value, [
+            {
+                "project_id": str(project_id),
+                "metric_type": series_type,
+                "resolution": resolution.value,
+                "timestamp": start.isoformat(),
+                "value": bucket.sum / bucket.count,
+                "count": bucket.count,
+                "min": bucket.min,
+                "max": bucket.max,
+                "last": bucket.last_value,
+            }
+            for series_type, start, bucket in series
+        ]
+
+    @staticmethod
+    def _rollup_filters(
+        project_id: UUID,
+        resolution: RollupResolution,
+        metric_type: Optional[str],
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+    ) -> list:
+        """Filters selecting the buckets that overlap the requested range."""
+        filters = [
+            MetricRollup.project_id == project_id,
+            MetricRollup.resolution == resolution.value,
+        ]
+        if metric_type:
+            filters.append(MetricRollup.metric_type == metric_type)
+        if start_date:
+            filters.append(MetricRollup.bucket_start >= bucket_start(start_date, resolution))
+        if end_date:
+            filters.append(MetricRollup.bucket_start <= end_date)
+        return filters
+
+    @staticmethod
+    def _merge_consecutive(
+        series: List[Tuple[str, datetime, RollupBucket]], factor: int
+    ) -> List[Tuple[str, datetime, RollupBucket]]:
+        """
+        Merge every ``factor`` consecutive buckets of each metric type.
+
+        Args:
+            series: (metric_type, bucket_start, bucket) sorted by type and time
+            factor: Number of buckets per merged point
+
+        Returns:
+            Merged series labelled with the first bucket's start
+        """
+        merged: List[Tuple[str, datetime, RollupBucket]] = []
+        run = 0
+        for metric_type, start, bucket in series:
+            if merged and merged[-1][0] == metric_type and run < factor:
+                merged[-1][2].merge(bucket)
+                run += 1
+            else:
+                merged.append((metric_type, start, bucket))
+                run = 1
+        return merged
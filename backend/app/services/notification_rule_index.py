@@ -0,0 +1,179 @@
+"""
+Indexed matching of notification rules against events.
+
+Rules whose conditions list ``project_ids`` are indexed in
+``notification_rule_projects`` by (event_type, project_id); every other
+rule sits in a wildcard bucket for its event type. An event therefore
+loads only the rules of its project plus the wildcard bucket, and the
+remaining conditions are checked with predicates compiled once per rule
+version.
+"""
+
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import delete, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.notification import NotificationRule, NotificationRuleProject
+
+RulePredicate = Callable[[Dict[str, Any]], bool]
+
+PREDICATE_CACHE_SIZE = 10000
+
+
+def compile_conditions(conditions: Optional[Dict[str, Any]]) -> RulePredicate:
+    """
+    Compile rule conditions into a predicate over event data.
+
+    Args:
+        conditions: Rule conditions (``project_ids``, ``min_completion``)
+
+    Returns:
+        Function returning True when event data matches the conditions
+    """
+    checks: List[RulePredicate] = []
+    conditions = conditions or {}
+
+    if "project_ids" in conditions:
+        allowed = frozenset(str(p) for p in conditions["project_ids"])
+        checks.append(
+            lambda event: event.get("project_id") is not None
+            and str(event["project_id"]) in allowed
+        )
+
+    if "min_completion" in conditions:
+        min_completion = conditions["min_completion"]
+        checks.append(lambda event: event.get("completion", 0) >= min_completion)
+
+    if not checks:
+        return lambda event: True
+    if len(checks) == 1:
+        return checks[0]
+    return lambda event: all(check(event) for check in checks)
+
+
+class RulePredicateCache:
+    """
+    LRU of compiled rule predicates.
+
+    Entries are tagged with the rule's ``updated_at``, so a rule changed by
+    another process is recompiled on its next match even without an
+    explicit invalidation.
+    """
+
+    def __init__(self, max_entries: int = PREDICATE_CACHE_SIZE):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of compiled predicates kept
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[UUID, Tuple[Any, RulePredicate]]" = OrderedDict()
+
+    def get(self, rule: NotificationRule) -> RulePredicate:
+        """Return the compiled predicate for ``rule``."""
+        entry = self._entries.get(rule.id)
+        if entry is not None and entry[0] == rule.updated_at:
+            self._entries.move_to_end(rule.id)
+            return entry[1]
+
+        predicate = compile_conditions(rule.conditions)
+        self._entries[rule.id] = (rule.updated_at, predicate)
+        self._entries.move_to_end(rule.id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return predicate
+
+    def invalidate(self, rule_id: UUID) -> None:
+        """Drop the compiled predicate of a created, updated or deleted rule."""
+        self._entries.pop(rule_id, None)
+
+    def clear(self) -> None:
+        """Drop all compiled predicates."""
+        self._entries.clear()
+
+
+rule_predicates = RulePredicateCache()
+
+
+def candidate_rules_query(event_type: str, project_id: Optional[Any]):
+    """
+    Build the query for enabled rules that can match an event.
+
+    Args:
+        event_type: Event type string
+        project_id: Project the event belongs to, if any
+
+    Returns:
+        SELECT of the wildcard bucket plus the project's indexed rules
+    """
+    bucket = NotificationRule.project_scoped.is_(False)
+    if project_id is not None:
+        bucket = or_(
+            bucket,
+            NotificationRule.id.in_(
+                select(NotificationRuleProject.rule_id).where(
+                    NotificationRuleProject.event_type == event_type,
+                    NotificationRuleProject.project_id == str(project_id),
+                )
+            ),
+        )
+
+    return select(NotificationRule).where(
+        NotificationRule.event_type == event_type,
+        NotificationRule.enabled.is_(True),
+        bucket,
+    )
+
+
+async def match_rules(
+    db: AsyncSession, event_type: str, event_data: Dict[str, Any]
+) -> List[NotificationRule]:
+    """
+    Return the enabled rules whose conditions match an event.
+
+    Args:
+        db: Database session
+        event_type: Event type string
+        event_data: Event-specific data
+
+    Returns:
+        Matching NotificationRule instances
+    """
+    result = await db.execute(
+        candidate_rules_query(event_type, event_data.get("project_id"))
+    )
+    return [
+        rule
+        for rule in result.scalars().all()
+        if rule_predicates.get(rule)(event_data)
+    ]
+
+
+async def index_rule_projects(db: AsyncSession, rule: NotificationRule) -> None:
+    """
+    Rewrite a rule's project index rows from its conditions.
+
+    The rule must already be flushed. Changes are left for the caller to
+    commit.
+
+    Args:
+        db: Database session
+        rule: Rule to index
+    """
+    conditions = rule.conditions or {}
+    rule.project_scoped = "project_ids" in conditions
+
+    await db.execute(
+        delete(NotificationRuleProject).where(NotificationRuleProject.rule_id == rule.id)
+    )
+    for project_id in {str(p) for p in conditions.get("project_ids", [])}:
+        db.add(
+            NotificationRuleProject(
+                rule_id=rule.id, project_id=project_id, event_type=rule.event_type
+            )
+        )
+    rule_predicates.invalidate(rule.id)
@@ -8,6 +8,7 @@ import structlog
 from sqlalchemy import and_, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.database.pagination import apply_keyset, decode_cursor
 from app.models.notification import (
     Notification,
     NotificationChannel,
@@ -18,9 +19,18 @@ from app.models.notification import (
     NotificationType,
 )
 from app.models.user import User
+from app.services.notification_rule_index import (
+    index_rule_projects,
+    match_rules,
+    rule_predicates,
+)
+from app.services.notification_template_cache import template_cache
 
 logger = structlog.get_logger(__name__)
 
+# Notifications are always listed newest first
+NOTIFICATION_SORT = "-created_at"
+
 
 class NotificationService:
     """Service for managing notifications and notification rules."""
@@ -130,27 +140,35 @@ class NotificationService:
         status: Optional[NotificationStatus] = None,
         limit: int = 50,
         offset: int = 0,
+        cursor: Optional[str] = None,
     ) -> List[Notification]:
         """
-        Get notifications for a user.
+        Get notifications for a user, newest first.
 
         Args:
             user_id: User ID
             status: Optional status filter (UNREAD, READ)
             limit: Maximum number of notifications to return
-            offset: Offset for pagination
+            offset: Offset for pagination (ignored with a cursor)
+            cursor: Cursor of the previous page's last notification
 
         Returns:
             List of notifications
+
+        Raises:
+            InvalidCursorError: If the cursor is invalid
         """
         query = select(Notification).where(Notification.user_id == user_id)
 
         if status is not None:
             query = query.where(Notification.status == status.value)
 
-        query = (
-            query.order_by(Notification.created_at.desc()).limit(limit).offset(offset)
-        )
+        position = decode_cursor(cursor, NOTIFICATION_SORT) if cursor else None
+        query = apply_keyset(
+            query, Notification.created_at, Notification.id, True, position
+        ).limit(limit)
+        if position is None and offset:
+            query = query.offset(offset)
 
         result = await self.db.execute(query)
         notifications = result.scalars().all()
@@ -303,6 +321,8 @@ class NotificationService:
         )
 
         self.db.add(rule)
+        await self.db.flush()
+        await index_rule_projects(self.db, rule)
         await self.db.commit()
         await self.db.refresh(rule)
 
@@ -375,8 +395,10 @@ class NotificationService:
                 rule.channels = channel_values
             if conditions is not None:
                 rule.conditions = conditions
+                await index_rule_projects(self.db, rule)
 
             await self.db.commit()
+            rule_predicates.invalidate(rule.id)
             await self.db.refresh(rule)
 
             logger.info("notification_rule_updated", rule_id=rule_id, user_id=user_id)
@@ -407,6 +429,7 @@ class NotificationService:
         if rule:
             await self.db.delete(rule)
             await self.db.commit()
+            rule_predicates.invalidate(rule_id)
             logger.info("notification_rule_deleted", rule_id=rule_id, user_id=user_id)
             return True
 
@@ -432,22 +455,8 @@ class NotificationService:
             event_type.value if isinstance(event_type, NotificationType) else event_type
         )
 
-        # Find all enabled rules for this event type
-        result = await self.db.execute(
-            select(NotificationRule).where(
-                and_(
-                    NotificationRule.event_type == event_type_str,
-                    NotificationRule.enabled.is_(True),
-                )
-            )
-        )
-        rules = list(result.scalars().all())
-
-        # Filter rules based on conditions
-        matching_rules = []
-        for rule in rules:
-            if self._rule_matches_conditions(rule, event_data):
-                matching_rules.append(rule)
+        # Load the event's project bucket plus wildcard rules only
+        matching_rules = await match_rules(self.db, event_type_str, event_data)
 
         logger.info(
             "notification_rules_evaluated",
@@ -457,36 +466,6 @@ class NotificationService:
 
         return matching_rules
 
-    def _rule_matches_conditions(
-        self, rule: NotificationRule, event_data: Dict[str, Any]
-    ) -> bool:
-        """
-        Check if event data matches rule conditions.
-
-        Args:
-            rule: NotificationRule to check
-            event_data: Event data to match against
-
-        Returns:
-            True if rule matches, False otherwise
-        """
-        if not rule.conditions:
-            return True
-
-        # Check project_ids condition
-        if "project_ids" in rule.conditions:
-            project_id = event_data.get("project_id")
-            if project_id not in rule.conditions["project_ids"]:
-                return False
-
-        # Check min_completion condition
-        if "min_completion" in rule.conditions:
-            completion = event_data.get("completion", 0)
-            if completion < rule.conditions["min_completion"]:
-                return False
-
-        return True
-
     # Template Management
     async def create_template(
         self,
@@ -521,6 +500,7 @@ class NotificationService:
         self.db.add(template)
         await self.db.commit()
         await self.db.refresh(template)
+        template_cache.invalidate(event_type_str)
 
         logger.info(
             "notification_template_created",
@@ -584,6 +564,7 @@ class NotificationService:
 
             await self.db.commit()
             await self.db.refresh(template)
+            template_cache.invalidate(template.event_type)
 
             logger.info(
                 "notification_template_updated",
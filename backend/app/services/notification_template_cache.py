@@ -0,0 +1,233 @@
+"""
+Compiled notification email templates.
+
+Templates are compiled once and cached in-process by event type, tagged
+with the row's ``updated_at``. A cached entry is trusted for
+``TEMPLATE_REVALIDATE_SECONDS``; after that only the template's
+``updated_at`` is re-read, and the template is reloaded and recompiled
+only when it changed. ``NotificationService`` invalidates entries when it
+writes a template, so changes made in the same process apply at once.
+"""
+
+import json
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import structlog
+from jinja2 import Environment, Template, TemplateError
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.notification import NotificationTemplate
+
+logger = structlog.get_logger(__name__)
+
+# Seconds a cached template is used before its updated_at is re-checked
+TEMPLATE_REVALIDATE_SECONDS = 60.0
+
+# Rendered in place of a template that fails to compile or render
+FALLBACK_TEXT = "Notification from SprintForge"
+
+# (subject, HTML body, plain text body)
+RenderedEmail = Tuple[str, str, str]
+
+_environment = Environment()
+
+
+@lru_cache(maxsize=1024)
+def compile_string(source: str) -> Template:
+    """
+    Compile a template string, reusing earlier compilations of the same source.
+
+    Args:
+        source: Jinja2 template source
+
+    Returns:
+        Compiled template (the fallback text if the source does not compile)
+    """
+    try:
+        return _environment.from_string(source)
+    except TemplateError as e:
+        logger.error("template_compile_failed", error=str(e))
+        return _environment.from_string(FALLBACK_TEXT)
+
+
+def render_string(template: Template, context: Dict[str, Any]) -> str:
+    """Render a compiled template, falling back to FALLBACK_TEXT on error."""
+    try:
+        return template.render(**context)
+    except Exception as e:
+        logger.error("template_render_failed", error=str(e), exc_info=True)
+        return FALLBACK_TEXT
+
+
+@dataclass(frozen=True)
+class CompiledTemplate:
+    """Compiled subject and body templates of one notification template."""
+
+    event_type: str
+    updated_at: Optional[datetime]
+    subject: Template
+    body_html: Template
+    body_text: Template
+
+    @classmethod
+    def from_model(cls, template: NotificationTemplate) -> "CompiledTemplate":
+        """Compile a NotificationTemplate row."""
+        return cls(
+            event_type=template.event_type,
+            updated_at=template.updated_at,
+            subject=compile_string(template.subject_template),
+            body_html=compile_string(template.body_template_html),
+            body_text=compile_string(template.body_template_text),
+        )
+
+    def render(self, context: Dict[str, Any]) -> RenderedEmail:
+        """
+        Render the template for one recipient.
+
+        Args:
+            context: Template variables
+
+        Returns:
+            Tuple of (subject, HTML body, plain text body)
+        """
+        return (
+            render_string(self.subject, context),
+            render_string(self.body_html, context),
+            render_string(self.body_text, context),
+        )
+
+    def render_many(self, contexts: Sequence[Dict[str, Any]]) -> List[RenderedEmail]:
+        """
+        Render the template for a batch of recipients.
+
+        Recipients of one event usually share a context, so each distinct
+        context is rendered once.
+
+        Args:
+            contexts: Template variables per recipient
+
+        Returns:
+            Rendered email per context, in order
+        """
+        rendered: Dict[str, RenderedEmail] = {}
+        results = []
+        for context in contexts:
+            key = json.dumps(context, sort_keys=True, default=str)
+            if key not in rendered:
+                rendered[key] = self.render(context)
+            results.append(rendered[key])
+        return results
+
+
+@dataclass
+class _Entry:
+    compiled: Optional[CompiledTemplate]
+    checked_at: float
+
+
+class TemplateCache:
+    """In-process cache of compiled templates keyed by event type."""
+
+    def __init__(self, revalidate_after: float = TEMPLATE_REVALIDATE_SECONDS):
+        """
+        Initialize the cache.
+
+        Args:
+            revalidate_after: Seconds an entry is used before re-checking updated_at
+        """
+        self.revalidate_after = revalidate_after
+        self._entries: Dict[str, _Entry] = {}
+
+    async def get(
+        self, db: AsyncSession, event_type: Any
+    ) -> Optional[CompiledTemplate]:
+        """
+        Return the compiled template for an event type.
+
+        Args:
+            db: Database session
+            event_type: Event type (string or NotificationType)
+
+        Returns:
+            CompiledTemplate, or None if the event type has no template
+        """
+        event_type = getattr(event_type, "value", event_type)
+        return (await self.get_many(db, [event_type])).get(event_type)
+
+    async def get_many(
+        self, db: AsyncSession, event_types: Iterable[Any]
+    ) -> Dict[str, CompiledTemplate]:
+        """
+        Return compiled templates for several event types.
+
+        At most two queries are issued: one for the ``updated_at`` of
+        expired entries and one loading templates that are new or changed.
+
+        Args:
+            db: Database session
+            event_types: Event types (strings or NotificationType)
+
+        Returns:
+            Dict of event type to CompiledTemplate, omitting types without one
+        """
+        wanted = {getattr(t, "value", t) for t in event_types}
+        now = time.monotonic()
+
+        missing = {t for t in wanted if t not in self._entries}
+        expired = {
+            t
+            for t in wanted - missing
+            if now - self._entries[t].checked_at > self.revalidate_after
+        }
+
+        if expired:
+            result = await db.execute(
+                select(
+                    NotificationTemplate.event_type, NotificationTemplate.updated_at
+                ).where(NotificationTemplate.event_type.in_(expired))
+            )
+            versions = dict(result.all())
+            for event_type in expired:
+                cached = self._entries[event_type].compiled
+                current = cached.updated_at if cached else None
+                if event_type in versions and versions[event_type] == current:
+                    self._entries[event_type].checked_at = now
+                elif event_type in versions:
+                    missing.add(event_type)
+                else:
+                    self._entries[event_type] = _Entry(None, now)
+
+        if missing:
+            result = await db.execute(
+                select(NotificationTemplate).where(
+                    NotificationTemplate.event_type.in_(missing)
+                )
+            )
+            for template in result.scalars().all():
+                self._entries[template.event_type] = _Entry(
+                    CompiledTemplate.from_model(template), now
+                )
+                missing.discard(template.event_type)
+            # Remember event types without a template, too
+            for event_type in missing:
+                self._entries[event_type] = _Entry(None, now)
+
+        return {
+            t: self._entries[t].compiled for t in wanted if self._entries[t].compiled
+        }
+
+    def invalidate(self, event_type: Any) -> None:
+        """Drop the cached template of a created or updated event type."""
+        self._entries.pop(getattr(event_type, "value", event_type), None)
+
+    def clear(self) -> None:
+        """Drop all cached templates."""
+        self._entries.clear()
+
+
+template_cache = TemplateCache()
@@ -7,11 +7,32 @@ from sqlalchemy import select, func, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 import structlog
 
+from app.core.cache import BoundedTTLDict
+from app.database.pagination import apply_keyset, decode_cursor
 from app.models.project import Project
 from app.schemas.project import ProjectCreate, ProjectUpdate
+from app.services.analytics_service import invalidate_project_analytics
+from app.services.baseline_service import BaselineService
 
 logger = structlog.get_logger(__name__)
 
+# Seconds a project list total is reused before it is counted again
+PROJECT_COUNT_TTL = 30
+
+# owner_id -> {search: total}; dropped whenever the owner's projects change
+_project_counts: BoundedTTLDict = BoundedTTLDict(max_entries=10_000, ttl=PROJECT_COUNT_TTL)
+
+
+def invalidate_project_counts(owner_id: UUID) -> None:
+    """Forget cached project list totals of an owner."""
+    _project_counts.pop(owner_id, None)
+
+
+def _search_pattern(search: str) -> str:
+    """Build an ILIKE pattern matching ``search`` literally anywhere."""
+    escaped = search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
 
 class ProjectService:
     """Service for project CRUD operations."""
@@ -63,6 +84,7 @@ class ProjectService:
         self.db.add(project)
         await self.db.commit()
         await self.db.refresh(project)
+        invalidate_project_counts(user_id)
 
         logger.info(
             "Project created successfully",
@@ -95,48 +117,60 @@ class ProjectService:
         search: Optional[str] = None,
         sort_by: str = "created_at",
         sort_desc: bool = True,
+        cursor: Optional[str] = None,
     ) -> tuple[List[Project], int]:
         """
         List projects owned by user with pagination and filtering.
 
+        Pages are addressed by ``cursor`` (keyset pagination on
+        (sort field, id), see app.database.pagination) or by ``offset``;
+        a cursor takes precedence. The total is cached per owner and
+        search for PROJECT_COUNT_TTL seconds, and recounted sooner when
+        the owner's projects change in this process.
+
+        On PostgreSQL the search is served by the trigram indexes of
+        migration 008; SQLite scans.
+
         Args:
             user_id: Owner user ID
             limit: Maximum number of results
-            offset: Pagination offset
+            offset: Pagination offset (ignored with a cursor)
             search: Optional search query for name/description
             sort_by: Field to sort by (created_at, updated_at, name)
             sort_desc: Sort in descending order
+            cursor: Cursor of the previous page's last project
 
         Returns:
             Tuple of (projects list, total count)
+
+        Raises:
+            InvalidCursorError: If the cursor is invalid for this sort
         """
         # Build base query
         query = select(Project).where(Project.owner_id == user_id)
 
         # Apply search filter
         if search:
-            search_pattern = f"%{search}%"
+            search_pattern = _search_pattern(search)
             query = query.where(
                 or_(
-                    Project.name.ilike(search_pattern),
-                    Project.description.ilike(search_pattern),
+                    Project.name.ilike(search_pattern, escape="\\"),
+                    Project.description.ilike(search_pattern, escape="\\"),
                 )
             )
 
-        # Get total count
-        count_query = select(func.count()).select_from(query.subquery())
-        total_result = await self.db.execute(count_query)
-        total = total_result.scalar_one()
-
-        # Apply sorting
-        sort_field = getattr(Project, sort_by, Project.created_at)
-        if sort_desc:
-            query = query.order_by(sort_field.desc())
-        else:
-            query = query.order_by(sort_field.asc())
+        total = await self._count_projects(user_id, search, query)
 
-        # Apply pagination
-        query = query.limit(limit).offset(offset)
+        # Apply sorting and pagination
+        if sort_by not in ("created_at", "updated_at", "name"):
+            sort_by = "created_at"
+        sort = f"-{sort_by}" if sort_desc else sort_by
+        position = decode_cursor(cursor, sort) if cursor else None
+        query = apply_keyset(
+            query, getattr(Project, sort_by), Project.id, sort_desc, position
+        ).limit(limit)
+        if position is None and offset:
+            query = query.offset(offset)
 
         # Execute query
         result = await self.db.execute(query)
@@ -151,6 +185,26 @@ class ProjectService:
 
         return projects, total
 
+    async def _count_projects(
+        self, user_id: UUID, search: Optional[str], query
+    ) -> int:
+        """Count the projects a list query matches, reusing a recent count."""
+        counts = _project_counts.get(user_id)
+        if counts is not None and search in counts:
+            return counts[search]
+
+        count_query = select(func.count()).select_from(
+            query.with_only_columns(Project.id).subquery()
+        )
+        total_result = await self.db.execute(count_query)
+        total = total_result.scalar_one()
+
+        if counts is None:
+            counts = {}
+            _project_counts[user_id] = counts
+        counts[search] = total
+        return total
+
     async def update_project(
         self,
         project_id: UUID,
@@ -173,12 +227,17 @@ class ProjectService:
         # Update fields that are provided
         update_dict = update_data.model_dump(exclude_unset=True)
 
+        tasks_changed = False
+        config_changed = False
+
         # Handle configuration partial updates
         if "configuration" in update_dict and update_dict["configuration"]:
             current_config = project.configuration or {}
             new_config = update_dict["configuration"]
             # Merge configurations (new values override old)
             merged_config = {**current_config, **new_config}
+            tasks_changed = merged_config.get("tasks") != current_config.get("tasks")
+            config_changed = merged_config != current_config
             project.configuration = merged_config
             del update_dict["configuration"]
 
@@ -189,6 +248,14 @@ class ProjectService:
 
         await self.db.commit()
         await self.db.refresh(project)
+        if "name" in update_dict or "description" in update_dict:
+            # Search totals may change
+            invalidate_project_counts(project.owner_id)
+
+        if config_changed:
+            await invalidate_project_analytics(project_id)
+        if tasks_changed:
+            await BaselineService().refresh_active_comparison(project_id, self.db)
 
         logger.info(
             "Project updated",
@@ -214,6 +281,7 @@ class ProjectService:
 
         await self.db.delete(project)
         await self.db.commit()
+        invalidate_project_counts(project.owner_id)
 
         logger.info(
             "Project deleted",
@@ -121,12 +121,14 @@ class QuotaService:
 
         return status
 
-    async def check_project_quota(self, user_id: UUID) -> None:
+    async def check_project_quota(self, user_id: UUID, new_projects: int = 1) -> None:
         """
-        Check if user can create a new project.
+        Check if user can create new projects.
 
         Args:
             user_id: User ID
+            new_projects: Number of projects about to be created (e.g. by a
+                          batch import, which must fit in the quota as a whole)
 
         Raises:
             HTTPException: 403 if quota exceeded
@@ -140,21 +142,27 @@ class QuotaService:
 
         count = await self.get_project_count(user_id)
 
-        if count >= limit:
+        if count + new_projects > limit:
             logger.warning(
                 "Project quota exceeded",
                 user_id=str(user_id),
                 tier=tier,
                 count=count,
+                requested=new_projects,
                 limit=limit
             )
 
+            message = f"Free tier allows {limit} active projects. You currently have {count} projects."
+            if new_projects > 1:
+                message += f" This request would add {new_projects} more."
+
             raise HTTPException(
                 status_code=403,
                 detail={
                     "error": "quota_exceeded",
-                    "message": f"Free tier allows {limit} active projects. You currently have {count} projects.",
+                    "message": message,
                     "current": count,
+                    "requested": new_projects,
                     "limit": limit,
                     "tier": tier,
                     "upgrade_url": "/pricing",
@@ -168,21 +176,22 @@ class QuotaService:
             tier=tier,
             count=count,
             limit=limit,
-            remaining=limit - count
+            remaining=limit - count - new_projects
         )
 
-    async def can_create_project(self, user_id: UUID) -> bool:
+    async def can_create_project(self, user_id: UUID, new_projects: int = 1) -> bool:
         """
-        Check if user can create a project without raising exception.
+        Check if user can create projects without raising exception.
 
         Args:
             user_id: User ID
+            new_projects: Number of projects about to be created
 
         Returns:
-            True if user can create project, False otherwise
+            True if user can create the projects, False otherwise
         """
         try:
-            await self.check_project_quota(user_id)
+            await self.check_project_quota(user_id, new_projects)
             return True
         except HTTPException:
             return False
@@ -12,7 +12,12 @@ from typing import Callable, Dict, List, Optional, Set
 import numpy as np
 from pydantic import BaseModel, Field
 
-from app.services.scheduler.scheduler_service import SchedulerService, TaskInput
+from app.services.scheduler.scheduler_service import (
+    SchedulerError,
+    SchedulerService,
+    TaskInput,
+)
+from app.services.scheduler.task_graph import TaskGraph
 
 
 class MonteCarloResult(BaseModel):
@@ -117,6 +122,7 @@ class MonteCarloEngine:
         holidays: Optional[List[date]] = None,
         workdays: Optional[Set[int]] = None,
         percentiles: Optional[List[int]] = None,
+        graph: Optional[TaskGraph] = None,
     ) -> MonteCarloResult:
         """
         Run Monte Carlo simulation for project scheduling.
@@ -130,6 +136,10 @@ class MonteCarloEngine:
             workdays: Optional set of working weekday numbers
             percentiles: List of percentile values to calculate
                 (default: [10, 50, 90, 95, 99])
+            graph: Optional prebuilt dependency graph for the tasks. Built
+                once up front when omitted, since only durations change
+                between iterations. Either way the graph is checked against
+                the tasks once, not per iteration.
 
         Returns:
             MonteCarloResult with statistical analysis
@@ -148,6 +158,20 @@ class MonteCarloEngine:
             if not 0 <= p <= 100:
                 raise ValueError(f"Percentile must be between 0 and 100, got {p}")
 
+        # Dependencies are identical across iterations - build (or check)
+        # the graph once instead of on every calculate_schedule call
+        graph_tasks = [
+            TaskInput(task_id=task.task_id, duration=1.0, dependencies=task.dependencies)
+            for task in tasks
+        ]
+        try:
+            if graph is None:
+                graph = self.scheduler.build_task_graph(graph_tasks)
+            else:
+                self.scheduler.check_task_graph(graph_tasks, graph)
+        except SchedulerError as e:
+            raise ValueError(f"Simulation failed: {e}") from e
+
         # Storage for results
         durations: List[float] = []
 
@@ -181,6 +205,8 @@ class MonteCarloEngine:
                     project_start=project_start,
                     holidays=holidays,
                     workdays=workdays,
+                    graph=graph,
+                    validated=True,
                 )
 
                 # Step 3: Collect project duration
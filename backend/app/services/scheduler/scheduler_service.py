@@ -62,12 +62,105 @@ class SchedulerService:
         )
     """
 
+    def build_task_graph(self, tasks: List[TaskInput]) -> TaskGraph:
+        """
+        Parse dependencies and build the validated TaskGraph for tasks.
+
+        The graph only depends on task IDs and dependencies, so callers that
+        schedule the same tasks repeatedly (e.g. Monte Carlo iterations) can
+        build it once and pass it to calculate_schedule.
+
+        Args:
+            tasks: Tasks to include in the graph
+
+        Returns:
+            TaskGraph with one node per task and one edge per dependency
+
+        Raises:
+            SchedulerError: If IDs are duplicated or dependencies are invalid
+        """
+        # Step 1: Validate unique task IDs
+        task_ids: Set[str] = set()
+        duplicates: Set[str] = set()
+        for task in tasks:
+            if task.task_id in task_ids:
+                duplicates.add(task.task_id)
+            task_ids.add(task.task_id)
+        if duplicates:
+            raise SchedulerError(
+                f"Duplicate task ID found: {', '.join(sorted(duplicates))}"
+            )
+
+        # Step 2: Parse dependencies and validate references
+        task_dependencies: Dict[str, List[str]] = {}
+        for task in tasks:
+            try:
+                deps = parse_dependencies(task.dependencies)
+                task_dependencies[task.task_id] = deps
+
+                # Validate that all dependencies exist
+                for dep in deps:
+                    if dep not in task_ids:
+                        raise SchedulerError(
+                            f"Unknown dependency '{dep}' referenced by task '{task.task_id}'"
+                        )
+            except DependencyParseError as e:
+                raise SchedulerError(f"Invalid dependency format for task '{task.task_id}': {e}")
+
+        # Step 3: Build TaskGraph
+        graph = TaskGraph()
+
+        # First, add all nodes
+        for task in tasks:
+            graph.add_node(task.task_id, duration=task.duration)
+
+        # Then, add all edges (now all nodes exist)
+        for task in tasks:
+            for dep in task_dependencies[task.task_id]:
+                graph.add_edge(dep, task.task_id)
+
+        return graph
+
+    def check_task_graph(self, tasks: List[TaskInput], graph: TaskGraph) -> None:
+        """
+        Verify that a prebuilt graph matches the tasks' IDs and dependencies.
+
+        Node IDs must match the task IDs exactly and every task's
+        predecessors in the graph must equal its parsed dependency list.
+
+        Args:
+            tasks: Tasks the graph is supposed to describe
+            graph: Prebuilt dependency graph
+
+        Raises:
+            SchedulerError: If the graph differs from the task list
+        """
+        if len(graph.nodes) != len(tasks) or any(
+            task.task_id not in graph.nodes for task in tasks
+        ):
+            raise SchedulerError("Provided task graph does not match task list")
+
+        for task in tasks:
+            try:
+                deps = parse_dependencies(task.dependencies)
+            except DependencyParseError as e:
+                raise SchedulerError(
+                    f"Invalid dependency format for task '{task.task_id}': {e}"
+                )
+            if set(deps) != set(graph.get_dependencies(task.task_id)):
+                raise SchedulerError(
+                    "Provided task graph does not match dependencies "
+                    f"of task '{task.task_id}'"
+                )
+
     def calculate_schedule(
         self,
         tasks: List[TaskInput],
         project_start: date,
         holidays: Optional[List[date]] = None,
         workdays: Optional[Set[int]] = None,
+        graph: Optional[TaskGraph] = None,
+        validated: bool = False,
     ) -> ScheduleResult:
         """
         Calculate complete project schedule with CPM and calendar dates.
@@ -78,6 +171,13 @@ class SchedulerService:
             holidays: Optional list of holiday dates (non-working days)
             workdays: Optional set of working weekday numbers (0=Mon, 6=Sun)
                      Default is {0,1,2,3,4} for Monday-Friday
+            graph: Optional prebuilt dependency graph for these tasks (from
+                   build_task_graph or the Excel parser). Skips graph
+                   construction when provided; its nodes and edges are
+                   checked against the tasks unless ``validated`` is set.
+            validated: Trust ``graph`` without checking it against the
+                       tasks. For callers that reuse one graph across many
+                       calls and have run check_task_graph once themselves.
 
         Returns:
             ScheduleResult with CPM analysis and calendar dates
@@ -95,43 +195,13 @@ class SchedulerService:
             )
 
         try:
-            # Step 1: Validate unique task IDs
-            task_ids = [task.task_id for task in tasks]
-            if len(task_ids) != len(set(task_ids)):
-                duplicates = [tid for tid in task_ids if task_ids.count(tid) > 1]
-                raise SchedulerError(
-                    f"Duplicate task ID found: {', '.join(set(duplicates))}"
-                )
+            # Steps 1-3: Validate tasks and build (or reuse) the TaskGraph
+            if graph is None:
+                graph = self.build_task_graph(tasks)
+            elif not validated:
+                self.check_task_graph(tasks, graph)
 
-            # Step 2: Parse dependencies and validate references
-            task_dependencies: Dict[str, List[str]] = {}
-            for task in tasks:
-                try:
-                    deps = parse_dependencies(task.dependencies)
-                    task_dependencies[task.task_id] = deps
-
-                    # Validate that all dependencies exist
-                    for dep in deps:
-                        if dep not in task_ids:
-                            raise SchedulerError(
-                                f"Unknown dependency '{dep}' referenced by task '{task.task_id}'"
-                            )
-                except DependencyParseError as e:
-                    raise SchedulerError(f"Invalid dependency format for task '{task.task_id}': {e}")
-
-            # Step 3: Build TaskGraph
-            graph = TaskGraph()
-            durations: Dict[str, float] = {}
-
-            # First, add all nodes
-            for task in tasks:
-                graph.add_node(task.task_id, duration=task.duration)
-                durations[task.task_id] = task.duration
-
-            # Then, add all edges (now all nodes exist)
-            for task in tasks:
-                for dep in task_dependencies[task.task_id]:
-                    graph.add_edge(dep, task.task_id)
+            durations: Dict[str, float] = {task.task_id: task.duration for task in tasks}
 
             # Step 4: Calculate CPM (this validates no cycles)
             try:
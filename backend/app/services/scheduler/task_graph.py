@@ -185,6 +185,83 @@ class TaskGraph:
 
         return result
 
+    def strongly_connected_components(self) -> List[List[str]]:
+        """
+        Find strongly connected components using iterative Tarjan's algorithm.
+
+        Runs in O(V + E) with an explicit stack, so long dependency chains
+        cannot hit Python's recursion limit.
+
+        Returns:
+            List of components, each a list of task IDs. Components are
+            emitted in reverse topological order.
+        """
+        index_of: Dict[str, int] = {}
+        lowlink: Dict[str, int] = {}
+        on_stack: Set[str] = set()
+        stack: List[str] = []
+        components: List[List[str]] = []
+        next_index = 0
+
+        for root in self.nodes:
+            if root in index_of:
+                continue
+
+            # Each work item is (node, iterator position over successors)
+            work = [(root, 0)]
+            index_of[root] = lowlink[root] = next_index
+            next_index += 1
+            stack.append(root)
+            on_stack.add(root)
+
+            while work:
+                node, pos = work[-1]
+                successors = self._edges.get(node, [])
+
+                if pos < len(successors):
+                    work[-1] = (node, pos + 1)
+                    successor = successors[pos]
+                    if successor not in index_of:
+                        index_of[successor] = lowlink[successor] = next_index
+                        next_index += 1
+                        stack.append(successor)
+                        on_stack.add(successor)
+                        work.append((successor, 0))
+                    elif successor in on_stack:
+                        lowlink[node] = min(lowlink[node], index_of[successor])
+                    continue
+
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+
+                if lowlink[node] == index_of[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+
+        return components
+
+    def find_cycles(self) -> List[List[str]]:
+        """
+        Find every group of tasks that depend on each other circularly.
+
+        Returns:
+            List of cycles, each a sorted list of the task IDs involved.
+            Empty if the graph is acyclic.
+        """
+        return [
+            sorted(component)
+            for component in self.strongly_connected_components()
+            if len(component) > 1
+        ]
+
     def __repr__(self) -> str:
         """String representation of graph."""
         return f"TaskGraph(nodes={len(self.nodes)}, edges={sum(len(v) for v in self._edges.values())})"
@@ -0,0 +1,163 @@
+"""
+Write-behind access counting for share links.
+
+Public share views are counted in an in-process buffer instead of
+updating the share link row on every request. A background task flushes
+the buffer every ``SHARE_ACCESS_FLUSH_INTERVAL`` seconds, or sooner once
+``MAX_PENDING_LINKS`` links are pending, with one batched UPDATE that
+adds each link's hits to ``access_count``. Flushes add increments rather
+than overwrite totals, so every worker process can flush its own buffer
+safely. Hits that fail to flush are kept for the next attempt; hits still
+buffered when a process dies are lost, so counts are a lower bound.
+"""
+
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Optional
+from uuid import UUID
+
+import structlog
+from sqlalchemy import bindparam, update
+
+from app.database.connection import get_session_factory
+from app.models.share_link import ShareLink
+
+logger = structlog.get_logger(__name__)
+
+# Seconds between flushes of buffered share link hits
+SHARE_ACCESS_FLUSH_INTERVAL = 10.0
+
+# Flush early once this many distinct links have pending hits
+MAX_PENDING_LINKS = 10_000
+
+_share_links = ShareLink.__table__
+
+# Core executemany, one parameter set per link
+_FLUSH_STATEMENT = (
+    update(_share_links)
+    .where(_share_links.c.id == bindparam("link_id"))
+    .values(
+        access_count=_share_links.c.access_count + bindparam("hits"),
+        last_accessed_at=bindparam("accessed_at"),
+    )
+)
+
+
+@dataclass
+class _Pending:
+    hits: int
+    last_accessed_at: datetime
+
+
+class ShareAccessTracker:
+    """Buffers share link hits and flushes them to the database in batches."""
+
+    def __init__(
+        self,
+        flush_interval: float = SHARE_ACCESS_FLUSH_INTERVAL,
+        max_pending_links: int = MAX_PENDING_LINKS,
+    ):
+        """
+        Initialize the tracker.
+
+        Args:
+            flush_interval: Seconds between background flushes
+            max_pending_links: Pending links that trigger an early flush
+        """
+        self.flush_interval = flush_interval
+        self.max_pending_links = max_pending_links
+        self._pending: Dict[UUID, _Pending] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup = asyncio.Event()
+
+    def record(self, share_link_id: UUID, accessed_at: Optional[datetime] = None) -> None:
+        """
+        Count one access to a share link.
+
+        Args:
+            share_link_id: Share link UUID
+            accessed_at: Access time (defaults to now, naive UTC like the model)
+        """
+        accessed_at = accessed_at or datetime.utcnow()
+        pending = self._pending.get(share_link_id)
+        if pending is None:
+            self._pending[share_link_id] = _Pending(1, accessed_at)
+            if len(self._pending) >= self.max_pending_links:
+                self._wakeup.set()
+        else:
+            pending.hits += 1
+            pending.last_accessed_at = max(pending.last_accessed_at, accessed_at)
+
+    def pending_hits(self, share_link_id: UUID) -> int:
+        """Return hits of a link that were counted here but not yet flushed."""
+        pending = self._pending.get(share_link_id)
+        return pending.hits if pending else 0
+
+    async def flush(self) -> int:
+        """
+        Write buffered hits to the database.
+
+        Returns:
+            Number of share links updated
+        """
+        if not self._pending:
+            return 0
+
+        batch, self._pending = self._pending, {}
+        params = [
+            {"link_id": link_id, "hits": p.hits, "accessed_at": p.last_accessed_at}
+            for link_id, p in batch.items()
+        ]
+        try:
+            async with get_session_factory()() as session:
+                await session.execute(_FLUSH_STATEMENT, params)
+                await session.commit()
+        except Exception as e:
+            logger.error(
+                "Share access flush failed", links=len(batch), error=str(e)
+            )
+            # Keep the hits for the next flush
+            for link_id, p in batch.items():
+                merged = self._pending.get(link_id)
+                if merged is None:
+                    self._pending[link_id] = p
+                else:
+                    merged.hits += p.hits
+                    merged.last_accessed_at = max(
+                        merged.last_accessed_at, p.last_accessed_at
+                    )
+            return 0
+
+        logger.debug("Share access flushed", links=len(batch))
+        return len(batch)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+    def start(self) -> None:
+        """Start the background flush loop on the running event loop."""
+        if self._task is None or self._task.done():
+            # The event must belong to the loop the task runs on
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background flush loop and flush what is left."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+
+share_access_tracker = ShareAccessTracker()
@@ -1,6 +1,10 @@
 """Share link service for public project sharing."""
 
+import asyncio
+import hashlib
+import hmac
 import secrets
+import time
 from datetime import datetime, timedelta
 from typing import Optional, List
 from uuid import UUID
@@ -12,13 +16,19 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 import structlog
 
+from app.core.config import settings
 from app.models.share_link import ShareLink
 from app.models.project import Project
 from app.schemas.sharing import ShareLinkCreate, ShareLinkUpdate
+from app.services.share_access_tracker import share_access_tracker
 
 logger = structlog.get_logger(__name__)
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# Cookie holding a signed grant that lets repeat views skip the password
+SHARE_ACCESS_COOKIE = "share_access"
+SHARE_ACCESS_TTL = 3600  # seconds
+
 
 class ShareService:
     """Service for managing share links."""
@@ -60,6 +70,46 @@ class ShareService:
         """
         return pwd_context.verify(plain_password, hashed_password)
 
+    @staticmethod
+    def _grant_signature(share_link: ShareLink, expires: int) -> str:
+        # Signing the password hash voids grants when the password changes
+        message = f"{share_link.id}|{expires}|{share_link.password_hash}".encode()
+        return hmac.new(settings.secret_key.encode(), message, hashlib.sha256).hexdigest()
+
+    @classmethod
+    def issue_access_grant(cls, share_link: ShareLink, ttl: int = SHARE_ACCESS_TTL) -> str:
+        """Sign a grant to view a password-protected link without the password.
+
+        Args:
+            share_link: Share link whose password was just verified
+            ttl: Seconds the grant is valid
+
+        Returns:
+            Grant string for the share access cookie
+        """
+        expires = int(time.time()) + ttl
+        return f"{expires}.{cls._grant_signature(share_link, expires)}"
+
+    @classmethod
+    def check_access_grant(cls, share_link: ShareLink, grant: Optional[str]) -> bool:
+        """Check a grant from issue_access_grant.
+
+        Args:
+            share_link: Share link being accessed
+            grant: Grant from the share access cookie
+
+        Returns:
+            True if the grant is for this link and password and has not expired
+        """
+        if not grant:
+            return False
+        expires, _, signature = grant.partition(".")
+        if not expires.isdigit() or int(expires) < time.time():
+            return False
+        return hmac.compare_digest(
+            signature, cls._grant_signature(share_link, int(expires))
+        )
+
     async def create_share_link(
         self,
         project_id: UUID,
@@ -104,7 +154,7 @@ class ShareService:
         # Hash password if provided
         password_hash = None
         if share_data.password:
-            password_hash = self.hash_password(share_data.password)
+            password_hash = await asyncio.to_thread(self.hash_password, share_data.password)
 
         # Create share link
         share_link = ShareLink(
@@ -150,13 +200,19 @@ class ShareService:
     async def verify_share_access(
         self,
         token: str,
-        password: Optional[str] = None
+        password: Optional[str] = None,
+        access_grant: Optional[str] = None,
     ) -> tuple[ShareLink, Project]:
         """Verify access to a shared project.
 
+        A valid access grant stands in for the password. Bcrypt runs in a
+        worker thread, and the access is counted by share_access_tracker
+        rather than written here.
+
         Args:
             token: Share link token
             password: Optional password for protected links
+            access_grant: Optional grant from the share access cookie
 
         Returns:
             Tuple of (ShareLink, Project)
@@ -185,13 +241,17 @@ class ShareService:
             )
 
         # Check password
-        if share_link.is_password_protected():
+        if share_link.is_password_protected() and not self.check_access_grant(
+            share_link, access_grant
+        ):
             if not password:
                 raise HTTPException(
                     status_code=status.HTTP_401_UNAUTHORIZED,
                     detail="Password required for this share link"
                 )
-            if not self.verify_password(password, share_link.password_hash):
+            if not await asyncio.to_thread(
+                self.verify_password, password, share_link.password_hash
+            ):
                 logger.warning(
                     "Incorrect password for share link",
                     share_link_id=str(share_link.id)
@@ -201,16 +261,13 @@ class ShareService:
                     detail="Incorrect password"
                 )
 
-        # Update access tracking
-        share_link.access_count += 1
-        share_link.last_accessed_at = datetime.utcnow()
-        await self.db.commit()
+        # Count the access; flushed to the database in batches
+        share_access_tracker.record(share_link.id)
 
-        logger.info(
+        logger.debug(
             "Share link accessed",
             share_link_id=str(share_link.id),
             project_id=str(share_link.project_id),
-            access_count=share_link.access_count
         )
 
         return share_link, share_link.project
@@ -272,7 +329,9 @@ class ShareService:
                 share_link.password_hash = None
             else:
                 # Update password
-                share_link.password_hash = self.hash_password(update_data.password)
+                share_link.password_hash = await asyncio.to_thread(
+                    self.hash_password, update_data.password
+                )
 
         await self.db.commit()
         await self.db.refresh(share_link)
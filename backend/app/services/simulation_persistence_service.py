@@ -12,11 +12,16 @@ import structlog
 from sqlalchemy import desc, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.database.pagination import apply_keyset, decode_cursor
 from app.models.simulation_result import SimulationResult
+from app.services.analytics_service import invalidate_project_analytics
 from app.services.scheduler.monte_carlo import MonteCarloResult
 
 logger = structlog.get_logger(__name__)
 
+# Simulation history is always listed newest first
+SIMULATION_HISTORY_SORT = "-created_at"
+
 
 class SimulationPersistenceService:
     """
@@ -78,6 +83,9 @@ class SimulationPersistenceService:
         await db.commit()
         await db.refresh(db_simulation)
 
+        # Simulation summary, risk and health scores depend on the latest run
+        await invalidate_project_analytics(project_id)
+
         logger.info(
             "simulation_saved",
             simulation_id=db_simulation.id,
@@ -111,6 +119,7 @@ class SimulationPersistenceService:
         project_id: UUID,
         limit: int = 10,
         offset: int = 0,
+        cursor: Optional[str] = None,
     ) -> List[SimulationResult]:
         """
         Get simulation history for a project.
@@ -121,22 +130,31 @@ class SimulationPersistenceService:
             db: Database session
             project_id: Project UUID
             limit: Maximum number of results (default 10, max 100)
-            offset: Number of results to skip (default 0)
+            offset: Number of results to skip (default 0, ignored with a cursor)
+            cursor: Cursor of the previous page's last simulation
 
         Returns:
             List of SimulationResult ordered by created_at DESC
+
+        Raises:
+            InvalidCursorError: If the cursor is invalid
         """
         # Enforce limits
         limit = min(max(1, limit), 100)
         offset = max(0, offset)
 
-        result = await db.execute(
-            select(SimulationResult)
-            .where(SimulationResult.project_id == project_id)
-            .order_by(desc(SimulationResult.created_at))
-            .limit(limit)
-            .offset(offset)
-        )
+        position = decode_cursor(cursor, SIMULATION_HISTORY_SORT) if cursor else None
+        query = apply_keyset(
+            select(SimulationResult).where(SimulationResult.project_id == project_id),
+            SimulationResult.created_at,
+            SimulationResult.id,
+            True,
+            position,
+        ).limit(limit)
+        if position is None and offset:
+            query = query.offset(offset)
+
+        result = await db.execute(query)
         return list(result.scalars().all())
 
     async def get_user_simulation_history(
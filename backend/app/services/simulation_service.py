@@ -12,6 +12,7 @@ from pydantic import BaseModel, Field
 
 from app.services.scheduler.monte_carlo import MonteCarloEngine, TaskDistributionInput
 from app.services.scheduler.scheduler_service import SchedulerError
+from app.services.scheduler.task_graph import TaskGraph
 
 
 class SimulationError(Exception):
@@ -106,6 +107,7 @@ class SimulationService:
         holidays: Optional[List[date]] = None,
         workdays: Optional[Set[int]] = None,
         percentiles: Optional[List[int]] = None,
+        graph: Optional[TaskGraph] = None,
     ) -> SimulationResult:
         """
         Run Monte Carlo simulation and return formatted results.
@@ -119,6 +121,8 @@ class SimulationService:
             workdays: Optional set of working weekday numbers (0=Mon, 6=Sun)
             percentiles: List of percentile values to calculate
                 (default: [10, 50, 90, 95, 99])
+            graph: Optional dependency graph already built during validation
+                (e.g. ExcelParserService.build_dependency_graph)
 
         Returns:
             SimulationResult with formatted statistics and metadata
@@ -149,6 +153,7 @@ class SimulationService:
                 holidays=holidays,
                 workdays=workdays,
                 percentiles=percentiles,
+                graph=graph,
             )
         except SchedulerError as e:
             # Wrap scheduler errors as simulation errors
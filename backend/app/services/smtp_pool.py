@@ -0,0 +1,330 @@
+"""
+Persistent SMTP connection pool for email delivery.
+
+Opening an SMTP session costs a TCP handshake, TLS negotiation and an
+AUTH exchange. The pool keeps authenticated sessions open between sends,
+probes sessions that sat idle with NOOP, reconnects once when the server
+has dropped a session, and retires a session after a fixed number of
+messages so a long-running worker never outstays server limits.
+
+Sessions are bound to the event loop that opened them, so pools are kept
+per (event loop, SMTP configuration) via :func:`get_smtp_pool`.
+"""
+
+import asyncio
+import time
+import weakref
+from contextlib import asynccontextmanager
+from dataclasses import astuple, dataclass, field
+from typing import (
+    TYPE_CHECKING,
+    AsyncIterator,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+import aiosmtplib
+import structlog
+
+if TYPE_CHECKING:
+    from app.services.email_service import EmailConfig
+
+logger = structlog.get_logger(__name__)
+
+# (sender, recipients, message) as passed to SMTP.sendmail
+Envelope = Tuple[str, List[str], str]
+
+# Errors after which a session is gone and a fresh one may succeed
+RECONNECT_ERRORS = (aiosmtplib.SMTPServerDisconnected, ConnectionError)
+
+
+@dataclass
+class PooledConnection:
+    """An open SMTP session and its usage counters."""
+
+    smtp: aiosmtplib.SMTP
+    created_at: float = field(default_factory=time.monotonic)
+    last_used: float = field(default_factory=time.monotonic)
+    messages_sent: int = 0
+
+
+class SMTPConnectionPool:
+    """Bounded pool of authenticated SMTP sessions for one configuration."""
+
+    def __init__(
+        self,
+        config: "EmailConfig",
+        max_size: Optional[int] = None,
+        max_messages_per_connection: Optional[int] = None,
+        keepalive_interval: Optional[float] = None,
+        max_idle: Optional[float] = None,
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            config: SMTP settings used to open sessions
+            max_size: Maximum number of concurrently open sessions
+            max_messages_per_connection: Messages sent before a session is retired
+            keepalive_interval: Idle seconds after which a session is probed with NOOP
+            max_idle: Idle seconds after which a session is closed instead of reused
+        """
+        self.config = config
+        self.max_size = max_size or config.pool_size
+        self.max_messages_per_connection = (
+            max_messages_per_connection or config.max_messages_per_connection
+        )
+        self.keepalive_interval = (
+            keepalive_interval
+            if keepalive_interval is not None
+            else config.keepalive_interval
+        )
+        self.max_idle = max_idle if max_idle is not None else config.max_idle
+        self._idle: List[PooledConnection] = []
+        self._slots = asyncio.Semaphore(self.max_size)
+        self.connections_opened = 0
+
+    @asynccontextmanager
+    async def connection(self) -> AsyncIterator[PooledConnection]:
+        """
+        Check out a session for the duration of the block.
+
+        A session that raised inside the block is closed rather than
+        returned, since its protocol state is unknown.
+
+        Yields:
+            PooledConnection ready for sendmail
+        """
+        async with self._slots:
+            conn = await self._checkout()
+            try:
+                yield conn
+            except BaseException:
+                await self._discard(conn)
+                raise
+            await self._checkin(conn)
+
+    async def send(self, sender: str, recipients: List[str], message: str) -> None:
+        """
+        Send one message, reconnecting once if the session was dropped.
+
+        Args:
+            sender: Envelope sender
+            recipients: Envelope recipients
+            message: Serialized message
+
+        Raises:
+            aiosmtplib.SMTPException: If the server rejects the message
+            ConnectionError: If no session can be established
+        """
+        for attempt in range(2):
+            try:
+                async with self.connection() as conn:
+                    await conn.smtp.sendmail(sender, recipients, message)
+                    conn.messages_sent += 1
+                return
+            except RECONNECT_ERRORS as e:
+                if attempt:
+                    raise
+                logger.info("smtp_reconnecting", error=str(e))
+
+    async def send_many(
+        self, envelopes: Sequence[Envelope]
+    ) -> List[Optional[Exception]]:
+        """
+        Send many messages over as few sessions as possible.
+
+        Messages are pipelined over one session, which is replaced when it
+        reaches ``max_messages_per_connection`` or is dropped by the server
+        (the interrupted message is retried once on the new session). A
+        message the server rejects does not abort the rest of the batch,
+        but if a session cannot be opened in two attempts the server is
+        taken to be unreachable: that message and all remaining ones fail
+        with the connection error without further attempts.
+
+        Args:
+            envelopes: (sender, recipients, message) tuples
+
+        Returns:
+            One entry per envelope: None if sent, otherwise the exception
+        """
+        results: List[Optional[Exception]] = []
+        if not envelopes:
+            return results
+
+        async with self._slots:
+            conn: Optional[PooledConnection] = None
+            unreachable: Optional[Exception] = None
+            try:
+                for sender, recipients, message in envelopes:
+                    for attempt in range(2):
+                        if conn is None:
+                            try:
+                                conn = await self._checkout_retrying()
+                            except (aiosmtplib.SMTPException, OSError) as e:
+                                unreachable = e
+                                break
+                        try:
+                            await conn.smtp.sendmail(sender, recipients, message)
+                            conn.messages_sent += 1
+                            results.append(None)
+                        except RECONNECT_ERRORS as e:
+                            await self._discard(conn)
+                            conn = None
+                            if attempt:
+                                results.append(e)
+                            else:
+                                logger.info("smtp_reconnecting", error=str(e))
+                                continue
+                        except aiosmtplib.SMTPException as e:
+                            # Rejected message; the session itself is still usable
+                            results.append(e)
+                            await self._reset(conn)
+                        break
+
+                    if unreachable is not None:
+                        logger.warning(
+                            "smtp_batch_aborted",
+                            error=str(unreachable),
+                            failed=len(envelopes) - len(results),
+                        )
+                        results.extend([unreachable] * (len(envelopes) - len(results)))
+                        break
+
+                    if (
+                        conn is not None
+                        and conn.messages_sent >= self.max_messages_per_connection
+                    ):
+                        await self._discard(conn)
+                        conn = None
+            except BaseException:
+                if conn is not None:
+                    await self._discard(conn)
+                raise
+            if conn is not None:
+                await self._checkin(conn)
+
+        return results
+
+    async def close(self) -> None:
+        """Close all idle sessions."""
+        idle, self._idle = self._idle, []
+        for conn in idle:
+            await self._discard(conn)
+
+    async def _checkout(self) -> PooledConnection:
+        """Return a live idle session, or open a new one."""
+        while self._idle:
+            conn = self._idle.pop()
+            if await self._is_usable(conn):
+                return conn
+            await self._discard(conn)
+        return await self._open()
+
+    async def _checkout_retrying(self) -> PooledConnection:
+        """Check out a session, trying once more if opening one fails."""
+        try:
+            return await self._checkout()
+        except (aiosmtplib.SMTPException, OSError) as e:
+            logger.info("smtp_connect_retrying", error=str(e))
+        return await self._checkout()
+
+    async def _checkin(self, conn: PooledConnection) -> None:
+        """Return a session to the pool, retiring it if it is used up."""
+        conn.last_used = time.monotonic()
+        if (
+            conn.messages_sent >= self.max_messages_per_connection
+            or not conn.smtp.is_connected
+        ):
+            await self._discard(conn)
+        else:
+            self._idle.append(conn)
+
+    async def _is_usable(self, conn: PooledConnection) -> bool:
+        """Check that an idle session can still carry a message."""
+        if not conn.smtp.is_connected:
+            return False
+
+        idle_for = time.monotonic() - conn.last_used
+        if idle_for > self.max_idle:
+            return False
+        if idle_for > self.keepalive_interval:
+            try:
+                await conn.smtp.noop()
+            except (aiosmtplib.SMTPException, OSError):
+                return False
+        return True
+
+    async def _open(self) -> PooledConnection:
+        """Connect and authenticate a new session."""
+        smtp = aiosmtplib.SMTP(
+            hostname=self.config.smtp_host,
+            port=self.config.smtp_port,
+            use_tls=self.config.use_tls,
+        )
+        await smtp.connect()
+        try:
+            if self.config.smtp_user and self.config.smtp_password:
+                await smtp.login(self.config.smtp_user, self.config.smtp_password)
+        except BaseException:
+            smtp.close()
+            raise
+
+        self.connections_opened += 1
+        logger.debug(
+            "smtp_connection_opened",
+            host=self.config.smtp_host,
+            opened=self.connections_opened,
+        )
+        return PooledConnection(smtp=smtp)
+
+    async def _reset(self, conn: PooledConnection) -> None:
+        """Clear a failed transaction so the session can be reused."""
+        try:
+            await conn.smtp.rset()
+        except Exception:
+            conn.smtp.close()
+
+    async def _discard(self, conn: PooledConnection) -> None:
+        """Close a session, politely if it is still connected."""
+        try:
+            if conn.smtp.is_connected:
+                await conn.smtp.quit()
+        except Exception:
+            conn.smtp.close()
+
+
+_pools: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[tuple, SMTPConnectionPool]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_smtp_pool(config: "EmailConfig") -> SMTPConnectionPool:
+    """
+    Return the process-wide pool for ``config`` on the running event loop.
+
+    Must be called from a coroutine.
+
+    Args:
+        config: SMTP settings
+
+    Returns:
+        Shared SMTPConnectionPool
+    """
+    loop = asyncio.get_running_loop()
+    loop_pools = _pools.setdefault(loop, {})
+    key = astuple(config)
+    pool = loop_pools.get(key)
+    if pool is None:
+        pool = loop_pools[key] = SMTPConnectionPool(config)
+    return pool
+
+
+async def close_smtp_pools() -> None:
+    """Close the idle sessions of every pool on the running event loop."""
+    loop_pools = _pools.pop(asyncio.get_running_loop(), {})
+    for pool in loop_pools.values():
+        await pool.close()
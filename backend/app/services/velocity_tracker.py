@@ -5,18 +5,92 @@ This service calculates and tracks sprint velocity metrics following TDD.
 Implemented in GREEN phase to pass tests.
 """
 
-from typing import List, Dict, Any
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import List, Dict, Any, Optional, Tuple
 from uuid import UUID
-import statistics
 
-from sqlalchemy import select, desc
+import numpy as np
+from sqlalchemy import case, func, select, desc
 from sqlalchemy.ext.asyncio import AsyncSession
 import structlog
 
 from app.models.historical_metrics import SprintVelocity
+from app.services.forecast_engine import ForecastEngine
 
 logger = structlog.get_logger(__name__)
 
+# Sprints considered for anomaly detection
+ANOMALY_HISTORY = 100
+
+# Z-score thresholds (more sensitive for short histories)
+ANOMALY_THRESHOLD = 2.0
+SMALL_SAMPLE_ANOMALY_THRESHOLD = 1.5
+SMALL_SAMPLE_SIZE = 10
+
+# Minimum sprints for anomaly detection
+MIN_ANOMALY_SAMPLE = 3
+
+# Relative change between halves of the history that counts as a trend
+TREND_CHANGE = 0.1
+
+
+@dataclass
+class VelocityAnalytics:
+    """Moving averages, z-scores and anomalies for recent sprints."""
+
+    points: List[Dict[str, Any]] = field(default_factory=list)
+    mean: float = 0.0
+    stdev: Optional[float] = None
+    moving_average: float = 0.0
+    trend_direction: str = "stable"
+
+    @property
+    def anomalies(self) -> List[Dict[str, Any]]:
+        """Anomalous sprints, most recent first."""
+        return [
+            {
+                "sprint_id": p["sprint_id"],
+                "velocity_points": p["velocity_points"],
+                "deviation": abs(p["velocity_points"] - self.mean),
+                "num_std_deviations": abs(p["z_score"]),
+                "mean": self.mean,
+                "timestamp": p["timestamp"],
+                "type": "spike" if p["velocity_points"] > self.mean else "drop",
+            }
+            for p in reversed(self.points)
+            if p["is_anomaly"]
+        ]
+
+
+def _anomaly_threshold(sample_size: int) -> float:
+    """Z-score threshold for a history of ``sample_size`` sprints."""
+    if sample_size < SMALL_SAMPLE_SIZE:
+        return SMALL_SAMPLE_ANOMALY_THRESHOLD
+    return ANOMALY_THRESHOLD
+
+
+def _trend_direction(values: List[float]) -> str:
+    """
+    Compare the older and newer halves of a chronological series.
+
+    Args:
+        values: Velocities, oldest first
+
+    Returns:
+        "increasing", "decreasing" or "stable"
+    """
+    if len(values) < 2:
+        return "stable"
+    half = len(values) // 2
+    older = sum(values[:half]) / half
+    newer = sum(values[half:]) / (len(values) - half)
+    if newer > older * (1 + TREND_CHANGE):
+        return "increasing"
+    if newer < older * (1 - TREND_CHANGE):
+        return "decreasing"
+    return "stable"
+
 
 class VelocityTracker:
     """Service for tracking and analyzing sprint velocity."""
@@ -62,13 +136,20 @@ class VelocityTracker:
             velocity_value = 0.0
 
             # Save to database
+            recorded_at = datetime.now(timezone.utc)
             velocity = SprintVelocity(
                 project_id=project_id,
                 sprint_id=sprint_id,
                 velocity_points=velocity_value,
-                completed_tasks=0
+                completed_tasks=0,
+                timestamp=recorded_at,
             )
             self.db_session.add(velocity)
+
+            # Keep the project's forecast model current in the same transaction
+            await ForecastEngine(self.db_session).record_velocity(
+                project_id, velocity_value, recorded_at
+            )
             await self.db_session.commit()
 
             logger.info(
@@ -129,6 +210,170 @@ class VelocityTracker:
             )
             return []
 
+    async def get_velocity_analytics(
+        self,
+        project_id: UUID,
+        num_sprints: int = ANOMALY_HISTORY,
+        window: int = 3,
+    ) -> VelocityAnalytics:
+        """
+        Compute moving averages, z-scores and anomaly flags in one query.
+
+        On databases with ``STDDEV_SAMP`` (PostgreSQL) everything is computed
+        with window functions over the most recent sprints. SQLite lacks a
+        standard deviation aggregate, so there the rows are fetched once and
+        the same statistics are computed with NumPy.
+
+        Args:
+            project_id: Project UUID
+            num_sprints: Number of recent sprints to analyse
+            window: Trailing window size for moving averages
+
+        Returns:
+            VelocityAnalytics with per-sprint points in chronological order
+        """
+        window = max(1, window)
+        recent = (
+            select(
+                SprintVelocity.sprint_id,
+                SprintVelocity.velocity_points,
+                SprintVelocity.completed_tasks,
+                SprintVelocity.timestamp,
+            )
+            .where(SprintVelocity.project_id == project_id)
+            .order_by(desc(SprintVelocity.timestamp))
+            .limit(num_sprints)
+            .subquery()
+        )
+
+        if self._supports_window_stddev():
+            points, mean, stdev = await self._analytics_sql(recent, window)
+        else:
+            points, mean, stdev = await self._analytics_numpy(recent, window)
+
+        if not points:
+            return VelocityAnalytics()
+
+        analytics = VelocityAnalytics(
+            points=points,
+            mean=mean,
+            stdev=stdev,
+            moving_average=points[-1]["moving_average"],
+            trend_direction=_trend_direction([p["velocity_points"] for p in points]),
+        )
+
+        logger.info(
+            "Calculated velocity analytics",
+            project_id=str(project_id),
+            sprints=len(points),
+            mean=analytics.mean,
+            stdev=analytics.stdev,
+            anomalies=sum(1 for p in points if p["is_anomaly"]),
+        )
+        return analytics
+
+    def _supports_window_stddev(self) -> bool:
+        """Whether the database has STDDEV_SAMP as a window function."""
+        return self.db_session.bind.dialect.name == "postgresql"
+
+    async def _analytics_sql(
+        self, recent, window: int
+    ) -> Tuple[List[Dict[str, Any]], float, Optional[float]]:
+        """Analytics via AVG/STDDEV_SAMP OVER in a single statement."""
+        velocity = recent.c.velocity_points
+        mean = func.avg(velocity).over()
+        stdev = func.stddev_samp(velocity).over()
+        sample_size = func.count().over()
+        z_score = (velocity - mean) / func.nullif(stdev, 0)
+        threshold = case(
+            (sample_size < SMALL_SAMPLE_SIZE, SMALL_SAMPLE_ANOMALY_THRESHOLD),
+            else_=ANOMALY_THRESHOLD,
+        )
+
+        result = await self.db_session.execute(
+            select(
+                recent.c.sprint_id,
+                velocity,
+                recent.c.completed_tasks,
+                recent.c.timestamp,
+                func.avg(velocity)
+                .over(order_by=recent.c.timestamp, rows=(-(window - 1), 0))
+                .label("moving_average"),
+                z_score.label("z_score"),
+                case(
+                    (
+                        (sample_size >= MIN_ANOMALY_SAMPLE)
+                        & (func.abs(z_score) > threshold),
+                        True,
+                    ),
+                    else_=False,
+                ).label("is_anomaly"),
+                mean.label("mean"),
+                stdev.label("stdev"),
+            ).order_by(recent.c.timestamp)
+        )
+
+        rows = result.all()
+        if not rows:
+            return [], 0.0, None
+
+        points = [
+            {
+                "sprint_id": row.sprint_id,
+                "velocity_points": row.velocity_points,
+                "completed_tasks": row.completed_tasks,
+                "timestamp": row.timestamp,
+                "moving_average": float(row.moving_average),
+                "z_score": float(row.z_score) if row.z_score is not None else 0.0,
+                "is_anomaly": bool(row.is_anomaly),
+            }
+            for row in rows
+        ]
+        stdev = rows[0].stdev
+        return points, float(rows[0].mean), float(stdev) if stdev is not None else None
+
+    async def _analytics_numpy(
+        self, recent, window: int
+    ) -> Tuple[List[Dict[str, Any]], float, Optional[float]]:
+        """Analytics computed with NumPy over one fetch of the same rows."""
+        result = await self.db_session.execute(
+            select(recent).order_by(recent.c.timestamp)
+        )
+        rows = result.all()
+        if not rows:
+            return [], 0.0, None
+
+        values = np.fromiter((row.velocity_points for row in rows), dtype=float)
+        n = len(values)
+
+        # Trailing moving average: (cumsum[i] - cumsum[i - window]) / window size
+        cumsum = np.concatenate(([0.0], np.cumsum(values)))
+        ends = np.arange(1, n + 1)
+        starts = np.maximum(ends - window, 0)
+        moving = (cumsum[ends] - cumsum[starts]) / (ends - starts)
+
+        mean = float(values.mean())
+        stdev = float(values.std(ddof=1)) if n > 1 else None
+        if stdev:
+            z_scores = (values - mean) / stdev
+        else:
+            z_scores = np.zeros(n)
+        anomalies = (np.abs(z_scores) > _anomaly_threshold(n)) & (n >= MIN_ANOMALY_SAMPLE)
+
+        points = [
+            {
+                "sprint_id": row.sprint_id,
+                "velocity_points": row.velocity_points,
+                "completed_tasks": row.completed_tasks,
+                "timestamp": row.timestamp,
+                "moving_average": float(moving[i]),
+                "z_score": float(z_scores[i]),
+                "is_anomaly": bool(anomalies[i]),
+            }
+            for i, row in enumerate(rows)
+        ]
+        return points, mean, stdev
+
     async def calculate_moving_average(
         self, project_id: UUID, window: int = 3
     ) -> float:
@@ -143,28 +388,19 @@ class VelocityTracker:
             Moving average as float (0.0 if no data)
         """
         try:
-            # Get recent velocities up to window size
-            velocities = await self.get_velocity_trend(
-                project_id=project_id,
-                num_sprints=window
+            analytics = await self.get_velocity_analytics(
+                project_id=project_id, num_sprints=window, window=window
             )
 
-            if not velocities:
-                return 0.0
-
-            # Calculate average of velocity_points
-            velocity_values = [v.velocity_points for v in velocities]
-            moving_avg = statistics.mean(velocity_values)
-
             logger.info(
                 "Calculated moving average",
                 project_id=str(project_id),
                 window=window,
-                average=moving_avg,
-                data_points=len(velocity_values)
+                average=analytics.moving_average,
+                data_points=len(analytics.points)
             )
 
-            return moving_avg
+            return analytics.moving_average
 
         except Exception as e:
             logger.error(
@@ -181,7 +417,7 @@ class VelocityTracker:
         Detect anomalies in velocity (spikes, drops).
 
         Uses statistical method: anomalies are velocities more than 2 standard
-        deviations from the mean.
+        deviations from the mean (1.5 for fewer than 10 sprints).
 
         Args:
             project_id: Project UUID
@@ -190,61 +426,18 @@ class VelocityTracker:
             List of anomaly dictionaries with sprint info
         """
         try:
-            # Get all velocities for the project
-            velocities = await self.get_velocity_trend(
-                project_id=project_id,
-                num_sprints=100  # Get more data for better anomaly detection
+            analytics = await self.get_velocity_analytics(
+                project_id=project_id, num_sprints=ANOMALY_HISTORY
             )
-
-            if len(velocities) < 3:
-                # Not enough data for statistical analysis
-                return []
-
-            # Extract velocity values
-            velocity_values = [v.velocity_points for v in velocities]
-
-            # Calculate mean and standard deviation
-            mean_velocity = statistics.mean(velocity_values)
-
-            # Need at least 2 values for stdev
-            if len(velocity_values) < 2:
-                return []
-
-            stdev_velocity = statistics.stdev(velocity_values)
-
-            # If stdev is 0 (all values identical), no anomalies
-            if stdev_velocity == 0:
-                return []
-
-            # Detect anomalies (> 2 standard deviations from mean for large datasets,
-            # lower threshold for small datasets)
-            anomalies = []
-            # Use lower threshold for small datasets to be more sensitive
-            threshold = 1.5 if len(velocities) < 10 else 2.0
-
-            for velocity in velocities:
-                deviation = abs(velocity.velocity_points - mean_velocity)
-                num_stdevs = deviation / stdev_velocity
-
-                if num_stdevs > threshold:
-                    anomaly = {
-                        "sprint_id": velocity.sprint_id,
-                        "velocity_points": velocity.velocity_points,
-                        "deviation": deviation,
-                        "num_std_deviations": num_stdevs,
-                        "mean": mean_velocity,
-                        "timestamp": velocity.timestamp,
-                        "type": "spike" if velocity.velocity_points > mean_velocity else "drop"
-                    }
-                    anomalies.append(anomaly)
+            anomalies = analytics.anomalies
 
             logger.info(
                 "Detected velocity anomalies",
                 project_id=str(project_id),
-                total_sprints=len(velocities),
+                total_sprints=len(analytics.points),
                 anomalies_found=len(anomalies),
-                mean=mean_velocity,
-                stdev=stdev_velocity
+                mean=analytics.mean,
+                stdev=analytics.stdev
             )
 
             return anomalies
@@ -1,13 +1,12 @@
 """Celery tasks for notification processing and delivery."""
 
-import asyncio
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
-from typing import Any, AsyncGenerator, Dict, List
+from typing import Any, AsyncGenerator, Dict, List, Optional
 from uuid import UUID
 
 import structlog
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import get_settings
@@ -16,15 +15,22 @@ from app.models.notification import (
     Notification,
     NotificationChannel,
     NotificationLog,
-    NotificationRule,
-    NotificationTemplate,
 )
 from app.models.user import User
-from app.services.celery_app import celery_app
-from app.services.email_service import EmailConfig, EmailService
+from app.services.celery_app import celery_app, run_async
+from app.services.email_service import EmailConfig, EmailService, OutgoingEmail
+from app.services.notification_rule_index import match_rules
+from app.services.notification_template_cache import (
+    CompiledTemplate,
+    RenderedEmail,
+    template_cache,
+)
 
 logger = structlog.get_logger(__name__)
 
+# Notification IDs handed to each batch_send_notifications task
+EMAIL_BATCH_SIZE = 500
+
 
 @asynccontextmanager
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
@@ -45,6 +51,37 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+def _email_config() -> EmailConfig:
+    """Build the SMTP configuration from application settings."""
+    settings = get_settings()
+    return EmailConfig(
+        smtp_host=settings.smtp_host,
+        smtp_port=settings.smtp_port,
+        smtp_user=settings.smtp_user or "",
+        smtp_password=settings.smtp_password or "",
+        smtp_from_email=settings.smtp_from_email,
+        smtp_from_name=settings.smtp_from_name,
+        use_tls=settings.smtp_use_tls,
+        pool_size=settings.smtp_pool_size,
+        max_messages_per_connection=settings.smtp_max_messages_per_connection,
+        keepalive_interval=settings.smtp_keepalive_interval,
+    )
+
+
+def _default_email(notification: Notification) -> RenderedEmail:
+    """
+    Prepare email content for a notification without a template.
+
+    Returns:
+        Tuple of (subject, HTML body, plain text body)
+    """
+    return (
+        notification.title,
+        f"<p>{notification.message}</p>",
+        notification.message,
+    )
+
+
 async def send_notification_email(notification_id: str) -> bool:
     """
     Send email for a notification.
@@ -80,13 +117,8 @@ async def send_notification_email(notification_id: str) -> bool:
                 )
                 return False
 
-            # Check for custom template
-            template_result = await db.execute(
-                select(NotificationTemplate).where(
-                    NotificationTemplate.event_type == notification.type
-                )
-            )
-            template = template_result.scalar_one_or_none()
+            # Check for custom template (compiled and cached per event type)
+            template = await template_cache.get(db, notification.type)
 
             # Fetch user
             user_result = await db.execute(
@@ -98,37 +130,16 @@ async def send_notification_email(notification_id: str) -> bool:
                 logger.warning("user_not_found", user_id=notification.user_id)
                 return False
 
-            # Initialize email service
-            settings = get_settings()
-            email_config = EmailConfig(
-                smtp_host=settings.smtp_host,
-                smtp_port=settings.smtp_port,
-                smtp_user=settings.smtp_user or "",
-                smtp_password=settings.smtp_password or "",
-                smtp_from_email=settings.smtp_from_email,
-                smtp_from_name=settings.smtp_from_name,
-                use_tls=settings.smtp_use_tls,
-            )
-            email_service = EmailService(email_config)
-
-            # Prepare email content
-            if template and hasattr(template, "subject_template"):
-                # Use template with metadata context
-                context = notification.metadata or {}
-                subject = email_service.render_template(
-                    template.subject_template, context
-                )
-                body_html = email_service.render_template(
-                    template.body_template_html, context
-                )
-                body_text = email_service.render_template(
-                    template.body_template_text, context
+            # Initialize email service (sends over the worker's SMTP pool)
+            email_service = EmailService(_email_config())
+
+            # Prepare email content, using template with metadata context
+            if template:
+                subject, body_html, body_text = template.render(
+                    notification.metadata or {}
                 )
             else:
-                # Use default notification content
-                subject = notification.title
-                body_html = f"<p>{notification.message}</p>"
-                body_text = notification.message
+                subject, body_html, body_text = _default_email(notification)
 
             # Send email
             success = await email_service.send_email(
@@ -197,6 +208,10 @@ async def process_notification_rules(
     """
     Process notification rules for an event.
 
+    Notifications for all matching rules are inserted in one batched
+    INSERT ... RETURNING, and email delivery is queued in chunks of
+    EMAIL_BATCH_SIZE IDs once the rows are committed.
+
     Args:
         event_type: Type of event (e.g., 'sprint_complete')
         event_data: Event-specific data
@@ -206,47 +221,60 @@ async def process_notification_rules(
     """
     try:
         async with get_db_session() as db:
-            # Find matching enabled rules
-            result = await db.execute(
-                select(NotificationRule).where(
-                    NotificationRule.event_type == event_type,
-                    NotificationRule.enabled.is_(True),
+            # Find matching enabled rules via the (event_type, project) index
+            rules = await match_rules(db, event_type, event_data)
+
+            # Create notifications for rules with the in-app channel enabled
+            recipients = [
+                rule for rule in rules if NotificationChannel.IN_APP.value in rule.channels
+            ]
+            email_ids: List[str] = []
+
+            if recipients:
+                title = event_data.get("title", f"Event: {event_type}")
+                message = event_data.get("message", "New notification")
+                metadata = event_data.get("metadata", {})
+
+                result = await db.execute(
+                    insert(Notification).returning(
+                        Notification.id, sort_by_parameter_order=True
+                    ),
+                    [
+                        {
+                            "user_id": rule.user_id,
+                            "type": event_type,
+                            "title": title,
+                            "message": message,
+                            "meta_data": metadata,
+                        }
+                        for rule in recipients
+                    ],
                 )
-            )
-            rules = result.scalars().all()
-
-            notifications_created = 0
-
-            for rule in rules:
-                # Evaluate conditions if present
-                if rule.conditions:
-                    if not _evaluate_rule_conditions(rule.conditions, event_data):
-                        continue
-
-                # Create notification if in-app channel enabled
-                if NotificationChannel.IN_APP.value in rule.channels:
-                    notification = Notification(
-                        user_id=rule.user_id,
-                        type=event_type,
-                        title=event_data.get("title", f"Event: {event_type}"),
-                        message=event_data.get("message", "New notification"),
-                        metadata=event_data.get("metadata", {}),
-                    )
-                    db.add(notification)
-                    await db.flush()
-                    notifications_created += 1
-
-                    # Queue email if enabled
-                    if NotificationChannel.EMAIL.value in rule.channels:
-                        send_notification_email.delay(str(notification.id))
+                notification_ids = [str(i) for i in result.scalars().all()]
+
+                # Queue email if enabled
+                email_ids = [
+                    notification_id
+                    for notification_id, rule in zip(notification_ids, recipients)
+                    if NotificationChannel.EMAIL.value in rule.channels
+                ]
+
+            notifications_created = len(recipients)
 
             await db.commit()
 
+            # Workers must see the committed rows, so enqueue afterwards
+            for start in range(0, len(email_ids), EMAIL_BATCH_SIZE):
+                batch_send_notifications_task.delay(
+                    email_ids[start : start + EMAIL_BATCH_SIZE]
+                )
+
             logger.info(
                 "notification_rules_processed",
                 event_type=event_type,
                 rules_matched=len(rules),
                 notifications_created=notifications_created,
+                emails_queued=len(email_ids),
             )
 
             return notifications_created
@@ -263,66 +291,112 @@ async def process_notification_rules(
 
 async def batch_send_notifications(notification_ids: List[str]) -> int:
     """
-    Batch send notifications.
+    Batch send notification emails.
+
+    Notifications and recipients are loaded with one query, templates
+    come from the compiled template cache and are rendered once per
+    distinct context, and the messages are pipelined over pooled SMTP
+    sessions.
 
     Args:
         notification_ids: List of notification IDs to send
 
     Returns:
-        Number of notifications queued for sending
+        Number of emails sent
     """
     if not notification_ids:
         return 0
 
-    queued = 0
-    for notification_id in notification_ids:
-        try:
-            send_notification_email.delay(notification_id)
-            queued += 1
-        except Exception as e:
-            logger.error(
-                "batch_send_failed_for_notification",
-                notification_id=notification_id,
-                error=str(e),
+    async with get_db_session() as db:
+        rows = (
+            await db.execute(
+                select(Notification, User.email)
+                .join(User, User.id == Notification.user_id)
+                .where(Notification.id.in_([UUID(i) for i in notification_ids]))
+            )
+        ).all()
+
+        if len(rows) < len(notification_ids):
+            logger.warning(
+                "batch_send_notifications_missing",
+                requested=len(notification_ids),
+                found=len(rows),
             )
-            # Continue with other notifications
-            continue
+        if not rows:
+            return 0
+
+        templates = await template_cache.get_many(
+            db, {notification.type for notification, _ in rows}
+        )
+        contents = _render_batch([notification for notification, _ in rows], templates)
+
+        email_service = EmailService(_email_config())
+        results = await email_service.send_batch(
+            [
+                OutgoingEmail(
+                    to=user_email,
+                    subject=subject,
+                    body_html=body_html,
+                    body_text=body_text,
+                )
+                for (_, user_email), (subject, body_html, body_text) in zip(
+                    rows, contents
+                )
+            ]
+        )
+
+        sent_at = datetime.now(timezone.utc)
+        db.add_all(
+            [
+                NotificationLog(
+                    notification_id=notification.id,
+                    channel=NotificationChannel.EMAIL.value,
+                    status="sent" if success else "failed",
+                    sent_at=sent_at,
+                    error_message=None if success else "Email delivery failed",
+                )
+                for (notification, _), success in zip(rows, results)
+            ]
+        )
+        await db.commit()
 
+    sent = sum(results)
     logger.info(
-        "batch_send_notifications_completed", total=len(notification_ids), queued=queued
+        "batch_send_notifications_completed", total=len(notification_ids), sent=sent
     )
 
-    return queued
+    return sent
 
 
-def _evaluate_rule_conditions(
-    conditions: Dict[str, Any], event_data: Dict[str, Any]
-) -> bool:
+def _render_batch(
+    notifications: List[Notification], templates: Dict[str, CompiledTemplate]
+) -> List[RenderedEmail]:
     """
-    Evaluate if event data matches rule conditions.
+    Render email content for a batch of notifications.
 
-    Args:
-        conditions: Rule conditions to evaluate
-        event_data: Event data to check
+    Notifications are grouped by event type so each template renders its
+    recipients in bulk.
 
     Returns:
-        True if conditions match, False otherwise
+        Rendered email per notification, in order
     """
-    # Check project_ids condition
-    if "project_ids" in conditions:
-        allowed_projects = conditions["project_ids"]
-        event_project = event_data.get("project_id")
-        if event_project not in allowed_projects:
-            return False
-
-    # Check min_completion condition
-    if "min_completion" in conditions:
-        min_completion = conditions["min_completion"]
-        event_completion = event_data.get("completion", 0)
-        if event_completion < min_completion:
-            return False
+    contents: List[Optional[RenderedEmail]] = [None] * len(notifications)
+    groups: Dict[str, List[int]] = {}
+
+    for position, notification in enumerate(notifications):
+        if notification.type in templates:
+            groups.setdefault(notification.type, []).append(position)
+        else:
+            contents[position] = _default_email(notification)
+
+    for event_type, positions in groups.items():
+        rendered = templates[event_type].render_many(
+            [notifications[p].metadata or {} for p in positions]
+        )
+        for position, content in zip(positions, rendered):
+            contents[position] = content
 
-    return True
+    return contents
 
 
 # Celery task wrappers
@@ -338,7 +412,7 @@ def send_notification_email_task(self, notification_id: str) -> Dict[str, Any]:
         Dict with status and details
     """
     try:
-        result = asyncio.run(send_notification_email(notification_id))
+        result = run_async(send_notification_email(notification_id))
         return {
             "status": "success" if result else "failed",
             "notification_id": notification_id,
@@ -369,7 +443,7 @@ def process_notification_rules_task(
         Dict with processing results
     """
     try:
-        notifications_created = asyncio.run(
+        notifications_created = run_async(
             process_notification_rules(event_type, event_data)
         )
         return {
@@ -399,11 +473,11 @@ def batch_send_notifications_task(notification_ids: List[str]) -> Dict[str, Any]
         Dict with batch results
     """
     try:
-        queued = asyncio.run(batch_send_notifications(notification_ids))
+        sent = run_async(batch_send_notifications(notification_ids))
         return {
             "status": "success",
             "total": len(notification_ids),
-            "queued": queued,
+            "sent": sent,
         }
     except Exception as exc:
         logger.error(
@@ -0,0 +1,19 @@
+-- Migration: Store baseline tasks in a compressed columnar archive
+-- Date: 2026-10-18
+
+-- Tasks sorted by ID as parallel arrays (dates, durations, status codes,
+-- dependency hashes) in a compressed .npz archive; snapshot_data keeps the
+-- remaining project state with an empty "tasks" list.
+ALTER TABLE project_baselines ADD COLUMN IF NOT EXISTS snapshot_columns BYTEA;
+
+-- Size accounts for both the JSON document and the columnar archive
+CREATE OR REPLACE FUNCTION update_baseline_snapshot_size()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.snapshot_size_bytes := length(NEW.snapshot_data::text)
+        + COALESCE(octet_length(NEW.snapshot_columns), 0);
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+COMMENT ON COLUMN project_baselines.snapshot_columns IS 'Compressed columnar snapshot of baseline tasks (NULL for baselines with tasks in snapshot_data)';
@@ -0,0 +1,19 @@
+-- Migration: Store baselines as keyframe + delta chains
+-- Date: 2026-10-18
+
+-- A baseline with a base is stored as a columnar delta (removed task IDs
+-- plus new or changed rows) against that base; NULL means a keyframe.
+ALTER TABLE project_baselines
+    ADD COLUMN IF NOT EXISTS base_baseline_id UUID REFERENCES project_baselines(id) ON DELETE SET NULL,
+    ADD COLUMN IF NOT EXISTS delta_depth INTEGER NOT NULL DEFAULT 0,
+    ADD COLUMN IF NOT EXISTS write_time_ms DOUBLE PRECISION;
+
+CREATE INDEX IF NOT EXISTS idx_baselines_base_baseline_id ON project_baselines(base_baseline_id);
+
+-- Tasks no longer live in snapshot_data and nothing queries into the
+-- document, so the GIN index only costs write time and storage
+DROP INDEX IF EXISTS idx_baselines_snapshot_data_gin;
+
+COMMENT ON COLUMN project_baselines.base_baseline_id IS 'Baseline this snapshot is a delta against (NULL for keyframes)';
+COMMENT ON COLUMN project_baselines.delta_depth IS 'Number of deltas between this baseline and its keyframe';
+COMMENT ON COLUMN project_baselines.write_time_ms IS 'Time taken to build and store the snapshot in milliseconds';
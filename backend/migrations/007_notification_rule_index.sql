@@ -0,0 +1,36 @@
+-- Migration: Index notification rules by (event_type, project_id)
+-- Date: 2026-10-18
+
+-- Rules whose conditions list project_ids are matched through
+-- notification_rule_projects; all others form the wildcard bucket.
+ALTER TABLE notification_rules
+    ADD COLUMN IF NOT EXISTS project_scoped BOOLEAN NOT NULL DEFAULT FALSE;
+
+CREATE TABLE IF NOT EXISTS notification_rule_projects (
+    rule_id UUID NOT NULL REFERENCES notification_rules(id) ON DELETE CASCADE,
+    project_id VARCHAR(64) NOT NULL,
+    event_type VARCHAR(50) NOT NULL,
+    PRIMARY KEY (rule_id, project_id)
+);
+
+CREATE INDEX IF NOT EXISTS ix_notification_rule_projects_lookup
+    ON notification_rule_projects(event_type, project_id);
+
+CREATE INDEX IF NOT EXISTS ix_notification_rules_wildcard
+    ON notification_rules(event_type)
+    WHERE enabled AND NOT project_scoped;
+
+-- Backfill from existing rule conditions
+UPDATE notification_rules
+SET project_scoped = TRUE
+WHERE conditions ? 'project_ids';
+
+INSERT INTO notification_rule_projects (rule_id, project_id, event_type)
+SELECT DISTINCT r.id, p.project_id, r.event_type
+FROM notification_rules r
+CROSS JOIN LATERAL jsonb_array_elements_text(r.conditions -> 'project_ids') AS p(project_id)
+WHERE r.conditions ? 'project_ids'
+ON CONFLICT DO NOTHING;
+
+COMMENT ON COLUMN notification_rules.project_scoped IS 'True when conditions restrict the rule to project_ids';
+COMMENT ON TABLE notification_rule_projects IS 'Project-scoped notification rules indexed by (event_type, project_id)';
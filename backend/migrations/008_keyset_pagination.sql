@@ -0,0 +1,30 @@
+-- Migration: Keyset pagination and trigram search for listings
+-- Date: 2026-10-18
+
+-- Listings page by (sort field, id) after a cursor instead of OFFSET;
+-- these indexes serve each page as one range scan.
+CREATE INDEX IF NOT EXISTS idx_projects_owner_created_id
+    ON projects(owner_id, created_at, id);
+
+CREATE INDEX IF NOT EXISTS idx_projects_owner_updated_id
+    ON projects(owner_id, updated_at, id);
+
+CREATE INDEX IF NOT EXISTS idx_projects_owner_name_id
+    ON projects(owner_id, name, id);
+
+CREATE INDEX IF NOT EXISTS ix_notifications_user_created_id
+    ON notifications(user_id, created_at, id);
+
+CREATE INDEX IF NOT EXISTS ix_simulation_results_project_created_id
+    ON simulation_results(project_id, created_at, id);
+
+-- Trigram indexes let ILIKE '%term%' project search use an index
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_projects_name_trgm
+    ON projects USING gin (name gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_projects_description_trgm
+    ON projects USING gin (description gin_trgm_ops);
+
+COMMENT ON INDEX idx_projects_name_trgm IS 'Trigram index for substring search on project names';
@@ -277,8 +277,8 @@ class TestCompareBaselineEndpoint:
         project_id = str(uuid4())
         baseline_id = str(uuid4())
 
-        with patch.object(BaselineService, 'compare_to_baseline') as mock_compare:
-            mock_compare.return_value = {
+        with patch.object(BaselineService, 'get_comparison') as mock_compare:
+            mock_compare.return_value = ('"etag"', {
                 "baseline": {"id": baseline_id, "name": "Test"},
                 "comparison_date": "2025-10-17T10:00:00Z",
                 "summary": {
@@ -292,7 +292,7 @@ class TestCompareBaselineEndpoint:
                 "task_variances": [],
                 "new_tasks": [],
                 "deleted_tasks": []
-            }
+            })
 
             response = await async_client.get(
                 f"/api/v1/projects/{project_id}/baselines/{baseline_id}/compare",
@@ -303,21 +303,22 @@ class TestCompareBaselineEndpoint:
             data = response.json()
             assert "summary" in data
             assert "task_variances" in data
+            assert response.headers["etag"] == '"etag"'
 
     async def test_compare_baseline_supports_include_unchanged_param(self, async_client, auth_headers):
         """Test that include_unchanged query parameter is respected."""
         project_id = str(uuid4())
         baseline_id = str(uuid4())
 
-        with patch.object(BaselineService, 'compare_to_baseline') as mock_compare:
-            mock_compare.return_value = {
+        with patch.object(BaselineService, 'get_comparison') as mock_compare:
+            mock_compare.return_value = ('"etag"', {
                 "baseline": {},
                 "comparison_date": "2025-10-17T10:00:00Z",
                 "summary": {},
                 "task_variances": [],
                 "new_tasks": [],
                 "deleted_tasks": []
-            }
+            })
 
             response = await async_client.get(
                 f"/api/v1/projects/{project_id}/baselines/{baseline_id}/compare?include_unchanged=true",
@@ -336,7 +337,7 @@ class TestCompareBaselineEndpoint:
         project_id = str(uuid4())
         baseline_id = str(uuid4())
 
-        with patch.object(BaselineService, 'compare_to_baseline') as mock_compare:
+        with patch.object(BaselineService, 'get_comparison') as mock_compare:
             mock_compare.side_effect = BaselineError("Baseline not found")
 
             response = await async_client.get(
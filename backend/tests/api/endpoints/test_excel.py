@@ -238,6 +238,180 @@ class TestExcelEndpoints:
             assert response.json()["detail"] == "Failed to generate Excel template"
 
 
+XLSX_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+
+class TestExcelSyncEndpoint:
+    """Test incremental Excel sync endpoint."""
+
+    def _upload(self, content: bytes) -> dict:
+        """Build the multipart payload for a workbook upload."""
+        return {"file": ("plan.xlsx", content, XLSX_CONTENT_TYPE)}
+
+    async def _workbook(self, db, project) -> bytes:
+        """Generate the project's workbook the same way the API does."""
+        from app.services.excel_service import ExcelService
+
+        return await ExcelService(db).generate_excel(project)
+
+    @pytest.mark.asyncio
+    async def test_sync_excel_success(
+        self,
+        client: AsyncClient,
+        test_db_session,
+        test_user,
+        test_project,
+        override_auth
+    ):
+        """Test syncing an edited workbook applies the changed row."""
+        from io import BytesIO
+        from openpyxl import load_workbook
+
+        test_project.configuration = {
+            **test_project.configuration,
+            "tasks": [{"id": "T1", "name": "Design", "duration": 5, "dependencies": []}],
+        }
+        await test_db_session.commit()
+
+        workbook = load_workbook(BytesIO(await self._workbook(test_db_session, test_project)))
+        workbook["Project Plan"].cell(row=2, column=3, value=8)
+        buffer = BytesIO()
+        workbook.save(buffer)
+
+        app.dependency_overrides[require_auth] = override_auth({
+            "sub": str(test_user.id),
+            "email": test_user.email
+        })
+
+        with patch("app.services.project_service.ProjectService.check_owner_permission") as mock_check, \
+             patch("app.services.project_service.ProjectService.get_project") as mock_get:
+
+            mock_check.return_value = True
+            mock_get.return_value = test_project
+
+            response = await client.post(
+                f"/api/v1/projects/{test_project.id}/sync",
+                files=self._upload(buffer.getvalue()),
+            )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["updated"] == ["T1"]
+        assert data["inserted"] == []
+        assert data["conflicts"] == []
+        assert test_project.configuration["tasks"][0]["duration"] == 8
+
+    @pytest.mark.asyncio
+    async def test_sync_excel_unauthorized_user(
+        self,
+        client: AsyncClient,
+        test_db_session,
+        test_user,
+        test_user_pro,
+        override_auth
+    ):
+        """Test sync by non-owner user returns 404."""
+        app.dependency_overrides[require_auth] = override_auth({
+            "sub": str(test_user.id),
+            "email": test_user.email
+        })
+
+        with patch("app.services.project_service.ProjectService.check_owner_permission") as mock_check:
+            mock_check.return_value = False
+
+            response = await client.post(
+                f"/api/v1/projects/{uuid4()}/sync",
+                files=self._upload(b"PK"),
+            )
+
+        assert response.status_code == 404
+        assert response.json()["detail"] == "Project not found"
+
+    @pytest.mark.asyncio
+    async def test_sync_excel_file_too_large(
+        self,
+        client: AsyncClient,
+        test_db_session,
+        test_user,
+        test_project,
+        override_auth
+    ):
+        """Test oversize uploads are rejected before parsing."""
+        app.dependency_overrides[require_auth] = override_auth({
+            "sub": str(test_user.id),
+            "email": test_user.email
+        })
+
+        with patch("app.api.endpoints.excel.MAX_SYNC_FILE_SIZE", 16):
+            response = await client.post(
+                f"/api/v1/projects/{test_project.id}/sync",
+                files=self._upload(b"x" * 17),
+            )
+
+        assert response.status_code == 413
+
+    @pytest.mark.asyncio
+    async def test_sync_excel_foreign_workbook(
+        self,
+        client: AsyncClient,
+        test_db_session,
+        test_user,
+        test_project,
+        override_auth
+    ):
+        """Test a workbook generated for another project is rejected."""
+        from app.excel.engine import ExcelTemplateEngine, ProjectConfig
+
+        other = ExcelTemplateEngine().generate_template(
+            ProjectConfig(project_id="someone_else", project_name="Other")
+        )
+        app.dependency_overrides[require_auth] = override_auth({
+            "sub": str(test_user.id),
+            "email": test_user.email
+        })
+
+        with patch("app.services.project_service.ProjectService.check_owner_permission") as mock_check, \
+             patch("app.services.project_service.ProjectService.get_project") as mock_get:
+
+            mock_check.return_value = True
+            mock_get.return_value = test_project
+
+            response = await client.post(
+                f"/api/v1/projects/{test_project.id}/sync",
+                files=self._upload(other),
+            )
+
+        assert response.status_code == 400
+        assert "different project" in response.json()["detail"]
+
+    @pytest.mark.asyncio
+    async def test_sync_excel_throttled(
+        self,
+        client: AsyncClient,
+        test_db_session,
+        test_user,
+        test_project,
+        override_auth
+    ):
+        """Test sync is blocked for users flagged by abuse detection."""
+        app.dependency_overrides[require_auth] = override_auth({
+            "sub": str(test_user.id),
+            "email": test_user.email
+        })
+
+        with patch(
+            "app.services.abuse_service.AbuseDetectionService.should_throttle_user",
+            new=AsyncMock(return_value=True),
+        ):
+            response = await client.post(
+                f"/api/v1/projects/{test_project.id}/sync",
+                files=self._upload(b"PK"),
+            )
+
+        assert response.status_code == 429
+        assert response.json()["detail"]["error"] == "suspicious_activity"
+
+
 class TestExcelServiceUnit:
     """Unit tests for ExcelService."""
 
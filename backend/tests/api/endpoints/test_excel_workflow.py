@@ -14,9 +14,10 @@ Tests cover:
 import io
 from datetime import date, datetime
 from unittest.mock import MagicMock, patch
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 import pytest
+import pytest_asyncio
 from fastapi import status
 from httpx import AsyncClient
 from openpyxl import Workbook
@@ -402,6 +403,143 @@ class TestDownloadExcelTemplate:
         assert response.status_code == 403
 
 
+@pytest.mark.asyncio
+class TestBatchImportExcel:
+    """Test cases for POST /excel/import endpoint."""
+
+    XLSX = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+    def _workbook(self, rows: list) -> bytes:
+        """Create an Excel file with one task sheet."""
+        wb = Workbook()
+        ws = wb.active
+        ws.title = "Tasks"
+        ws.append(
+            ["Task ID", "Task Name", "Optimistic", "Most Likely", "Pessimistic", "Dependencies"]
+        )
+        for row in rows:
+            ws.append(row)
+        excel_bytes = io.BytesIO()
+        wb.save(excel_bytes)
+        return excel_bytes.getvalue()
+
+    @pytest_asyncio.fixture
+    async def import_user(self, db_session: AsyncSession, mock_user_info: dict):
+        """Create the authenticated free tier user the projects belong to."""
+        from app.models.user import User
+
+        user = User(
+            id=UUID(mock_user_info["sub"]),
+            email=mock_user_info["email"],
+            subscription_tier="free",
+        )
+        db_session.add(user)
+        await db_session.commit()
+        return user
+
+    async def test_batch_import_success(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        mock_user_info: dict,
+        override_auth,
+        import_user,
+    ):
+        """Test importing several workbooks creates one project each."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        files = [
+            ("files", ("alpha.xlsx", self._workbook([["A-1", "Task", 1.0, 2.0, 3.0, ""]]), self.XLSX)),
+            ("files", ("beta.xlsx", self._workbook([["B-1", "Task", 1.0, 2.0, 3.0, ""]]), self.XLSX)),
+        ]
+
+        with ThreadPoolExecutor(max_workers=2) as executor, \
+             patch("app.services.excel_import_service.get_import_executor", return_value=executor):
+            response = await client.post("/api/v1/excel/import", files=files)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["imported"] is True
+        assert [p["name"] for p in data["projects"]] == ["alpha", "beta"]
+        assert [f["status"] for f in data["files"]] == ["imported", "imported"]
+        assert all(f["wall_ms"] >= 0 for f in data["files"])
+
+    async def test_batch_import_validation_failure(
+        self, client: AsyncClient, db_session: AsyncSession, mock_user_info: dict, override_auth
+    ):
+        """Test a workbook with a circular dependency aborts the batch."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        cyclic = self._workbook(
+            [["A", "First", 1.0, 2.0, 3.0, "B"], ["B", "Second", 1.0, 2.0, 3.0, "A"]]
+        )
+        files = [
+            ("files", ("good.xlsx", self._workbook([["G-1", "Task", 1.0, 2.0, 3.0, ""]]), self.XLSX)),
+            ("files", ("cyclic.xlsx", cyclic, self.XLSX)),
+        ]
+
+        with ThreadPoolExecutor(max_workers=2) as executor, \
+             patch("app.services.excel_import_service.get_import_executor", return_value=executor):
+            response = await client.post("/api/v1/excel/import", files=files)
+
+        assert response.status_code == 422
+        detail = response.json()["detail"]
+        assert detail["imported"] is False
+        assert detail["projects"] == []
+        assert [f["status"] for f in detail["files"]] == ["imported", "failed"]
+
+    async def test_batch_import_exceeding_quota_imports_nothing(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        mock_user_info: dict,
+        override_auth,
+        import_user,
+    ):
+        """Test a batch that does not fit in the project quota is rejected whole."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        from sqlalchemy import func, select
+
+        from app.models.project import Project
+
+        for i in range(2):
+            db_session.add(
+                Project(owner_id=import_user.id, name=f"Existing {i}", configuration={})
+            )
+        await db_session.commit()
+
+        files = [
+            ("files", ("alpha.xlsx", self._workbook([["A-1", "Task", 1.0, 2.0, 3.0, ""]]), self.XLSX)),
+            ("files", ("beta.xlsx", self._workbook([["B-1", "Task", 1.0, 2.0, 3.0, ""]]), self.XLSX)),
+        ]
+
+        with ThreadPoolExecutor(max_workers=2) as executor, \
+             patch("app.services.excel_import_service.get_import_executor", return_value=executor):
+            response = await client.post("/api/v1/excel/import", files=files)
+
+        assert response.status_code == 403
+        detail = response.json()["detail"]
+        assert detail["error"] == "quota_exceeded"
+        assert detail["requested"] == 2
+        count = await db_session.scalar(
+            select(func.count(Project.id)).where(Project.owner_id == import_user.id)
+        )
+        assert count == 2
+
+    async def test_batch_import_unsupported_file(
+        self, client: AsyncClient, mock_user_info: dict, override_auth
+    ):
+        """Test non-Excel uploads are rejected."""
+        response = await client.post(
+            "/api/v1/excel/import",
+            files=[("files", ("notes.txt", b"hello", "text/plain"))],
+        )
+
+        assert response.status_code == 400
+        assert "Unsupported file type" in response.json()["detail"]
+
+
 @pytest.mark.asyncio
 class TestExcelWorkflowIntegration:
     """Integration tests for complete Excel workflow."""
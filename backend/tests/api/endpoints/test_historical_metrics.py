@@ -14,6 +14,8 @@ Tests cover:
 - GET /api/v1/projects/{id}/metrics/summary
 """
 
+import json
+
 import pytest
 import pytest_asyncio
 from datetime import datetime, timedelta, timezone
@@ -152,6 +154,32 @@ class TestHistoricalMetricsEndpoint:
             assert len(data) == 0
 
 
+    @pytest.mark.asyncio
+    async def test_get_historical_metrics_downsampled(
+        self, client: AsyncClient, test_db_session: AsyncSession, test_project
+    ):
+        """Test that ranges over max_points are served from rollups."""
+        from app.services.metric_rollup_service import MetricRollupService
+
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        await MetricRollupService(test_db_session).record_metrics(
+            test_project.id,
+            MetricType.VELOCITY,
+            [(float(i), start + timedelta(hours=i)) for i in range(72)],
+        )
+
+        response = await client.get(
+            f"/api/v1/projects/{test_project.id}/metrics/historical",
+            params={"max_points": 10},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data) == 3
+        assert all(point["resolution"] == "day" for point in data)
+        assert [point["count"] for point in data] == [24, 24, 24]
+
+
 class TestVelocityMetricsEndpoint:
     """Test suite for GET /api/v1/projects/{id}/metrics/velocity."""
 
@@ -322,6 +350,37 @@ class TestForecastMetricsEndpoint:
         assert isinstance(data, (dict, list))
 
 
+class TestCompletionForecastEndpoint:
+    """Test suite for GET /api/v1/projects/{id}/metrics/forecast/completion."""
+
+    @pytest.mark.asyncio
+    async def test_get_completion_forecast(
+        self, client: AsyncClient, test_project, sample_metrics_data
+    ):
+        """Test Monte Carlo percentiles and probability curve are returned."""
+        response = await client.get(
+            f"/api/v1/projects/{test_project.id}/metrics/forecast/completion",
+            params={"remaining_points": 300, "simulations": 2000},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["simulations"] == 2000
+        assert set(data["percentiles"]) == {"p50", "p70", "p85", "p95"}
+        assert data["probability_by_date"][-1]["probability"] == pytest.approx(1.0)
+
+    @pytest.mark.asyncio
+    async def test_get_completion_forecast_requires_remaining_points(
+        self, client: AsyncClient, test_project
+    ):
+        """Test remaining_points is required."""
+        response = await client.get(
+            f"/api/v1/projects/{test_project.id}/metrics/forecast/completion"
+        )
+
+        assert response.status_code == 422
+
+
 class TestMetricsSummaryEndpoint:
     """Test suite for GET /api/v1/projects/{id}/metrics/summary."""
 
@@ -385,6 +444,19 @@ class TestMetricsSummaryEndpoint:
         assert isinstance(data, dict)
         assert len(data) >= 2  # At least 2 sections of data
 
+    @pytest.mark.asyncio
+    async def test_get_metrics_summary_aggregates(
+        self, client: AsyncClient, test_project, sample_metrics_data
+    ):
+        """Test summary aggregates match the sample data."""
+        response = await client.get(f"/api/v1/projects/{test_project.id}/metrics/summary")
+
+        data = response.json()
+        assert data["total_sprints"] == 8
+        assert data["current_velocity"] == pytest.approx(35.0)
+        assert data["average_velocity"] == pytest.approx(45.5)
+        assert data["completion_rate"] == pytest.approx(0.775)
+
     @pytest.mark.asyncio
     async def test_get_metrics_summary_no_data(
         self, client: AsyncClient, test_project
@@ -464,3 +536,78 @@ class TestAPIAuthentication:
         # For now, just verify endpoint exists
         response = await client.get(f"/api/v1/projects/{test_project.id}/metrics/summary")
         assert response.status_code in [200, 401, 403, 404]
+
+
+class TestMetricsIngestEndpoint:
+    """Test suite for POST /api/v1/projects/{id}/metrics/ingest."""
+
+    @pytest.mark.asyncio
+    async def test_ingest_ndjson(self, client: AsyncClient, test_project, test_user):
+        """Test NDJSON ingestion with one invalid line."""
+        lines = [
+            {"metric_type": "velocity", "value": 40, "timestamp": "2024-03-04T10:00:00Z",
+             "idempotency_key": "ci-1"},
+            {"metric_type": "velocity", "value": 42, "timestamp": "2024-03-05T10:00:00Z",
+             "idempotency_key": "ci-2"},
+            {"metric_type": "unknown", "value": 1, "timestamp": "2024-03-05T10:00:00Z"},
+        ]
+        body = "\n".join(json.dumps(line) for line in lines)
+
+        response = await client.post(
+            f"/api/v1/projects/{test_project.id}/metrics/ingest",
+            content=body,
+            headers={
+                "Content-Type": "application/x-ndjson",
+                "Authorization": f"Bearer {test_user.id}",
+            },
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert (data["received"], data["inserted"], data["rejected"]) == (3, 2, 1)
+        assert data["errors"] == [{"index": 2, "reason": "invalid metric_type"}]
+
+        historical = await client.get(f"/api/v1/projects/{test_project.id}/metrics/historical")
+        assert [point["value"] for point in historical.json()] == [40.0, 42.0]
+
+    @pytest.mark.asyncio
+    async def test_ingest_columnar_retry(self, client: AsyncClient, test_project, test_user):
+        """Test columnar ingestion is idempotent across retries."""
+        payload = {
+            "metric_type": "burndown",
+            "values": [10, 8, 5],
+            "timestamps": [1709510400, 1709596800, 1709683200],
+            "idempotency_keys": ["b-1", "b-2", "b-3"],
+        }
+        url = f"/api/v1/projects/{test_project.id}/metrics/ingest"
+        headers = {"Authorization": f"Bearer {test_user.id}"}
+
+        first = await client.post(url, json=payload, headers=headers)
+        retry = await client.post(url, json=payload, headers=headers)
+
+        assert first.json()["inserted"] == 3
+        assert (retry.json()["inserted"], retry.json()["duplicates"]) == (0, 3)
+
+    @pytest.mark.asyncio
+    async def test_ingest_malformed_payload(
+        self, client: AsyncClient, test_project, test_user
+    ):
+        """Test malformed payloads are rejected with 400."""
+        response = await client.post(
+            f"/api/v1/projects/{test_project.id}/metrics/ingest",
+            json={"values": [1, 2], "timestamps": [0]},
+            headers={"Authorization": f"Bearer {test_user.id}"},
+        )
+
+        assert response.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_ingest_requires_project_owner(self, client: AsyncClient, test_project):
+        """Test non-owners get 404."""
+        response = await client.post(
+            f"/api/v1/projects/{test_project.id}/metrics/ingest",
+            json={"metric_type": "velocity", "values": [1], "timestamps": [0]},
+            headers={"Authorization": f"Bearer {uuid4()}"},
+        )
+
+        assert response.status_code == 404
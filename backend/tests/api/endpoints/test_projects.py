@@ -528,5 +528,103 @@ class TestProjectServiceUnit:
         assert mock_db.execute.called
 
 
+class TestProjectListingPagination:
+    """Test keyset pagination and cached totals on a real session."""
+
+    async def _create_projects(self, db, owner_id, names):
+        projects = [
+            Project(name=name, description=None, owner_id=owner_id, configuration={})
+            for name in names
+        ]
+        db.add_all(projects)
+        await db.commit()
+        return projects
+
+    @pytest.mark.asyncio
+    async def test_cursor_pages_cover_all_projects(self, test_db_session, test_user):
+        """Walking cursors yields every project once, in (name, id) order."""
+        from app.database.pagination import next_cursor
+        from app.services.project_service import ProjectService, invalidate_project_counts
+
+        invalidate_project_counts(test_user.id)
+        await self._create_projects(
+            test_db_session, test_user.id, ["Delta", "Alpha", "Charlie", "Bravo", "Alpha"]
+        )
+        service = ProjectService(test_db_session)
+
+        seen = []
+        cursor = None
+        while True:
+            projects, total = await service.list_projects(
+                test_user.id, limit=2, sort_by="name", sort_desc=False, cursor=cursor
+            )
+            seen.extend(projects)
+            cursor = next_cursor(projects, 2, "name", "name")
+            if cursor is None:
+                break
+
+        assert total == 5
+        assert [p.name for p in seen] == ["Alpha", "Alpha", "Bravo", "Charlie", "Delta"]
+        assert len({p.id for p in seen}) == 5
+
+    @pytest.mark.asyncio
+    async def test_cursor_for_other_sort_rejected(self, test_db_session, test_user):
+        """A cursor issued for one sort cannot continue another."""
+        from app.database.pagination import InvalidCursorError, encode_cursor
+        from app.services.project_service import ProjectService
+
+        cursor = encode_cursor("name", "Alpha", uuid4())
+
+        with pytest.raises(InvalidCursorError):
+            await ProjectService(test_db_session).list_projects(
+                test_user.id, sort_by="created_at", cursor=cursor
+            )
+
+    @pytest.mark.asyncio
+    async def test_search_matches_wildcards_literally(self, test_db_session, test_user):
+        """% and _ in the search term are not LIKE wildcards."""
+        from app.services.project_service import ProjectService, invalidate_project_counts
+
+        invalidate_project_counts(test_user.id)
+        await self._create_projects(
+            test_db_session, test_user.id, ["100% done", "100 items", "a_b", "axb"]
+        )
+        service = ProjectService(test_db_session)
+
+        percent, _ = await service.list_projects(test_user.id, search="100%")
+        underscore, _ = await service.list_projects(test_user.id, search="a_b")
+
+        assert [p.name for p in percent] == ["100% done"]
+        assert [p.name for p in underscore] == ["a_b"]
+
+    @pytest.mark.asyncio
+    async def test_total_is_cached_until_projects_change(self, test_db_session, test_user):
+        """Totals are reused across pages and recounted after a create."""
+        from app.schemas.project import ProjectCreate
+        from app.services.project_service import ProjectService, invalidate_project_counts
+
+        invalidate_project_counts(test_user.id)
+        await self._create_projects(test_db_session, test_user.id, ["One", "Two"])
+        service = ProjectService(test_db_session)
+
+        _, total = await service.list_projects(test_user.id)
+        assert total == 2
+
+        # Added behind the service's back: the cached total is served
+        await self._create_projects(test_db_session, test_user.id, ["Three"])
+        _, total = await service.list_projects(test_user.id, offset=1)
+        assert total == 2
+
+        await service.create_project(
+            test_user.id,
+            ProjectCreate(
+                name="Four",
+                configuration={"project_name": "Four", "sprint_pattern": "YY.Q.#"},
+            ),
+        )
+        _, total = await service.list_projects(test_user.id)
+        assert total == 4
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--cov=app.api.endpoints.projects", "--cov=app.services.project_service"])
\ No newline at end of file
@@ -72,6 +72,26 @@ def event_loop():
     loop.close()
 
 
+@pytest.fixture(autouse=True)
+def reset_smtp_pools():
+    """
+    Drop the shared SMTP pools after each test.
+
+    The pools live as long as the session-scoped event loop, so without
+    this a test would check out sessions opened under an earlier test's
+    mocked ``aiosmtplib.SMTP``. Synchronous so it also runs cleanly after
+    tests that do not use the event loop.
+    """
+    from app.services import smtp_pool
+
+    yield
+    for loop, loop_pools in list(smtp_pool._pools.items()):
+        if not loop.is_closed():
+            for pool in loop_pools.values():
+                loop.run_until_complete(pool.close())
+    smtp_pool._pools.clear()
+
+
 @pytest_asyncio.fixture(scope="session")
 async def test_engine():
     """Create test database engine (session scope - reused across tests)."""
@@ -129,7 +149,7 @@ async def client(test_db_session: AsyncSession) -> AsyncGenerator[AsyncClient, N
     and need the app to use the test database.
     """
     from app.main import app
-    from app.database.connection import get_db
+    from app.database.connection import get_db, get_read_db
     from app.core import auth
     from uuid import UUID
 
@@ -160,6 +180,7 @@ async def client(test_db_session: AsyncSession) -> AsyncGenerator[AsyncClient, N
     auth.verify_nextauth_jwt = test_verify_token
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
 
     # Clear rate limiter state to prevent test interference
     # The RateLimitMiddleware stores requests in instance attribute
@@ -0,0 +1,145 @@
+"""Tests for precompiled formula templates."""
+
+import json
+from pathlib import Path
+from string import Template
+
+import pytest
+
+from app.excel.components.formula_compiler import compile_formula
+from app.excel.components.formulas import FormulaTemplate
+from app.excel.components.templates.formula_loader import FormulaTemplateLoader
+
+TEMPLATES_DIR = Path(__file__).parents[2] / "app" / "excel" / "components" / "templates"
+
+
+class TestCompileFormula:
+    """Test formula tokenization."""
+
+    def test_splits_literals_and_slots(self):
+        """Placeholders become slots between literal segments."""
+        compiled = compile_formula("=MAX($start, $finish + ${lag}d)")
+
+        assert compiled.slots == ("start", "finish", "lag")
+        assert compiled.literals == ("=MAX(", ", ", " + ", "d)")
+        assert compiled.parameters == frozenset({"start", "finish", "lag"})
+
+    def test_matches_whole_identifiers(self):
+        """$hours is not matched inside $hours_per_point."""
+        compiled = compile_formula("=$hours_per_point*$hours")
+
+        assert compiled.render({"hours": "8", "hours_per_point": "H1"}) == "=H1*8"
+
+    def test_escaped_dollar(self):
+        """$$ renders as a literal dollar sign."""
+        assert compile_formula("=$$A$$1+$x").render({"x": "1"}) == "=$A$1+1"
+
+    def test_missing_parameter(self):
+        """Strict rendering raises; lenient rendering keeps the placeholder."""
+        compiled = compile_formula("=$a+$b")
+
+        with pytest.raises(KeyError):
+            compiled.render({"a": "1"})
+        assert compiled.render({"a": "1"}, strict=False) == "=1+$b"
+
+    def test_compilation_is_cached(self):
+        """The same formula text compiles to the same object."""
+        assert compile_formula("=$x*2") is compile_formula("=$x*2")
+
+    def test_matches_string_template_for_shipped_templates(self):
+        """Compiled rendering equals string.Template for every JSON formula."""
+        checked = 0
+        for path in TEMPLATES_DIR.glob("*.json"):
+            for name, config in json.loads(path.read_text()).items():
+                if name.startswith("_"):
+                    continue
+                formula = config["formula"]
+                params = {
+                    p: f"P{i}" for i, p in enumerate(compile_formula(formula).parameters)
+                }
+                expected = Template(formula).substitute(params)
+
+                assert compile_formula(formula).render(params) == expected, name
+                checked += 1
+
+        assert checked > 0
+
+
+class TestRenderRows:
+    """Test vectorized row rendering."""
+
+    def test_row_token_expansion(self):
+        """{row} in parameter values is replaced per row."""
+        compiled = compile_formula("=$start+$duration")
+
+        formulas = compiled.render_rows(2, 4, {"start": "D{row}", "duration": "E{row}"})
+
+        assert formulas == ["=D2+E2", "=D3+E3", "=D4+E4"]
+
+    def test_sequence_values(self):
+        """Sequence values supply one value per row."""
+        compiled = compile_formula("=$cell*$factor")
+
+        formulas = compiled.render_rows(5, 6, {"cell": "A{row}", "factor": [2, 3]})
+
+        assert formulas == ["=A5*2", "=A6*3"]
+
+    def test_braces_in_formula_are_preserved(self):
+        """Array constants survive the format-based rendering."""
+        compiled = compile_formula("=SUM($cell*{1,2})")
+
+        assert compiled.render_rows(1, 1, {"cell": "B{row}"}) == ["=SUM(B1*{1,2})"]
+
+    def test_invalid_ranges_and_lengths(self):
+        """Bad row ranges and sequence lengths are rejected."""
+        compiled = compile_formula("=$x")
+
+        with pytest.raises(ValueError, match="row range"):
+            compiled.render_rows(3, 2, {"x": "1"})
+        with pytest.raises(ValueError, match="2 values for 3 rows"):
+            compiled.render_rows(1, 3, {"x": [1, 2]})
+
+    def test_matches_apply_template_per_row(self):
+        """render_rows equals calling apply_template for each row."""
+        templates = FormulaTemplate()
+
+        formulas = templates.render_rows(
+            "dependency_fs",
+            2,
+            101,
+            predecessor_finish="E{row}",
+            task_start="D{row}",
+            lag_days="0",
+        )
+
+        expected = [
+            templates.apply_template(
+                "dependency_fs",
+                predecessor_finish=f"E{row}",
+                task_start=f"D{row}",
+                lag_days="0",
+            )
+            for row in range(2, 102)
+        ]
+        assert formulas == expected
+
+    def test_render_rows_validates_parameters(self):
+        """Missing parameters are reported like apply_template."""
+        with pytest.raises(ValueError, match="Missing required parameter"):
+            FormulaTemplate().render_rows("dependency_fs", 2, 3, task_start="D{row}")
+
+    def test_loader_render_rows(self):
+        """FormulaTemplateLoader renders row ranges from loaded JSON."""
+        loader = FormulaTemplateLoader()
+        loader.load_template("monte_carlo")
+
+        formulas = loader.render_rows(
+            "pert_mean", 2, 3, optimistic="B{row}", most_likely="C{row}", pessimistic="D{row}"
+        )
+
+        assert formulas == [
+            loader.apply_template(
+                "pert_mean", optimistic=f"B{r}", most_likely=f"C{r}", pessimistic=f"D{r}"
+            )
+            for r in (2, 3)
+        ]
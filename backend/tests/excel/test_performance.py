@@ -6,15 +6,30 @@ for the Excel template engine.
 
 Note: These tests measure performance of the actual implemented functionality,
 which generates a fixed template structure with metadata and sync capabilities.
+
+Task-scaled benchmarks (100 to 50k tasks) live in app.excel.benchmark; run
+``python -m app.excel.benchmark --baseline tests/excel/benchmark_baseline.json``
+to compare against the stored baseline.
 """
 
+import json
 import pytest
 import time
 import tracemalloc
 from io import BytesIO
 from datetime import datetime
+from pathlib import Path
 from openpyxl import load_workbook
 
+from app.excel.benchmark import (
+    FEATURES,
+    compare_to_baseline,
+    main as benchmark_main,
+    render_feature_formulas,
+    run_benchmarks,
+    run_scenario,
+    synthetic_tasks,
+)
 from app.excel.engine import ExcelTemplateEngine, ProjectConfig
 
 
@@ -418,6 +433,103 @@ class TestEngineScalability:
         print(f"  Ratio: {ratio:.2f}")
 
 
+BASELINE_PATH = Path(__file__).parent / "benchmark_baseline.json"
+
+
+class TestBenchmarkHarness:
+    """Test the Excel benchmark harness (app.excel.benchmark)."""
+
+    def test_synthetic_tasks_are_deterministic(self):
+        """Synthetic projects are reproducible and carry feature columns."""
+        tasks = synthetic_tasks(20, ("gantt_chart", "resource_leveling"))
+
+        assert tasks == synthetic_tasks(20, ("gantt_chart", "resource_leveling"))
+        assert tasks[19]["dependencies"] == ["T19", "T10"]
+        assert "start_date" in tasks[0] and "owner" in tasks[0]
+        assert "status" not in tasks[0]
+
+    def test_run_scenario_measures_all_stages(self):
+        """A scenario records time, memory and size for every stage."""
+        result = run_scenario(100, "all", FEATURES)
+
+        assert result.scenario == "100-all"
+        for stage in ("template", "workbook", "parse"):
+            assert result.metrics[f"{stage}_wall_s"] > 0
+            assert result.metrics[f"{stage}_peak_bytes"] > 0
+        assert result.metrics["template_size_bytes"] > 0
+        assert result.metrics["workbook_size_bytes"] > 0
+        assert result.metrics["formulas_wall_s"] > 0
+        assert result.metrics["formula_cells"] > 0
+
+    def test_feature_formulas_follow_enabled_features(self):
+        """Only the enabled features' formula templates are rendered, per row."""
+        assert render_feature_formulas(50, ()) == 0
+
+        gantt = render_feature_formulas(50, ("gantt_chart",))
+        assert gantt > 0
+        assert gantt % 50 == 0
+        assert render_feature_formulas(100, ("gantt_chart",)) == 2 * gantt
+        assert render_feature_formulas(50, FEATURES) > gantt
+
+    def test_compare_flags_regressions_beyond_threshold(self):
+        """Only metrics above their threshold are reported."""
+        baseline = {"results": [{"scenario": "100-basic", "metrics": {
+            "template_wall_s": 1.0, "template_peak_bytes": 1000, "template_size_bytes": 100,
+        }}]}
+        report = {"results": [
+            {"scenario": "100-basic", "metrics": {
+                "template_wall_s": 1.4, "template_peak_bytes": 1300, "template_size_bytes": 100,
+            }},
+            {"scenario": "1000-basic", "metrics": {"template_wall_s": 99.0}},
+        ]}
+
+        regressions = compare_to_baseline(report, baseline)
+
+        assert [(r.scenario, r.metric) for r in regressions] == [
+            ("100-basic", "template_peak_bytes")
+        ]
+        assert compare_to_baseline(report, baseline, {"wall_s": 1.2})[0].metric == (
+            "template_wall_s"
+        )
+
+    def test_compare_skips_noisy_timings(self):
+        """Sub-threshold baseline timings are not compared."""
+        baseline = {"results": [{"scenario": "s", "metrics": {"parse_wall_s": 0.001}}]}
+        report = {"results": [{"scenario": "s", "metrics": {"parse_wall_s": 0.01}}]}
+
+        assert compare_to_baseline(report, baseline) == []
+
+    def test_cli_writes_report_and_fails_on_regression(self, tmp_path):
+        """The CLI writes JSON and exits non-zero on regressions."""
+        output = tmp_path / "report.json"
+        baseline = tmp_path / "baseline.json"
+        baseline.write_text(json.dumps({"results": [
+            {"scenario": "100-basic", "metrics": {"template_size_bytes": 1}},
+        ]}))
+
+        exit_code = benchmark_main([
+            "--sizes", "100", "--combos", "basic", "--no-memory",
+            "--output", str(output), "--baseline", str(baseline),
+        ])
+
+        report = json.loads(output.read_text())
+        assert exit_code == 1
+        assert report["results"][0]["scenario"] == "100-basic"
+
+    def test_small_scenarios_within_stored_baseline(self):
+        """100-task scenarios stay within the stored size and memory budgets."""
+        baseline = json.loads(BASELINE_PATH.read_text())
+        report = run_benchmarks(sizes=[100], combos={"basic": (), "all": FEATURES})
+
+        # Timing is machine-dependent; only gate size and memory here
+        regressions = [
+            r for r in compare_to_baseline(report, baseline)
+            if not r.metric.endswith("wall_s")
+        ]
+
+        assert regressions == []
+
+
 # Performance benchmark summary
 def test_performance_benchmark_summary():
     """Summary of all performance benchmarks."""
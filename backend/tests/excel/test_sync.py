@@ -0,0 +1,159 @@
+"""Tests for row-level sync checksums."""
+
+from datetime import date, datetime
+from io import BytesIO
+
+from openpyxl import load_workbook
+
+from app.excel.engine import ExcelTemplateEngine, ProjectConfig
+from app.excel.sync import (
+    ROW_CHECKSUM_START_ROW,
+    apply_task_delta,
+    calculate_row_checksum,
+    calculate_row_checksums,
+    diff_task_rows,
+    read_row_checksums,
+)
+
+
+TASKS = [
+    {"id": "T1", "name": "Design", "duration": 5, "start_date": "2025-01-06", "status": "Done"},
+    {"id": "T2", "name": "Build", "duration": 10.5, "dependencies": ["T1"], "owner": "ana"},
+    {"id": "T3", "name": "Test", "duration": 3, "dependencies": ["T1", "T2"]},
+]
+
+ROWS = [
+    ("T1", "Design", 5, datetime(2025, 1, 6), None, None, None, "Done", None),
+    ("T2", "Build", 10.5, None, None, "T1", None, None, "ana"),
+    ("T3", "Test", 3, None, None, "T1, T2", None, None, None),
+]
+
+
+class TestRowChecksums:
+    """Test checksum normalization."""
+
+    def test_task_and_row_hash_identically(self):
+        """Stored task dicts and worksheet rows produce the same checksum."""
+        checksums = calculate_row_checksums(TASKS)
+        delta = diff_task_rows(ROWS, {}, checksums)
+
+        assert delta.unchanged_count == 3
+        assert not delta.has_changes
+
+    def test_checksum_normalizes_types(self):
+        """Equivalent numbers, dates and dependency forms hash the same."""
+        a = {"id": "T1", "duration": 5, "start_date": date(2025, 1, 6), "dependencies": "A, B"}
+        b = {"task_id": "T1", "duration": 5.0, "start_date": "2025-01-06", "dependencies": ["A", "B"]}
+
+        assert calculate_row_checksum(a) == calculate_row_checksum(b)
+
+    def test_checksum_detects_changes(self):
+        """Changing any managed field changes the checksum."""
+        changed = dict(TASKS[0], status="In Progress")
+
+        assert calculate_row_checksum(changed) != calculate_row_checksum(TASKS[0])
+
+
+class TestDiffTaskRows:
+    """Test delta computation."""
+
+    def test_detects_insert_update_delete(self):
+        """Edited, added and removed rows are classified correctly."""
+        checksums = calculate_row_checksums(TASKS)
+        rows = [
+            ROWS[0],
+            ("T2", "Build", 12, None, None, "T1", None, None, "ana"),
+            ("T4", "Deploy", 1, None, None, "T2", None, None, None),
+        ]
+
+        delta = diff_task_rows(rows, checksums, checksums)
+
+        assert [t["id"] for t in delta.inserted] == ["T4"]
+        assert [t["id"] for t in delta.updated] == ["T2"]
+        assert delta.deleted == ["T3"]
+        assert delta.unchanged_count == 1
+
+    def test_server_side_additions_are_not_deleted(self):
+        """Tasks added on the server after generation survive a sync."""
+        embedded = calculate_row_checksums(TASKS)
+        stored = calculate_row_checksums(TASKS + [{"id": "T9", "name": "New"}])
+
+        delta = diff_task_rows(ROWS, embedded, stored)
+
+        assert delta.deleted == []
+
+    def test_reapplied_change_is_noop(self):
+        """Re-uploading a change already stored on the server is a no-op."""
+        embedded = calculate_row_checksums(TASKS)
+        edited_task = dict(TASKS[2], name="Test all")
+        stored = calculate_row_checksums([TASKS[0], TASKS[1], edited_task])
+        rows = [ROWS[0], ROWS[1], ("T3", "Test all", 3, None, None, "T1, T2", None, None, None)]
+
+        delta = diff_task_rows(rows, embedded, stored)
+
+        assert not delta.has_changes
+        assert delta.unchanged_count == 3
+
+    def test_concurrent_edit_is_reported_as_conflict(self):
+        """A row edited in Excel and on the server is not applied."""
+        embedded = calculate_row_checksums(TASKS)
+        server_task = dict(TASKS[1], owner="bo")
+        stored = calculate_row_checksums([TASKS[0], server_task, TASKS[2]])
+        rows = [ROWS[0], ("T2", "Build", 12, None, None, "T1", None, None, "ana"), ROWS[2]]
+
+        delta = diff_task_rows(rows, embedded, stored)
+
+        assert delta.updated == []
+        assert delta.conflicts == [{"id": "T2", "operation": "update"}]
+        assert delta.to_sync_data()["conflicts"] == [{"id": "T2", "operation": "update"}]
+
+    def test_delete_of_server_edited_task_is_conflict(self):
+        """Removing a row whose task changed on the server is not applied."""
+        embedded = calculate_row_checksums(TASKS)
+        server_task = dict(TASKS[2], duration=4)
+        stored = calculate_row_checksums([TASKS[0], TASKS[1], server_task])
+
+        delta = diff_task_rows(ROWS[:2], embedded, stored)
+
+        assert delta.deleted == []
+        assert delta.conflicts == [{"id": "T3", "operation": "delete"}]
+        assert not delta.has_changes
+
+    def test_apply_delta_preserves_unmanaged_fields(self):
+        """Fields outside the sync columns are kept on update."""
+        tasks = [dict(TASKS[1], optimistic=8)]
+        checksums = calculate_row_checksums(tasks)
+        rows = [("T2", "Build v2", 10.5, None, None, "T1", None, None, "ana")]
+
+        delta = diff_task_rows(rows, checksums, checksums)
+        result = apply_task_delta(tasks, delta)
+
+        assert result[0]["name"] == "Build v2"
+        assert result[0]["optimistic"] == 8
+        assert result[0]["dependencies"] == ["T1"]
+        assert delta.to_sync_data()["updated"] == ["T2"]
+
+
+class TestEngineRowChecksums:
+    """Test checksum embedding in generated workbooks."""
+
+    def test_generated_workbook_round_trips_unchanged(self):
+        """An untouched generated workbook produces an empty delta."""
+        engine = ExcelTemplateEngine()
+        config = ProjectConfig(project_id="sync_1", project_name="Sync", tasks=TASKS)
+
+        workbook = load_workbook(BytesIO(engine.generate_template(config)))
+        metadata = engine.load_metadata_from_excel(engine.generate_template(config))
+        embedded = read_row_checksums(
+            workbook["_SYNC_META"].iter_rows(
+                min_row=ROW_CHECKSUM_START_ROW, values_only=True
+            )
+        )
+        rows = workbook["Project Plan"].iter_rows(min_row=2, values_only=True)
+
+        delta = diff_task_rows(rows, embedded, calculate_row_checksums(TASKS))
+
+        assert metadata["row_checksums"]["count"] == 3
+        assert embedded == calculate_row_checksums(TASKS)
+        assert delta.unchanged_count == 3
+        assert not delta.has_changes
@@ -253,3 +253,107 @@ class TestGenerationRateLimiter:
         assert retry_after <= limiter.window_seconds
 
         await limiter.close()
+
+
+class TestBatchedRateLimits:
+    """Test multi-key checks and the single-call Redis path."""
+
+    @pytest.mark.asyncio
+    async def test_generation_check_records_nothing_when_ip_limited(self):
+        """A request rejected by the IP limit does not use up the user limit."""
+        limiter = GenerationRateLimiter(redis_url=None)
+        user_id = str(uuid4())
+        ip_address = "192.168.2.1"
+
+        for i in range(20):
+            await limiter.check_ip_limit(ip_address)
+
+        from fastapi import HTTPException
+
+        with pytest.raises(HTTPException):
+            await limiter.check_generation_limit(user_id, ip_address, "free")
+
+        user_key = limiter._get_redis_key(user_id, "user")
+        assert limiter.in_memory_store[user_key] == []
+
+    @pytest.mark.asyncio
+    async def test_generation_check_is_one_script_call(self):
+        """User and IP limits are evaluated by one script invocation."""
+        from unittest.mock import AsyncMock
+
+        limiter = GenerationRateLimiter(redis_url=None)
+        limiter._script = AsyncMock(return_value=[0, 0])
+
+        await limiter.check_generation_limit("user-1", "10.0.0.1", "free")
+
+        limiter._script.assert_awaited_once()
+        kwargs = limiter._script.call_args.kwargs
+        assert kwargs["keys"] == ["ratelimit:user:user-1", "ratelimit:ip:10.0.0.1"]
+        assert kwargs["args"][2:] == [10, 3600, 20, 3600]
+
+    @pytest.mark.asyncio
+    async def test_script_result_maps_to_ip_error(self):
+        """A retry-after for the IP key raises the IP limit error."""
+        from unittest.mock import AsyncMock
+        from fastapi import HTTPException
+
+        limiter = GenerationRateLimiter(redis_url=None)
+        limiter._script = AsyncMock(return_value=[0, 120])
+
+        with pytest.raises(HTTPException) as exc_info:
+            await limiter.check_generation_limit("user-1", "10.0.0.2", "free")
+
+        assert exc_info.value.detail["retry_after"] == 120
+        assert "IP" in exc_info.value.detail["message"]
+
+    @pytest.mark.asyncio
+    async def test_script_failure_falls_back_to_memory(self):
+        """Redis errors fall back to the in-memory sliding window."""
+        from unittest.mock import AsyncMock
+
+        limiter = GenerationRateLimiter(redis_url=None)
+        limiter._script = AsyncMock(side_effect=ConnectionError("down"))
+
+        results = await limiter.check_limits([("ratelimit:test:a", 1, 60)])
+        assert results == [(False, 0)]
+        results = await limiter.check_limits([("ratelimit:test:a", 1, 60)])
+        assert results[0][0] is True
+
+    def test_unknown_algorithm_rejected(self):
+        """Only the supported algorithms are accepted."""
+        with pytest.raises(ValueError):
+            GenerationRateLimiter(redis_url=None, algorithm="leaky")
+
+
+@pytest.mark.integration
+class TestRedisRateLimitScripts:
+    """Run the Lua scripts against Redis when it is available."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("algorithm", ["sliding_window", "gcra", "token_bucket"])
+    async def test_limit_and_all_or_nothing(self, algorithm):
+        """Each algorithm enforces the limit and records atomically."""
+        limiter = GenerationRateLimiter(algorithm=algorithm)
+        await limiter.connect()
+        if limiter.redis_client is None:
+            pytest.skip("Redis not available")
+
+        prefix = f"ratelimit:test:{uuid4()}"
+        tight, loose = f"{prefix}:tight", f"{prefix}:loose"
+        try:
+            for i in range(3):
+                results = await limiter.check_limits([(tight, 3, 60), (loose, 10, 60)])
+                assert results == [(False, 0), (False, 0)]
+
+            results = await limiter.check_limits([(tight, 3, 60), (loose, 10, 60)])
+            assert results[0][0] is True
+            assert 0 < results[0][1] <= 60
+            assert results[1] == (False, 0)
+
+            # The rejected request was not counted against the loose key
+            for i in range(7):
+                assert (await limiter.check_limits([(loose, 10, 60)]))[0] == (False, 0)
+            assert (await limiter.check_limits([(loose, 10, 60)]))[0][0] is True
+        finally:
+            await limiter.redis_client.delete(tight, loose)
+            await limiter.close()
@@ -12,7 +12,7 @@ Tests cover:
 
 import time
 from datetime import date
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import numpy as np
 import pytest
@@ -22,7 +22,7 @@ from app.services.scheduler.monte_carlo import (
     MonteCarloResult,
     TaskDistributionInput,
 )
-from app.services.scheduler.scheduler_service import SchedulerService
+from app.services.scheduler.scheduler_service import SchedulerService, TaskInput
 
 
 class TestMonteCarloResult:
@@ -440,6 +440,50 @@ class TestMonteCarloEngine:
                 project_start=date(2025, 1, 13),
             )
 
+    def test_prebuilt_graph_checked_once(self):
+        """Test a caller's graph is checked once, not on every iteration."""
+        scheduler = SchedulerService()
+        engine = MonteCarloEngine(iterations=20, scheduler=scheduler)
+        tasks = [
+            TaskDistributionInput(task_id="T001", dependencies=""),
+            TaskDistributionInput(task_id="T002", dependencies="T001"),
+        ]
+        graph = scheduler.build_task_graph(
+            [
+                TaskInput(task_id="T001", duration=1.0, dependencies=""),
+                TaskInput(task_id="T002", duration=1.0, dependencies="T001"),
+            ]
+        )
+
+        with patch.object(
+            scheduler, "check_task_graph", wraps=scheduler.check_task_graph
+        ) as check:
+            result = engine.simulate(
+                tasks=tasks,
+                duration_sampler=lambda task_id: 2.0,
+                project_start=date(2025, 1, 13),
+                graph=graph,
+            )
+
+        assert check.call_count == 1
+        assert result.mean_duration == 4.0
+
+    def test_mismatched_prebuilt_graph_rejected(self):
+        """Test a graph that does not describe the tasks is rejected up front."""
+        scheduler = SchedulerService()
+        engine = MonteCarloEngine(iterations=5, scheduler=scheduler)
+        graph = scheduler.build_task_graph(
+            [TaskInput(task_id="T001", duration=1.0, dependencies="")]
+        )
+
+        with pytest.raises(ValueError, match="does not match"):
+            engine.simulate(
+                tasks=[TaskDistributionInput(task_id="T999", dependencies="")],
+                duration_sampler=lambda task_id: 2.0,
+                project_start=date(2025, 1, 13),
+                graph=graph,
+            )
+
     def test_single_iteration_edge_case(self):
         """Test edge case with single iteration."""
         engine = MonteCarloEngine(iterations=1)
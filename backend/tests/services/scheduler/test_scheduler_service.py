@@ -215,6 +215,62 @@ class TestSchedulerServiceValidation:
             TaskInput(task_id="T001", duration=0.0, dependencies="")
 
 
+class TestSchedulerServicePrebuiltGraph:
+    """Test scheduling with a prebuilt dependency graph."""
+
+    def test_schedule_with_prebuilt_graph(self):
+        """Test prebuilt graph gives the same schedule as inline parsing."""
+        tasks = [
+            TaskInput(task_id="T001", duration=3.0, dependencies=""),
+            TaskInput(task_id="T002", duration=5.0, dependencies="T001"),
+        ]
+
+        scheduler = SchedulerService()
+        graph = scheduler.build_task_graph(tasks)
+        result = scheduler.calculate_schedule(
+            tasks=tasks,
+            project_start=date(2025, 1, 13),
+            graph=graph,
+        )
+
+        assert result.project_duration == 8.0
+        assert result.critical_path == ["T001", "T002"]
+
+    def test_reject_mismatched_graph(self):
+        """Test graph built for other tasks is rejected."""
+        scheduler = SchedulerService()
+        graph = scheduler.build_task_graph(
+            [TaskInput(task_id="T001", duration=3.0, dependencies="")]
+        )
+
+        with pytest.raises(SchedulerError, match="does not match"):
+            scheduler.calculate_schedule(
+                tasks=[TaskInput(task_id="T999", duration=3.0, dependencies="")],
+                project_start=date(2025, 1, 13),
+                graph=graph,
+            )
+
+    def test_reject_graph_with_different_edges(self):
+        """Test graph whose edges differ from task dependencies is rejected."""
+        scheduler = SchedulerService()
+        graph = scheduler.build_task_graph(
+            [
+                TaskInput(task_id="T001", duration=3.0, dependencies=""),
+                TaskInput(task_id="T002", duration=5.0, dependencies=""),
+            ]
+        )
+
+        with pytest.raises(SchedulerError, match="dependencies of task 'T002'"):
+            scheduler.calculate_schedule(
+                tasks=[
+                    TaskInput(task_id="T001", duration=3.0, dependencies=""),
+                    TaskInput(task_id="T002", duration=5.0, dependencies="T001"),
+                ],
+                project_start=date(2025, 1, 13),
+                graph=graph,
+            )
+
+
 class TestSchedulerServiceFractional:
     """Test fractional duration support."""
 
@@ -258,3 +258,49 @@ class TestTaskGraphProperties:
 
         graph.add_node("T001", duration=5.0)
         assert not graph.is_empty()
+
+
+class TestTaskGraphCycles:
+    """Test strongly connected component and cycle detection."""
+
+    def test_acyclic_graph_has_no_cycles(self):
+        """Test DAG reports no cycles."""
+        graph = TaskGraph()
+        for task_id in ["T001", "T002", "T003"]:
+            graph.add_node(task_id)
+        graph.add_edge("T001", "T002")
+        graph.add_edge("T002", "T003")
+
+        assert graph.find_cycles() == []
+        assert len(graph.strongly_connected_components()) == 3
+
+    def test_reports_every_cycle(self):
+        """Test all independent cycles are reported, not just the first."""
+        graph = TaskGraph()
+        for task_id in ["A", "B", "C", "D", "E", "F"]:
+            graph.add_node(task_id)
+        graph.add_edge("A", "B")
+        graph.add_edge("B", "A")
+        graph.add_edge("C", "D")
+        graph.add_edge("D", "E")
+        graph.add_edge("E", "C")
+        graph.add_edge("B", "F")
+
+        cycles = sorted(graph.find_cycles())
+
+        assert cycles == [["A", "B"], ["C", "D", "E"]]
+
+    def test_long_chain_does_not_hit_recursion_limit(self):
+        """Test iterative SCC handles chains longer than the recursion limit."""
+        graph = TaskGraph()
+        size = 20000
+        for i in range(size):
+            graph.add_node(f"T{i}")
+        for i in range(1, size):
+            graph.add_edge(f"T{i - 1}", f"T{i}")
+        graph.add_edge(f"T{size - 1}", "T0")
+
+        cycles = graph.find_cycles()
+
+        assert len(cycles) == 1
+        assert len(cycles[0]) == size
@@ -4,6 +4,7 @@ Unit tests for AnalyticsService.
 Tests cover all 5 core functions with comprehensive edge cases, mocking, and performance benchmarks.
 """
 
+import asyncio
 import pytest
 from datetime import date, datetime, timedelta
 from uuid import uuid4, UUID
@@ -13,6 +14,7 @@ import time
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.services import analytics_service as analytics_module
 from app.services.analytics_service import AnalyticsService, AnalyticsError
 from app.models.project import Project
 from app.models.simulation_result import SimulationResult
@@ -709,6 +711,194 @@ class TestCaching:
             assert isinstance(score, float)
 
 
+class TestAnalyticsOverview:
+    """Test get_analytics_overview aggregation."""
+
+    @pytest.mark.asyncio
+    async def test_overview_loads_each_entity_once(self, analytics_service, mock_project):
+        """Test overview selects shared rows once and writes one pipeline."""
+        mock_db = AsyncMock(spec=AsyncSession)
+
+        sim_result = MagicMock()
+        sim_result.scalar_one_or_none.return_value = None
+        mock_db.execute.return_value = sim_result
+
+        with patch.object(
+            analytics_service, "_get_many_cached", return_value=[None] * 5
+        ), patch.object(
+            analytics_service, "_set_many_cached"
+        ) as mock_set, patch.object(
+            analytics_service, "_get_cached"
+        ) as mock_get:
+            overview = await analytics_service.get_analytics_overview(
+                mock_project.id, mock_db, project=mock_project
+            )
+
+        # Latest and earliest simulation only; the project was passed in
+        assert mock_db.execute.call_count == 2
+        mock_get.assert_not_called()
+        mock_set.assert_called_once()
+        assert len(mock_set.call_args.args[0]) == 5
+        assert overview["progress"]["tasks_completed"] == 2
+        assert overview["resources"]["total_resources"] == 3
+        assert overview["simulation"]["risk_level"] == "unknown"
+        assert 0 <= overview["health_score"] <= 100
+
+    @pytest.mark.asyncio
+    async def test_overview_served_from_cache(self, analytics_service, mock_project):
+        """Test overview with every metric cached skips the database."""
+        mock_db = AsyncMock(spec=AsyncSession)
+
+        cached = [
+            {"health_score": 81.0},
+            {"critical_tasks": ["T1"], "total_duration": 5},
+            {"utilization_pct": 80.0},
+            {"risk_level": "low"},
+            {"completion_pct": 50.0, "estimated_completion_date": "2025-06-01"},
+        ]
+
+        with patch.object(
+            analytics_service, "_get_many_cached", return_value=cached
+        ), patch.object(analytics_service, "_set_many_cached") as mock_set:
+            overview = await analytics_service.get_analytics_overview(
+                mock_project.id, mock_db
+            )
+
+        mock_db.execute.assert_not_called()
+        mock_set.assert_called_once_with({})
+        assert overview["health_score"] == 81.0
+        assert overview["progress"]["estimated_completion_date"] == date(2025, 6, 1)
+
+
+class TestStaleWhileRevalidate:
+    """Test stale-while-revalidate caching."""
+
+    @staticmethod
+    def _entry(value, stale_in):
+        return json.dumps({"value": value, "stale_at": time.time() + stale_in})
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_served_with_single_refresh(self):
+        """Test stale values are returned while one refresh runs."""
+        service = AnalyticsService()
+        mock_redis = AsyncMock()
+        mock_redis.get.return_value = self._entry({"v": 1}, stale_in=-5)
+        mock_redis.set.return_value = True
+        service._redis_client = mock_redis
+        refresh = AsyncMock(return_value={"v": 2})
+
+        values = await asyncio.gather(
+            *(service._get_cached("analytics:test", refresh=refresh) for _ in range(5))
+        )
+        await asyncio.gather(*analytics_module._background_tasks)
+
+        assert values == [{"v": 1}] * 5
+        refresh.assert_awaited_once()
+        key, ttl, payload = mock_redis.setex.call_args.args
+        assert key == "analytics:test"
+        assert json.loads(payload)["value"] == {"v": 2}
+        mock_redis.delete.assert_awaited_once_with("analytics:test:refresh_lock")
+
+    @pytest.mark.asyncio
+    async def test_fresh_entry_not_refreshed(self):
+        """Test fresh values do not trigger a refresh."""
+        service = AnalyticsService()
+        mock_redis = AsyncMock()
+        mock_redis.get.return_value = self._entry({"v": 1}, stale_in=60)
+        service._redis_client = mock_redis
+        refresh = AsyncMock()
+
+        assert await service._get_cached("analytics:test", refresh=refresh) == {"v": 1}
+        refresh.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_refresh_skipped_when_locked_elsewhere(self):
+        """Test no refresh runs when another process holds the lock."""
+        service = AnalyticsService()
+        mock_redis = AsyncMock()
+        mock_redis.set.return_value = None
+        service._redis_client = mock_redis
+        refresh = AsyncMock()
+
+        await service._refresh("analytics:test", refresh)
+
+        refresh.assert_not_called()
+        assert "analytics:test" not in analytics_module._refreshing
+
+    def test_jittered_ttl_bounds(self):
+        """Test fresh lifetimes are spread around cache_ttl."""
+        service = AnalyticsService(cache_ttl=300)
+        ttls = {service._jittered_ttl() for _ in range(200)}
+
+        assert min(ttls) >= 270
+        assert max(ttls) <= 330
+        assert len(ttls) > 1
+
+    @pytest.mark.asyncio
+    async def test_invalidate_project(self):
+        """Test invalidation deletes every overview key for the project."""
+        service = AnalyticsService()
+        mock_redis = AsyncMock()
+        service._redis_client = mock_redis
+        project_id = uuid4()
+
+        await service.invalidate_project(project_id)
+
+        keys = mock_redis.delete.call_args.args
+        assert len(keys) == 5
+        assert all(key.endswith(str(project_id)) for key in keys)
+        mock_redis.setex.assert_awaited_once_with(
+            f"analytics:invalidated:{project_id}",
+            analytics_module.settings.database_replica_max_lag,
+            "1",
+        )
+
+    @pytest.mark.asyncio
+    async def test_recompute_uses_primary_after_invalidation(self):
+        """Test recomputes right after an invalidation bypass the replicas."""
+        service = AnalyticsService()
+        mock_redis = AsyncMock()
+        mock_redis.exists.return_value = 1
+        service._redis_client = mock_redis
+        primary, replica = MagicMock(), MagicMock()
+
+        with patch.object(
+            analytics_module, "get_read_replica_urls", return_value=["replica"]
+        ), patch.object(
+            analytics_module, "get_session_factory", return_value=primary
+        ), patch.object(
+            analytics_module, "get_read_session_factory", return_value=replica
+        ), patch.object(service, "_health_score", return_value=70.0):
+            value = await service._recompute("health", uuid4())
+
+        assert value == {"health_score": 70.0}
+        primary.assert_called_once()
+        replica.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_replica_result_dropped_if_invalidated_meanwhile(self):
+        """Test a replica recompute overtaken by an invalidation is not cached."""
+        service = AnalyticsService()
+        mock_redis = AsyncMock()
+        # Not invalidated when the recompute starts, invalidated by its end
+        mock_redis.exists.side_effect = [0, 1]
+        mock_redis.set.return_value = True
+        service._redis_client = mock_redis
+        project_id = uuid4()
+
+        with patch.object(
+            analytics_module, "get_read_replica_urls", return_value=["replica"]
+        ), patch.object(
+            analytics_module, "get_read_session_factory", return_value=MagicMock()
+        ), patch.object(service, "_health_score", return_value=70.0):
+            await service._refresh(
+                "analytics:test",
+                lambda: service._recompute("health", project_id),
+            )
+
+        mock_redis.setex.assert_not_called()
+
+
 class TestHelperMethods:
     """Test private helper methods."""
 
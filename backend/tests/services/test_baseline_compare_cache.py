@@ -0,0 +1,149 @@
+"""Tests for baseline comparison caching and precomputation."""
+
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+
+from app.schemas.project import ProjectUpdate
+from app.services import baseline_compare_cache
+from app.services.baseline_compare_cache import BaselineComparisonCache, etag_matches
+from app.services.baseline_service import DEFAULT_COMPARISON_LIMIT, BaselineService
+from app.services.project_service import ProjectService
+
+
+def _tasks(slip: int = 0):
+    return [
+        {"id": f"T{i}", "name": f"Task {i}", "end_date": f"2025-02-{10 + i:02d}"}
+        for i in range(5)
+    ] + [{"id": "T9", "name": "Late", "end_date": f"2025-03-{1 + slip:02d}"}]
+
+
+@pytest.fixture(autouse=True)
+def local_cache(monkeypatch):
+    """Keep the comparison cache in-process."""
+    monkeypatch.setattr(
+        baseline_compare_cache.comparison_cache, "_redis_retry_at", float("inf")
+    )
+    monkeypatch.setattr(baseline_compare_cache.comparison_cache, "_redis_client", None)
+
+
+@pytest.mark.asyncio
+class TestComparisonPrecomputation:
+    """Test cached comparisons against the active baseline."""
+
+    async def _active_baseline(self, db, project):
+        service = BaselineService()
+        await ProjectService(db).update_project(
+            project.id, ProjectUpdate(configuration={"tasks": _tasks()})
+        )
+        baseline = await service.create_baseline(project.id, "Plan", None, db)
+        await service.set_baseline_active(baseline.id, project.id, db)
+        return service, baseline
+
+    async def test_activation_precomputes_default_page(self, test_db_session, test_project):
+        """The first page is served from cache after activation."""
+        service, baseline = await self._active_baseline(test_db_session, test_project)
+
+        with patch.object(BaselineService, "compare_to_baseline") as compare:
+            etag, comparison = await service.get_comparison(
+                baseline.id, test_project.id, test_db_session, limit=DEFAULT_COMPARISON_LIMIT
+            )
+            not_modified = await service.get_comparison(
+                baseline.id,
+                test_project.id,
+                test_db_session,
+                limit=DEFAULT_COMPARISON_LIMIT,
+                if_none_match=etag,
+            )
+
+        compare.assert_not_called()
+        assert comparison["summary"]["total_tasks"] == 6
+        assert not_modified == (etag, None)
+
+    async def test_task_changes_refresh_comparison(self, test_db_session, test_project):
+        """Updating tasks changes the ETag and recomputes the active comparison."""
+        service, baseline = await self._active_baseline(test_db_session, test_project)
+        etag, _ = await service.get_comparison(
+            baseline.id, test_project.id, test_db_session, limit=DEFAULT_COMPARISON_LIMIT
+        )
+
+        await ProjectService(test_db_session).update_project(
+            test_project.id, ProjectUpdate(configuration={"tasks": _tasks(slip=3)})
+        )
+        with patch.object(BaselineService, "compare_to_baseline") as compare:
+            new_etag, comparison = await service.get_comparison(
+                baseline.id,
+                test_project.id,
+                test_db_session,
+                limit=DEFAULT_COMPARISON_LIMIT,
+                if_none_match=etag,
+            )
+
+        compare.assert_not_called()
+        assert new_etag != etag
+        assert [v["variance_days"] for v in comparison["task_variances"]] == [3]
+
+    async def test_other_projects_baseline_is_rejected(
+        self, test_db_session, test_project, test_user
+    ):
+        """Cached comparisons are never served under another project."""
+        from app.models.project import Project
+        from app.services.baseline_service import BaselineError
+
+        _, baseline = await self._active_baseline(test_db_session, test_project)
+        other = Project(name="Other", owner_id=test_user.id, configuration={})
+        test_db_session.add(other)
+        await test_db_session.commit()
+
+        with pytest.raises(BaselineError, match="does not belong"):
+            await BaselineService().get_comparison(baseline.id, other.id, test_db_session)
+
+
+@pytest.mark.asyncio
+class TestCompareEndpointCaching:
+    """Test the conditional response of the compare endpoint."""
+
+    async def test_returns_304_if_etag_matches(self, client, test_user):
+        """A matching If-None-Match header returns 304 with the ETag."""
+        headers = {"Authorization": f"Bearer {test_user.id}", "If-None-Match": '"etag"'}
+
+        with patch.object(BaselineService, "get_comparison") as compare:
+            compare.return_value = ('"etag"', None)
+            response = await client.get(
+                f"/api/v1/projects/{uuid4()}/baselines/{uuid4()}/compare",
+                headers=headers,
+            )
+
+        assert response.status_code == 304
+        assert response.headers["etag"] == '"etag"'
+        assert compare.call_args.kwargs["if_none_match"] == '"etag"'
+
+
+class TestBaselineComparisonCache:
+    """Test the in-process fallback."""
+
+    @pytest.mark.asyncio
+    async def test_lru_and_ttl(self, monkeypatch):
+        """Entries expire after their TTL and the oldest is evicted."""
+        cache = BaselineComparisonCache(max_local_entries=2)
+        monkeypatch.setattr(cache, "_redis_retry_at", float("inf"))
+
+        await cache.set("a", {"v": 1})
+        await cache.set("b", {"v": 2})
+        assert await cache.get("a") == {"v": 1}
+        await cache.set("c", {"v": 3})
+        await cache.set("expired", 1, ttl=0)
+
+        assert await cache.get("b") is None
+        assert await cache.get("c") == {"v": 3}
+        assert await cache.get("expired") is None
+
+    def test_etag_matches(self):
+        """Strong, weak, listed and wildcard validators match."""
+        assert etag_matches('"abc"', '"abc"')
+        assert etag_matches('W/"abc"', '"abc"')
+        assert etag_matches('"x", "abc"', '"abc"')
+        assert etag_matches("*", '"abc"')
+        assert not etag_matches(None, '"abc"')
+        assert not etag_matches('"x"', '"abc"')
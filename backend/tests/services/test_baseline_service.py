@@ -37,7 +37,8 @@ class TestBaselineCreation:
         mock_db.begin_nested.return_value = mock_nested
 
         # Mock project and snapshot building
-        with patch.object(service, '_build_snapshot_data') as mock_build:
+        with patch.object(service, '_build_snapshot_data') as mock_build, \
+                patch.object(service, '_delta_parent', return_value=None):
             mock_build.return_value = {"project": {}, "tasks": []}
 
             # Act
@@ -76,7 +77,8 @@ class TestBaselineCreation:
             "tasks": [{"id": "1", "name": "Task 1"}]
         }
 
-        with patch.object(service, '_build_snapshot_data') as mock_build:
+        with patch.object(service, '_build_snapshot_data') as mock_build, \
+                patch.object(service, '_delta_parent', return_value=None):
             mock_build.return_value = snapshot_data
 
             baseline = await service.create_baseline(
@@ -108,7 +110,8 @@ class TestBaselineCreation:
             "tasks": [{"data": "x" * (11 * 1024 * 1024)}]  # 11MB
         }
 
-        with patch.object(service, '_build_snapshot_data') as mock_build:
+        with patch.object(service, '_build_snapshot_data') as mock_build, \
+                patch.object(service, '_delta_parent', return_value=None):
             mock_build.return_value = huge_snapshot
 
             with pytest.raises(ValueError, match="exceeds maximum allowed size"):
@@ -130,7 +133,8 @@ class TestBaselineCreation:
         mock_nested.__aexit__ = AsyncMock()
         mock_db.begin_nested.return_value = mock_nested
 
-        with patch.object(service, '_build_snapshot_data') as mock_build:
+        with patch.object(service, '_build_snapshot_data') as mock_build, \
+                patch.object(service, '_delta_parent', return_value=None):
             mock_build.return_value = {"project": {}, "tasks": []}
 
             await service.create_baseline(
@@ -0,0 +1,305 @@
+"""Tests for columnar baseline snapshots and vectorized comparison."""
+
+import time
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy.orm.attributes import flag_modified
+
+from app.services import baseline_service as baseline_module
+from app.services.baseline_service import BaselineService
+from app.services.baseline_snapshot import ColumnarSnapshot, SnapshotDelta, diff_snapshots
+
+
+def _tasks(count: int, slip_every: int = 0, start: date = date(2025, 1, 6)):
+    tasks = []
+    for i in range(count):
+        end = start + timedelta(days=i % 30 + 1)
+        if slip_every and i % slip_every == 0:
+            end += timedelta(days=2)
+        tasks.append(
+            {
+                "id": f"T{i:05d}",
+                "name": f"Task {i}",
+                "start_date": start.isoformat(),
+                "end_date": end.isoformat(),
+                "duration": i % 30 + 1,
+                "status": "in_progress" if i % 2 else "not_started",
+                "dependencies": [f"T{i - 1:05d}"] if i else [],
+            }
+        )
+    return tasks
+
+
+class TestColumnarSnapshot:
+    """Test encoding and decoding."""
+
+    def test_round_trip_preserves_tasks(self):
+        """Tasks survive serialization, including extra fields."""
+        tasks = [
+            {"id": "b", "name": "Ünïcode", "duration": 2.5, "dependencies": ["a"],
+             "assignee": "sam"},
+            {"id": "a", "name": "First", "start_date": "2025-01-06T09:00:00",
+             "end_date": "2025-01-08", "duration": 3, "status": "completed"},
+        ]
+
+        snapshot = ColumnarSnapshot.from_bytes(ColumnarSnapshot.from_tasks(tasks).to_bytes())
+
+        assert snapshot.task_ids.tolist() == ["a", "b"]
+        assert snapshot.to_tasks() == [
+            {"id": "a", "name": "First", "start_date": "2025-01-06",
+             "end_date": "2025-01-08", "duration": 3, "status": "completed"},
+            {"id": "b", "name": "Ünïcode", "duration": 2.5, "dependencies": ["a"],
+             "assignee": "sam"},
+        ]
+
+    def test_date_objects_are_stored_as_days(self):
+        """date and datetime values are encoded like their ISO strings."""
+        tasks = [
+            {"id": "a", "start_date": date(2025, 1, 6), "end_date": datetime(2025, 1, 8, 17, 30)},
+            {"id": "b", "start_date": "2025-01-06", "end_date": "2025-01-08"},
+        ]
+
+        snapshot = ColumnarSnapshot.from_tasks(tasks)
+
+        assert snapshot.start_days.tolist()[0] == snapshot.start_days.tolist()[1]
+        assert snapshot.end_days.tolist()[0] == snapshot.end_days.tolist()[1]
+        assert snapshot.to_tasks()[0]["end_date"] == "2025-01-08"
+
+    def test_malformed_dates_are_missing(self):
+        """An unparseable date only blanks that value, not the snapshot."""
+        tasks = [
+            {"id": "a", "start_date": "not a date", "end_date": "2025-02-30"},
+            {"id": "b", "start_date": "2025-01-06", "end_date": "2025-01-08"},
+        ]
+
+        restored = ColumnarSnapshot.from_tasks(tasks).to_tasks()
+
+        assert "start_date" not in restored[0] and "end_date" not in restored[0]
+        assert restored[1]["start_date"] == "2025-01-06"
+        assert restored[1]["end_date"] == "2025-01-08"
+
+    def test_empty_snapshot(self):
+        """Snapshots without tasks encode and compare."""
+        empty = ColumnarSnapshot.from_bytes(ColumnarSnapshot.from_tasks([]).to_bytes())
+
+        result = diff_snapshots(empty, ColumnarSnapshot.from_tasks(_tasks(2)))
+
+        assert len(empty) == 0
+        assert [t["task_id"] for t in result["new_tasks"]] == ["T00000", "T00001"]
+        assert result["summary"]["avg_variance_days"] == 0.0
+
+
+class TestSnapshotDelta:
+    """Test delta encoding between snapshots."""
+
+    def test_delta_round_trip(self):
+        """Applying a delta to its parent rebuilds the child exactly."""
+        parent_tasks = _tasks(200)
+        child_tasks = [dict(t) for t in parent_tasks[5:]]
+        child_tasks[0]["status"] = "completed"
+        child_tasks[1]["name"] = "Renamed"
+        child_tasks[2]["notes"] = "extra field"
+        child_tasks.append({"id": "Z1", "name": "New", "status": "blocked"})
+        parent = ColumnarSnapshot.from_tasks(parent_tasks)
+        child = ColumnarSnapshot.from_tasks(child_tasks)
+
+        delta = SnapshotDelta.from_bytes(SnapshotDelta.between(parent, child).to_bytes())
+        rebuilt = delta.apply(parent)
+
+        assert len(delta.removed_ids) == 5
+        assert sorted(delta.upserts.task_ids.tolist()) == ["T00005", "T00006", "T00007", "Z1"]
+        assert rebuilt.to_tasks() == child.to_tasks()
+        assert len(delta.to_bytes()) < len(child.to_bytes()) / 2
+
+
+class TestDiffSnapshots:
+    """Test the vectorized comparison."""
+
+    def test_task_variances(self):
+        """Date, duration, status and dependency changes are detected."""
+        baseline = [
+            {"id": "a", "name": "A", "end_date": "2025-01-10", "duration": 3,
+             "status": "not_started", "dependencies": ["x", "y"]},
+            {"id": "b", "name": "B", "duration": 5},
+            {"id": "c", "name": "C", "end_date": "2025-01-10"},
+            {"id": "gone", "name": "Gone"},
+        ]
+        current = [
+            {"id": "a", "name": "A", "end_date": "2025-01-13", "duration": 3,
+             "status": "in_progress", "dependencies": ["y", "x"]},
+            {"id": "b", "name": "B", "duration": 3},
+            {"id": "c", "name": "C", "end_date": "2025-01-10"},
+            {"id": "new", "name": "New"},
+        ]
+
+        result = diff_snapshots(
+            ColumnarSnapshot.from_tasks(baseline), ColumnarSnapshot.from_tasks(current)
+        )
+
+        by_id = {v["task_id"]: v for v in result["task_variances"]}
+        assert set(by_id) == {"a", "b"}
+        assert by_id["a"]["variance_days"] == 3
+        assert by_id["a"]["is_behind"]
+        assert by_id["a"]["status_changed"]
+        assert not by_id["a"]["dependencies_changed"]
+        assert by_id["b"]["variance_days"] == -2
+        assert by_id["b"]["duration_variance"] == -2
+        assert result["new_tasks"] == [
+            {"task_id": "new", "task_name": "New", "added_after_baseline": True}
+        ]
+        assert [t["task_id"] for t in result["deleted_tasks"]] == ["gone"]
+        assert result["summary"] == {
+            "total_tasks": 4,
+            "tasks_ahead": 1,
+            "tasks_behind": 1,
+            "tasks_on_track": 1,
+            "avg_variance_days": 0.33,
+            "critical_path_variance_days": 0.0,
+        }
+
+    def test_pagination(self):
+        """Only the requested page is materialized; totals cover all tasks."""
+        baseline = ColumnarSnapshot.from_tasks(_tasks(100))
+        current = ColumnarSnapshot.from_tasks(_tasks(100, slip_every=5))
+
+        result = diff_snapshots(baseline, current, offset=10, limit=5)
+
+        assert result["pagination"] == {"offset": 10, "limit": 5, "total": 20}
+        assert [v["task_id"] for v in result["task_variances"]] == [
+            "T00050", "T00055", "T00060", "T00065", "T00070"
+        ]
+        assert result["summary"]["tasks_behind"] == 20
+
+    def test_large_comparison_is_fast(self):
+        """Comparing two 20k-task baselines stays well under a second."""
+        baseline = ColumnarSnapshot.from_tasks(_tasks(20000)).to_bytes()
+        current = ColumnarSnapshot.from_tasks(_tasks(20000, slip_every=3)).to_bytes()
+
+        started = time.perf_counter()
+        result = diff_snapshots(
+            ColumnarSnapshot.from_bytes(baseline),
+            ColumnarSnapshot.from_bytes(current),
+            limit=100,
+        )
+        elapsed = time.perf_counter() - started
+
+        assert result["pagination"]["total"] == 6667
+        assert len(result["task_variances"]) == 100
+        assert elapsed < 1.0
+
+
+@pytest.mark.asyncio
+class TestBaselineServiceColumnar:
+    """Test baseline creation and comparison with columnar storage."""
+
+    async def test_create_and_compare(self, test_db_session, test_project):
+        """Tasks are stored column-wise and compared against current state."""
+        service = BaselineService()
+        test_project.configuration = {**test_project.configuration, "tasks": _tasks(50)}
+        await test_db_session.commit()
+
+        baseline = await service.create_baseline(
+            test_project.id, "Plan", None, test_db_session
+        )
+
+        assert baseline.snapshot_data["tasks"] == []
+        assert "tasks" not in baseline.snapshot_data["project"]["configuration"]
+        assert baseline.snapshot_data["snapshot_metadata"]["total_tasks"] == 50
+        materialized = await service.materialize_snapshot(baseline, test_db_session)
+        assert len(materialized["tasks"]) == 50
+
+        test_project.configuration["tasks"] = _tasks(50, slip_every=10)[1:]
+        flag_modified(test_project, "configuration")
+        await test_db_session.commit()
+
+        comparison = await service.compare_to_baseline(
+            baseline.id, test_project.id, test_db_session, limit=2
+        )
+
+        assert comparison["pagination"] == {"offset": 0, "limit": 2, "total": 4}
+        assert [v["task_id"] for v in comparison["task_variances"]] == ["T00010", "T00020"]
+        assert [t["task_id"] for t in comparison["deleted_tasks"]] == ["T00000"]
+        assert comparison["baseline"]["name"] == "Plan"
+
+    async def test_compare_legacy_json_baseline(self, test_db_session, test_project):
+        """Baselines without columns fall back to tasks in snapshot_data."""
+        from app.models.baseline import ProjectBaseline
+
+        baseline = ProjectBaseline(
+            project_id=test_project.id,
+            name="Legacy",
+            snapshot_data={"tasks": [{"id": "old", "name": "Old"}]},
+        )
+        test_db_session.add(baseline)
+        await test_db_session.commit()
+
+        comparison = await BaselineService().compare_to_baseline(
+            baseline.id, test_project.id, test_db_session
+        )
+
+        assert comparison["deleted_tasks"][0]["task_id"] == "old"
+        assert comparison["pagination"]["total"] == 0
+
+
+@pytest.mark.asyncio
+class TestBaselineDeltaChains:
+    """Test keyframe + delta storage of successive baselines."""
+
+    async def _snapshot(self, service, project, db, name, tasks):
+        project.configuration = {**project.configuration, "tasks": tasks}
+        await db.commit()
+        return await service.create_baseline(project.id, name, None, db)
+
+    async def test_successive_baselines_are_deltas(
+        self, test_db_session, test_project, monkeypatch
+    ):
+        """Baselines chain as deltas and start a new keyframe at max depth."""
+        monkeypatch.setattr(baseline_module, "MAX_DELTA_DEPTH", 2)
+        service = BaselineService()
+        weeks = [_tasks(500, slip_every=week + 50) for week in range(4)]
+
+        baselines = [
+            await self._snapshot(service, test_project, test_db_session, f"W{i}", tasks)
+            for i, tasks in enumerate(weeks)
+        ]
+
+        assert [b.delta_depth for b in baselines] == [0, 1, 2, 0]
+        assert [b.is_keyframe for b in baselines] == [True, False, False, True]
+        assert baselines[1].base_baseline_id == baselines[0].id
+        assert baselines[1].snapshot_size_bytes < baselines[0].snapshot_size_bytes / 3
+        assert all(b.write_time_ms is not None for b in baselines)
+
+        baseline_module._materialized_cache.clear()
+        rebuilt = await service.load_snapshot(baselines[2], test_db_session)
+        assert rebuilt.to_tasks() == ColumnarSnapshot.from_tasks(weeks[2]).to_tasks()
+
+    async def test_large_changes_store_keyframe(self, test_db_session, test_project):
+        """A baseline that rewrites most tasks is stored in full."""
+        service = BaselineService()
+        await self._snapshot(service, test_project, test_db_session, "A", _tasks(50))
+
+        rewritten = await self._snapshot(
+            service, test_project, test_db_session, "B", _tasks(50, slip_every=1)
+        )
+
+        assert rewritten.is_keyframe
+
+    async def test_delete_rebases_dependents(self, test_db_session, test_project):
+        """Deleting a baseline keeps its dependents reconstructible."""
+        service = BaselineService()
+        weeks = [_tasks(100, slip_every=week + 5) for week in range(3)]
+        first, middle, last = [
+            await self._snapshot(service, test_project, test_db_session, f"W{i}", tasks)
+            for i, tasks in enumerate(weeks)
+        ]
+
+        await service.delete_baseline(middle.id, test_project.id, test_db_session)
+        await service.delete_baseline(first.id, test_project.id, test_db_session)
+        await test_db_session.refresh(last)
+
+        assert last.is_keyframe
+        assert last.delta_depth == 0
+        baseline_module._materialized_cache.clear()
+        rebuilt = await service.load_snapshot(last, test_db_session)
+        assert rebuilt.to_tasks() == ColumnarSnapshot.from_tasks(weeks[2]).to_tasks()
@@ -0,0 +1,253 @@
+"""Tests for ExcelBatchImportService parallel workbook import."""
+
+import io
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from fastapi import HTTPException
+from openpyxl import Workbook
+from sqlalchemy import select
+
+from app.models.project import Project
+from app.services.excel_import_service import (
+    ExcelBatchImportService,
+    ExcelImportError,
+    expand_uploads,
+    parse_import_file,
+)
+
+HEADERS = ["Task ID", "Task Name", "Optimistic", "Most Likely", "Pessimistic", "Dependencies"]
+
+
+def _workbook(sheets: dict) -> bytes:
+    """Build an .xlsx with one sheet per entry of {title: rows}."""
+    wb = Workbook()
+    wb.remove(wb.active)
+    for title, rows in sheets.items():
+        ws = wb.create_sheet(title)
+        for row in rows:
+            ws.append(row)
+    buffer = io.BytesIO()
+    wb.save(buffer)
+    return buffer.getvalue()
+
+
+def _tasks(prefix: str, deps_of_second: str = None) -> list:
+    """Header plus two tasks where the second depends on the first."""
+    return [
+        HEADERS,
+        [f"{prefix}-1", "Design", 1.0, 2.0, 3.0, ""],
+        [f"{prefix}-2", "Build", 2.0, 4.0, 6.0, deps_of_second or f"{prefix}-1"],
+    ]
+
+
+def _zip(entries: dict) -> bytes:
+    """Build a zip archive from {name: bytes}."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        for name, content in entries.items():
+            archive.writestr(name, content)
+    return buffer.getvalue()
+
+
+class TestParseImportFile:
+    """Test the per-workbook worker function."""
+
+    def test_parses_every_task_sheet(self):
+        """All task sheets are parsed; non-task sheets are skipped."""
+        content = _workbook(
+            {
+                "Backend": _tasks("BE"),
+                "Frontend": _tasks("FE"),
+                "Notes": [["Read me first"]],
+            }
+        )
+
+        result = parse_import_file("portfolio.xlsx", content)
+
+        assert result.errors == []
+        assert [s.sheet_name for s in result.sheets] == ["Backend", "Frontend"]
+        assert result.task_count == 4
+        assert result.sheets[0].tasks[1]["dependencies"] == ["BE-1"]
+        assert result.parse_ms > 0
+
+    def test_reports_cycles_per_sheet(self):
+        """Dependency graphs are validated per sheet."""
+        cyclic = [
+            HEADERS,
+            ["A", "First", 1.0, 2.0, 3.0, "B"],
+            ["B", "Second", 1.0, 2.0, 3.0, "A"],
+        ]
+        content = _workbook({"Good": _tasks("G"), "Bad": cyclic})
+
+        result = parse_import_file("mixed.xlsx", content)
+
+        assert [s.sheet_name for s in result.sheets] == ["Good"]
+        assert len(result.errors) == 1
+        assert result.errors[0].startswith("Sheet 'Bad': Circular dependency")
+
+    def test_parses_only_requested_sheets(self):
+        """A sheet job parses just the sheets it was given."""
+        content = _workbook({"Backend": _tasks("BE"), "Frontend": _tasks("FE")})
+
+        result = parse_import_file("portfolio.xlsx", content, ["Frontend"])
+
+        assert [s.sheet_name for s in result.sheets] == ["Frontend"]
+
+    def test_reports_unparseable_file(self):
+        """Invalid workbooks are reported, not raised."""
+        result = parse_import_file("broken.xlsx", b"not a workbook")
+
+        assert result.sheets == []
+        assert "Not a valid Excel file" in result.errors[0]
+
+
+class TestExpandUploads:
+    """Test zip expansion and batch limits."""
+
+    def test_expands_zip_archives(self):
+        """Excel entries are extracted; other entries are ignored."""
+        archive = _zip(
+            {
+                "team/a.xlsx": _workbook({"Tasks": _tasks("A")}),
+                "__MACOSX/team/._a.xlsx": b"junk",
+                "readme.txt": b"hello",
+            }
+        )
+
+        files = expand_uploads([("batch.zip", archive), ("b.xlsx", b"PK")])
+
+        assert [name for name, _ in files] == ["batch.zip/team/a.xlsx", "b.xlsx"]
+
+    def test_rejects_unsupported_files(self):
+        """Non-Excel uploads are rejected."""
+        with pytest.raises(ExcelImportError, match="Unsupported file type"):
+            expand_uploads([("notes.csv", b"a,b")])
+
+    def test_rejects_oversize_archive_before_reading(self, monkeypatch):
+        """Declared uncompressed size is checked before decompression."""
+        monkeypatch.setattr(
+            "app.services.excel_import_service.MAX_IMPORT_UNCOMPRESSED_SIZE", 10
+        )
+        archive = _zip({"big.xlsx": b"x" * 100})
+
+        with pytest.raises(ExcelImportError, match="exceeds"):
+            expand_uploads([("batch.zip", archive)])
+
+
+@pytest.mark.asyncio
+class TestExcelBatchImportService:
+    """Test suite for ExcelBatchImportService."""
+
+    async def test_imports_all_sheets_in_one_transaction(self, test_db_session, test_user):
+        """Each task sheet of each workbook becomes a project."""
+        uploads = [
+            ("alpha.xlsx", _workbook({"Tasks": _tasks("A")})),
+            (
+                "bundle.zip",
+                _zip({"beta.xlsx": _workbook({"API": _tasks("B"), "UI": _tasks("C")})}),
+            ),
+        ]
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            service = ExcelBatchImportService(test_db_session, executor=executor)
+            result = await service.import_files(test_user.id, uploads)
+
+        assert result.errors == {}
+        assert [project.name for project, _, _ in result.projects] == [
+            "alpha",
+            "beta - API",
+            "beta - UI",
+        ]
+        stored = (await test_db_session.execute(select(Project))).scalars().all()
+        assert len(stored) == 3
+        alpha = next(p for p in stored if p.name == "alpha")
+        assert alpha.configuration["tasks"][0]["id"] == "A-1"
+        assert alpha.configuration["import"]["filename"] == "alpha.xlsx"
+
+    async def test_failed_file_imports_nothing(self, test_db_session, test_user):
+        """A single invalid workbook aborts the whole batch."""
+        uploads = [
+            ("good.xlsx", _workbook({"Tasks": _tasks("A")})),
+            ("bad.xlsx", _workbook({"Tasks": _tasks("B", deps_of_second="Z-9")})),
+        ]
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            service = ExcelBatchImportService(test_db_session, executor=executor)
+            result = await service.import_files(test_user.id, uploads)
+
+        assert list(result.errors) == ["bad.xlsx"]
+        assert result.projects == []
+        stored = (await test_db_session.execute(select(Project))).scalars().all()
+        assert stored == []
+
+    async def test_batch_over_quota_imports_nothing(self, test_db_session, test_user):
+        """The whole batch must fit in the owner's project quota."""
+        uploads = [
+            ("alpha.xlsx", _workbook({"A": _tasks("A"), "B": _tasks("B")})),
+            ("beta.xlsx", _workbook({"C": _tasks("C"), "D": _tasks("D")})),
+        ]
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            service = ExcelBatchImportService(test_db_session, executor=executor)
+            with pytest.raises(HTTPException) as exc_info:
+                await service.import_files(test_user.id, uploads)
+
+        assert exc_info.value.status_code == 403
+        assert exc_info.value.detail["requested"] == 4
+        stored = (await test_db_session.execute(select(Project))).scalars().all()
+        assert stored == []
+
+    async def test_import_refreshes_cached_project_total(self, test_db_session, test_user):
+        """Listing totals cached before the import include the new projects."""
+        from app.services.project_service import ProjectService
+
+        project_service = ProjectService(test_db_session)
+        _, total_before = await project_service.list_projects(test_user.id)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            service = ExcelBatchImportService(test_db_session, executor=executor)
+            await service.import_files(
+                test_user.id, [("alpha.xlsx", _workbook({"Tasks": _tasks("A")}))]
+            )
+
+        _, total_after = await project_service.list_projects(test_user.id)
+        assert (total_before, total_after) == (0, 1)
+
+    async def test_parses_each_sheet_as_its_own_job(self, test_db_session):
+        """Task sheets of one workbook are parsed in separate jobs and merged."""
+        content = _workbook(
+            {"Backend": _tasks("BE"), "Notes": [["Read me"]], "Frontend": _tasks("FE")}
+        )
+        header_only = _workbook({"Tasks": [HEADERS]})
+        sheet_jobs = []
+
+        class RecordingExecutor(ThreadPoolExecutor):
+            def submit(self, fn, *args, **kwargs):
+                if len(args) == 3:
+                    sheet_jobs.append((args[0], args[2]))
+                return super().submit(fn, *args, **kwargs)
+
+        with RecordingExecutor(max_workers=2) as executor:
+            service = ExcelBatchImportService(test_db_session, executor=executor)
+            results = await service.parse_files(
+                [("portfolio.xlsx", content), ("empty.xlsx", header_only)]
+            )
+
+        assert sheet_jobs == [
+            ("portfolio.xlsx", ["Backend"]),
+            ("portfolio.xlsx", ["Frontend"]),
+            ("empty.xlsx", ["Tasks"]),
+        ]
+        assert [s.sheet_name for s in results[0].sheets] == ["Backend", "Frontend"]
+        assert results[0].errors == []
+        assert results[1].errors == ["No tasks found in Excel file empty.xlsx"]
+
+    async def test_parses_in_process_pool(self, test_db_session):
+        """Workbooks are parsed in worker processes by default."""
+        service = ExcelBatchImportService(test_db_session)
+
+        results = await service.parse_files(
+            [("a.xlsx", _workbook({"Tasks": _tasks("A")}))]
+        )
+
+        assert results[0].task_count == 2
+        assert results[0].wall_ms >= results[0].parse_ms
@@ -616,6 +616,91 @@ class TestExcelParserService:
             for error in errors
         )
 
+    # Test: Build Dependency Graph - All Errors In One Pass
+    def test_build_dependency_graph_reports_all_errors(
+        self, parser_service: ExcelParserService
+    ):
+        """Test duplicates, unknown references and every cycle are reported together."""
+
+        def task(task_id: str, deps: str = "") -> ParsedTask:
+            return ParsedTask(
+                task_id=task_id,
+                task_name=task_id,
+                optimistic=1.0,
+                most_likely=2.0,
+                pessimistic=3.0,
+                dependencies=deps,
+            )
+
+        tasks = [
+            task("T001", "T002"),
+            task("T002", "T001"),
+            task("T003", "T005"),
+            task("T004", "T003"),
+            task("T005", "T004, T999"),
+            task("T001"),
+        ]
+
+        validation = parser_service.build_dependency_graph(tasks)
+
+        assert not validation.is_valid
+        assert sum("Duplicate" in e for e in validation.errors) == 1
+        assert sum("T999" in e for e in validation.errors) == 1
+        assert sum("circular" in e.lower() for e in validation.errors) == 2
+
+    # Test: Build Dependency Graph - Graph Reused By Scheduler
+    def test_build_dependency_graph_returns_scheduler_graph(
+        self, parser_service: ExcelParserService
+    ):
+        """Test the validated graph carries the dependency edges."""
+        tasks = [
+            ParsedTask(
+                task_id="T001",
+                task_name="Task 1",
+                optimistic=1.0,
+                most_likely=2.0,
+                pessimistic=3.0,
+            ),
+            ParsedTask(
+                task_id="T002",
+                task_name="Task 2",
+                optimistic=1.0,
+                most_likely=2.0,
+                pessimistic=3.0,
+                dependencies="T001",
+            ),
+        ]
+
+        validation = parser_service.build_dependency_graph(tasks)
+
+        assert validation.is_valid
+        assert validation.graph.get_dependencies("T002") == ["T001"]
+        assert validation.graph.topological_sort() == ["T001", "T002"]
+
+    # Test: Build Dependency Graph - Malformed Dependency Strings
+    def test_build_dependency_graph_rejects_malformed_dependencies(
+        self, parser_service: ExcelParserService
+    ):
+        """Test empty parts and invalid IDs fail the parse_dependencies checks."""
+        tasks = [
+            ParsedTask(
+                task_id=task_id,
+                task_name=task_id,
+                optimistic=1.0,
+                most_likely=2.0,
+                pessimistic=3.0,
+                dependencies=deps,
+            )
+            for task_id, deps in [("A", ""), ("B", ""), ("C", "A,,B C")]
+        ]
+
+        validation = parser_service.build_dependency_graph(tasks)
+
+        assert not validation.is_valid
+        assert len(validation.errors) == 1
+        assert validation.errors[0].startswith("Task C: Empty task ID")
+        assert validation.graph.get_dependencies("C") == []
+
     # Test: Convert to Distribution Input
     def test_convert_to_distribution_input(self, parser_service: ExcelParserService):
         """Test converting parsed tasks to TaskDistributionInput."""
@@ -0,0 +1,136 @@
+"""Tests for ExcelSyncService incremental workbook sync."""
+
+from io import BytesIO
+
+import pytest
+import pytest_asyncio
+from openpyxl import load_workbook
+from sqlalchemy import select
+
+from app.excel.engine import ExcelTemplateEngine
+from app.models.sync import SyncOperation
+from app.services.excel_service import ExcelService
+from app.services.excel_sync_service import ExcelSyncError, ExcelSyncService
+
+
+TASKS = [
+    {"id": "T1", "name": "Design", "duration": 5, "dependencies": []},
+    {"id": "T2", "name": "Build", "duration": 8, "dependencies": ["T1"], "optimistic": 6},
+    {"id": "T3", "name": "Test", "duration": 3, "dependencies": ["T2"]},
+]
+
+
+async def _generate(db, project) -> bytes:
+    """Generate a workbook for the project the same way the API does."""
+    return await ExcelService(db).generate_excel(project)
+
+
+def _edit(excel_bytes: bytes, edit) -> bytes:
+    """Apply an edit callback to the Project Plan sheet and re-save."""
+    workbook = load_workbook(BytesIO(excel_bytes))
+    edit(workbook["Project Plan"])
+    buffer = BytesIO()
+    workbook.save(buffer)
+    return buffer.getvalue()
+
+
+@pytest_asyncio.fixture
+async def sync_project(test_db_session, test_project):
+    """Project with stored tasks."""
+    test_project.configuration = {**test_project.configuration, "tasks": TASKS}
+    await test_db_session.commit()
+    return test_project
+
+
+@pytest.mark.asyncio
+class TestExcelSyncService:
+    """Test suite for ExcelSyncService."""
+
+    async def test_unchanged_workbook_applies_nothing(self, test_db_session, sync_project):
+        """Re-uploading an untouched workbook records an empty delta."""
+        service = ExcelSyncService(test_db_session)
+
+        upload = await _generate(test_db_session, sync_project)
+
+        operation = await service.sync_workbook(
+            sync_project, sync_project.owner_id, upload, "plan.xlsx"
+        )
+
+        assert operation.status == "completed"
+        assert operation.sync_data["unchanged_count"] == 3
+        assert operation.sync_data["inserted"] == []
+        assert operation.sync_data["updated"] == []
+        assert operation.sync_data["deleted"] == []
+
+    async def test_applies_only_changed_rows(self, test_db_session, sync_project):
+        """Edited, added and removed rows are applied and recorded."""
+
+        def edit(ws):
+            ws.cell(row=3, column=3, value=13)  # T2 duration
+            ws.delete_rows(4)  # T3
+            ws.append(["T4", "Release", 1, None, None, "T2"])
+
+        upload = _edit(await _generate(test_db_session, sync_project), edit)
+        service = ExcelSyncService(test_db_session)
+
+        operation = await service.sync_workbook(
+            sync_project, sync_project.owner_id, upload, "plan.xlsx"
+        )
+
+        assert operation.sync_data["updated"] == ["T2"]
+        assert operation.sync_data["inserted"] == ["T4"]
+        assert operation.sync_data["deleted"] == ["T3"]
+        assert operation.sync_data["unchanged_count"] == 1
+
+        tasks = {t["id"]: t for t in sync_project.configuration["tasks"]}
+        assert set(tasks) == {"T1", "T2", "T4"}
+        assert tasks["T2"]["duration"] == 13
+        assert tasks["T2"]["optimistic"] == 6
+        assert tasks["T4"]["dependencies"] == ["T2"]
+
+        stored = (await test_db_session.execute(select(SyncOperation))).scalars().all()
+        assert len(stored) == 1
+        assert stored[0].file_checksum is not None
+
+    async def test_server_side_edit_is_not_overwritten(self, test_db_session, sync_project):
+        """Rows changed on the server after generation are reported as conflicts."""
+        upload = _edit(
+            await _generate(test_db_session, sync_project),
+            lambda ws: ws.cell(row=3, column=3, value=13),
+        )
+        tasks = [dict(t) for t in sync_project.configuration["tasks"]]
+        tasks[1]["duration"] = 20
+        sync_project.configuration = {**sync_project.configuration, "tasks": tasks}
+        await test_db_session.commit()
+        service = ExcelSyncService(test_db_session)
+
+        operation = await service.sync_workbook(
+            sync_project, sync_project.owner_id, upload, "plan.xlsx"
+        )
+
+        assert operation.sync_data["updated"] == []
+        assert operation.sync_data["conflicts"] == [{"id": "T2", "operation": "update"}]
+        assert sync_project.configuration["tasks"][1]["duration"] == 20
+
+    async def test_rejects_workbook_for_other_project(self, test_db_session, sync_project):
+        """Workbooks generated for a different project are rejected."""
+        from app.excel.engine import ProjectConfig
+
+        other = ExcelTemplateEngine().generate_template(
+            ProjectConfig(project_id="someone_else", project_name="Other")
+        )
+        service = ExcelSyncService(test_db_session)
+
+        with pytest.raises(ExcelSyncError, match="different project"):
+            await service.sync_workbook(sync_project, sync_project.owner_id, other, "x.xlsx")
+
+    async def test_rejects_non_sprintforge_file(self, test_db_session, sync_project):
+        """Workbooks without sync metadata are rejected."""
+        from openpyxl import Workbook
+
+        buffer = BytesIO()
+        Workbook().save(buffer)
+        service = ExcelSyncService(test_db_session)
+
+        with pytest.raises(ExcelSyncError, match="_SYNC_META"):
+            service.diff_workbook(sync_project, buffer.getvalue())
@@ -20,10 +20,12 @@ import pytest_asyncio
 from datetime import datetime, timedelta, timezone
 from uuid import uuid4
 from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
 from sqlalchemy.ext.asyncio import AsyncSession
 
 # Import service that will be created
-from app.services.forecast_engine import ForecastEngine
+from app.services.forecast_engine import ForecastEngine, simulate_sprints_needed
 from app.models.historical_metrics import ForecastData, SprintVelocity, ForecastModelType
 
 
@@ -564,3 +566,230 @@ class TestForecastEngineIntegration:
         if len(forecasts1) > 0 and len(forecasts2) > 0:
             # Compare first forecast
             assert abs(forecasts1[0].predicted_value - forecasts2[0].predicted_value) < 0.01
+
+
+class TestVelocityForecastModels:
+    """Test persisted, incrementally updated velocity models."""
+
+    async def _add_history(self, db, project_id, values):
+        now = datetime.now(timezone.utc)
+        for i, value in enumerate(values):
+            db.add(
+                SprintVelocity(
+                    project_id=project_id,
+                    sprint_id=str(uuid4()),
+                    velocity_points=value,
+                    completed_tasks=0,
+                    timestamp=now - timedelta(days=(len(values) - i) * 14),
+                )
+            )
+        await db.commit()
+
+    @pytest.mark.asyncio
+    async def test_closed_form_fit_matches_sklearn(
+        self, forecast_engine: ForecastEngine, test_db_session: AsyncSession, test_project
+    ):
+        """Stored parameters equal a regression over the full history."""
+        values = [31.0, 28.5, 35.0, 33.0, 40.0, 37.5, 42.0]
+        await self._add_history(test_db_session, test_project.id, values)
+
+        model = (await forecast_engine.get_models([test_project.id]))[test_project.id]
+        expected = await forecast_engine.fit_linear_regression(
+            list(range(len(values))), values
+        )
+
+        assert model.n == len(values)
+        assert model.slope == pytest.approx(expected["slope"])
+        assert model.intercept == pytest.approx(expected["intercept"])
+        residuals = [v - (expected["slope"] * i + expected["intercept"]) for i, v in enumerate(values)]
+        assert model.residual_std == pytest.approx(float(np.std(residuals)))
+
+    @pytest.mark.asyncio
+    async def test_record_velocity_updates_incrementally(
+        self, forecast_engine: ForecastEngine, test_db_session: AsyncSession, test_project
+    ):
+        """Appending a sprint updates the model without a refit."""
+        await self._add_history(test_db_session, test_project.id, [30.0, 34.0, 33.0])
+        await forecast_engine.get_models([test_project.id])
+
+        recorded_at = datetime.now(timezone.utc)
+        test_db_session.add(
+            SprintVelocity(
+                project_id=test_project.id,
+                sprint_id="new",
+                velocity_points=39.0,
+                completed_tasks=0,
+                timestamp=recorded_at,
+            )
+        )
+        with patch.object(forecast_engine, "refit_model", AsyncMock()) as refit:
+            model = await forecast_engine.record_velocity(test_project.id, 39.0, recorded_at)
+            await test_db_session.commit()
+            refit.assert_not_called()
+
+        expected = await forecast_engine.fit_linear_regression(
+            [0, 1, 2, 3], [30.0, 34.0, 33.0, 39.0]
+        )
+        assert model.n == 4
+        assert model.slope == pytest.approx(expected["slope"])
+        assert model.intercept == pytest.approx(expected["intercept"])
+
+        # The model is current, so loading it again does not refit either
+        with patch.object(forecast_engine, "refit_model", AsyncMock()) as refit:
+            await forecast_engine.get_models([test_project.id])
+            refit.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_stale_model_is_refitted(
+        self, forecast_engine: ForecastEngine, test_db_session: AsyncSession, test_project
+    ):
+        """Rows inserted outside record_velocity trigger a refit."""
+        await self._add_history(test_db_session, test_project.id, [30.0, 32.0, 34.0])
+        await forecast_engine.get_models([test_project.id])
+        await test_db_session.commit()
+
+        test_db_session.add(
+            SprintVelocity(
+                project_id=test_project.id,
+                sprint_id="late",
+                velocity_points=50.0,
+                completed_tasks=0,
+                timestamp=datetime.now(timezone.utc),
+            )
+        )
+        await test_db_session.commit()
+
+        model = (await forecast_engine.get_models([test_project.id]))[test_project.id]
+
+        assert model.n == 4
+        assert model.sum_y == pytest.approx(146.0)
+
+    @pytest.mark.asyncio
+    async def test_batch_forecast_matches_single(
+        self,
+        forecast_engine: ForecastEngine,
+        test_db_session: AsyncSession,
+        test_project,
+        test_user,
+    ):
+        """forecast_projects returns per-project forecasts in one call."""
+        from app.models.project import Project
+
+        other = Project(name="Other", owner_id=test_user.id, configuration={}, template_version="1.0")
+        short = Project(name="Short", owner_id=test_user.id, configuration={}, template_version="1.0")
+        test_db_session.add_all([other, short])
+        await test_db_session.commit()
+        await self._add_history(test_db_session, test_project.id, [30.0, 32.0, 35.0, 36.0])
+        await self._add_history(test_db_session, other.id, [50.0, 45.0, 41.0])
+        await self._add_history(test_db_session, short.id, [10.0])
+
+        batch = await forecast_engine.forecast_projects(
+            [test_project.id, other.id, short.id], periods_ahead=3
+        )
+        single = await forecast_engine.forecast_velocity(other.id, periods_ahead=3)
+
+        assert len(batch[test_project.id]) == 3
+        assert batch[short.id] == []
+        assert [f.predicted_value for f in batch[other.id]] == pytest.approx(
+            [f.predicted_value for f in single]
+        )
+        assert batch[other.id][0].predicted_value < 41.0
+
+
+class TestSimulateCompletionDate:
+    """Test bootstrap Monte Carlo completion forecasts."""
+
+    def test_constant_velocity_is_deterministic(self):
+        """With a single velocity every future needs the same sprints."""
+        needed = simulate_sprints_needed([10.0], 25.0, 100, np.random.default_rng(0))
+
+        assert np.allclose(needed, 2.5)
+
+    def test_unfinished_futures_are_infinite(self):
+        """Futures that never finish within the cap are reported as inf."""
+        needed = simulate_sprints_needed(
+            [0.0, 10.0], 100.0, 1000, np.random.default_rng(0), max_sprints=12
+        )
+
+        assert np.isinf(needed).any()
+        assert np.isfinite(needed).any()
+        assert needed[np.isfinite(needed)].max() <= 12
+
+    @pytest.mark.asyncio
+    async def test_percentiles_and_probability_curve(
+        self, forecast_engine: ForecastEngine, test_project, sample_velocity_history
+    ):
+        """Percentiles are ordered and the probability curve reaches 1."""
+        forecast = await forecast_engine.simulate_completion_date(
+            test_project.id, remaining_points=400, num_simulations=5000
+        )
+
+        percentiles = forecast["percentiles"]
+        assert percentiles["p50"] <= percentiles["p70"] <= percentiles["p85"] <= percentiles["p95"]
+        assert forecast["completion_date"] == percentiles["p50"]
+
+        curve = forecast["probability_by_date"]
+        probabilities = [point["probability"] for point in curve]
+        assert probabilities == sorted(probabilities)
+        assert probabilities[-1] == pytest.approx(1.0)
+        # Velocities 30..48 need between 8.3 and 13.4 sprints for 400 points
+        assert 8 <= curve[0]["sprints"] and curve[-1]["sprints"] <= 14
+        assert forecast["history_size"] == 10
+
+    @pytest.mark.asyncio
+    async def test_results_cached_per_history_version(
+        self,
+        forecast_engine: ForecastEngine,
+        test_db_session: AsyncSession,
+        test_project,
+        sample_velocity_history,
+    ):
+        """Repeated calls hit the cache until a sprint is recorded."""
+        first = await forecast_engine.simulate_completion_date(test_project.id, 200)
+        second = await forecast_engine.simulate_completion_date(test_project.id, 200)
+
+        assert not first["cached"] and second["cached"]
+        assert second["percentiles"] == first["percentiles"]
+
+        recorded_at = datetime.now(timezone.utc) + timedelta(days=1)
+        test_db_session.add(
+            SprintVelocity(
+                project_id=test_project.id,
+                sprint_id="next",
+                velocity_points=80.0,
+                completed_tasks=0,
+                timestamp=recorded_at,
+            )
+        )
+        await forecast_engine.record_velocity(test_project.id, 80.0, recorded_at)
+        await test_db_session.commit()
+
+        third = await forecast_engine.simulate_completion_date(test_project.id, 200)
+        assert not third["cached"]
+        assert third["history_size"] == 11
+
+    @pytest.mark.asyncio
+    async def test_no_history(self, forecast_engine: ForecastEngine, test_project):
+        """Projects without history get no completion date."""
+        forecast = await forecast_engine.simulate_completion_date(test_project.id, 100)
+
+        assert forecast["completion_date"] is None
+        assert forecast["message"] == "Insufficient velocity history"
+
+
+def test_ml_libraries_are_imported_lazily():
+    """Importing the engine does not load scipy or scikit-learn."""
+    import os
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, app.services.forecast_engine; "
+        "print(any(m.split('.')[0] in ('scipy', 'sklearn') for m in sys.modules))"
+    )
+    env = {**os.environ, "SECRET_KEY": os.environ.get("SECRET_KEY", "test-secret")}
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, env=env, check=True
+    ).stdout
+
+    assert output.strip() == "False"
@@ -0,0 +1,205 @@
+"""Tests for MetricIngestService bulk ingestion."""
+
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import func, select
+
+from app.models.historical_metrics import HistoricalMetric, MetricRollup
+from app.services.metric_ingest_service import (
+    MetricIngestError,
+    MetricIngestService,
+    parse_columnar,
+    parse_ndjson,
+    validate_columns,
+)
+
+BASE = datetime(2024, 3, 4, tzinfo=timezone.utc)
+
+
+def _ndjson(points) -> bytes:
+    return "\n".join(json.dumps(p) for p in points).encode()
+
+
+class TestParsing:
+    """Test payload parsing."""
+
+    def test_parse_ndjson(self):
+        """Each line becomes one point; blank lines are skipped."""
+        body = _ndjson(
+            [
+                {"metric_type": "velocity", "value": 1, "timestamp": "2024-03-04T00:00:00Z"},
+                {"metric_type": "burndown", "value": 2, "timestamp": 1709510400,
+                 "idempotency_key": "k2", "metadata": {"sprint": 3}},
+            ]
+        ) + b"\n\n"
+
+        columns = parse_ndjson(body)
+
+        assert len(columns) == 2
+        assert columns.idempotency_keys == [None, "k2"]
+        assert columns.metadata[1] == {"sprint": 3}
+
+    def test_parse_ndjson_rejects_bad_lines(self):
+        """Malformed lines abort the request with their line number."""
+        with pytest.raises(MetricIngestError, match="Line 2"):
+            parse_ndjson(b'{"value": 1}\n[1, 2]')
+
+    def test_parse_columnar_broadcasts_metric_type(self):
+        """A single metric_type applies to every point."""
+        columns = parse_columnar(
+            {"metric_type": "velocity", "values": [1, 2], "timestamps": [0, 1]}
+        )
+
+        assert columns.metric_types == ["velocity", "velocity"]
+        assert columns.idempotency_keys == [None, None]
+
+    def test_parse_columnar_length_mismatch(self):
+        """Columns must have the same length."""
+        with pytest.raises(MetricIngestError, match="'timestamps' must have 2 entries"):
+            parse_columnar({"metric_type": "velocity", "values": [1, 2], "timestamps": [0]})
+
+    def test_parse_columnar_limits(self, monkeypatch):
+        """Empty and oversize payloads are rejected."""
+        monkeypatch.setattr("app.services.metric_ingest_service.MAX_INGEST_POINTS", 2)
+
+        with pytest.raises(MetricIngestError, match="no metric points"):
+            parse_columnar({"values": [], "timestamps": []})
+        with pytest.raises(MetricIngestError, match="Too many points"):
+            parse_columnar({"values": [1, 2, 3], "timestamps": [0, 0, 0]})
+
+
+class TestValidateColumns:
+    """Test vectorized validation."""
+
+    def test_reports_invalid_points(self):
+        """Each invalid point is reported once with its first failure."""
+        columns = parse_columnar(
+            {
+                "metric_type": ["velocity", "nope", "VELOCITY", "velocity", "velocity"],
+                "values": [1.0, 2.0, "x", None, 5.0],
+                "timestamps": [
+                    "2024-03-04T00:00:00+00:00",
+                    "2024-03-04T00:00:00",
+                    "2024-03-04T00:00:00",
+                    "2024-03-04T00:00:00",
+                    "not a date",
+                ],
+            }
+        )
+
+        batch, errors = validate_columns(columns, now=BASE)
+
+        assert errors == [
+            {"index": 1, "reason": "invalid metric_type"},
+            {"index": 2, "reason": "value must be a finite number"},
+            {"index": 3, "reason": "value must be a finite number"},
+            {"index": 4, "reason": "invalid timestamp"},
+        ]
+        assert batch.indices.tolist() == [0]
+
+    def test_future_timestamps_and_repeated_keys(self):
+        """Future points are rejected; repeated keys keep the first point."""
+        columns = parse_columnar(
+            {
+                "metric_type": "Velocity",
+                "values": [1, 2, 3],
+                "timestamps": [
+                    BASE.timestamp(),
+                    BASE.timestamp(),
+                    (BASE + timedelta(days=3)).timestamp(),
+                ],
+                "idempotency_keys": ["a", "a", "b"],
+            }
+        )
+
+        batch, errors = validate_columns(columns, now=BASE)
+
+        assert errors == [{"index": 2, "reason": "timestamp is in the future"}]
+        assert batch.indices.tolist() == [0]
+        assert batch.metric_types.tolist() == ["velocity"]
+
+
+@pytest.mark.asyncio
+class TestMetricIngestService:
+    """Test ingestion into the database."""
+
+    async def test_ingest_inserts_points_and_rollups(self, test_db_session, test_project):
+        """Valid points are inserted in batches and rolled up."""
+        count = 1200
+        columns = parse_columnar(
+            {
+                "metric_type": "velocity",
+                "values": list(range(count)),
+                "timestamps": [(BASE + timedelta(minutes=i)).timestamp() for i in range(count)],
+                "metadata": {"source": "ci"},
+            }
+        )
+
+        result = await MetricIngestService(test_db_session).ingest(test_project.id, columns)
+
+        assert (result.inserted, result.duplicates, result.rejected) == (count, 0, 0)
+        stored = await test_db_session.scalar(select(func.count(HistoricalMetric.id)))
+        assert stored == count
+        weekly = (
+            await test_db_session.execute(
+                select(MetricRollup).where(MetricRollup.resolution == "week")
+            )
+        ).scalar_one()
+        assert weekly.count == count
+        assert weekly.sum == sum(range(count))
+
+    async def test_retried_batch_is_deduplicated(self, test_db_session, test_project):
+        """Points with stored idempotency keys are skipped."""
+        service = MetricIngestService(test_db_session)
+        payload = {
+            "metric_type": "velocity",
+            "values": [1, 2],
+            "timestamps": [BASE.timestamp(), BASE.timestamp() + 60],
+            "idempotency_keys": ["run-1:0", "run-1:1"],
+        }
+
+        first = await service.ingest(test_project.id, parse_columnar(payload))
+        payload["values"].append(3)
+        payload["timestamps"].append(BASE.timestamp() + 120)
+        payload["idempotency_keys"].append("run-1:2")
+        retry = await service.ingest(test_project.id, parse_columnar(payload))
+
+        assert (first.inserted, first.duplicates) == (2, 0)
+        assert (retry.inserted, retry.duplicates) == (1, 2)
+        stored = await test_db_session.scalar(select(func.count(HistoricalMetric.id)))
+        assert stored == 3
+        rollup_count = await test_db_session.scalar(
+            select(MetricRollup.count).where(MetricRollup.resolution == "day")
+        )
+        assert rollup_count == 3
+
+    async def test_keys_stored_after_lookup_are_skipped(
+        self, test_db_session, test_project, monkeypatch
+    ):
+        """Keys inserted concurrently since the lookup neither fail nor count."""
+        service = MetricIngestService(test_db_session)
+        payload = {
+            "metric_type": "velocity",
+            "values": [1, 2],
+            "timestamps": [BASE.timestamp(), BASE.timestamp() + 60],
+            "idempotency_keys": ["run-2:0", "run-2:1"],
+        }
+        await service.ingest(test_project.id, parse_columnar(payload))
+
+        async def lookup_missed_keys(project_id, keys):
+            return set()
+
+        # As if another writer stored the keys right after our lookup
+        monkeypatch.setattr(service, "_existing_keys", lookup_missed_keys)
+        payload["values"].append(3)
+        payload["timestamps"].append(BASE.timestamp() + 120)
+        payload["idempotency_keys"].append("run-2:2")
+        retry = await service.ingest(test_project.id, parse_columnar(payload))
+
+        assert (retry.inserted, retry.duplicates) == (1, 2)
+        rollup_count = await test_db_session.scalar(
+            select(MetricRollup.count).where(MetricRollup.resolution == "day")
+        )
+        assert rollup_count == 3
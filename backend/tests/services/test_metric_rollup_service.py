@@ -0,0 +1,235 @@
+"""Tests for MetricRollupService incremental rollups and downsampling."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.historical_metrics import HistoricalMetric, MetricRollup, MetricType
+from app.services.metric_rollup_service import MetricRollupService, bucket_start
+
+# A Monday
+BASE = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest_asyncio.fixture
+async def rollup_service(test_db_session: AsyncSession):
+    """Create MetricRollupService with test database session."""
+    return MetricRollupService(test_db_session)
+
+
+async def _rollups(db: AsyncSession, resolution: str):
+    result = await db.execute(
+        select(MetricRollup)
+        .where(MetricRollup.resolution == resolution)
+        .order_by(MetricRollup.bucket_start)
+    )
+    return result.scalars().all()
+
+
+class TestBucketStart:
+    """Test bucket flooring."""
+
+    def test_floors_to_hour_day_and_monday(self):
+        """Buckets start on the hour, at midnight and on Monday."""
+        ts = datetime(2024, 1, 10, 15, 42, 7, tzinfo=timezone.utc)  # Wednesday
+
+        assert bucket_start(ts, "hour") == datetime(2024, 1, 10, 15, tzinfo=timezone.utc)
+        assert bucket_start(ts, "day") == datetime(2024, 1, 10, tzinfo=timezone.utc)
+        assert bucket_start(ts, "week") == datetime(2024, 1, 8, tzinfo=timezone.utc)
+
+    def test_naive_timestamps_are_utc(self):
+        """Naive datetimes are treated as UTC."""
+        assert bucket_start(datetime(2024, 1, 1, 5, 30), "hour") == BASE.replace(hour=5)
+
+    def test_unknown_resolution(self):
+        """Unknown resolutions are rejected."""
+        with pytest.raises(ValueError):
+            bucket_start(BASE, "month")
+
+
+@pytest.mark.asyncio
+class TestIncrementalRollups:
+    """Test rollup maintenance on insert."""
+
+    async def test_record_metrics_creates_rollups(
+        self, rollup_service, test_db_session, test_project
+    ):
+        """Each resolution gets count, sum, min, max and last."""
+        await rollup_service.record_metrics(
+            test_project.id,
+            MetricType.VELOCITY,
+            [
+                (10.0, BASE + timedelta(minutes=5)),
+                (30.0, BASE + timedelta(minutes=50)),
+                (20.0, BASE + timedelta(hours=2)),
+            ],
+        )
+
+        hourly = await _rollups(test_db_session, "hour")
+        assert [(r.count, r.sum, r.min, r.max, r.last_value) for r in hourly] == [
+            (2, 40.0, 10.0, 30.0, 30.0),
+            (1, 20.0, 20.0, 20.0, 20.0),
+        ]
+        daily = await _rollups(test_db_session, "day")
+        assert len(daily) == 1
+        assert (daily[0].count, daily[0].sum, daily[0].last_value) == (3, 60.0, 20.0)
+
+        raw = (await test_db_session.execute(select(HistoricalMetric))).scalars().all()
+        assert len(raw) == 3
+
+    async def test_later_inserts_merge_into_existing_buckets(
+        self, rollup_service, test_db_session, test_project
+    ):
+        """A second write updates aggregates instead of adding rows."""
+        await rollup_service.record_metrics(
+            test_project.id, "velocity", [(10.0, BASE + timedelta(hours=3))]
+        )
+        # Older point: counted, but does not replace the last value
+        await rollup_service.record_metrics(
+            test_project.id,
+            "velocity",
+            [(5.0, BASE + timedelta(hours=1)), (50.0, BASE + timedelta(hours=2))],
+        )
+
+        (weekly,) = await _rollups(test_db_session, "week")
+        assert weekly.count == 3
+        assert weekly.sum == 65.0
+        assert (weekly.min, weekly.max) == (5.0, 50.0)
+        assert weekly.last_value == 10.0
+
+    async def test_rebuild_matches_incremental(
+        self, rollup_service, test_db_session, test_project
+    ):
+        """Backfilling from raw rows yields the same aggregates."""
+        for i in range(10):
+            test_db_session.add(
+                HistoricalMetric(
+                    project_id=test_project.id,
+                    metric_type="velocity",
+                    value=float(i),
+                    timestamp=BASE + timedelta(hours=i * 7),
+                    metric_metadata={},
+                )
+            )
+        await test_db_session.commit()
+
+        processed = await rollup_service.rebuild_rollups(test_project.id)
+
+        assert processed == 10
+        daily = await _rollups(test_db_session, "day")
+        assert sum(r.count for r in daily) == 10
+        assert sum(r.sum for r in daily) == 45.0
+
+
+@pytest.mark.asyncio
+class TestGetSeries:
+    """Test resolution selection."""
+
+    async def _seed(self, service, project_id, hours: int):
+        await service.record_metrics(
+            project_id,
+            "velocity",
+            [(float(i % 10), BASE + timedelta(hours=i)) for i in range(hours)],
+        )
+
+    async def test_raw_when_within_budget(self, rollup_service, test_project):
+        """Small ranges return raw points."""
+        await self._seed(rollup_service, test_project.id, 24)
+
+        resolution, points = await rollup_service.get_series(
+            test_project.id, max_points=100
+        )
+
+        assert resolution == "raw"
+        assert len(points) == 24
+        assert "id" in points[0]
+
+    async def test_finest_rollup_within_budget(self, rollup_service, test_project):
+        """Large ranges use the finest rollup that fits."""
+        await self._seed(rollup_service, test_project.id, 24 * 14)
+
+        resolution, points = await rollup_service.get_series(
+            test_project.id, max_points=20
+        )
+
+        assert resolution == "day"
+        assert len(points) == 14
+        assert points[0]["count"] == 24
+        assert points[0]["value"] == pytest.approx(sum(i % 10 for i in range(24)) / 24)
+
+    async def test_range_filter_and_merge_beyond_weekly(
+        self, rollup_service, test_project
+    ):
+        """Weekly buckets are merged when even they exceed the budget."""
+        await self._seed(rollup_service, test_project.id, 24 * 28)
+
+        resolution, points = await rollup_service.get_series(
+            test_project.id,
+            metric_type="velocity",
+            start_date=BASE + timedelta(days=7),
+            max_points=1,
+        )
+
+        assert resolution == "week"
+        assert len(points) == 1
+        assert points[0]["count"] == 24 * 21
+        assert points[0]["timestamp"].startswith("2024-01-08")
+
+    async def _seed_raw(self, db, project_id, hours: int, offset: int = 0):
+        """Insert raw points directly, bypassing rollups (pre-rollup data)."""
+        db.add_all(
+            HistoricalMetric(
+                project_id=project_id,
+                metric_type="velocity",
+                value=float(i % 10),
+                timestamp=BASE + timedelta(hours=i),
+                metric_metadata={},
+            )
+            for i in range(offset, offset + hours)
+        )
+        await db.commit()
+
+    async def test_raw_rows_without_rollups_are_aggregated(
+        self, rollup_service, test_db_session, test_project
+    ):
+        """Points stored without rollups are downsampled from the raw rows."""
+        await self._seed_raw(test_db_session, test_project.id, 24 * 14)
+
+        resolution, points = await rollup_service.get_series(
+            test_project.id, max_points=20
+        )
+
+        assert resolution == "day"
+        assert len(points) == 14
+        assert points[0]["timestamp"].startswith("2024-01-01")
+        assert points[0]["count"] == 24
+        assert points[0]["value"] == pytest.approx(sum(i % 10 for i in range(24)) / 24)
+        assert (points[0]["min"], points[0]["max"]) == (0.0, 9.0)
+        # Hour 23 of the first day holds 23 % 10
+        assert points[0]["last"] == 3.0
+
+    async def test_partially_rolled_up_range_uses_raw_rows(
+        self, rollup_service, test_db_session, test_project
+    ):
+        """Rollups missing older points do not truncate the series."""
+        await self._seed_raw(test_db_session, test_project.id, 24 * 14)
+        await rollup_service.record_metrics(
+            test_project.id,
+            "velocity",
+            [(1.0, BASE + timedelta(days=14, hours=i)) for i in range(24)],
+        )
+
+        resolution, points = await rollup_service.get_series(
+            test_project.id, max_points=3
+        )
+
+        assert resolution == "week"
+        assert sum(point["count"] for point in points) == 24 * 15
+        assert [point["timestamp"][:10] for point in points] == [
+            "2024-01-01",
+            "2024-01-08",
+            "2024-01-15",
+        ]
@@ -0,0 +1,167 @@
+"""Tests for indexed notification rule matching."""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.notification import (
+    NotificationRule,
+    NotificationRuleProject,
+    NotificationType,
+)
+from app.services.notification_rule_index import (
+    RulePredicateCache,
+    candidate_rules_query,
+    compile_conditions,
+)
+from app.services.notification_service import NotificationService
+
+
+class TestCompileConditions:
+    """Test compiled rule predicates."""
+
+    def test_empty_conditions_match_everything(self):
+        """Rules without conditions match any event."""
+        assert compile_conditions(None)({})
+        assert compile_conditions({})({"project_id": "p1"})
+
+    def test_project_and_completion_conditions(self):
+        """Both conditions must hold."""
+        predicate = compile_conditions({"project_ids": ["p1", "p2"], "min_completion": 80})
+
+        assert predicate({"project_id": "p2", "completion": 90})
+        assert not predicate({"project_id": "p3", "completion": 90})
+        assert not predicate({"project_id": "p1", "completion": 50})
+        assert not predicate({"completion": 100})
+
+    def test_project_ids_compare_as_text(self):
+        """UUID event project IDs match their string form in conditions."""
+        project_id = uuid4()
+        predicate = compile_conditions({"project_ids": [str(project_id)]})
+
+        assert predicate({"project_id": project_id})
+
+
+class TestRulePredicateCache:
+    """Test the compiled-predicate cache."""
+
+    def _rule(self, conditions, updated_at):
+        rule = Mock(spec=NotificationRule)
+        rule.id = uuid4()
+        rule.conditions = conditions
+        rule.updated_at = updated_at
+        return rule
+
+    def test_reuses_and_recompiles_on_update(self):
+        """A predicate is reused until the rule's updated_at changes."""
+        cache = RulePredicateCache()
+        now = datetime.now(timezone.utc)
+        rule = self._rule({"min_completion": 50}, now)
+
+        first = cache.get(rule)
+        assert cache.get(rule) is first
+
+        rule.conditions = {"min_completion": 90}
+        rule.updated_at = now + timedelta(seconds=1)
+        assert not cache.get(rule)({"completion": 60})
+
+    def test_invalidate_and_bounded_size(self):
+        """Invalidated entries are recompiled and the oldest is evicted."""
+        cache = RulePredicateCache(max_entries=2)
+        rules = [self._rule({}, None) for _ in range(3)]
+        predicates = [cache.get(rule) for rule in rules]
+
+        assert cache.get(rules[0]) is not predicates[0]
+        cache.invalidate(rules[2].id)
+        assert cache.get(rules[2]) is not predicates[2]
+
+
+class TestCandidateRulesQuery:
+    """Test the indexed candidate query."""
+
+    def test_event_without_project_uses_wildcard_bucket_only(self):
+        """Project-scoped rules are not considered without a project."""
+        sql = str(candidate_rules_query("sprint_complete", None))
+
+        assert "notification_rule_projects" not in sql
+        assert "project_scoped" in sql
+
+    def test_event_with_project_uses_index(self):
+        """The project's indexed rules are unioned with the wildcard bucket."""
+        sql = str(candidate_rules_query("sprint_complete", "p1"))
+
+        assert "notification_rule_projects" in sql
+
+
+@pytest.mark.asyncio
+class TestIndexedEvaluation:
+    """Test rule evaluation against the database index."""
+
+    async def test_evaluate_uses_project_index(
+        self, test_db_session: AsyncSession, test_user
+    ):
+        """Only the event's project rules and wildcard rules match."""
+        service = NotificationService(test_db_session)
+        project_id = str(uuid4())
+
+        wildcard = await service.create_rule(
+            user_id=test_user.id, event_type=NotificationType.SPRINT_COMPLETE
+        )
+        scoped = await service.create_rule(
+            user_id=test_user.id,
+            event_type=NotificationType.SPRINT_COMPLETE,
+            conditions={"project_ids": [project_id]},
+        )
+        for _ in range(5):
+            await service.create_rule(
+                user_id=test_user.id,
+                event_type=NotificationType.SPRINT_COMPLETE,
+                conditions={"project_ids": [str(uuid4())]},
+            )
+
+        matching = await service.evaluate_rules(
+            NotificationType.SPRINT_COMPLETE, {"project_id": project_id}
+        )
+
+        assert {r.id for r in matching} == {wildcard.id, scoped.id}
+        assert scoped.project_scoped is True
+        assert wildcard.project_scoped is False
+
+    async def test_update_and_delete_reindex(
+        self, test_db_session: AsyncSession, test_user
+    ):
+        """Changing or deleting a rule rewrites its index rows."""
+        service = NotificationService(test_db_session)
+        old_project, new_project = str(uuid4()), str(uuid4())
+
+        rule = await service.create_rule(
+            user_id=test_user.id,
+            event_type=NotificationType.SPRINT_COMPLETE,
+            conditions={"project_ids": [old_project]},
+        )
+        await service.update_rule(
+            rule.id, test_user.id, conditions={"project_ids": [new_project]}
+        )
+
+        assert not await service.evaluate_rules(
+            NotificationType.SPRINT_COMPLETE, {"project_id": old_project}
+        )
+        assert await service.evaluate_rules(
+            NotificationType.SPRINT_COMPLETE, {"project_id": new_project}
+        )
+
+        rows = await test_db_session.execute(
+            select(NotificationRuleProject.project_id).where(
+                NotificationRuleProject.rule_id == rule.id
+            )
+        )
+        assert rows.scalars().all() == [new_project]
+
+        await service.delete_rule(rule.id, test_user.id)
+        assert not await service.evaluate_rules(
+            NotificationType.SPRINT_COMPLETE, {"project_id": new_project}
+        )
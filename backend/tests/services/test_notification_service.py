@@ -175,6 +175,40 @@ class TestNotificationServiceRetrieval:
         page2_ids = {n.id for n in page2}
         assert len(page1_ids & page2_ids) == 0
 
+    @pytest.mark.asyncio
+    async def test_get_user_notifications_cursor(
+        self, test_db_session: AsyncSession, test_user
+    ):
+        """Cursor pages walk all notifications newest first without overlap."""
+        from app.database.pagination import next_cursor
+        from app.services.notification_service import NOTIFICATION_SORT
+
+        service = NotificationService(test_db_session)
+        for i in range(7):
+            await service.create_notification(
+                user_id=test_user.id,
+                notification_type=NotificationType.SPRINT_COMPLETE,
+                title=f"Notification {i}",
+                message=f"Message {i}",
+            )
+
+        seen = []
+        cursor = None
+        while True:
+            page = await service.get_user_notifications(
+                test_user.id, limit=3, cursor=cursor
+            )
+            seen.extend(page)
+            cursor = next_cursor(page, 3, NOTIFICATION_SORT, "created_at")
+            if cursor is None:
+                break
+
+        assert len(seen) == 7
+        assert len({n.id for n in seen}) == 7
+        assert [n.created_at for n in seen] == sorted(
+            (n.created_at for n in seen), reverse=True
+        )
+
     @pytest.mark.asyncio
     async def test_get_user_notifications_filter_unread(
         self, test_db_session: AsyncSession, test_user
@@ -0,0 +1,141 @@
+"""Tests for the compiled notification template cache."""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.notification import NotificationTemplate, NotificationType
+from app.services.notification_service import NotificationService
+from app.services.notification_template_cache import (
+    FALLBACK_TEXT,
+    CompiledTemplate,
+    TemplateCache,
+    template_cache,
+)
+
+
+def _template(subject="Sprint {{ sprint_name }} Complete", updated_at=None):
+    return NotificationTemplate(
+        event_type=NotificationType.SPRINT_COMPLETE.value,
+        subject_template=subject,
+        body_template_html="<p>{{ sprint_name }}</p>",
+        body_template_text="{{ sprint_name }}",
+        updated_at=updated_at or datetime.now(timezone.utc),
+    )
+
+
+def _templates_result(templates):
+    result = Mock()
+    result.scalars.return_value.all.return_value = templates
+    return result
+
+
+def _versions_result(versions):
+    result = Mock()
+    result.all.return_value = versions
+    return result
+
+
+class TestCompiledTemplate:
+    """Test rendering of compiled templates."""
+
+    def test_render(self):
+        """Subject and bodies render with the context."""
+        compiled = CompiledTemplate.from_model(_template())
+
+        assert compiled.render({"sprint_name": "24.Q1.1"}) == (
+            "Sprint 24.Q1.1 Complete",
+            "<p>24.Q1.1</p>",
+            "24.Q1.1",
+        )
+
+    def test_render_many_reuses_identical_contexts(self):
+        """Each distinct context is rendered once."""
+        compiled = CompiledTemplate.from_model(_template())
+        contexts = [{"sprint_name": "A"}] * 3 + [{"sprint_name": "B"}]
+
+        rendered = compiled.render_many(contexts)
+
+        assert [r[2] for r in rendered] == ["A", "A", "A", "B"]
+        assert rendered[0] is rendered[1]
+
+    def test_invalid_template_falls_back(self):
+        """A template that does not compile renders the fallback text."""
+        compiled = CompiledTemplate.from_model(_template(subject="{% if %}"))
+
+        assert compiled.render({})[0] == FALLBACK_TEXT
+
+
+@pytest.mark.asyncio
+class TestTemplateCache:
+    """Test cache lookups and revalidation."""
+
+    async def test_compiles_once(self):
+        """A cached template is served without querying."""
+        cache = TemplateCache()
+        db = AsyncMock(spec=AsyncSession)
+        db.execute.return_value = _templates_result([_template()])
+
+        first = await cache.get(db, NotificationType.SPRINT_COMPLETE)
+        second = await cache.get(db, "sprint_complete")
+
+        assert first is second
+        assert db.execute.call_count == 1
+
+    async def test_missing_template_is_cached(self):
+        """Event types without a template are not re-queried."""
+        cache = TemplateCache()
+        db = AsyncMock(spec=AsyncSession)
+        db.execute.return_value = _templates_result([])
+
+        assert await cache.get(db, "system_alert") is None
+        assert await cache.get_many(db, ["system_alert"]) == {}
+        assert db.execute.call_count == 1
+
+    async def test_revalidates_by_updated_at(self):
+        """Expired entries reload only when updated_at changed."""
+        cache = TemplateCache(revalidate_after=0)
+        db = AsyncMock(spec=AsyncSession)
+        template = _template()
+        changed = _template(
+            subject="Done: {{ sprint_name }}",
+            updated_at=template.updated_at + timedelta(seconds=1),
+        )
+
+        db.execute.side_effect = [
+            _templates_result([template]),
+            _versions_result([("sprint_complete", template.updated_at)]),
+            _versions_result([("sprint_complete", changed.updated_at)]),
+            _templates_result([changed]),
+        ]
+
+        first = await cache.get(db, "sprint_complete")
+        assert await cache.get(db, "sprint_complete") is first
+
+        reloaded = await cache.get(db, "sprint_complete")
+        assert reloaded.render({"sprint_name": "X"})[0] == "Done: X"
+        assert db.execute.call_count == 4
+
+    async def test_update_template_invalidates(self, test_db_session: AsyncSession):
+        """NotificationService.update_template drops the cached template."""
+        template_cache.clear()
+        service = NotificationService(test_db_session)
+        await service.create_template(
+            event_type=NotificationType.SPRINT_COMPLETE,
+            subject_template="Old {{ sprint_name }}",
+            body_template_html="<p>Old</p>",
+            body_template_text="Old",
+        )
+
+        cached = await template_cache.get(test_db_session, "sprint_complete")
+        assert cached.render({"sprint_name": "X"})[0] == "Old X"
+
+        await service.update_template(
+            NotificationType.SPRINT_COMPLETE, subject_template="New {{ sprint_name }}"
+        )
+
+        cached = await template_cache.get(test_db_session, "sprint_complete")
+        assert cached.render({"sprint_name": "X"})[0] == "New X"
+        template_cache.clear()
@@ -50,3 +50,100 @@ class TestPasswordHashing:
         """Test that verify_password method exists."""
         assert hasattr(ShareService, 'verify_password')
         assert callable(ShareService.verify_password)
+
+
+class TestAccessGrant:
+    """Test signed grants that let repeat views skip the password."""
+
+    def _link(self, password_hash="$2b$12$hash"):
+        from uuid import uuid4
+        from app.models.share_link import ShareLink
+
+        return ShareLink(id=uuid4(), token="t" * 64, password_hash=password_hash)
+
+    def test_grant_round_trip(self):
+        """A fresh grant is accepted for its own link only."""
+        link = self._link()
+        grant = ShareService.issue_access_grant(link)
+
+        assert ShareService.check_access_grant(link, grant)
+        assert not ShareService.check_access_grant(self._link(), grant)
+
+    def test_expired_grant_rejected(self):
+        """Grants stop working after their TTL."""
+        link = self._link()
+        grant = ShareService.issue_access_grant(link, ttl=-1)
+
+        assert not ShareService.check_access_grant(link, grant)
+
+    def test_password_change_voids_grant(self):
+        """Changing the password invalidates grants issued before."""
+        link = self._link()
+        grant = ShareService.issue_access_grant(link)
+        link.password_hash = "$2b$12$other"
+
+        assert not ShareService.check_access_grant(link, grant)
+
+    @pytest.mark.parametrize("grant", [None, "", "garbage", "9999999999.deadbeef"])
+    def test_malformed_grant_rejected(self, grant):
+        """Missing, malformed and forged grants are rejected."""
+        assert not ShareService.check_access_grant(self._link(), grant)
+
+
+@pytest.mark.asyncio
+class TestShareAccessTracker:
+    """Test write-behind counting of share link hits."""
+
+    def _session_factory(self, session):
+        from unittest.mock import MagicMock
+
+        factory = MagicMock()
+        factory.return_value.__aenter__.return_value = session
+        return MagicMock(return_value=factory)
+
+    async def test_hits_are_batched(self):
+        """Hits are summed per link and flushed in one statement."""
+        from unittest.mock import AsyncMock, patch
+        from uuid import uuid4
+        from app.services.share_access_tracker import ShareAccessTracker
+
+        tracker = ShareAccessTracker()
+        first, second = uuid4(), uuid4()
+        for _ in range(3):
+            tracker.record(first)
+        tracker.record(second)
+        assert tracker.pending_hits(first) == 3
+
+        session = AsyncMock()
+        with patch(
+            "app.services.share_access_tracker.get_session_factory",
+            self._session_factory(session),
+        ):
+            assert await tracker.flush() == 2
+
+        session.execute.assert_awaited_once()
+        params = session.execute.await_args.args[1]
+        assert {p["link_id"]: p["hits"] for p in params} == {first: 3, second: 1}
+        session.commit.assert_awaited_once()
+        assert tracker.pending_hits(first) == 0
+
+    async def test_failed_flush_keeps_hits(self):
+        """Hits survive a failed flush and are retried."""
+        from unittest.mock import AsyncMock, patch
+        from uuid import uuid4
+        from app.services.share_access_tracker import ShareAccessTracker
+
+        tracker = ShareAccessTracker()
+        link_id = uuid4()
+        tracker.record(link_id)
+
+        session = AsyncMock()
+        session.execute.side_effect = ConnectionError("database down")
+        with patch(
+            "app.services.share_access_tracker.get_session_factory",
+            self._session_factory(session),
+        ):
+            assert await tracker.flush() == 0
+
+        tracker.record(link_id)
+        assert tracker.pending_hits(link_id) == 2
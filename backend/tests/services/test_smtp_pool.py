@@ -0,0 +1,191 @@
+"""
+Tests for pooled SMTP delivery.
+
+Runs EmailService against a local aiosmtpd server so session reuse,
+rotation and reconnects are observed on real SMTP connections.
+"""
+
+import socket
+
+import pytest
+
+pytest.importorskip("aiosmtpd")
+from aiosmtpd.controller import Controller
+
+from app.services.email_service import EmailConfig, EmailService, OutgoingEmail
+from app.services.smtp_pool import SMTPConnectionPool, get_smtp_pool
+
+
+class RecordingHandler:
+    """aiosmtpd handler that records messages and the sessions carrying them."""
+
+    def __init__(self):
+        self.messages = []
+        self.sessions = []
+
+    async def handle_RCPT(self, server, session, envelope, address, rcpt_options):
+        if address.startswith("reject"):
+            return "550 Mailbox unavailable"
+        envelope.rcpt_tos.append(address)
+        return "250 OK"
+
+    async def handle_DATA(self, server, session, envelope):
+        self.messages.append(envelope)
+        if not any(s is session for s in self.sessions):
+            self.sessions.append(session)
+        return "250 Message accepted"
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def smtp_server():
+    """Run a local SMTP server for the duration of a test."""
+    handler = RecordingHandler()
+    controller = Controller(handler, hostname="127.0.0.1", port=_free_port())
+    controller.start()
+    yield controller
+    controller.stop()
+
+
+def _config(host: str, port: int) -> EmailConfig:
+    return EmailConfig(
+        smtp_host=host,
+        smtp_port=port,
+        smtp_user="",
+        smtp_password="",
+        smtp_from_email="noreply@sprintforge.com",
+        use_tls=False,
+    )
+
+
+@pytest.fixture
+def email_config(smtp_server):
+    """SMTP configuration pointing at the local server."""
+    return _config(smtp_server.hostname, smtp_server.port)
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestSMTPConnectionPool:
+    """Test session reuse over a real SMTP server."""
+
+    async def test_send_email_reuses_session(self, smtp_server, email_config):
+        """Consecutive sends share one authenticated session."""
+        pool = SMTPConnectionPool(email_config, keepalive_interval=0)
+        service = EmailService(email_config, pool=pool)
+
+        for i in range(3):
+            assert await service.send_email(
+                to=f"user{i}@example.com", subject="Hi", body_html="<p>Hi</p>"
+            )
+
+        assert len(smtp_server.handler.messages) == 3
+        assert len(smtp_server.handler.sessions) == 1
+        assert pool.connections_opened == 1
+        await pool.close()
+
+    async def test_send_batch_rotates_sessions(self, smtp_server, email_config):
+        """A session is retired after max_messages_per_connection messages."""
+        pool = SMTPConnectionPool(email_config, max_messages_per_connection=2)
+        service = EmailService(email_config, pool=pool)
+
+        results = await service.send_batch(
+            [
+                OutgoingEmail(to=f"user{i}@example.com", subject="Hi", body_html="x")
+                for i in range(5)
+            ]
+        )
+
+        assert results == [True] * 5
+        assert len(smtp_server.handler.messages) == 5
+        assert pool.connections_opened == 3
+        await pool.close()
+
+    async def test_send_batch_continues_after_rejection(
+        self, smtp_server, email_config
+    ):
+        """A rejected message fails alone and the session stays in use."""
+        pool = SMTPConnectionPool(email_config)
+        service = EmailService(email_config, pool=pool)
+
+        results = await service.send_batch(
+            [
+                OutgoingEmail(to="first@example.com", subject="Hi", body_html="x"),
+                OutgoingEmail(to="reject@example.com", subject="Hi", body_html="x"),
+                OutgoingEmail(to="invalid-email", subject="Hi", body_html="x"),
+                OutgoingEmail(to="last@example.com", subject="Hi", body_html="x"),
+            ]
+        )
+
+        assert results == [True, False, False, True]
+        assert len(smtp_server.handler.messages) == 2
+        assert pool.connections_opened == 1
+        await pool.close()
+
+    async def test_reconnects_after_server_restart(self):
+        """A session dropped by the server is replaced transparently."""
+        # A stopped Controller cannot be started again, so the restart
+        # runs a second one on the same port
+        handler = RecordingHandler()
+        port = _free_port()
+        server = Controller(handler, hostname="127.0.0.1", port=port)
+        server.start()
+        try:
+            config = _config("127.0.0.1", port)
+            pool = SMTPConnectionPool(config)
+            service = EmailService(config, pool=pool)
+
+            assert await service.send_email(
+                to="before@example.com", subject="Hi", body_html="x"
+            )
+        finally:
+            server.stop()
+
+        restarted = Controller(handler, hostname="127.0.0.1", port=port)
+        restarted.start()
+        try:
+            assert await service.send_email(
+                to="after@example.com", subject="Hi", body_html="x"
+            )
+            await pool.close()
+        finally:
+            restarted.stop()
+
+        assert len(handler.messages) == 2
+        assert pool.connections_opened == 2
+
+    async def test_send_many_stops_when_server_unreachable(self, monkeypatch):
+        """Two failed connection attempts fail the whole batch."""
+        # Nothing listens on a freshly released port
+        pool = SMTPConnectionPool(_config("127.0.0.1", _free_port()))
+        attempts = []
+        open_session = pool._open
+
+        async def counting_open():
+            attempts.append(1)
+            return await open_session()
+
+        monkeypatch.setattr(pool, "_open", counting_open)
+        envelopes = [
+            ("noreply@sprintforge.com", [f"user{i}@example.com"], "Subject: Hi\r\n\r\nx")
+            for i in range(5)
+        ]
+
+        results = await pool.send_many(envelopes)
+
+        assert len(attempts) == 2
+        assert len(results) == 5
+        assert all(isinstance(result, ConnectionError) for result in results)
+
+    async def test_shared_pool_per_config(self, email_config):
+        """Services with equal configuration share one pool."""
+        first = EmailService(email_config)
+        second = EmailService(EmailConfig(**vars(email_config)))
+
+        assert first.pool is second.pool
+        assert first.pool is get_smtp_pool(email_config)
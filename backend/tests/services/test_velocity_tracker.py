@@ -444,3 +444,125 @@ class TestDetectVelocityAnomalies:
 
         assert isinstance(anomalies, list)
         assert len(anomalies) == 0
+
+
+class _StdDevSamp:
+    """SQLite window-function implementation of STDDEV_SAMP for tests."""
+
+    def __init__(self):
+        self.values = []
+
+    def step(self, value):
+        self.values.append(value)
+
+    def inverse(self, value):
+        self.values.remove(value)
+
+    def value(self):
+        import statistics
+
+        return statistics.stdev(self.values) if len(self.values) > 1 else None
+
+    def finalize(self):
+        return self.value()
+
+
+class TestGetVelocityAnalytics:
+    """Test suite for get_velocity_analytics method."""
+
+    @pytest_asyncio.fixture
+    async def spiky_velocities(self, test_db_session: AsyncSession, test_project):
+        """Six sprints, two weeks apart, with one spike."""
+        now = datetime.now(timezone.utc)
+        values = [40.0, 42.0, 38.0, 41.0, 95.0, 39.0]
+        for i, value in enumerate(values):
+            test_db_session.add(
+                SprintVelocity(
+                    project_id=test_project.id,
+                    sprint_id=f"sprint-{i}",
+                    velocity_points=value,
+                    completed_tasks=int(value / 2.5),
+                    timestamp=now - timedelta(days=(len(values) - i) * 14),
+                )
+            )
+        await test_db_session.commit()
+        return values
+
+    @pytest.mark.asyncio
+    async def test_numpy_analytics_values(
+        self, velocity_tracker: VelocityTracker, test_project, spiky_velocities
+    ):
+        """Moving averages, z-scores and anomaly flags are computed together."""
+        analytics = await velocity_tracker.get_velocity_analytics(test_project.id, window=3)
+
+        assert [p["sprint_id"] for p in analytics.points] == [
+            f"sprint-{i}" for i in range(6)
+        ]
+        assert [round(p["moving_average"], 2) for p in analytics.points] == [
+            40.0, 41.0, 40.0, 40.33, 58.0, 58.33
+        ]
+        assert analytics.mean == pytest.approx(sum(spiky_velocities) / 6)
+        assert [p["is_anomaly"] for p in analytics.points] == [
+            False, False, False, False, True, False
+        ]
+        assert analytics.anomalies[0]["sprint_id"] == "sprint-4"
+        assert analytics.anomalies[0]["type"] == "spike"
+
+    @pytest.mark.asyncio
+    async def test_window_function_query_matches_numpy(
+        self,
+        velocity_tracker: VelocityTracker,
+        test_db_session: AsyncSession,
+        test_project,
+        spiky_velocities,
+        monkeypatch,
+    ):
+        """The SQL window-function path returns the same analytics."""
+        expected = await velocity_tracker.get_velocity_analytics(test_project.id, window=3)
+
+        connection = await test_db_session.connection()
+        raw = await connection.get_raw_connection()
+        raw.driver_connection._conn.create_window_function(
+            "stddev_samp", 1, _StdDevSamp
+        )
+        monkeypatch.setattr(velocity_tracker, "_supports_window_stddev", lambda: True)
+
+        analytics = await velocity_tracker.get_velocity_analytics(test_project.id, window=3)
+
+        assert analytics.mean == pytest.approx(expected.mean)
+        assert analytics.stdev == pytest.approx(expected.stdev)
+        for actual, wanted in zip(analytics.points, expected.points):
+            assert actual["moving_average"] == pytest.approx(wanted["moving_average"])
+            assert actual["z_score"] == pytest.approx(wanted["z_score"])
+            assert actual["is_anomaly"] == wanted["is_anomaly"]
+
+    @pytest.mark.asyncio
+    async def test_trend_direction(
+        self, velocity_tracker: VelocityTracker, test_db_session: AsyncSession, test_project
+    ):
+        """Rising velocities are reported as increasing."""
+        now = datetime.now(timezone.utc)
+        for i, value in enumerate([20.0, 22.0, 30.0, 34.0]):
+            test_db_session.add(
+                SprintVelocity(
+                    project_id=test_project.id,
+                    sprint_id=f"s{i}",
+                    velocity_points=value,
+                    completed_tasks=0,
+                    timestamp=now - timedelta(days=(4 - i) * 14),
+                )
+            )
+        await test_db_session.commit()
+
+        analytics = await velocity_tracker.get_velocity_analytics(test_project.id)
+
+        assert analytics.trend_direction == "increasing"
+
+    @pytest.mark.asyncio
+    async def test_no_data(self, velocity_tracker: VelocityTracker, test_project):
+        """Empty history returns empty analytics."""
+        analytics = await velocity_tracker.get_velocity_analytics(test_project.id)
+
+        assert analytics.points == []
+        assert analytics.anomalies == []
+        assert analytics.moving_average == 0.0
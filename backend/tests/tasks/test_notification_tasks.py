@@ -25,13 +25,22 @@ from app.models.notification import (
     NotificationType,
     NotificationChannel,
     NotificationStatus,
+    NotificationTemplate,
 )
+from app.services.notification_template_cache import CompiledTemplate
 
 
 @pytest.mark.unit
 class TestSendNotificationEmailTask:
     """Test suite for send_notification_email Celery task."""
 
+    @pytest.fixture(autouse=True)
+    def mock_template_cache(self):
+        """Serve no custom templates unless a test provides one."""
+        with patch("app.tasks.notification_tasks.template_cache") as mock_cache:
+            mock_cache.get = AsyncMock(return_value=None)
+            yield mock_cache
+
     @patch("app.tasks.notification_tasks.EmailService")
     @patch("app.tasks.notification_tasks.get_db_session")
     @pytest.mark.asyncio
@@ -151,17 +160,16 @@ class TestSendNotificationEmailTask:
         # Should create error log entry
         assert mock_db.add.called
 
-    @patch("app.tasks.notification_tasks.NotificationTemplate")
     @patch("app.tasks.notification_tasks.EmailService")
     @patch("app.tasks.notification_tasks.get_db_session")
     @pytest.mark.asyncio
     async def test_send_notification_with_template(
-        self, mock_get_db, mock_email_service_class, mock_template_class
+        self, mock_get_db, mock_email_service_class, mock_template_cache
     ):
         """
         Test sending notification with email template.
 
-        Validates template retrieval and rendering.
+        Validates that the cached compiled template is rendered.
         """
         notification_id = uuid4()
 
@@ -176,25 +184,23 @@ class TestSendNotificationEmailTask:
         mock_user = Mock()
         mock_user.email = "user@example.com"
 
-        mock_template = Mock()
-        mock_template.subject_template = "Sprint {sprint_name} Complete"
-        mock_template.body_template_html = "<p>{sprint_name} is {completion}% done</p>"
-        mock_template.body_template_text = "{sprint_name} is {completion}% done"
+        template = NotificationTemplate(
+            event_type=NotificationType.SPRINT_COMPLETE.value,
+            subject_template="Sprint {{ sprint_name }} Complete",
+            body_template_html="<p>{{ sprint_name }} is {{ completion }}% done</p>",
+            body_template_text="{{ sprint_name }} is {{ completion }}% done",
+        )
+        mock_template_cache.get.return_value = CompiledTemplate.from_model(template)
 
         mock_db = AsyncMock()
         mock_get_db.return_value.__aenter__.return_value = mock_db
 
         mock_db.execute = AsyncMock()
         mock_db.execute.return_value.scalar_one.return_value = mock_notification
-        mock_db.execute.return_value.scalar_one_or_none = Mock(
-            side_effect=[mock_template, mock_user]
-        )
+        mock_db.execute.return_value.scalar_one_or_none.return_value = mock_user
 
         mock_email_service = Mock()
         mock_email_service.send_email = AsyncMock(return_value=True)
-        mock_email_service.render_template = Mock(
-            side_effect=lambda template, context: template.format(**context)
-        )
         mock_email_service_class.return_value = mock_email_service
 
         # Execute task
@@ -202,18 +208,23 @@ class TestSendNotificationEmailTask:
 
         assert result is True
         # Verify template was used
-        assert mock_email_service.render_template.call_count >= 2  # Subject + body
+        mock_template_cache.get.assert_called_once_with(
+            mock_db, NotificationType.SPRINT_COMPLETE
+        )
+        sent = mock_email_service.send_email.call_args.kwargs
+        assert sent["subject"] == "Sprint 24.Q1.1 Complete"
+        assert sent["body_text"] == "24.Q1.1 is 100% done"
 
 
 @pytest.mark.unit
 class TestProcessNotificationRulesTask:
     """Test suite for process_notification_rules Celery task."""
 
-    @patch("app.tasks.notification_tasks.send_notification_email")
+    @patch("app.tasks.notification_tasks.batch_send_notifications_task")
     @patch("app.tasks.notification_tasks.get_db_session")
     @pytest.mark.asyncio
     async def test_process_rules_creates_notifications(
-        self, mock_get_db, mock_send_task
+        self, mock_get_db, mock_batch_task
     ):
         """
         Test processing notification rules creates notifications.
@@ -240,18 +251,23 @@ class TestProcessNotificationRulesTask:
         mock_db = AsyncMock()
         mock_get_db.return_value.__aenter__.return_value = mock_db
 
-        # Mock query to return one matching rule
-        mock_db.execute = AsyncMock()
-        mock_db.execute.return_value.scalars.return_value.all.return_value = [
-            mock_rule
-        ]
+        # Mock rule query, then the bulk insert returning one ID
+        notification_id = uuid4()
+        rules_result = Mock()
+        rules_result.scalars.return_value.all.return_value = [mock_rule]
+        insert_result = Mock()
+        insert_result.scalars.return_value.all.return_value = [notification_id]
+        mock_db.execute = AsyncMock(side_effect=[rules_result, insert_result])
 
         # Execute task
         result = await process_notification_rules(event_type.value, event_data)
 
         assert result > 0  # At least one notification created
-        # Verify notification was added to DB
-        assert mock_db.add.called
+        # Verify notifications were inserted in one batch
+        assert mock_db.execute.call_count == 2
+        assert len(mock_db.execute.call_args.args[1]) == 1
+        assert not mock_db.add.called
+        mock_batch_task.delay.assert_called_once_with([str(notification_id)])
 
     @patch("app.tasks.notification_tasks.get_db_session")
     @pytest.mark.asyncio
@@ -276,10 +292,10 @@ class TestProcessNotificationRulesTask:
 
         assert result == 0  # No notifications created
 
-    @patch("app.tasks.notification_tasks.send_notification_email")
+    @patch("app.tasks.notification_tasks.batch_send_notifications_task")
     @patch("app.tasks.notification_tasks.get_db_session")
     @pytest.mark.asyncio
-    async def test_process_rules_with_conditions(self, mock_get_db, mock_send_task):
+    async def test_process_rules_with_conditions(self, mock_get_db, mock_batch_task):
         """
         Test processing rules with custom conditions.
 
@@ -299,7 +315,7 @@ class TestProcessNotificationRulesTask:
         mock_rule_match.user_id = uuid4()
         mock_rule_match.event_type = event_type
         mock_rule_match.enabled = True
-        mock_rule_match.channels = [NotificationChannel.EMAIL]
+        mock_rule_match.channels = [NotificationChannel.EMAIL, NotificationChannel.IN_APP]
         mock_rule_match.conditions = {
             "project_ids": [project_id],
             "min_completion": 80,
@@ -319,24 +335,28 @@ class TestProcessNotificationRulesTask:
         mock_db = AsyncMock()
         mock_get_db.return_value.__aenter__.return_value = mock_db
 
-        mock_db.execute = AsyncMock()
-        mock_db.execute.return_value.scalars.return_value.all.return_value = [
+        rules_result = Mock()
+        rules_result.scalars.return_value.all.return_value = [
             mock_rule_match,
             mock_rule_no_match,
         ]
+        insert_result = Mock()
+        insert_result.scalars.return_value.all.return_value = [uuid4()]
+        mock_db.execute = AsyncMock(side_effect=[rules_result, insert_result])
 
         # Execute task
         result = await process_notification_rules(event_type.value, event_data)
 
         # Only one notification should be created (for matching rule)
         assert result == 1
-        assert mock_db.add.call_count == 1
+        inserted_rows = mock_db.execute.call_args.args[1]
+        assert [row["user_id"] for row in inserted_rows] == [mock_rule_match.user_id]
 
-    @patch("app.tasks.notification_tasks.send_notification_email")
+    @patch("app.tasks.notification_tasks.batch_send_notifications_task")
     @patch("app.tasks.notification_tasks.get_db_session")
     @pytest.mark.asyncio
     async def test_process_rules_disabled_rules_ignored(
-        self, mock_get_db, mock_send_task
+        self, mock_get_db, mock_batch_task
     ):
         """
         Test that disabled rules are not processed.
@@ -367,32 +387,169 @@ class TestProcessNotificationRulesTask:
 
         assert result == 0
         assert not mock_db.add.called
+        mock_batch_task.delay.assert_not_called()
+
+    @patch("app.tasks.notification_tasks.batch_send_notifications_task")
+    @patch("app.tasks.notification_tasks.get_db_session")
+    @pytest.mark.asyncio
+    async def test_process_rules_large_fan_out_batches_emails(
+        self, mock_get_db, mock_batch_task
+    ):
+        """
+        Test fan-out to many recipients.
+
+        Validates one insert for all rows and email IDs queued in chunks.
+        """
+        from app.tasks.notification_tasks import EMAIL_BATCH_SIZE
+
+        event_type = NotificationType.SPRINT_COMPLETE
+        recipients = EMAIL_BATCH_SIZE * 2 + 7
+
+        rules = []
+        for _ in range(recipients):
+            rule = Mock(spec=NotificationRule)
+            rule.id = uuid4()
+            rule.user_id = uuid4()
+            rule.channels = [NotificationChannel.EMAIL, NotificationChannel.IN_APP]
+            rule.conditions = {}
+            rules.append(rule)
+
+        mock_db = AsyncMock()
+        mock_get_db.return_value.__aenter__.return_value = mock_db
+
+        rules_result = Mock()
+        rules_result.scalars.return_value.all.return_value = rules
+        insert_result = Mock()
+        insert_result.scalars.return_value.all.return_value = [
+            uuid4() for _ in range(recipients)
+        ]
+        mock_db.execute = AsyncMock(side_effect=[rules_result, insert_result])
+
+        result = await process_notification_rules(event_type.value, {})
+
+        assert result == recipients
+        assert mock_db.execute.call_count == 2
+        batch_sizes = [len(c.args[0]) for c in mock_batch_task.delay.call_args_list]
+        assert batch_sizes == [EMAIL_BATCH_SIZE, EMAIL_BATCH_SIZE, 7]
 
 
 @pytest.mark.unit
 class TestBatchSendNotificationsTask:
     """Test suite for batch_send_notifications Celery task."""
 
-    @patch("app.tasks.notification_tasks.send_notification_email")
+    @staticmethod
+    def _notification(notification_type=NotificationType.SPRINT_COMPLETE):
+        notification = Mock(spec=Notification)
+        notification.id = uuid4()
+        notification.user_id = uuid4()
+        notification.type = notification_type
+        notification.title = "Sprint Complete"
+        notification.message = "Sprint complete"
+        notification.metadata = {}
+        return notification
+
+    @patch("app.tasks.notification_tasks.template_cache")
+    @patch("app.tasks.notification_tasks.EmailService")
     @patch("app.tasks.notification_tasks.get_db_session")
     @pytest.mark.asyncio
-    async def test_batch_send_notifications(self, mock_get_db, mock_send_task):
+    async def test_batch_send_notifications(
+        self, mock_get_db, mock_email_service_class, mock_template_cache
+    ):
         """
         Test batch sending multiple notifications.
 
-        Validates bulk notification processing.
+        Validates one lookup for all notifications and one pipelined send.
         """
-        notification_ids = [uuid4() for _ in range(5)]
+        notifications = [self._notification() for _ in range(5)]
+        rows = [(n, f"user{i}@example.com") for i, n in enumerate(notifications)]
+
+        mock_db = AsyncMock()
+        mock_get_db.return_value.__aenter__.return_value = mock_db
+
+        rows_result = Mock()
+        rows_result.all.return_value = rows
+        mock_db.execute = AsyncMock(return_value=rows_result)
+        mock_template_cache.get_many = AsyncMock(return_value={})
+        mock_db.add_all = Mock()
+
+        mock_email_service = Mock()
+        mock_email_service.send_batch = AsyncMock(
+            return_value=[True, True, False, True, True]
+        )
+        mock_email_service_class.return_value = mock_email_service
 
         # Execute task
-        result = await batch_send_notifications([str(nid) for nid in notification_ids])
+        result = await batch_send_notifications([str(n.id) for n in notifications])
+
+        assert result == 4
+        mock_email_service.send_batch.assert_called_once()
+        emails = mock_email_service.send_batch.call_args.args[0]
+        assert [e.to for e in emails] == [email for _, email in rows]
+        assert emails[0].subject == "Sprint Complete"
+
+        logs = mock_db.add_all.call_args.args[0]
+        assert [log.status for log in logs] == [
+            "sent",
+            "sent",
+            "failed",
+            "sent",
+            "sent",
+        ]
+        mock_db.commit.assert_called_once()
+
+    @patch("app.tasks.notification_tasks.template_cache")
+    @patch("app.tasks.notification_tasks.EmailService")
+    @patch("app.tasks.notification_tasks.get_db_session")
+    @pytest.mark.asyncio
+    async def test_batch_send_renders_template_once_per_context(
+        self, mock_get_db, mock_email_service_class, mock_template_cache
+    ):
+        """
+        Test batch rendering of a fan-out with a shared context.
+
+        Validates that recipients sharing event metadata share one render.
+        """
+        notifications = [self._notification() for _ in range(4)]
+        for notification in notifications:
+            notification.metadata = {"sprint_name": "24.Q1.1"}
+        rows = [(n, f"user{i}@example.com") for i, n in enumerate(notifications)]
+
+        mock_db = AsyncMock()
+        mock_get_db.return_value.__aenter__.return_value = mock_db
+        rows_result = Mock()
+        rows_result.all.return_value = rows
+        mock_db.execute = AsyncMock(return_value=rows_result)
+        mock_db.add_all = Mock()
+
+        compiled = CompiledTemplate.from_model(
+            NotificationTemplate(
+                event_type=NotificationType.SPRINT_COMPLETE.value,
+                subject_template="Sprint {{ sprint_name }} Complete",
+                body_template_html="<p>{{ sprint_name }}</p>",
+                body_template_text="{{ sprint_name }}",
+            )
+        )
+        mock_template_cache.get_many = AsyncMock(
+            return_value={NotificationType.SPRINT_COMPLETE: compiled}
+        )
 
-        assert result == len(notification_ids)
-        assert mock_send_task.delay.call_count == len(notification_ids)
+        mock_email_service = Mock()
+        mock_email_service.send_batch = AsyncMock(return_value=[True] * 4)
+        mock_email_service_class.return_value = mock_email_service
+
+        with patch.object(
+            CompiledTemplate, "render", autospec=True, side_effect=CompiledTemplate.render
+        ) as mock_render:
+            result = await batch_send_notifications([str(n.id) for n in notifications])
 
-    @patch("app.tasks.notification_tasks.send_notification_email")
+        assert result == 4
+        assert mock_render.call_count == 1
+        emails = mock_email_service.send_batch.call_args.args[0]
+        assert {e.subject for e in emails} == {"Sprint 24.Q1.1 Complete"}
+
+    @patch("app.tasks.notification_tasks.get_db_session")
     @pytest.mark.asyncio
-    async def test_batch_send_empty_list(self, mock_send_task):
+    async def test_batch_send_empty_list(self, mock_get_db):
         """
         Test batch sending with empty notification list.
 
@@ -401,33 +558,30 @@ class TestBatchSendNotificationsTask:
         result = await batch_send_notifications([])
 
         assert result == 0
-        assert not mock_send_task.delay.called
+        assert not mock_get_db.called
 
-    @patch("app.tasks.notification_tasks.send_notification_email")
+    @patch("app.tasks.notification_tasks.EmailService")
+    @patch("app.tasks.notification_tasks.get_db_session")
     @pytest.mark.asyncio
-    async def test_batch_send_handles_failures(self, mock_send_task):
+    async def test_batch_send_missing_notifications(
+        self, mock_get_db, mock_email_service_class
+    ):
         """
-        Test batch sending continues despite individual failures.
+        Test batch sending when notifications no longer exist.
 
-        Validates error resilience in batch processing.
+        Validates that nothing is sent for unknown IDs.
         """
-        notification_ids = [str(uuid4()) for _ in range(3)]
+        mock_db = AsyncMock()
+        mock_get_db.return_value.__aenter__.return_value = mock_db
 
-        # First task fails, others succeed
-        mock_send_task.delay = Mock(
-            side_effect=[
-                Exception("Task failed"),
-                Mock(),
-                Mock(),
-            ]
-        )
+        rows_result = Mock()
+        rows_result.all.return_value = []
+        mock_db.execute = AsyncMock(return_value=rows_result)
 
-        # Should continue processing despite failure
-        # Implementation should handle this gracefully
-        result = await batch_send_notifications(notification_ids)
+        result = await batch_send_notifications([str(uuid4()) for _ in range(3)])
 
-        # At minimum, should attempt all
-        assert mock_send_task.delay.call_count == len(notification_ids)
+        assert result == 0
+        assert not mock_email_service_class.called
 
 
 @pytest.mark.unit
@@ -378,4 +378,101 @@ class TestAuthenticationMiddleware:
         await middleware(scope, receive, send)
 
         # Verify app was called directly (middleware should pass through)
-        mock_app.assert_called_once_with(scope, receive, send)
\ No newline at end of file
+        mock_app.assert_called_once_with(scope, receive, send)
+
+class TestVerifiedTokenCache:
+    """Test caching of verified tokens and the middleware handoff."""
+
+    def create_test_token(self, minutes: int = 30) -> str:
+        """Create a test JWT token expiring in the given minutes."""
+        payload = {
+            "sub": "test-user-123",
+            "email": "test@example.com",
+            "exp": (datetime.now(timezone.utc) + timedelta(minutes=minutes)).timestamp(),
+            "iat": datetime.now(timezone.utc).timestamp()
+        }
+        return jwt.encode(payload, NEXTAUTH_SECRET, algorithm=ALGORITHM)
+
+    @pytest.mark.asyncio
+    async def test_cached_token_skips_decode(self):
+        """A token verified once is not decoded again."""
+        from app.core.auth import clear_token_cache
+
+        clear_token_cache()
+        token = self.create_test_token()
+        first = await verify_nextauth_jwt(token)
+        first["sub"] = "tampered"
+
+        with patch('app.core.auth.jwt.decode') as mock_decode:
+            second = await verify_nextauth_jwt(token)
+
+        mock_decode.assert_not_called()
+        assert second["sub"] == "test-user-123"
+
+    @pytest.mark.asyncio
+    async def test_cache_entry_expires_with_token(self):
+        """Cached claims are not served past the token's exp."""
+        from app.core import auth
+
+        auth.clear_token_cache()
+        token = self.create_test_token(minutes=1)
+
+        with patch('app.core.cache.time.monotonic', return_value=100.0):
+            await verify_nextauth_jwt(token)
+
+        with patch('app.core.cache.time.monotonic', return_value=161.0), \
+                patch('app.core.auth.jwt.decode', wraps=jwt.decode) as mock_decode:
+            await verify_nextauth_jwt(token)
+
+        mock_decode.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_invalid_token_not_cached(self):
+        """Failed verifications are repeated rather than remembered."""
+        with patch('app.core.auth.jwt.decode', wraps=jwt.decode) as mock_decode:
+            for _ in range(2):
+                with pytest.raises(JWTAuthError):
+                    await verify_nextauth_jwt("invalid.token.here")
+
+        assert mock_decode.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_dependency_reuses_middleware_result(self):
+        """get_current_user_from_token reuses the claims set by the middleware."""
+        from starlette.requests import Request
+        from app.core.auth import AuthenticationMiddleware
+
+        token = self.create_test_token()
+        scope = {
+            "type": "http",
+            "headers": [(b"authorization", f"Bearer {token}".encode())],
+            "method": "GET",
+            "path": "/api/v1/auth/me"
+        }
+        mock_app = AsyncMock()
+        await AuthenticationMiddleware(mock_app)(scope, AsyncMock(), AsyncMock())
+        request = Request(mock_app.call_args.args[0])
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+        with patch('app.core.auth.verify_nextauth_jwt') as mock_verify:
+            user = await get_current_user_from_token(credentials, request)
+            optional_user = await get_current_user_optional(credentials, request)
+
+        mock_verify.assert_not_called()
+        assert user["sub"] == "test-user-123"
+        assert optional_user["sub"] == "test-user-123"
+
+    @pytest.mark.asyncio
+    async def test_dependency_verifies_different_token(self):
+        """A token other than the one the middleware saw is verified."""
+        from starlette.requests import Request
+
+        request = Request({"type": "http", "headers": [], "state": {}})
+        request.state.user = {"sub": "someone-else"}
+        request.state.auth_token_digest = "not-this-token"
+        token = self.create_test_token()
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+        user = await get_current_user_from_token(credentials, request)
+
+        assert user["sub"] == "test-user-123"
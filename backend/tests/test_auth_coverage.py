@@ -332,9 +332,10 @@ class TestSecurityValidation:
         }
         token = jwt.encode(payload, NEXTAUTH_SECRET, algorithm=ALGORITHM)
 
-        with patch('app.core.auth.logger') as mock_logger:
+        with patch('app.core.auth.logger') as mock_logger, \
+                patch('app.core.auth.AUTH_LOG_SAMPLE_RATE', 1.0):
             result = await verify_nextauth_jwt(token)
 
-            # Should log successful validation
+            # Should log successful validation (when sampled)
             mock_logger.info.assert_called()
             assert result["sub"] == "test-user-123"
\ No newline at end of file
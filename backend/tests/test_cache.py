@@ -0,0 +1,41 @@
+"""
+Tests for the in-process caches.
+"""
+
+from unittest.mock import patch
+
+from app.core.cache import BoundedTTLDict
+
+
+class TestBoundedTTLDict:
+    """Test the bounded, expiring map."""
+
+    def test_evicts_least_recently_used(self):
+        """The least recently used entry goes once the bound is exceeded."""
+        store = BoundedTTLDict(max_entries=2)
+        store["a"] = 1
+        store["b"] = 2
+        store["a"]  # Touch a so b is the oldest
+        store["c"] = 3
+
+        assert set(store) == {"a", "c"}
+
+    def test_entries_expire(self):
+        """Entries past their TTL behave as missing."""
+        store = BoundedTTLDict(ttl=10)
+        with patch("app.core.cache.time.monotonic", return_value=100.0):
+            store["a"] = 1
+            store.set("b", 2, ttl=60)
+
+        with patch("app.core.cache.time.monotonic", return_value=120.0):
+            assert "a" not in store
+            assert store["b"] == 2
+            assert list(store) == ["b"]
+
+    def test_default_factory(self):
+        """Missing keys are created like a defaultdict."""
+        store = BoundedTTLDict(default_factory=int)
+        store["a"] += 1
+
+        assert store["a"] == 1
+        assert "b" not in store
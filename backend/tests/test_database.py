@@ -2,6 +2,7 @@
 Database connectivity and migration tests using SQLite.
 """
 import pytest
+import pytest_asyncio
 import os
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
@@ -102,3 +103,59 @@ async def test_database_session_creation():
             assert row[0] == 1
     finally:
         await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def replica_setup(tmp_path, monkeypatch):
+    """Point the app at a primary and a replica, each its own SQLite file."""
+    from app.database import connection
+
+    primary_url = f"sqlite+aiosqlite:///{tmp_path / 'primary.db'}"
+    replica_url = f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}"
+    settings = get_settings()
+    monkeypatch.setattr(settings, "database_url", primary_url)
+    monkeypatch.setattr(settings, "database_read_replica_urls", [replica_url])
+    await connection.close_database_connections()
+
+    for url, name in ((primary_url, "primary"), (replica_url, "replica")):
+        engine = create_async_engine(url)
+        async with engine.begin() as conn:
+            await conn.execute(text("CREATE TABLE origin (name TEXT)"))
+            await conn.execute(text(f"INSERT INTO origin VALUES ('{name}')"))
+        await engine.dispose()
+
+    yield connection
+    await connection.close_database_connections()
+
+
+@pytest.mark.asyncio
+async def test_read_sessions_use_replica(replica_setup):
+    """get_read_db reads from the replica while get_db uses the primary."""
+    async for session in replica_setup.get_db():
+        result = await session.execute(text("SELECT name FROM origin"))
+        assert result.scalar() == "primary"
+
+    async for session in replica_setup.get_read_db():
+        result = await session.execute(text("SELECT name FROM origin"))
+        assert result.scalar() == "replica"
+
+
+@pytest.mark.asyncio
+async def test_read_session_rejects_writes(replica_setup):
+    """Flushing ORM changes on a read-only session fails."""
+    from sqlalchemy.exc import InvalidRequestError
+    from app.models.user import User
+
+    async for session in replica_setup.get_read_db():
+        session.add(User(email="replica@example.com"))
+        with pytest.raises(InvalidRequestError):
+            await session.flush()
+
+
+@pytest.mark.asyncio
+async def test_pool_stats_cover_all_engines(replica_setup):
+    """Pool statistics are reported for the primary and each replica."""
+    stats = replica_setup.get_pool_stats()
+
+    assert set(stats) == {"primary", "replica_0"}
+    assert "pool" in stats["replica_0"]
@@ -0,0 +1,136 @@
+"""
+Tests for the global rate limiter's storage backends and route matcher.
+"""
+
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from app.core.config import settings
+from app.core.rate_limit_backends import (
+    MemoryRateLimitBackend,
+    RedisRateLimitBackend,
+    RouteLimitMatcher,
+    create_rate_limit_backend,
+)
+
+
+class TestMemoryRateLimitBackend:
+    """Test the in-memory backend."""
+
+    @pytest.mark.asyncio
+    async def test_sliding_window(self):
+        """Requests beyond the limit are rejected without being recorded."""
+        backend = MemoryRateLimitBackend()
+
+        for i in range(3):
+            decision = await backend.check("ip:1.1.1.1", limit=3, window=60)
+            assert not decision.limited
+            assert decision.count == i + 1
+
+        decision = await backend.check("ip:1.1.1.1", limit=3, window=60)
+        assert decision.limited
+        assert decision.count == 3
+
+    @pytest.mark.asyncio
+    async def test_memory_is_bounded(self):
+        """Request logs for many clients stay within max_keys."""
+        backend = MemoryRateLimitBackend(max_keys=10)
+
+        for i in range(100):
+            await backend.check(f"ip:10.0.0.{i}", limit=5, window=60)
+
+        assert len(backend.requests) == 10
+
+    @pytest.mark.asyncio
+    async def test_auth_lockout(self):
+        """Repeated auth violations lock the identifier out."""
+        backend = MemoryRateLimitBackend()
+        identifier = f"ip:{uuid4()}"
+
+        await backend.check(identifier, limit=1, window=60, auth=True)
+        for i in range(2):
+            decision = await backend.check(
+                identifier, limit=1, window=60, auth=True, max_failed_attempts=2
+            )
+
+        assert decision.locked_until is not None
+        decision = await backend.check(identifier, limit=100, window=60, auth=True)
+        assert decision.limited
+        assert decision.count == 0
+
+
+class TestRouteLimitMatcher:
+    """Test prefix trie matching."""
+
+    def test_prefix_and_default(self):
+        """Paths match by string prefix, longest first."""
+        matcher = RouteLimitMatcher(
+            {
+                "/health": {"requests": 200, "window": 60},
+                "/api/v1/auth/login": {"requests": 3, "window": 60},
+                "/api/v1/auth": {"requests": 10, "window": 60},
+            },
+            {"requests": 100, "window": 60},
+        )
+
+        assert matcher.match("/health")["requests"] == 200
+        assert matcher.match("/healthz")["requests"] == 200
+        assert matcher.match("/api/v1/auth/login/")["requests"] == 3
+        assert matcher.match("/api/v1/auth/logout")["requests"] == 10
+        assert matcher.match("/api/v1/projects")["requests"] == 100
+        assert matcher.match("/")["requests"] == 100
+
+
+class TestRedisRateLimitBackend:
+    """Test the Redis backend."""
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_memory_on_error(self):
+        """Redis errors use the in-memory fallback until the retry interval."""
+        backend = RedisRateLimitBackend("redis://localhost:1")
+        backend._script = AsyncMock(side_effect=ConnectionError("down"))
+
+        first = await backend.check("ip:1.1.1.1", limit=1, window=60)
+        second = await backend.check("ip:1.1.1.1", limit=1, window=60)
+
+        assert not first.limited
+        assert second.limited
+        assert backend._script.await_count == 1
+
+    def test_unknown_backend_rejected(self):
+        """Only memory and redis backends exist."""
+        with pytest.raises(ValueError):
+            create_rate_limit_backend("memcached")
+
+    @pytest.mark.integration
+    @pytest.mark.asyncio
+    async def test_shared_limit_and_lockout(self):
+        """Limits and lockouts are enforced by the Lua script."""
+        backend = RedisRateLimitBackend(settings.redis_url)
+        try:
+            await backend.client.ping()
+        except Exception:
+            pytest.skip("Redis not available")
+
+        identifier = f"ip:{uuid4()}"
+        try:
+            for i in range(2):
+                decision = await backend.check(identifier, limit=2, window=60, auth=True)
+                assert not decision.limited
+                assert decision.count == i + 1
+
+            for i in range(2):
+                decision = await backend.check(
+                    identifier, limit=2, window=60, auth=True, max_failed_attempts=2
+                )
+                assert decision.limited
+            assert decision.locked_until is not None
+
+            decision = await backend.check(identifier, limit=100, window=60, auth=True)
+            assert decision.limited
+            assert decision.count == 0
+        finally:
+            await backend.client.delete(*backend._keys(identifier))
+            await backend.close()
@@ -43,10 +43,10 @@ class TestRateLimitMiddleware:
 
     @pytest.fixture
     def mock_app(self):
-        """Create a mock FastAPI app."""
-        async def mock_call_next(request):
-            return Response(content="OK", status_code=200)
-        return mock_call_next
+        """Create a mock ASGI app."""
+        async def app(scope, receive, send):
+            await Response(content="OK", status_code=200)(scope, receive, send)
+        return app
 
     @pytest.fixture
     def rate_limiter(self, mock_app):
@@ -54,15 +54,33 @@ class TestRateLimitMiddleware:
         return RateLimitMiddleware(mock_app, default_requests=5, default_window=60)
 
     @pytest.fixture
-    def mock_request(self):
-        """Create a mock request."""
-        request = Mock(spec=Request)
-        request.url.path = "/api/v1/auth/login"
-        request.client.host = "127.0.0.1"
-        request.headers = {}
-        request.state = Mock()
-        request.state.user_id = None
-        return request
+    def mock_scope(self):
+        """Create an HTTP request scope."""
+        return {
+            "type": "http",
+            "method": "POST",
+            "path": "/api/v1/auth/login",
+            "headers": [],
+            "query_string": b"",
+            "client": ("127.0.0.1", 12345),
+            "state": {},
+        }
+
+    @staticmethod
+    async def _call(middleware, scope):
+        """Run the middleware on a scope and return (status, headers)."""
+        messages = []
+
+        async def receive():
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message):
+            messages.append(message)
+
+        await middleware(scope, receive, send)
+        start = messages[0]
+        headers = {k.decode().lower(): v.decode() for k, v in start["headers"]}
+        return start["status"], headers
 
     def test_get_client_identifier_with_user_id(self, rate_limiter):
         """Test client identifier extraction with user ID."""
@@ -109,7 +127,8 @@ class TestRateLimitMiddleware:
         limits = rate_limiter._get_rate_limit("/api/v1/projects")
         assert limits == {"requests": 5, "window": 60}
 
-    def test_rate_limiting_within_limits(self, rate_limiter):
+    @pytest.mark.asyncio
+    async def test_rate_limiting_within_limits(self, rate_limiter):
         """Test that requests within limits are allowed."""
         identifier = "test_user"
         limits = {"requests": 5, "window": 60}
@@ -117,11 +136,12 @@ class TestRateLimitMiddleware:
 
         # First few requests should be allowed
         for i in range(3):
-            is_limited, delay = rate_limiter._is_rate_limited(identifier, limits, path)
+            is_limited, delay = await rate_limiter._is_rate_limited(identifier, limits, path)
             assert not is_limited
             assert delay == 0
 
-    def test_rate_limiting_exceeds_limits(self, rate_limiter):
+    @pytest.mark.asyncio
+    async def test_rate_limiting_exceeds_limits(self, rate_limiter):
         """Test that requests exceeding limits are blocked."""
         identifier = "test_user"
         limits = {"requests": 3, "window": 60}
@@ -129,14 +149,15 @@ class TestRateLimitMiddleware:
 
         # Fill up the limit
         for i in range(3):
-            rate_limiter._is_rate_limited(identifier, limits, path)
+            await rate_limiter._is_rate_limited(identifier, limits, path)
 
         # Next request should be limited
-        is_limited, delay = rate_limiter._is_rate_limited(identifier, limits, path)
+        is_limited, delay = await rate_limiter._is_rate_limited(identifier, limits, path)
         assert is_limited
         assert delay > 0
 
-    def test_progressive_delay_calculation(self, rate_limiter):
+    @pytest.mark.asyncio
+    async def test_progressive_delay_calculation(self, rate_limiter):
         """Test progressive delay increases with violations."""
         identifier = "test_user"
         limits = {"requests": 2, "window": 60}
@@ -144,28 +165,27 @@ class TestRateLimitMiddleware:
 
         # Fill up the limit
         for i in range(2):
-            rate_limiter._is_rate_limited(identifier, limits, path)
+            await rate_limiter._is_rate_limited(identifier, limits, path)
 
         # First violation - len=2, violation_count = 2-2+1 = 1, delay = 2^1 = 2
-        is_limited1, delay1 = rate_limiter._is_rate_limited(identifier, limits, path)
+        is_limited1, delay1 = await rate_limiter._is_rate_limited(identifier, limits, path)
         assert is_limited1
         assert delay1 == 2
 
-        # To get progressive delay, we need to add more requests to the deque
-        # Simulate more rapid requests that would increase the delay
-        import time
-        now = time.time()
-        rate_limiter.requests[identifier].append(now)
+        # To get progressive delay, we need more requests in the window
+        # Simulate a request recorded under a higher limit
+        await rate_limiter.backend.check(identifier, limit=10, window=60)
 
         # Now len=3, violation_count = 3-2+1 = 2, delay = 2^2 = 4
-        is_limited2, delay2 = rate_limiter._is_rate_limited(identifier, limits, path)
+        is_limited2, delay2 = await rate_limiter._is_rate_limited(identifier, limits, path)
         assert is_limited2
         assert delay2 == 4
 
         # Verify delay increases
         assert delay2 > delay1
 
-    def test_account_lockout_mechanism(self, rate_limiter):
+    @pytest.mark.asyncio
+    async def test_account_lockout_mechanism(self, rate_limiter):
         """Test account lockout after excessive failures."""
         identifier = "test_user"
         limits = {"requests": 1, "window": 60}
@@ -173,37 +193,65 @@ class TestRateLimitMiddleware:
 
         # Exceed rate limit multiple times to trigger lockout
         for i in range(6):  # max_failed_attempts = 5
-            rate_limiter._is_rate_limited(identifier, limits, path)
+            await rate_limiter._is_rate_limited(identifier, limits, path)
 
         # Check that account is locked
         assert identifier in account_lockouts
         assert failed_attempts[identifier] >= rate_limiter.max_failed_attempts
 
     @pytest.mark.asyncio
-    async def test_dispatch_successful_request(self, rate_limiter, mock_request, mock_app):
+    async def test_dispatch_successful_request(self, rate_limiter, mock_scope):
         """Test successful request processing."""
-        response = await rate_limiter.dispatch(mock_request, mock_app)
+        mock_scope["path"] = "/api/v1/projects"
+        status, headers = await self._call(rate_limiter, mock_scope)
 
-        assert response.status_code == 200
-        assert "X-RateLimit-Limit" in response.headers
-        assert "X-RateLimit-Remaining" in response.headers
-        assert "X-RateLimit-Window" in response.headers
+        assert status == 200
+        assert headers["x-ratelimit-limit"] == "5"
+        assert headers["x-ratelimit-remaining"] == "4"
+        assert "x-ratelimit-window" in headers
 
     @pytest.mark.asyncio
-    async def test_dispatch_rate_limited_request(self, rate_limiter, mock_request, mock_app):
+    async def test_dispatch_rate_limited_request(self, rate_limiter, mock_scope):
         """Test rate limited request handling."""
-        identifier = rate_limiter._get_client_identifier(mock_request)
-        limits = rate_limiter._get_rate_limit(mock_request.url.path)
+        mock_scope["client"] = ("127.0.0.2", 12345)
+        identifier = "ip:127.0.0.2"
+        limits = rate_limiter._get_rate_limit(mock_scope["path"])
 
         # Fill up the rate limit
-        for i in range(limits["requests"] + 1):
-            rate_limiter._is_rate_limited(identifier, limits, mock_request.url.path)
+        for i in range(limits["requests"]):
+            await rate_limiter._is_rate_limited(identifier, limits, mock_scope["path"])
 
-        response = await rate_limiter.dispatch(mock_request, mock_app)
+        with patch("app.core.security.asyncio.sleep", new=AsyncMock()):
+            status, headers = await self._call(rate_limiter, mock_scope)
 
-        assert response.status_code == 429
-        assert "Retry-After" in response.headers
-        assert "X-Progressive-Delay" in response.headers
+        assert status == 429
+        assert "retry-after" in headers
+        assert "x-progressive-delay" in headers
+
+    @pytest.mark.asyncio
+    async def test_non_http_scope_passes_through(self, rate_limiter):
+        """Test that lifespan and websocket scopes are not rate limited."""
+        inner = AsyncMock()
+        middleware = RateLimitMiddleware(inner)
+        scope = {"type": "lifespan"}
+
+        await middleware(scope, AsyncMock(), AsyncMock())
+
+        inner.assert_awaited_once()
+
+    def test_route_matching_uses_longest_prefix(self, mock_app):
+        """Test that the most specific configured prefix wins."""
+        middleware = RateLimitMiddleware(
+            mock_app,
+            endpoint_limits={
+                "/api/v1/": {"requests": 50, "window": 60},
+                "/api/v1/auth/": {"requests": 5, "window": 60},
+            },
+        )
+
+        assert middleware._get_rate_limit("/api/v1/auth/login")["requests"] == 5
+        assert middleware._get_rate_limit("/api/v1/projects")["requests"] == 50
+        assert middleware._get_rate_limit("/other")["requests"] == 100
 
 
 class TestSecurityHeadersMiddleware:
@@ -0,0 +1,49 @@
+"""Unit tests for keyset pagination cursors."""
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from app.database.pagination import (
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+    next_cursor,
+)
+
+
+class TestCursors:
+    """Test cursor encoding."""
+
+    def test_round_trip(self):
+        """Datetimes and UUIDs survive encoding."""
+        created = datetime(2026, 10, 18, 12, 30, tzinfo=timezone.utc)
+        row_id = uuid4()
+
+        cursor = decode_cursor(encode_cursor("-created_at", created, row_id), "-created_at")
+
+        assert cursor.value == created
+        assert cursor.id == row_id
+
+    def test_other_sort_rejected(self):
+        """A cursor only continues the sort it was issued for."""
+        cursor = encode_cursor("name", "Alpha", 1)
+
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(cursor, "-name")
+
+    @pytest.mark.parametrize("cursor", ["", "not-a-cursor", "e30"])
+    def test_malformed_rejected(self, cursor):
+        """Garbage cursors raise InvalidCursorError, not arbitrary errors."""
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(cursor, "name")
+
+    def test_next_cursor_after_full_page_only(self):
+        """A short page is the last page."""
+        rows = [SimpleNamespace(id=i, name=f"p{i}") for i in range(3)]
+
+        assert next_cursor(rows, 4, "name", "name") is None
+        cursor = decode_cursor(next_cursor(rows, 3, "name", "name"), "name")
+        assert (cursor.value, cursor.id) == ("p2", 2)